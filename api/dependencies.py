@@ -2,7 +2,12 @@ from fastapi import Depends
 from database.models import DatabaseManager  # 하위 호환성을 위해 유지 (내부적으로 SQLAlchemy 사용)
 from database.sqlalchemy_manager import SQLAlchemyDatabaseManager  # SQLAlchemy 매니저
 from database.config import get_db
+from database.async_db import AsyncDatabase
 from sqlalchemy.orm import Session
+from typing import Iterator, Optional
+
+# 매니저는 상태가 없으므로(세션은 호출/작업 단위마다 생성) 요청마다 만들지 않고 공유
+_database_manager: Optional[DatabaseManager] = None
 
 def get_database_manager() -> DatabaseManager:
     """
@@ -10,7 +15,26 @@ def get_database_manager() -> DatabaseManager:
     하위 호환성을 위해 DatabaseManager 인터페이스를 유지하되,
     내부적으로는 SQLAlchemy를 사용합니다.
     """
-    return DatabaseManager()  # db_path 파라미터 제거
+    global _database_manager
+    if _database_manager is None:
+        _database_manager = DatabaseManager()  # db_path 파라미터 제거
+    return _database_manager
+
+def get_async_database_manager() -> AsyncDatabase:
+    """
+    async 라우터용 데이터베이스 매니저를 반환합니다.
+    모든 메서드가 DB 전용 스레드 풀에서 실행되므로 await 로 호출합니다.
+    """
+    return AsyncDatabase(get_database_manager())
+
+def get_unit_of_work() -> Iterator[AsyncDatabase]:
+    """
+    요청 하나의 DB 호출이 세션 하나를 공유하는 async 라우터용 매니저를 반환합니다. (조회용, 단일 writer 잠금을 잡지 않음)
+    요청이 정상 처리되면 커밋하고, 오류가 나면 롤백합니다.
+    호출은 순서대로 await 해야 하므로 동시 조회(asyncio.gather)를 하는 엔드포인트에는 사용하지 않습니다.
+    """
+    with get_database_manager().unit_of_work(write=False) as db:
+        yield AsyncDatabase(db)
 
 def get_sqlalchemy_database_manager() -> SQLAlchemyDatabaseManager:
     """SQLAlchemy 데이터베이스 매니저 인스턴스를 반환합니다."""
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 from datetime import datetime, date
@@ -15,6 +16,9 @@ from api.routers import data_collection, data_viewer, async_collection
 from api.dependencies import get_database_manager, get_sqlalchemy_database_manager
 from database.models import DatabaseManager
 from database.config import db_config
+from database.async_db import shutdown_db_executor
+from platforms.http_session import http_session_manager
+from api.services.async_task_manager import task_manager
 from utils.logger import get_logger
 
 # 로거 설정
@@ -57,8 +61,20 @@ async def startup_event():
     """서버 시작 시 실행되는 이벤트"""
     logger.info("🚀 API 서버 시작 중...")
     initialize_database()
+    task_manager.start_worker()
+    logger.info("🔁 비동기 작업 워커 시작 (중단된 작업 자동 재개)")
     logger.info("🎉 API 서버 준비 완료!")
 
+# 서버 종료 시 이벤트
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 실행되는 이벤트"""
+    logger.info("🛑 API 서버 종료 중...")
+    await task_manager.stop_worker()
+    await http_session_manager.close_all()
+    logger.info("✅ 플랫폼 HTTP 세션 정리 완료")
+    shutdown_db_executor()
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -68,6 +84,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 큰 목록/검색/내보내기 응답 압축 (작은 응답은 압축 비용이 더 크므로 제외)
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "1024")))
+
 # 라우터 등록
 app.include_router(data_collection.router, prefix="/api/v1/collection", tags=["데이터 수집"])
 app.include_router(data_viewer.router, prefix="/api/v1/data", tags=["데이터 조회"])
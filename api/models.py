@@ -116,12 +116,13 @@ class NaverBoardListResponse(BaseModel):
 class PaginatedResponse(BaseModel):
     """페이지네이션 응답 모델"""
     data: List[Any] = Field(..., description="데이터 목록")
-    total: int = Field(..., description="전체 데이터 수")
+    total: Optional[int] = Field(None, description="전체 데이터 수 (커서 모드에서는 계산하지 않음)")
     page: int = Field(..., description="현재 페이지")
     limit: int = Field(..., description="페이지당 데이터 수")
-    total_pages: int = Field(..., description="전체 페이지 수")
+    total_pages: Optional[int] = Field(None, description="전체 페이지 수 (커서 모드에서는 계산하지 않음)")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
     has_prev: bool = Field(..., description="이전 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 None)")
 
 # 데이터 모델들
 class Article(BaseModel):
@@ -196,23 +197,31 @@ class SearchRequest(BaseModel):
     page: int = Field(1, ge=1, description="페이지 번호")
     limit: int = Field(20, ge=1, le=1000, description="페이지당 데이터 수")
 
+class SearchResultItem(BaseModel):
+    """검색 결과 정렬 순서 항목"""
+    type: str = Field(..., description="데이터 타입 (article, comment, review)")
+    id: int = Field(..., description="데이터 ID")
+
 class SearchResponse(BaseModel):
     """키워드 검색 응답 모델"""
     articles: List[Article] = Field(..., description="검색된 게시글 목록")
     comments: List[Comment] = Field(..., description="검색된 댓글 목록")
     reviews: List[Review] = Field(..., description="검색된 후기 목록")
-    total_counts: Dict[str, int] = Field(..., description="타입별 총 개수")
+    total_counts: Dict[str, int] = Field(..., description="타입별 총 개수 (커서 모드에서는 빈 값)")
     page: int = Field(..., description="현재 페이지")
     limit: int = Field(..., description="페이지당 데이터 수")
-    total_pages: int = Field(..., description="전체 페이지 수")
+    total_pages: Optional[int] = Field(None, description="전체 페이지 수 (커서 모드에서는 계산하지 않음)")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
     has_prev: bool = Field(..., description="이전 페이지 존재 여부")
     search_info: Dict[str, Any] = Field(..., description="검색 조건 정보")
+    results: List[SearchResultItem] = Field(default_factory=list, description="작성일 역순으로 정렬된 전체 결과 순서")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 None)")
 
 # Bulk Get API 모델들
 class BulkGetRequest(BaseModel):
     """Bulk Get 요청 모델"""
-    ids: List[int] = Field(..., description="조회할 ID 목록", min_items=1, max_items=100)
+    ids: List[int] = Field(..., description="조회할 ID 목록", min_items=1, max_items=50000)
+    stream: bool = Field(False, description="NDJSON 스트리밍 응답 여부 (대량 조회용)")
 
 class BulkGetResponse(BaseModel):
     """Bulk Get 응답 모델"""
@@ -13,6 +13,11 @@ from api.services.callback_service import callback_service
 
 router = APIRouter(prefix="/async-collection", tags=["비동기 수집"])
 
+# 서버 재시작/워커 장애 후 작업을 이어서 실행할 수 있도록 작업 타입별 실행 함수 등록
+task_manager.register_runner(TaskType.BABITALK_COLLECT, AsyncCollectionService.collect_babitalk_data)
+task_manager.register_runner(TaskType.GANGNAMUNNI_COLLECT, AsyncCollectionService.collect_gangnamunni_data)
+task_manager.register_runner(TaskType.NAVER_COLLECT, AsyncCollectionService.collect_naver_data)
+
 # 요청 모델들
 class BabitalkCollectionRequest(BaseModel):
     """바비톡 수집 요청 모델"""
@@ -54,7 +59,7 @@ async def start_babitalk_collection(request: BabitalkCollectionRequest):
     """
     try:
         # 작업 생성
-        task_id = task_manager.create_task(
+        task_id = await task_manager.create_task(
             TaskType.BABITALK_COLLECT,
             {
                 "target_date": request.target_date,
@@ -63,7 +68,7 @@ async def start_babitalk_collection(request: BabitalkCollectionRequest):
         )
         
         # 작업 시작
-        success = task_manager.start_task(
+        success = await task_manager.start_task(
             task_id,
             AsyncCollectionService.collect_babitalk_data,
             request.target_date,
@@ -112,7 +117,7 @@ async def start_gangnamunni_collection(request: GangnamunniCollectionRequest):
     
     try:
         # 작업 생성
-        task_id = task_manager.create_task(
+        task_id = await task_manager.create_task(
             TaskType.GANGNAMUNNI_COLLECT,
             {
                 "target_date": request.target_date,
@@ -122,7 +127,7 @@ async def start_gangnamunni_collection(request: GangnamunniCollectionRequest):
         )
         
         # 작업 시작
-        success = task_manager.start_task(
+        success = await task_manager.start_task(
             task_id,
             AsyncCollectionService.collect_gangnamunni_data,
             request.target_date,
@@ -160,7 +165,7 @@ async def start_naver_collection(request: NaverCollectionRequest):
     """
     try:
         # 작업 생성
-        task_id = task_manager.create_task(
+        task_id = await task_manager.create_task(
             TaskType.NAVER_COLLECT,
             {
                 "cafe_id": request.cafe_id,
@@ -171,7 +176,7 @@ async def start_naver_collection(request: NaverCollectionRequest):
         )
         
         # 작업 시작
-        success = task_manager.start_task(
+        success = await task_manager.start_task(
             task_id,
             AsyncCollectionService.collect_naver_data,
             request.cafe_id,
@@ -199,7 +204,7 @@ async def get_task_status(task_id: str):
     
     특정 작업의 진행 상황과 결과를 조회합니다.
     """
-    task_status = task_manager.get_task_status(task_id)
+    task_status = await task_manager.get_task_status(task_id)
     
     if not task_status:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
@@ -213,7 +218,7 @@ async def get_all_tasks():
     
     현재 진행 중이거나 완료된 모든 작업의 상태를 조회합니다.
     """
-    return task_manager.get_all_tasks()
+    return await task_manager.get_all_tasks()
 
 @router.delete("/task/{task_id}")
 async def cancel_task(task_id: str):
@@ -222,7 +227,7 @@ async def cancel_task(task_id: str):
     
     진행 중인 작업을 취소합니다.
     """
-    success = task_manager.cancel_task(task_id)
+    success = await task_manager.cancel_task(task_id)
     
     if not success:
         raise HTTPException(status_code=400, detail="작업을 취소할 수 없습니다")
@@ -236,7 +241,7 @@ async def cleanup_old_tasks(max_age_hours: int = 24):
     
     완료된 오래된 작업들을 정리합니다.
     """
-    task_manager.cleanup_old_tasks(max_age_hours)
+    await task_manager.cleanup_old_tasks(max_age_hours)
     return {"message": f"{max_age_hours}시간 이상 된 완료된 작업들이 정리되었습니다"}
 
 @router.get("/status/summary")
@@ -246,7 +251,7 @@ async def get_status_summary():
     
     현재 실행 중인 작업 수, 완료된 작업 수 등의 요약 정보를 제공합니다.
     """
-    all_tasks = task_manager.get_all_tasks()
+    all_tasks = await task_manager.get_all_tasks()
     
     summary = {
         "total_tasks": len(all_tasks),
@@ -14,6 +14,7 @@ from api.models import (
 from api.dependencies import get_database_manager
 from database.models import DatabaseManager
 from api.services.callback_service import callback_service
+from platforms.circuit_breaker import circuit_breakers
 
 # 수집기 import
 from collectors.gannamunni_collector import GangnamUnniDataCollector
@@ -88,6 +89,29 @@ async def get_collection_status():
         "timestamp": datetime.now().isoformat()
     }
 
+@router.get("/circuit-breakers")
+async def get_circuit_breaker_status():
+    """
+    호스트별 서킷 브레이커 상태를 확인합니다.
+    OPEN 상태인 호스트는 표시된 시간 동안 요청이 중단되며 다른 호스트 수집은 계속 진행됩니다.
+    """
+    return {
+        "hosts": circuit_breakers.get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+@router.post("/circuit-breakers/reset")
+async def reset_circuit_breakers(host: Optional[str] = Query(None, description="초기화할 호스트 (미지정 시 전체)")):
+    """
+    서킷 브레이커 상태를 초기화합니다.
+    """
+    circuit_breakers.reset(host)
+    return {
+        "message": f"{host or '전체'} 서킷 브레이커가 초기화되었습니다.",
+        "hosts": circuit_breakers.get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
 @router.get("/boards/naver/{cafe_id}", response_model=NaverBoardListResponse)
 async def get_naver_board_list(
     cafe_id: str,
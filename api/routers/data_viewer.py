@@ -1,17 +1,35 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Dict, Any, Iterator, Callable, Awaitable
+from collections import deque
 from datetime import datetime
+import asyncio
+import csv
+import io
+import json
 
 from api.models import (
     Article, Review, Comment, PaginatedResponse, PlatformType, 
     SearchRequest, SearchResponse, DataType, BulkGetRequest, BulkGetResponse
 )
-from api.dependencies import get_database_manager
+from api.dependencies import get_async_database_manager, get_unit_of_work
 from api.utils.url_generator import ArticleURLGenerator
-from database.models import DatabaseManager
+from api.utils.response_cache import cached_response
+from api.utils.serialization import FastJSONResponse, dumps
+from database.async_db import AsyncDatabase, DB_THREAD_POOL_SIZE, run_db
+from database.pagination import decode_cursor, split_page
+from database.sqlalchemy_manager import BULK_CHUNK_SIZE
 
 router = APIRouter()
 
+def _validate_cursor(cursor: Optional[str]):
+    """커서 형식 검증 (잘못된 커서는 400)"""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
 def _parse_naver_cafe_filter(naver_cafes: Optional[str]) -> Optional[List[str]]:
     """
     네이버 카페 필터를 파싱하여 카페명 리스트로 변환
@@ -51,18 +69,93 @@ def _parse_naver_cafe_filter(naver_cafes: Optional[str]) -> Optional[List[str]]:
     
     return cafe_names if cafe_names else None
 
+# DB 조회 결과(매니저의 딕셔너리)는 이미 응답 형식이므로 Pydantic 모델을 만들어 검증하지 않고
+# 응답 모델(Article/Comment/Review)과 같은 키 순서의 딕셔너리로 바로 변환합니다.
+def _article_item(article: Dict[str, Any], article_url: Optional[str] = None) -> Dict[str, Any]:
+    """게시글 행 -> Article 응답 형식"""
+    return {
+        "id": article['id'],
+        "platform_id": article['platform_id'],
+        "community_article_id": article['community_article_id'],
+        "community_id": article['community_id'],
+        "title": article['title'],
+        "content": article['content'],
+        "images": article['images'],
+        "writer_nickname": article['writer_nickname'],
+        "writer_id": article['writer_id'],
+        "like_count": article['like_count'],
+        "comment_count": article['comment_count'],
+        "view_count": article['view_count'],
+        "created_at": article['created_at'],
+        "category_name": article['category_name'],
+        "collected_at": article['collected_at'],
+        "article_url": article_url
+    }
+
+def _comment_item(comment: Dict[str, Any], comment_url: Optional[str] = None, community_id: int = 1) -> Dict[str, Any]:
+    """댓글 행 -> Comment 응답 형식 (community_article_id/community_comment_id 를 comment_id 로 매핑)"""
+    return {
+        "id": comment['id'],
+        "platform_id": comment['platform_id'],
+        "community_article_id": comment['community_article_id'],
+        "community_id": comment.get('community_id', community_id),
+        "comment_id": comment['community_comment_id'],
+        "parent_comment_id": comment.get('parent_comment_id'),
+        "content": comment['content'],
+        "writer_nickname": comment['writer_nickname'],
+        "writer_id": comment['writer_id'],
+        "like_count": comment.get('like_count', 0),
+        "created_at": comment['created_at'],
+        "collected_at": comment['collected_at'],
+        "comment_url": comment_url
+    }
+
+def _review_item(review: Dict[str, Any], article_url: Optional[str] = None) -> Dict[str, Any]:
+    """후기 행 -> Review 응답 형식"""
+    return {
+        "id": review['id'],
+        "platform_id": review['platform_id'],
+        "platform_review_id": review['platform_review_id'],
+        "community_id": review['community_id'],
+        "title": review['title'],
+        "content": review['content'],
+        "images": review['images'],
+        "writer_nickname": review['writer_nickname'],
+        "writer_id": review['writer_id'],
+        "like_count": review['like_count'],
+        "rating": review['rating'],
+        "price": review['price'],
+        "categories": review['categories'],
+        "sub_categories": review['sub_categories'],
+        "surgery_date": review['surgery_date'],
+        "hospital_name": review['hospital_name'],
+        "doctor_name": review['doctor_name'],
+        "is_blind": review['is_blind'],
+        "is_image_blur": review['is_image_blur'],
+        "is_certificated_review": review['is_certificated_review'],
+        "created_at": review['created_at'],
+        "collected_at": review['collected_at'],
+        "article_url": article_url
+    }
+
 @router.get("/articles", response_model=PaginatedResponse)
+@cached_response(platforms=lambda params: [params["platform"]] if params["platform"] else None)
 async def get_articles(
     platform: Optional[PlatformType] = Query(None, description="플랫폼 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=1000, description="페이지당 데이터 수"),
-    db: DatabaseManager = Depends(get_database_manager)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 대신 사용)"),
+    db: AsyncDatabase = Depends(get_unit_of_work)
 ):
     """
     게시글 목록을 조회합니다.
+    
+    page 로 조회하거나(UI), 응답의 next_cursor 를 cursor 로 넘겨 다음 페이지를 조회합니다(동기화 작업).
+    커서 모드는 페이지 깊이와 관계없이 조회 비용이 일정하며, 전체 개수는 계산하지 않습니다.
     """
     try:
+        _validate_cursor(cursor)
         offset = (page - 1) * limit
         
         # 필터 조건 구성
@@ -73,42 +166,31 @@ async def get_articles(
             filters["category_name"] = category
         
         # 게시글 조회
-        articles = db.get_articles_by_filters(filters, limit=limit, offset=offset)
-        total = db.get_articles_count_by_filters(filters)
+        articles, next_cursor = split_page(
+            await db.get_articles_by_filters(filters, limit=limit + 1, offset=offset, cursor=cursor), limit
+        )
+        total = None if cursor else await db.get_articles_count_by_filters(filters)
         
         # 응답 데이터 변환
         article_responses = []
         for article in articles:
-            article_responses.append(Article(
-                id=article['id'],
-                platform_id=article['platform_id'],
-                community_article_id=article['community_article_id'],
-                community_id=article['community_id'],
-                title=article['title'],
-                content=article['content'],
-                writer_nickname=article['writer_nickname'],
-                writer_id=article['writer_id'],
-                like_count=article['like_count'],
-                comment_count=article['comment_count'],
-                view_count=article['view_count'],
-                images=article['images'],
-                created_at=article['created_at'],
-                category_name=article['category_name'],
-                collected_at=article['collected_at']
-            ))
-        
-        total_pages = (total + limit - 1) // limit
-        
-        return PaginatedResponse(
-            data=article_responses,
-            total=total,
-            page=page,
-            limit=limit,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
-        )
+            article_responses.append(_article_item(article))
         
+        total_pages = None if cursor else (total + limit - 1) // limit
+        
+        return {
+            "data": article_responses,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "has_next": next_cursor is not None,
+            "has_prev": bool(cursor) or page > 1,
+            "next_cursor": next_cursor
+        }
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -116,17 +198,23 @@ async def get_articles(
         )
 
 @router.get("/reviews", response_model=PaginatedResponse)
+@cached_response(platforms=lambda params: [params["platform"]] if params["platform"] else None)
 async def get_reviews(
     platform: Optional[PlatformType] = Query(None, description="플랫폼 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 데이터 수"),
-    db: DatabaseManager = Depends(get_database_manager)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 대신 사용)"),
+    db: AsyncDatabase = Depends(get_unit_of_work)
 ):
     """
     후기 목록을 조회합니다.
+    
+    page 로 조회하거나(UI), 응답의 next_cursor 를 cursor 로 넘겨 다음 페이지를 조회합니다(동기화 작업).
+    커서 모드는 페이지 깊이와 관계없이 조회 비용이 일정하며, 전체 개수는 계산하지 않습니다.
     """
     try:
+        _validate_cursor(cursor)
         offset = (page - 1) * limit
         
         # 필터 조건 구성
@@ -137,49 +225,31 @@ async def get_reviews(
             filters["category_name"] = category
         
         # 후기 조회
-        reviews = db.get_reviews_by_filters(filters, limit=limit, offset=offset)
-        total = db.get_reviews_count_by_filters(filters)
+        reviews, next_cursor = split_page(
+            await db.get_reviews_by_filters(filters, limit=limit + 1, offset=offset, cursor=cursor), limit
+        )
+        total = None if cursor else await db.get_reviews_count_by_filters(filters)
         
         # 응답 데이터 변환
         review_responses = []
         for review in reviews:
-            review_responses.append(Review(
-                id=review['id'],
-                platform_id=review['platform_id'],
-                platform_review_id=review['platform_review_id'],
-                community_id=review['community_id'],
-                title=review['title'],
-                content=review['content'],
-                writer_nickname=review['writer_nickname'],
-                writer_id=review['writer_id'],
-                like_count=review['like_count'],
-                rating=review['rating'],
-                price=review['price'],
-                images=review['images'],
-                categories=review['categories'],
-                sub_categories=review['sub_categories'],
-                surgery_date=review['surgery_date'],
-                hospital_name=review['hospital_name'],
-                doctor_name=review['doctor_name'],
-                is_blind=review['is_blind'],
-                is_image_blur=review['is_image_blur'],
-                is_certificated_review=review['is_certificated_review'],
-                created_at=review['created_at'],
-                collected_at=review['collected_at']
-            ))
-        
-        total_pages = (total + limit - 1) // limit
-        
-        return PaginatedResponse(
-            data=review_responses,
-            total=total,
-            page=page,
-            limit=limit,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
-        )
+            review_responses.append(_review_item(review))
+        
+        total_pages = None if cursor else (total + limit - 1) // limit
+        
+        return {
+            "data": review_responses,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "has_next": next_cursor is not None,
+            "has_prev": bool(cursor) or page > 1,
+            "next_cursor": next_cursor
+        }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -187,17 +257,23 @@ async def get_reviews(
         )
 
 @router.get("/comments", response_model=PaginatedResponse)
+@cached_response(platforms=lambda params: [params["platform"]] if params["platform"] else None)
 async def get_comments(
     platform: Optional[PlatformType] = Query(None, description="플랫폼 필터"),
     article_id: Optional[str] = Query(None, description="게시글 ID 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 데이터 수"),
-    db: DatabaseManager = Depends(get_database_manager)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 대신 사용)"),
+    db: AsyncDatabase = Depends(get_unit_of_work)
 ):
     """
     댓글 목록을 조회합니다.
+    
+    page 로 조회하거나(UI), 응답의 next_cursor 를 cursor 로 넘겨 다음 페이지를 조회합니다(동기화 작업).
+    커서 모드는 페이지 깊이와 관계없이 조회 비용이 일정하며, 전체 개수는 계산하지 않습니다.
     """
     try:
+        _validate_cursor(cursor)
         offset = (page - 1) * limit
         
         # 필터 조건 구성
@@ -208,39 +284,31 @@ async def get_comments(
             filters["community_article_id"] = article_id
         
         # 댓글 조회
-        comments = db.get_comments_by_filters(filters, limit=limit, offset=offset)
-        total = db.get_comments_count_by_filters(filters)
+        comments, next_cursor = split_page(
+            await db.get_comments_by_filters(filters, limit=limit + 1, offset=offset, cursor=cursor), limit
+        )
+        total = None if cursor else await db.get_comments_count_by_filters(filters)
         
         # 응답 데이터 변환
         comment_responses = []
         for comment in comments:
-            comment_responses.append(Comment(
-                id=comment['id'],
-                platform_id=comment['platform_id'],
-                community_article_id=comment['community_article_id'],
-                community_id=comment.get('community_id', 1),  # 기본값 설정
-                comment_id=comment['community_comment_id'],  # 필드명 수정
-                parent_comment_id=comment['parent_comment_id'],
-                content=comment['content'],
-                writer_nickname=comment['writer_nickname'],
-                writer_id=comment['writer_id'],
-                like_count=comment.get('like_count', 0),  # 기본값 설정
-                created_at=comment['created_at'],
-                collected_at=comment['collected_at']
-            ))
-        
-        total_pages = (total + limit - 1) // limit
-        
-        return PaginatedResponse(
-            data=comment_responses,
-            total=total,
-            page=page,
-            limit=limit,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
-        )
+            comment_responses.append(_comment_item(comment))
+        
+        total_pages = None if cursor else (total + limit - 1) // limit
         
+        return {
+            "data": comment_responses,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "has_next": next_cursor is not None,
+            "has_prev": bool(cursor) or page > 1,
+            "next_cursor": next_cursor
+        }
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -250,36 +318,20 @@ async def get_comments(
 @router.get("/articles/{article_id}", response_model=Article)
 async def get_article(
     article_id: int,
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     특정 게시글을 조회합니다.
     """
     try:
-        article = db.get_article_by_id(article_id)
+        article = await db.get_article_by_id(article_id)
         if not article:
             raise HTTPException(
                 status_code=404,
                 detail="게시글을 찾을 수 없습니다."
             )
         
-        return Article(
-            id=article['id'],
-            platform_id=article['platform_id'],
-            community_article_id=article['community_article_id'],
-            community_id=article['community_id'],
-            title=article['title'],
-            content=article['content'],
-            writer_nickname=article['writer_nickname'],
-            writer_id=article['writer_id'],
-            like_count=article['like_count'],
-            comment_count=article['comment_count'],
-            view_count=article['view_count'],
-            images=article['images'],
-            created_at=article['created_at'],
-            category_name=article['category_name'],
-            collected_at=article['collected_at']
-        )
+        return _article_item(article)
         
     except HTTPException:
         raise
@@ -292,43 +344,20 @@ async def get_article(
 @router.get("/reviews/{review_id}", response_model=Review)
 async def get_review(
     review_id: int,
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     특정 후기를 조회합니다.
     """
     try:
-        review = db.get_review_by_id(review_id)
+        review = await db.get_review_by_id(review_id)
         if not review:
             raise HTTPException(
                 status_code=404,
                 detail="후기를 찾을 수 없습니다."
             )
         
-        return Review(
-            id=review['id'],
-            platform_id=review['platform_id'],
-            platform_review_id=review['platform_review_id'],
-            community_id=review['community_id'],
-            title=review['title'],
-            content=review['content'],
-            writer_nickname=review['writer_nickname'],
-            writer_id=review['writer_id'],
-            like_count=review['like_count'],
-            rating=review['rating'],
-            price=review['price'],
-            images=review['images'],
-            categories=review['categories'],
-            sub_categories=review['sub_categories'],
-            surgery_date=review['surgery_date'],
-            hospital_name=review['hospital_name'],
-            doctor_name=review['doctor_name'],
-            is_blind=review['is_blind'],
-            is_image_blur=review['is_image_blur'],
-            is_certificated_review=review['is_certificated_review'],
-            created_at=review['created_at'],
-            collected_at=review['collected_at']
-        )
+        return _review_item(review)
         
     except HTTPException:
         raise
@@ -341,33 +370,20 @@ async def get_review(
 @router.get("/comments/{comment_id}", response_model=Comment)
 async def get_comment(
     comment_id: int,
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     특정 댓글을 조회합니다.
     """
     try:
-        comment = db.get_comment_by_id(comment_id)
+        comment = await db.get_comment_by_id(comment_id)
         if not comment:
             raise HTTPException(
                 status_code=404,
                 detail="댓글을 찾을 수 없습니다."
             )
         
-        return Comment(
-            id=comment['id'],
-            platform_id=comment['platform_id'],
-            community_article_id=comment['community_article_id'],
-            community_id=comment.get('community_id', 1),  # 기본값 설정
-            comment_id=comment['community_comment_id'],  # 필드명 수정
-            parent_comment_id=comment['parent_comment_id'],
-            content=comment['content'],
-            writer_nickname=comment['writer_nickname'],
-            writer_id=comment['writer_id'],
-            like_count=comment.get('like_count', 0),  # 기본값 설정
-            created_at=comment['created_at'],
-            collected_at=comment['collected_at']
-        )
+        return _comment_item(comment)
         
     except HTTPException:
         raise
@@ -378,39 +394,29 @@ async def get_comment(
         )
 
 @router.get("/statistics/summary")
+@cached_response()
 async def get_statistics_summary(
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
-    데이터 수집 통계 요약을 조회합니다.
+    데이터 수집 통계 요약을 조회합니다. (일별 집계 테이블 기준)
     """
     try:
-        # 전체 통계
-        total_articles = db.get_articles_count_by_filters({})
-        total_reviews = db.get_reviews_count_by_filters({})
-        total_comments = db.get_comments_count_by_filters({})
-        
-        # 플랫폼별 통계
-        gangnamunni_articles = db.get_articles_count_by_filters({"platform_id": "gangnamunni"})
-        babitalk_articles = db.get_articles_count_by_filters({"platform_id": "babitalk"})
-        gangnamunni_reviews = db.get_reviews_count_by_filters({"platform_id": "gangnamunni"})
-        babitalk_reviews = db.get_reviews_count_by_filters({"platform_id": "babitalk"})
+        stats = await db.get_statistics()
+        platform_stats = stats["platform_stats"]
         
         return {
             "total": {
-                "articles": total_articles,
-                "reviews": total_reviews,
-                "comments": total_comments
+                "articles": stats["total_articles"],
+                "reviews": stats["total_reviews"],
+                "comments": stats["total_comments"]
             },
             "by_platform": {
-                "gangnamunni": {
-                    "articles": gangnamunni_articles,
-                    "reviews": gangnamunni_reviews
-                },
-                "babitalk": {
-                    "articles": babitalk_articles,
-                    "reviews": babitalk_reviews
+                platform: {
+                    "articles": platform_stats.get(platform, {}).get("articles", 0),
+                    "reviews": platform_stats.get(platform, {}).get("reviews", 0)
                 }
+                for platform in ("gangnamunni", "babitalk")
             },
             "timestamp": datetime.now().isoformat()
         }
@@ -421,7 +427,81 @@ async def get_statistics_summary(
             detail=f"통계 조회 실패: {str(e)}"
         )
 
+@router.get("/statistics/daily")
+async def get_daily_statistics(
+    date: Optional[str] = Query(None, description="조회 날짜 (YYYY-MM-DD, 기본값: 오늘)"),
+    db: AsyncDatabase = Depends(get_async_database_manager)
+):
+    """
+    특정 날짜의 데이터 타입별/플랫폼별 수집 건수를 조회합니다.
+    """
+    try:
+        target_date = date or datetime.now().strftime("%Y-%m-%d")
+        try:
+            datetime.strptime(target_date, '%Y-%m-%d')
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="날짜는 YYYY-MM-DD 형식이어야 합니다."
+            )
+        
+        return {
+            **(await db.get_daily_statistics(target_date)),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"일별 통계 조회 실패: {str(e)}"
+        )
+
+@router.get("/statistics/trends")
+async def get_trend_statistics(
+    days: int = Query(7, ge=1, le=365, description="조회 기간 (오늘 포함 최근 N일)"),
+    db: AsyncDatabase = Depends(get_async_database_manager)
+):
+    """
+    최근 N일간 날짜별 게시글/댓글/후기 수집 건수를 조회합니다.
+    """
+    try:
+        return {
+            "days": days,
+            **(await db.get_trend_statistics(days)),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"트렌드 통계 조회 실패: {str(e)}"
+        )
+
+@router.get("/statistics/platforms/{platform_id}")
+async def get_platform_statistics(
+    platform_id: str,
+    db: AsyncDatabase = Depends(get_async_database_manager)
+):
+    """
+    특정 플랫폼의 데이터 타입별 수집 건수를 조회합니다.
+    """
+    try:
+        return {
+            "platform_id": platform_id,
+            **(await db.get_platform_statistics(platform_id)),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"플랫폼 통계 조회 실패: {str(e)}"
+        )
+
 @router.get("/search", response_model=SearchResponse)
+@cached_response(platforms=lambda params: params["platforms"].split(",") if params["platforms"] else None)
 async def search_data_by_keywords(
     keywords: str = Query(..., description="검색 키워드 (콤마로 구분)"),
     platforms: Optional[str] = Query(None, description="플랫폼 필터 (콤마로 구분, 예: gangnamunni,babitalk)"),
@@ -431,7 +511,8 @@ async def search_data_by_keywords(
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=1000, description="페이지당 데이터 수"),
-    db: DatabaseManager = Depends(get_database_manager)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 대신 사용)"),
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     키워드로 게시글, 댓글, 후기를 검색합니다.
@@ -444,6 +525,9 @@ async def search_data_by_keywords(
     - **end_date**: 검색 종료 날짜 (YYYY-MM-DD 형식)
     - **page**: 페이지 번호 (기본값: 1)
     - **limit**: 페이지당 데이터 수 (기본값: 20, 최대: 100)
+    - **cursor**: 다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 대신 사용하며 개수는 계산하지 않음)
+    
+    게시글/댓글/후기를 합쳐 작성일 역순으로 페이지를 나누며, results 에 전체 정렬 순서가 담깁니다.
     """
     try:
         # 키워드 파싱
@@ -502,11 +586,13 @@ async def search_data_by_keywords(
                     detail="종료 날짜는 YYYY-MM-DD 형식이어야 합니다."
                 )
         
+        _validate_cursor(cursor)
+        
         # 페이지네이션 계산
         offset = (page - 1) * limit
         
-        # 데이터베이스에서 검색
-        search_results = db.search_data_by_keywords(
+        # 통합 검색 인덱스에서 검색 (전체 작성일 순서 기준 페이지 + 타입별 총 개수)
+        search_results = await db.search_documents_by_keywords(
             keywords=keyword_list,
             platforms=platform_list,
             data_types=data_type_list,
@@ -514,18 +600,11 @@ async def search_data_by_keywords(
             end_date=end_date,
             naver_cafes=naver_cafe_list,
             limit=limit,
-            offset=offset
-        )
-        
-        # 총 개수 조회
-        total_counts = db.search_data_count_by_keywords(
-            keywords=keyword_list,
-            platforms=platform_list,
-            data_types=data_type_list,
-            start_date=start_date,
-            end_date=end_date,
-            naver_cafes=naver_cafe_list
+            offset=offset,
+            cursor=cursor,
+            with_counts=cursor is None
         )
+        total_counts = search_results['total_counts'] if cursor is None else {}
         
         # 응답 데이터 변환
         from api.utils.url_generator import ArticleURLGenerator
@@ -539,24 +618,7 @@ async def search_data_by_keywords(
                 category_name=article['category_name']
             )
             
-            article_responses.append(Article(
-                id=article['id'],
-                platform_id=article['platform_id'],
-                community_article_id=article['community_article_id'],
-                community_id=article['community_id'],
-                title=article['title'],
-                content=article['content'],
-                writer_nickname=article['writer_nickname'],
-                writer_id=article['writer_id'],
-                like_count=article['like_count'],
-                comment_count=article['comment_count'],
-                view_count=article['view_count'],
-                images=article['images'],
-                created_at=article['created_at'],
-                category_name=article['category_name'],
-                collected_at=article['collected_at'],
-                article_url=article_url
-            ))
+            article_responses.append(_article_item(article, article_url))
         
         comment_responses = []
         for comment in search_results['comments']:
@@ -568,21 +630,7 @@ async def search_data_by_keywords(
                 category_name=comment.get('category_name')
             )
             
-            comment_responses.append(Comment(
-                id=comment['id'],
-                platform_id=comment['platform_id'],
-                community_article_id=comment['community_article_id'],
-                community_id=comment.get('community_id', 1),
-                comment_id=comment['community_comment_id'],
-                parent_comment_id=comment['parent_comment_id'],
-                content=comment['content'],
-                writer_nickname=comment['writer_nickname'],
-                writer_id=comment['writer_id'],
-                like_count=comment.get('like_count', 0),
-                created_at=comment['created_at'],
-                collected_at=comment['collected_at'],
-                comment_url=comment_url
-            ))
+            comment_responses.append(_comment_item(comment, comment_url))
         
         review_responses = []
         for review in search_results['reviews']:
@@ -593,35 +641,11 @@ async def search_data_by_keywords(
                 category_name=review.get('categories')
             )
             
-            review_responses.append(Review(
-                id=review['id'],
-                platform_id=review['platform_id'],
-                platform_review_id=review['platform_review_id'],
-                community_id=review['community_id'],
-                title=review['title'],
-                content=review['content'],
-                writer_nickname=review['writer_nickname'],
-                writer_id=review['writer_id'],
-                like_count=review['like_count'],
-                rating=review['rating'],
-                price=review['price'],
-                images=review['images'],
-                categories=review['categories'],
-                sub_categories=review['sub_categories'],
-                surgery_date=review['surgery_date'],
-                hospital_name=review['hospital_name'],
-                doctor_name=review['doctor_name'],
-                is_blind=review['is_blind'],
-                is_image_blur=review['is_image_blur'],
-                is_certificated_review=review['is_certificated_review'],
-                created_at=review['created_at'],
-                collected_at=review['collected_at'],
-                article_url=review_url
-            ))
+            review_responses.append(_review_item(review, review_url))
         
         # 페이지네이션 정보 계산
-        total_results = sum(total_counts.values())
-        total_pages = (total_results + limit - 1) // limit if total_results > 0 else 1
+        total_results = search_results['total']
+        total_pages = None if cursor else ((total_results + limit - 1) // limit if total_results > 0 else 1)
         
         # 검색 정보 구성
         search_info = {
@@ -634,18 +658,20 @@ async def search_data_by_keywords(
             "timestamp": datetime.now().isoformat()
         }
         
-        return SearchResponse(
-            articles=article_responses,
-            comments=comment_responses,
-            reviews=review_responses,
-            total_counts=total_counts,
-            page=page,
-            limit=limit,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
-            search_info=search_info
-        )
+        return {
+            "articles": article_responses,
+            "comments": comment_responses,
+            "reviews": review_responses,
+            "total_counts": total_counts,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "has_next": search_results['next_cursor'] is not None,
+            "has_prev": bool(cursor) or page > 1,
+            "search_info": search_info,
+            "results": [{"type": item['type'], "id": item['id']} for item in search_results['results']],
+            "next_cursor": search_results['next_cursor']
+        }
         
     except HTTPException:
         raise
@@ -655,53 +681,146 @@ async def search_data_by_keywords(
             detail=f"키워드 검색 실패: {str(e)}"
         )
 
+def _format_export_batch(batch: List[Dict[str, Any]], fields: List[str], export_format: str) -> str:
+    """내보내기 배치를 NDJSON 또는 CSV 텍스트로 변환"""
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([row[field] for field in fields] for row in batch)
+        return buffer.getvalue()
+    return "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in batch)
+
+async def _stream_export(batches: Iterator[List[Dict[str, Any]]], fields: List[str], export_format: str):
+    """DB 스레드 풀에서 배치를 하나씩 가져와 바로 전송 (전체 결과를 메모리에 올리지 않음)"""
+    try:
+        if export_format == "csv":
+            yield _format_export_batch([dict(zip(fields, fields))], fields, export_format)
+        while True:
+            batch = await run_db(next, batches, None)
+            if batch is None:
+                break
+            yield _format_export_batch(batch, fields, export_format)
+    finally:
+        # 클라이언트 연결이 끊겨도 서버 측 커서와 세션 정리
+        await run_db(batches.close)
+
+@router.get("/export")
+async def export_data(
+    data_type: DataType = Query(..., description="데이터 타입 (article, comment, review)"),
+    platforms: Optional[str] = Query(None, description="플랫폼 필터 (콤마로 구분, 예: gangnamunni,babitalk)"),
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="출력 형식 (ndjson, csv)"),
+    db: AsyncDatabase = Depends(get_async_database_manager)
+):
+    """
+    조건에 맞는 전체 데이터를 작성일 순서로 스트리밍합니다.
+    
+    페이지 단위 조회 없이 서버 측 커서로 끝까지 읽어 바로 전송하므로,
+    기간 전체를 동기화하는 작업은 /articles, /search 를 페이지마다 호출하는 대신 이 API 를 사용합니다.
+    
+    - **format=ndjson**: 한 줄에 JSON 객체 하나
+    - **format=csv**: 첫 줄 헤더 + 데이터 행
+    """
+    platform_list = None
+    if platforms:
+        platform_list = [p.strip() for p in platforms.split(',') if p.strip()]
+        valid_platforms = [p.value for p in PlatformType]
+        for platform in platform_list:
+            if platform not in valid_platforms:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"유효하지 않은 플랫폼: {platform}. 유효한 플랫폼: {', '.join(valid_platforms)}"
+                )
+    
+    for value in (start_date, end_date):
+        if value:
+            try:
+                datetime.strptime(value, '%Y-%m-%d')
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail="날짜는 YYYY-MM-DD 형식이어야 합니다."
+                )
+    
+    fields = await db.get_export_fields(data_type.value)
+    batches = await db.iter_export_batches(data_type.value, platform_list, start_date, end_date)
+    
+    filename = f"{data_type.value}s_{start_date or 'all'}_{end_date or 'all'}.{format}"
+    return StreamingResponse(
+        _stream_export(batches, fields, format),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 # Bulk Get API 엔드포인트들
+async def _fetch_bulk_chunks(fetch: Callable[[List[int]], Awaitable[List[Dict[str, Any]]]], ids: List[int]):
+    """
+    ID 목록을 BULK_CHUNK_SIZE 단위로 나눠 DB 스레드 풀에서 동시에 조회하고 청크 순서대로 결과 반환
+    
+    동시에 조회하는 청크는 DB_THREAD_POOL_SIZE 개까지이며, 앞 청크를 내보내는 동안 다음 청크를 미리 조회합니다.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    pending = deque()
+    try:
+        for i in range(0, len(unique_ids), BULK_CHUNK_SIZE):
+            pending.append(asyncio.ensure_future(fetch(unique_ids[i:i + BULK_CHUNK_SIZE])))
+            if len(pending) >= DB_THREAD_POOL_SIZE:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def _stream_bulk(ids: List[int], fetch: Callable, to_item: Callable[[Dict[str, Any]], Dict[str, Any]]):
+    """조회된 항목을 요청 ID 순서대로 한 줄씩 전송하고 마지막 줄에 요약({"summary": ...}) 전송"""
+    found = set()
+    async for rows in _fetch_bulk_chunks(fetch, ids):
+        found.update(row['id'] for row in rows)
+        if rows:
+            yield b"".join(dumps(to_item(row)) + b"\n" for row in rows)
+    yield dumps({"summary": {
+        "total": len(found),
+        "requested": len(ids),
+        "missing_ids": [id for id in ids if id not in found]
+    }}) + b"\n"
+
+async def _bulk_get(request: BulkGetRequest, fetch: Callable, to_item: Callable[[Dict[str, Any]], Dict[str, Any]]):
+    """Bulk Get 공통 처리 (요청 ID 순서 유지, 누락 ID 보고, stream=true 이면 NDJSON 스트리밍)"""
+    if request.stream:
+        return StreamingResponse(_stream_bulk(request.ids, fetch, to_item), media_type="application/x-ndjson")
+    
+    items = []
+    async for rows in _fetch_bulk_chunks(fetch, request.ids):
+        items.extend(to_item(row) for row in rows)
+    
+    # 조회된 ID와 누락된 ID 계산
+    found_ids = [item['id'] for item in items]
+    found = set(found_ids)
+    missing_ids = [id for id in request.ids if id not in found]
+    
+    return FastJSONResponse({
+        "data": items,
+        "total": len(items),
+        "requested_ids": request.ids,
+        "found_ids": found_ids,
+        "missing_ids": missing_ids
+    })
+
 @router.post("/articles/bulk", response_model=BulkGetResponse)
 async def get_articles_bulk(
     request: BulkGetRequest,
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     ID 목록으로 게시글들을 조회합니다.
     
-    - **ids**: 조회할 게시글 ID 목록 (1-100개)
+    - **ids**: 조회할 게시글 ID 목록 (1-50000개, 결과는 요청 순서대로 반환)
+    - **stream**: true 이면 게시글을 한 줄씩 NDJSON 으로 스트리밍하고 마지막 줄에 요약(누락 ID 포함)을 보냅니다.
     """
     try:
-        # 게시글 조회
-        articles_data = db.get_articles_by_ids(request.ids)
-        
-        # 응답 데이터 변환
-        articles = []
-        for article_data in articles_data:
-            articles.append(Article(
-                id=article_data['id'],
-                platform_id=article_data['platform_id'],
-                community_article_id=article_data['community_article_id'],
-                community_id=article_data['community_id'],
-                title=article_data['title'],
-                content=article_data['content'],
-                writer_nickname=article_data['writer_nickname'],
-                writer_id=article_data['writer_id'],
-                like_count=article_data['like_count'],
-                comment_count=article_data['comment_count'],
-                view_count=article_data['view_count'],
-                images=article_data['images'],
-                created_at=article_data['created_at'],
-                category_name=article_data['category_name'],
-                collected_at=article_data['collected_at']
-            ))
-        
-        # 조회된 ID와 누락된 ID 계산
-        found_ids = [article.id for article in articles]
-        missing_ids = [id for id in request.ids if id not in found_ids]
-        
-        return BulkGetResponse(
-            data=articles,
-            total=len(articles),
-            requested_ids=request.ids,
-            found_ids=found_ids,
-            missing_ids=missing_ids
-        )
+        return await _bulk_get(request, db.get_articles_by_ids, _article_item)
         
     except Exception as e:
         raise HTTPException(
@@ -712,56 +831,16 @@ async def get_articles_bulk(
 @router.post("/reviews/bulk", response_model=BulkGetResponse)
 async def get_reviews_bulk(
     request: BulkGetRequest,
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     ID 목록으로 후기들을 조회합니다.
     
-    - **ids**: 조회할 후기 ID 목록 (1-100개)
+    - **ids**: 조회할 후기 ID 목록 (1-50000개, 결과는 요청 순서대로 반환)
+    - **stream**: true 이면 후기를 한 줄씩 NDJSON 으로 스트리밍하고 마지막 줄에 요약(누락 ID 포함)을 보냅니다.
     """
     try:
-        # 후기 조회
-        reviews_data = db.get_reviews_by_ids(request.ids)
-        
-        # 응답 데이터 변환
-        reviews = []
-        for review_data in reviews_data:
-            reviews.append(Review(
-                id=review_data['id'],
-                platform_id=review_data['platform_id'],
-                platform_review_id=review_data['platform_review_id'],
-                community_id=review_data['community_id'],
-                title=review_data['title'],
-                content=review_data['content'],
-                writer_nickname=review_data['writer_nickname'],
-                writer_id=review_data['writer_id'],
-                like_count=review_data['like_count'],
-                rating=review_data['rating'],
-                price=review_data['price'],
-                images=review_data['images'],
-                categories=review_data['categories'],
-                sub_categories=review_data['sub_categories'],
-                surgery_date=review_data['surgery_date'],
-                hospital_name=review_data['hospital_name'],
-                doctor_name=review_data['doctor_name'],
-                is_blind=review_data['is_blind'],
-                is_image_blur=review_data['is_image_blur'],
-                is_certificated_review=review_data['is_certificated_review'],
-                created_at=review_data['created_at'],
-                collected_at=review_data['collected_at']
-            ))
-        
-        # 조회된 ID와 누락된 ID 계산
-        found_ids = [review.id for review in reviews]
-        missing_ids = [id for id in request.ids if id not in found_ids]
-        
-        return BulkGetResponse(
-            data=reviews,
-            total=len(reviews),
-            requested_ids=request.ids,
-            found_ids=found_ids,
-            missing_ids=missing_ids
-        )
+        return await _bulk_get(request, db.get_reviews_by_ids, _review_item)
         
     except Exception as e:
         raise HTTPException(
@@ -772,46 +851,16 @@ async def get_reviews_bulk(
 @router.post("/comments/bulk", response_model=BulkGetResponse)
 async def get_comments_bulk(
     request: BulkGetRequest,
-    db: DatabaseManager = Depends(get_database_manager)
+    db: AsyncDatabase = Depends(get_async_database_manager)
 ):
     """
     ID 목록으로 댓글들을 조회합니다.
     
-    - **ids**: 조회할 댓글 ID 목록 (1-100개)
+    - **ids**: 조회할 댓글 ID 목록 (1-50000개, 결과는 요청 순서대로 반환)
+    - **stream**: true 이면 댓글을 한 줄씩 NDJSON 으로 스트리밍하고 마지막 줄에 요약(누락 ID 포함)을 보냅니다.
     """
     try:
-        # 댓글 조회
-        comments_data = db.get_comments_by_ids(request.ids)
-        
-        # 응답 데이터 변환
-        comments = []
-        for comment_data in comments_data:
-            comments.append(Comment(
-                id=comment_data['id'],
-                platform_id=comment_data['platform_id'],
-                community_article_id=comment_data['community_article_id'],
-                community_id=comment_data.get('community_id', 0),  # 기본값 0 설정
-                comment_id=comment_data['community_comment_id'],  # community_comment_id를 comment_id로 매핑
-                parent_comment_id=comment_data.get('parent_comment_id'),
-                content=comment_data['content'],
-                writer_nickname=comment_data['writer_nickname'],
-                writer_id=comment_data['writer_id'],
-                like_count=0,  # Comment 모델에 like_count 필드가 없으므로 기본값 0 설정
-                created_at=comment_data['created_at'],
-                collected_at=comment_data['collected_at']
-            ))
-        
-        # 조회된 ID와 누락된 ID 계산
-        found_ids = [comment.id for comment in comments]
-        missing_ids = [id for id in request.ids if id not in found_ids]
-        
-        return BulkGetResponse(
-            data=comments,
-            total=len(comments),
-            requested_ids=request.ids,
-            found_ids=found_ids,
-            missing_ids=missing_ids
-        )
+        return await _bulk_get(request, db.get_comments_by_ids, lambda comment: _comment_item(comment, community_id=0))
         
     except Exception as e:
         raise HTTPException(
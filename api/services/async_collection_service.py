@@ -2,14 +2,63 @@
 비동기 데이터 수집 서비스
 각 플랫폼별 데이터 수집을 비동기로 처리하는 서비스 함수들
 """
-import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 
 from collectors.babitalk_collector import BabitalkDataCollector
 from collectors.gannamunni_collector import GangnamUnniDataCollector
 from collectors.naver_collector import NaverDataCollector
+from collectors.checkpoint import STATUS_COMPLETED
 from api.services.callback_service import callback_service
+from collectors.scheduler import CollectionScheduler, CollectionUnit
+from database.async_db import run_db
+
+
+def _date_checkpoints_completed(db, target_date: str, scopes: List[Tuple[str, Any]]) -> bool:
+    """(플랫폼 ID, 카테고리) 목록의 날짜별 체크포인트가 모두 완료 상태인지 확인"""
+    for platform_id, category in scopes:
+        checkpoint = db.get_collection_checkpoint(platform_id, target_date, str(category))
+        if not checkpoint or checkpoint["status"] != STATUS_COMPLETED:
+            return False
+    return True
+
+
+def _checkpointed_units(units: List[CollectionUnit], checkpoint: Optional[Dict[str, Any]],
+                        checkpoint_callback: Optional[Callable], db, target_date: str,
+                        checkpoint_scopes: Dict[Any, List[Tuple[str, Any]]]) -> List[CollectionUnit]:
+    """
+    체크포인트를 적용한 수집 단위 목록 반환
+    이미 완료된 단위는 저장된 결과를 그대로 사용하고, 새로 완료된 단위는 결과를 체크포인트에 기록합니다.
+    단위가 끝나도 날짜별 체크포인트(DateCheckpoint)가 완료되지 않았으면(요청 실패로 중단) 기록하지 않아
+    다음 실행에서 체크포인트부터 재개합니다.
+    """
+    state = dict(checkpoint or {})
+    completed_units = dict(state.get("units") or {})
+
+    def wrap(unit: CollectionUnit) -> CollectionUnit:
+        key = str(unit.key)
+        if key in completed_units:
+            saved_value = completed_units[key]
+
+            async def restore():
+                print(f"⏭️ {unit.name} 수집은 이전 실행에서 완료되어 건너뜁니다.")
+                return saved_value
+            return CollectionUnit(unit.key, unit.name, restore)
+
+        async def run_and_save():
+            value = await unit.factory()
+            scopes = checkpoint_scopes.get(unit.key, [])
+            if not await run_db(_date_checkpoints_completed, db, target_date, scopes):
+                print(f"⏯️ {unit.name} 수집이 날짜 끝에 도달하지 못해 다음 실행에서 재개합니다.")
+                return value
+            completed_units[key] = value
+            if checkpoint_callback:
+                state["units"] = dict(completed_units)
+                checkpoint_callback(state)
+            return value
+        return CollectionUnit(unit.key, unit.name, run_and_save)
+
+    return [wrap(unit) for unit in units]
 
 
 class AsyncCollectionService:
@@ -20,7 +69,9 @@ class AsyncCollectionService:
         target_date: str,
         categories: list = None,
         callback_url: str = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        checkpoint_callback: Optional[Callable] = None
     ) -> Dict[str, Any]:
         """
         바비톡 데이터 비동기 수집
@@ -30,6 +81,8 @@ class AsyncCollectionService:
             categories: 수집할 카테고리 목록 ["reviews", "talks", "event_ask_memos"]
             callback_url: 수집 완료 시 호출할 콜백 URL
             progress_callback: 진행률 콜백 함수
+            checkpoint: 이전 실행의 체크포인트 (완료된 수집 단위는 건너뜀)
+            checkpoint_callback: 수집 단위 완료 시 체크포인트 저장 콜백
             
         Returns:
             Dict[str, Any]: 수집 결과
@@ -53,59 +106,63 @@ class AsyncCollectionService:
         }
         
         total_categories = len(categories)
-        completed_categories = 0
         
         try:
             if progress_callback:
                 progress_callback(0, total_categories, "바비톡 데이터 수집 시작")
             
-            # 1. 시술후기 수집
-            if "reviews" in categories:
-                if progress_callback:
-                    progress_callback(completed_categories, total_categories, "시술후기 수집 중...")
-                
-                review_count = await collector.collect_reviews_by_date(target_date)
-                results["total_reviews"] += review_count
-                results["category_results"]["reviews"] = review_count
-                completed_categories += 1
-                
-                await asyncio.sleep(1)  # API 호출 간격 조절
-            
-            # 2. 발품후기 수집
-            if "event_ask_memos" in categories:
-                if progress_callback:
-                    progress_callback(completed_categories, total_categories, "발품후기 수집 중...")
-                
-                memo_results = await collector.collect_all_event_ask_memos_by_date(target_date)
-                memo_total = sum(memo_results.values())
-                results["total_articles"] += memo_total
-                results["category_results"]["event_ask_memos"] = memo_results
-                completed_categories += 1
-                
-                await asyncio.sleep(1)
-            
-            # 3. 자유톡 수집
-            if "talks" in categories:
-                if progress_callback:
-                    progress_callback(completed_categories, total_categories, "자유톡 수집 중...")
-                
+            async def collect_talks_with_comments() -> Dict[str, Any]:
                 talk_results = await collector.collect_all_talks_by_date(target_date)
-                talk_total = sum(talk_results.values())
-                results["total_articles"] += talk_total
-                results["category_results"]["talks"] = talk_results
-                completed_categories += 1
-                
-                # 댓글 수집
-                if progress_callback:
-                    progress_callback(completed_categories - 0.5, total_categories, "자유톡 댓글 수집 중...")
                 
                 # 각 서비스별 댓글 수집
                 comment_total = 0
                 for service_id in collector.api.TALK_SERVICE_CATEGORIES.keys():
                     comments_count = await collector.collect_comments_for_talks_by_date(target_date, service_id)
                     comment_total += comments_count
-                
-                results["total_comments"] += comment_total
+                return {"talks": talk_results, "comments": comment_total}
+            
+            # 시술후기/발품후기/자유톡을 병렬 실행
+            # (발품후기/자유톡 내부의 카테고리별 수집이 플랫폼 예산을 사용하므로 상위 단위는 예산 없이 실행)
+            category_units = {
+                "reviews": CollectionUnit("reviews", "시술후기", lambda: collector.collect_reviews_by_date(target_date)),
+                "event_ask_memos": CollectionUnit("event_ask_memos", "발품후기", lambda: collector.collect_all_event_ask_memos_by_date(target_date)),
+                "talks": CollectionUnit("talks", "자유톡", collect_talks_with_comments),
+            }
+            units = [unit for key, unit in category_units.items() if key in categories]
+            checkpoint_scopes = {
+                "reviews": [("babitalk_review", "")],
+                "event_ask_memos": [("babitalk_event_ask", category_id) for category_id in collector.api.EVENT_ASK_CATEGORIES],
+                "talks": [("babitalk_talk", service_id) for service_id in collector.api.TALK_SERVICE_CATEGORIES],
+            }
+            units = _checkpointed_units(units, checkpoint, checkpoint_callback, collector.db, target_date, checkpoint_scopes)
+            
+            def on_unit_done(unit_result, completed, total):
+                if progress_callback:
+                    status_text = "완료" if unit_result.ok else "실패"
+                    progress_callback(completed, total, f"{unit_result.name} 수집 {status_text}")
+            
+            report = await CollectionScheduler("babitalk", use_platform_budget=False).run(units, on_unit_done=on_unit_done)
+            
+            # 1. 시술후기
+            if "reviews" in report.units:
+                review_count = report.units["reviews"].value or 0
+                results["total_reviews"] += review_count
+                results["category_results"]["reviews"] = review_count
+            
+            # 2. 발품후기
+            if "event_ask_memos" in report.units:
+                memo_results = report.units["event_ask_memos"].value or {}
+                results["total_articles"] += sum(memo_results.values())
+                results["category_results"]["event_ask_memos"] = memo_results
+            
+            # 3. 자유톡 (+ 댓글)
+            if "talks" in report.units:
+                talk_result = report.units["talks"].value or {"talks": {}, "comments": 0}
+                results["total_articles"] += sum(talk_result["talks"].values())
+                results["category_results"]["talks"] = talk_result["talks"]
+                results["total_comments"] += talk_result["comments"]
+            
+            results["unit_errors"] = {str(key): error for key, error in report.errors.items()}
             
             if progress_callback:
                 progress_callback(total_categories, total_categories, "바비톡 데이터 수집 완료")
@@ -180,7 +237,9 @@ class AsyncCollectionService:
         categories: list = None,
         token: str = None,
         callback_url: str = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        checkpoint_callback: Optional[Callable] = None
     ) -> Dict[str, Any]:
         """
         강남언니 데이터 비동기 수집
@@ -191,6 +250,8 @@ class AsyncCollectionService:
             token: 강남언니 API 토큰 (None이면 기본값 사용)
             callback_url: 수집 완료 시 호출할 콜백 URL
             progress_callback: 진행률 콜백 함수
+            checkpoint: 이전 실행의 체크포인트 (완료된 수집 단위는 건너뜀)
+            checkpoint_callback: 수집 단위 완료 시 체크포인트 저장 콜백
             
         Returns:
             Dict[str, Any]: 수집 결과
@@ -223,34 +284,46 @@ class AsyncCollectionService:
             "total_comments": 0,
             "total_reviews": 0,
             "category_results": {},
+            "review_result": {},
             "start_time": datetime.now().isoformat(),
             "end_time": None
         }
         
-        total_categories = len(categories)
-        completed_categories = 0
+        total_categories = len(categories) + 1  # 카테고리 + 리뷰
         
         try:
             if progress_callback:
                 progress_callback(0, total_categories, "강남언니 데이터 수집 시작")
             
+            # 리뷰(날짜당 1회)와 카테고리별 게시글 수집을 플랫폼 예산 안에서 병렬 실행
+            units = [CollectionUnit("reviews", "리뷰", lambda: collector.collect_reviews_by_date(target_date))]
             for category in categories:
-                category_name = category_names.get(category, category)
-                print(f"🔄 {category_name} 카테고리 수집 중...")
-                
+                units.append(CollectionUnit(
+                    category, category_names.get(category, category),
+                    lambda category=category: collector.collect_category_articles_by_date(target_date, category)
+                ))
+            checkpoint_scopes = {"reviews": [("gangnamunni_review", "")]}
+            checkpoint_scopes.update({category: [("gangnamunni", category)] for category in categories})
+            units = _checkpointed_units(units, checkpoint, checkpoint_callback, collector.db, target_date, checkpoint_scopes)
+            
+            def on_unit_done(unit_result, completed, total):
+                status_text = "완료" if unit_result.ok else "실패"
+                print(f"✅ {unit_result.name} 수집 {status_text} ({completed}/{total})")
                 if progress_callback:
-                    progress_callback(completed_categories, total_categories, f"{category_name} 카테고리 수집 중...")
-                
-                result = await collector.collect_articles_by_date(target_date, category, include_reviews=True)
+                    progress_callback(completed, total, f"{unit_result.name} 수집 {status_text}")
+            
+            report = await CollectionScheduler("gangnamunni").run(units, on_unit_done=on_unit_done)
+            
+            for category in categories:
+                result = report.units[category].value or {"articles": 0, "comments": 0}
                 results["total_articles"] += result["articles"]
                 results["total_comments"] += result["comments"]
-                results["total_reviews"] += result.get("reviews", 0)
                 results["category_results"][category] = result["articles"]
-                completed_categories += 1
-                
-                print(f"✅ {category_name} 카테고리 수집 완료: {result['articles']}개")
-                
-                await asyncio.sleep(2)  # API 호출 간격 조절
+            
+            review_result = report.units["reviews"].value or {"reviews": 0}
+            results["total_reviews"] = review_result["reviews"]
+            results["review_result"] = review_result
+            results["unit_errors"] = {str(key): error for key, error in report.errors.items()}
             
             end_time = time.time()
             total_elapsed_time = end_time - start_time
@@ -282,6 +355,7 @@ class AsyncCollectionService:
                     result={
                         "total_articles": results['total_articles'],
                         "total_comments": results['total_comments'],
+                        "total_reviews": results['total_reviews'],
                         "execution_time": total_elapsed_time,
                         "category_results": results["category_results"]
                     },
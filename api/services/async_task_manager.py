@@ -1,18 +1,44 @@
 """
 비동기 작업 관리 모듈
 외부 API 호출로부터 데이터 수집 작업을 비동기로 처리하고 진행 상황을 추적합니다.
+
+작업 상태는 데이터베이스(collection_tasks 테이블)에 저장되므로 여러 API 워커가 같은 작업 목록을 공유하며,
+워커 루프가 하트비트가 끊긴 작업을 마지막 체크포인트부터 이어서 실행합니다.
+
+DB 호출은 모두 run_db(조회)/run_db_write(쓰기)로 실행해 이벤트 루프를 막지 않습니다.
+수집 서비스가 동기로 호출하는 진행률/체크포인트 콜백은 쓰기를 작업별로 순서대로 예약합니다.
 """
 import asyncio
+import copy
+import inspect
+import os
+import socket
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional, Callable
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Callable, List
 from enum import Enum
 import logging
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+
+from database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from database.async_db import run_db, run_db_write
 
 logger = logging.getLogger(__name__)
 
+# 워커 설정 (환경변수로 조정 가능)
+TASK_HEARTBEAT_INTERVAL = int(os.getenv("TASK_HEARTBEAT_INTERVAL", "15"))   # 하트비트/재개 확인 주기 (초)
+TASK_STALE_SECONDS = int(os.getenv("TASK_STALE_SECONDS", "120"))            # 하트비트가 끊긴 것으로 보는 시간 (초)
+TASK_PENDING_GRACE_SECONDS = int(os.getenv("TASK_PENDING_GRACE_SECONDS", "60"))  # 시작되지 않은 대기 작업을 인수하기까지의 시간 (초)
+TASK_MAX_CONCURRENT = int(os.getenv("TASK_MAX_CONCURRENT", "10"))           # 워커당 최대 동시 작업 수
+TASK_MAX_LOGS = 50
+
+# 작업 저장 시 제외하는 인증 정보 (인자 이름 -> 재개 시 값을 읽을 환경변수)
+# 요청으로 받은 토큰/쿠키는 이 워커의 실행에만 사용하고 collection_tasks 에 평문으로 남기지 않습니다.
+CREDENTIAL_PARAMS = {
+    "token": "GANGNAMUNNI_TOKEN",
+    "naver_cookies": "NAVER_COOKIES",
+}
+
 class TaskStatus(Enum):
     """작업 상태 열거형"""
     PENDING = "pending"         # 대기 중
@@ -21,6 +47,8 @@ class TaskStatus(Enum):
     FAILED = "failed"          # 실패
     CANCELLED = "cancelled"     # 취소
 
+FINISHED_STATUSES = [TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.CANCELLED.value]
+
 class TaskType(Enum):
     """작업 타입 열거형"""
     BABITALK_COLLECT = "babitalk_collect"
@@ -28,42 +56,42 @@ class TaskType(Enum):
     NAVER_COLLECT = "naver_collect"
 
 class AsyncTaskManager:
-    """비동기 작업 관리자"""
-    
-    def __init__(self):
-        self.tasks: Dict[str, Dict[str, Any]] = {}
-        self.executor = ThreadPoolExecutor(max_workers=10)  # 최대 10개 동시 작업
-        
-    def create_task(self, task_type: TaskType, task_data: Dict[str, Any]) -> str:
-        """새로운 작업 생성"""
+    """비동기 작업 관리자 (DB 저장 + 재시작 복구)"""
+
+    def __init__(self, db_manager: Optional[SQLAlchemyDatabaseManager] = None):
+        self.db = db_manager or SQLAlchemyDatabaseManager()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # 작업 타입 -> 실행 함수 (재개 시 저장된 인자로 다시 호출)
+        self._runners: Dict[str, Callable] = {}
+        # 이 워커에서 실행 중인 작업
+        self._local_tasks: Dict[str, asyncio.Task] = {}
+        self._local_logs: Dict[str, List[str]] = {}
+        self._worker_task: Optional[asyncio.Task] = None
+        # 작업별 마지막으로 예약한 상태 쓰기 (콜백 쓰기 순서 유지)
+        self._pending_writes: Dict[str, asyncio.Future] = {}
+
+    def register_runner(self, task_type: TaskType, task_func: Callable):
+        """작업 타입별 실행 함수 등록 (재개 시 사용)"""
+        self._runners[task_type.value] = task_func
+
+    async def create_task(self, task_type: TaskType, task_data: Dict[str, Any]) -> str:
+        """새로운 작업 생성 (인증 정보는 저장하지 않음)"""
         task_id = str(uuid.uuid4())
-        
-        self.tasks[task_id] = {
-            "id": task_id,
-            "type": task_type.value,
-            "status": TaskStatus.PENDING.value,
-            "progress": 0,
-            "total": 0,
-            "current_step": "",
-            "result": None,
-            "error": None,
-            "created_at": datetime.now().isoformat(),
-            "started_at": None,
-            "completed_at": None,
-            "task_data": task_data,
-            "logs": []
-        }
-        
+        task_data = {key: value for key, value in task_data.items() if key not in CREDENTIAL_PARAMS}
+        await run_db_write(self.db.create_collection_task, task_id, task_type.value, task_data)
+
         logger.info(f"새로운 작업 생성: {task_id} ({task_type.value})")
         return task_id
-    
-    def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+
+    async def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """작업 상태 조회"""
-        task = self.tasks.get(task_id)
+        task = await run_db(self.db.get_collection_task, task_id)
         if not task:
             return None
-            
-        # 민감한 정보 제거한 상태로 반환
+        return self._to_status(task)
+
+    def _to_status(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        # 민감한 정보(task_data, call_args)를 제거한 상태로 반환
         return {
             "id": task["id"],
             "type": task["type"],
@@ -75,113 +103,289 @@ class AsyncTaskManager:
             "started_at": task["started_at"],
             "completed_at": task["completed_at"],
             "error": task["error"],
+            "attempts": task["attempts"],
+            "worker_id": task["worker_id"],
             "result_summary": self._get_result_summary(task["result"]),
-            "logs": task["logs"][-10:]  # 최근 10개 로그만 반환
+            "logs": (task["logs"] or [])[-10:]  # 최근 10개 로그만 반환
         }
-    
-    def get_all_tasks(self) -> Dict[str, Dict[str, Any]]:
+
+    async def get_all_tasks(self) -> Dict[str, Dict[str, Any]]:
         """모든 작업 상태 조회"""
-        return {task_id: self.get_task_status(task_id) for task_id in self.tasks}
-    
+        return {task["id"]: self._to_status(task) for task in await run_db(self.db.list_collection_tasks)}
+
+    def _append_log(self, task_id: str, message: str) -> List[str]:
+        """작업 로그 추가 (최대 50개 유지)"""
+        logs = self._local_logs.setdefault(task_id, [])
+        logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        if len(logs) > TASK_MAX_LOGS:
+            del logs[:-TASK_MAX_LOGS]
+        return logs
+
+    def _queue_update(self, task_id: str, updates: Dict[str, Any]):
+        """
+        작업 상태 쓰기 예약 (동기 콜백용)
+
+        이전에 예약한 쓰기가 끝난 뒤 실행하므로 진행률/체크포인트가 호출 순서대로 저장됩니다.
+        """
+        previous = self._pending_writes.get(task_id)
+
+        async def write():
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+            try:
+                await run_db_write(self.db.update_collection_task, task_id, updates,
+                                   expected_worker_id=self.worker_id)
+            except Exception as e:
+                logger.error(f"작업 상태 저장 실패: {task_id}, 오류: {e}")
+            finally:
+                if self._pending_writes.get(task_id) is asyncio.current_task():
+                    del self._pending_writes[task_id]
+
+        self._pending_writes[task_id] = asyncio.ensure_future(write())
+
+    async def _flush_updates(self, task_id: str):
+        """예약된 작업 상태 쓰기가 끝날 때까지 대기"""
+        pending = self._pending_writes.get(task_id)
+        if pending is not None:
+            await asyncio.gather(pending, return_exceptions=True)
+
     def update_task_progress(self, task_id: str, progress: int, total: int, current_step: str = ""):
-        """작업 진행률 업데이트"""
-        if task_id in self.tasks:
-            self.tasks[task_id]["progress"] = progress
-            self.tasks[task_id]["total"] = total
-            self.tasks[task_id]["current_step"] = current_step
-            
-            # 로그 추가
-            log_entry = f"[{datetime.now().strftime('%H:%M:%S')}] {current_step} ({progress}/{total})"
-            self.tasks[task_id]["logs"].append(log_entry)
-            
-            # 최대 50개 로그만 유지
-            if len(self.tasks[task_id]["logs"]) > 50:
-                self.tasks[task_id]["logs"] = self.tasks[task_id]["logs"][-50:]
-    
-    def start_task(self, task_id: str, task_func: Callable, *args, **kwargs) -> bool:
+        """작업 진행률 업데이트 (쓰기는 예약만 하고 바로 반환)"""
+        logs = self._append_log(task_id, f"{current_step} ({progress}/{total})")
+        self._queue_update(task_id, {
+            "progress": progress,
+            "total": total,
+            "current_step": current_step,
+            "logs": list(logs),
+            "heartbeat_at": datetime.now()
+        })
+
+    async def start_task(self, task_id: str, task_func: Callable, *args, **kwargs) -> bool:
         """작업 시작"""
-        if task_id not in self.tasks:
+        task = await run_db(self.db.get_collection_task, task_id)
+        if not task or task["status"] != TaskStatus.PENDING.value:
             return False
-            
-        if self.tasks[task_id]["status"] != TaskStatus.PENDING.value:
+
+        # 다른 워커가 이어서 실행할 수 있도록 호출 인자 저장 (인증 정보 제외)
+        await run_db_write(self.db.update_collection_task, task_id, {"call_args": self._storable_call_args(task_func, args, kwargs)})
+        if task["type"] not in self._runners:
+            self._runners[task["type"]] = task_func
+
+        # 조건부 UPDATE 로 실행 권한 획득 (중복 실행 방지)
+        if not await run_db_write(self.db.claim_collection_task, task_id, self.worker_id):
             return False
-        
-        self.tasks[task_id]["status"] = TaskStatus.RUNNING.value
-        self.tasks[task_id]["started_at"] = datetime.now().isoformat()
-        
+
+        self._launch(task_id, task_func, list(args), dict(kwargs), checkpoint=None, logs=[])
+        logger.info(f"작업 시작: {task_id}")
+        return True
+
+    @staticmethod
+    def _storable_call_args(task_func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """저장할 호출 인자: 인자 이름으로 묶고 인증 정보를 제외"""
+        bound = inspect.signature(task_func).bind_partial(*args, **kwargs)
+        return {
+            "args": [],
+            "kwargs": {name: value for name, value in bound.arguments.items() if name not in CREDENTIAL_PARAMS}
+        }
+
+    @staticmethod
+    def _inject_credentials(task_func: Callable, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """재개 시 저장하지 않은 인증 정보를 환경변수에서 채움 (없으면 실행 함수의 기본값 사용)"""
+        kwargs = dict(kwargs)
+        parameters = inspect.signature(task_func).parameters
+        for name, env_name in CREDENTIAL_PARAMS.items():
+            if name in parameters and name not in kwargs and os.getenv(env_name):
+                kwargs[name] = os.getenv(env_name)
+        return kwargs
+
+    def _launch(self, task_id: str, task_func: Callable, args: List, kwargs: Dict,
+                checkpoint: Optional[Dict], logs: List[str]):
+        """이 워커에서 작업 실행"""
+        self._local_logs[task_id] = list(logs or [])
+
         # 진행률 콜백 함수 생성
         def progress_callback(progress: int, total: int, step: str = ""):
             self.update_task_progress(task_id, progress, total, step)
-        
-        # 비동기 작업 실행
-        asyncio.create_task(self._run_task(task_id, task_func, progress_callback, *args, **kwargs))
-        
-        logger.info(f"작업 시작: {task_id}")
-        return True
-    
-    async def _run_task(self, task_id: str, task_func: Callable, progress_callback: Callable, *args, **kwargs):
+
+        kwargs['progress_callback'] = progress_callback
+
+        # 체크포인트를 지원하는 작업이면 이전 체크포인트와 저장 콜백 전달
+        parameters = inspect.signature(task_func).parameters
+        if 'checkpoint_callback' in parameters:
+            def checkpoint_callback(new_checkpoint: Dict[str, Any]):
+                self._queue_update(task_id, {
+                    "checkpoint": copy.deepcopy(new_checkpoint),
+                    "heartbeat_at": datetime.now()
+                })
+
+            kwargs['checkpoint'] = checkpoint
+            kwargs['checkpoint_callback'] = checkpoint_callback
+
+        self._local_tasks[task_id] = asyncio.create_task(self._run_task(task_id, task_func, *args, **kwargs))
+
+    async def _run_task(self, task_id: str, task_func: Callable, *args, **kwargs):
         """작업 실행 (내부 메서드)"""
         try:
-            # kwargs에 progress_callback 추가
-            kwargs['progress_callback'] = progress_callback
-            
             # 작업 실행
             result = await task_func(*args, **kwargs)
-            
-            # 작업 완료
-            self.tasks[task_id]["status"] = TaskStatus.COMPLETED.value
-            self.tasks[task_id]["result"] = result
-            self.tasks[task_id]["completed_at"] = datetime.now().isoformat()
-            self.tasks[task_id]["logs"].append(f"[{datetime.now().strftime('%H:%M:%S')}] 작업 완료")
-            
+
+            # 작업 완료 (이 워커가 여전히 소유한 경우에만 기록, 예약된 진행률 쓰기 이후)
+            await self._flush_updates(task_id)
+            logs = self._append_log(task_id, "작업 완료")
+            await run_db_write(self.db.update_collection_task, task_id, {
+                "status": TaskStatus.COMPLETED.value,
+                "result": result,
+                "logs": logs,
+                "completed_at": datetime.now()
+            }, expected_worker_id=self.worker_id)
+
             logger.info(f"작업 완료: {task_id}")
-            
+
+        except asyncio.CancelledError:
+            # 취소 또는 서버 종료: 취소된 작업은 이미 상태가 기록되어 있고,
+            # 종료로 중단된 작업은 하트비트가 끊긴 뒤 다른 워커가 체크포인트부터 재개
+            logger.info(f"작업 실행 중단: {task_id}")
+            raise
+
         except Exception as e:
             # 작업 실패
-            self.tasks[task_id]["status"] = TaskStatus.FAILED.value
-            self.tasks[task_id]["error"] = str(e)
-            self.tasks[task_id]["completed_at"] = datetime.now().isoformat()
-            self.tasks[task_id]["logs"].append(f"[{datetime.now().strftime('%H:%M:%S')}] 작업 실패: {str(e)}")
-            
+            await self._flush_updates(task_id)
+            logs = self._append_log(task_id, f"작업 실패: {str(e)}")
+            await run_db_write(self.db.update_collection_task, task_id, {
+                "status": TaskStatus.FAILED.value,
+                "error": str(e),
+                "logs": logs,
+                "completed_at": datetime.now()
+            }, expected_worker_id=self.worker_id)
+
             logger.error(f"작업 실패: {task_id}, 오류: {str(e)}")
             logger.error(traceback.format_exc())
-    
-    def cancel_task(self, task_id: str) -> bool:
+
+        finally:
+            self._local_tasks.pop(task_id, None)
+            self._local_logs.pop(task_id, None)
+
+    async def cancel_task(self, task_id: str) -> bool:
         """작업 취소"""
-        if task_id not in self.tasks:
+        task = await run_db(self.db.get_collection_task, task_id)
+        if not task:
             return False
-            
-        if self.tasks[task_id]["status"] in [TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.CANCELLED.value]:
+
+        if task["status"] in FINISHED_STATUSES:
             return False
-        
-        self.tasks[task_id]["status"] = TaskStatus.CANCELLED.value
-        self.tasks[task_id]["completed_at"] = datetime.now().isoformat()
-        self.tasks[task_id]["logs"].append(f"[{datetime.now().strftime('%H:%M:%S')}] 작업 취소됨")
-        
+
+        logs = (task["logs"] or []) + [f"[{datetime.now().strftime('%H:%M:%S')}] 작업 취소됨"]
+        await run_db_write(self.db.update_collection_task, task_id, {
+            "status": TaskStatus.CANCELLED.value,
+            "logs": logs[-TASK_MAX_LOGS:],
+            "completed_at": datetime.now()
+        })
+
+        # 이 워커에서 실행 중이면 바로 중단 (다른 워커는 하트비트 시 취소를 감지)
+        local_task = self._local_tasks.get(task_id)
+        if local_task:
+            local_task.cancel()
+
         logger.info(f"작업 취소: {task_id}")
         return True
-    
-    def cleanup_old_tasks(self, max_age_hours: int = 24):
+
+    async def cleanup_old_tasks(self, max_age_hours: int = 24):
         """오래된 작업 정리"""
-        current_time = datetime.now()
-        to_remove = []
-        
-        for task_id, task in self.tasks.items():
-            created_at = datetime.fromisoformat(task["created_at"])
-            age_hours = (current_time - created_at).total_seconds() / 3600
-            
-            if age_hours > max_age_hours and task["status"] in [TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.CANCELLED.value]:
-                to_remove.append(task_id)
-        
-        for task_id in to_remove:
-            del self.tasks[task_id]
-            logger.info(f"오래된 작업 정리: {task_id}")
-    
+        created_before = datetime.now() - timedelta(hours=max_age_hours)
+        deleted = await run_db_write(self.db.delete_collection_tasks, FINISHED_STATUSES, created_before)
+        logger.info(f"오래된 작업 정리: {deleted}개")
+
+    # 워커 루프 (하트비트 + 중단된 작업 재개)
+    def start_worker(self):
+        """워커 루프 시작 (서버 시작 시 호출)"""
+        if self._worker_task and not self._worker_task.done():
+            return
+        self._worker_task = asyncio.create_task(self._worker_loop())
+        logger.info(f"작업 워커 시작: {self.worker_id}")
+
+    async def stop_worker(self):
+        """워커 루프와 이 워커의 실행 중 작업 중단 (서버 종료 시 호출)"""
+        if self._worker_task:
+            self._worker_task.cancel()
+            await asyncio.gather(self._worker_task, return_exceptions=True)
+            self._worker_task = None
+
+        # 실행 중 작업은 상태를 running 으로 남겨 다른 워커(또는 재시작 후)가 이어서 실행
+        local_tasks = list(self._local_tasks.values())
+        for local_task in local_tasks:
+            local_task.cancel()
+        await asyncio.gather(*local_tasks, return_exceptions=True)
+        # 예약된 진행률/체크포인트 쓰기 마무리
+        await asyncio.gather(*list(self._pending_writes.values()), return_exceptions=True)
+        logger.info(f"작업 워커 종료: {self.worker_id}")
+
+    async def _worker_loop(self):
+        while True:
+            try:
+                await self.run_worker_cycle()
+            except Exception as e:
+                logger.error(f"작업 워커 주기 실행 실패: {e}")
+            await asyncio.sleep(TASK_HEARTBEAT_INTERVAL)
+
+    async def run_worker_cycle(self) -> List[str]:
+        """
+        워커 주기 1회 실행: 하트비트 갱신, 소유권을 잃은 작업 중단, 중단된 작업 재개
+
+        Returns:
+            List[str]: 이번 주기에 재개한 작업 ID 목록
+        """
+        # 1. 하트비트 갱신 및 취소/인수된 작업 중단
+        lost_task_ids = await run_db_write(self.db.heartbeat_collection_tasks, self.worker_id, list(self._local_tasks.keys()))
+        for task_id in lost_task_ids:
+            local_task = self._local_tasks.get(task_id)
+            if local_task:
+                logger.info(f"작업 소유권 상실로 실행 중단: {task_id}")
+                local_task.cancel()
+
+        # 2. 하트비트가 끊긴 작업/시작되지 않은 작업 재개
+        resumed = []
+        now = datetime.now()
+        stale_before = now - timedelta(seconds=TASK_STALE_SECONDS)
+        pending_before = now - timedelta(seconds=TASK_PENDING_GRACE_SECONDS)
+
+        for task_id in await run_db(self.db.find_resumable_collection_tasks, stale_before, pending_before):
+            if len(self._local_tasks) >= TASK_MAX_CONCURRENT:
+                break
+            if task_id in self._local_tasks:
+                continue
+            if await self._resume_task(task_id, stale_before):
+                resumed.append(task_id)
+
+        return resumed
+
+    async def _resume_task(self, task_id: str, stale_before: datetime) -> bool:
+        """저장된 인자와 체크포인트로 작업 재개"""
+        task = await run_db(self.db.get_collection_task, task_id)
+        if not task:
+            return False
+
+        task_func = self._runners.get(task["type"])
+        call_args = task["call_args"]
+        if task_func is None or call_args is None:
+            logger.warning(f"재개할 수 없는 작업 (실행 함수 또는 인자 없음): {task_id}")
+            return False
+
+        if not await run_db_write(self.db.claim_collection_task, task_id, self.worker_id, stale_before=stale_before):
+            # 다른 워커가 먼저 인수함
+            return False
+
+        logs = (task["logs"] or []) + [f"[{datetime.now().strftime('%H:%M:%S')}] 작업 재개 (워커: {self.worker_id})"]
+        kwargs = self._inject_credentials(task_func, call_args.get("kwargs", {}))
+        self._launch(task_id, task_func, call_args.get("args", []), kwargs,
+                     checkpoint=task["checkpoint"], logs=logs[-TASK_MAX_LOGS:])
+        logger.info(f"작업 재개: {task_id} (체크포인트: {'있음' if task['checkpoint'] else '없음'})")
+        return True
+
     def _get_result_summary(self, result: Any) -> Dict[str, Any]:
         """결과 요약 정보 생성"""
         if not result:
             return {}
-            
+
         if isinstance(result, dict):
             summary = {}
             for key, value in result.items():
@@ -0,0 +1,106 @@
+"""
+데이터 조회 API 응답 캐시 (ETag / If-None-Match)
+
+@cached_response 를 붙인 엔드포인트는 정규화한 조회 조건 + 조회 대상 플랫폼의 데이터 세대를 키로
+직렬화된 응답 본문을 캐시합니다. 세대는 조회 전에 읽으므로 조회 도중 새 데이터가 저장되면
+방금 만든 응답은 이전 세대 키로 저장되고, 다음 요청은 새 세대로 다시 조회합니다.
+
+응답에는 본문 해시 ETag 를 붙이고, 클라이언트가 If-None-Match 로 같은 ETag 를 보내면 본문 없이 304 를 반환합니다.
+"""
+import functools
+import hashlib
+import inspect
+import json
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Request, Response
+
+from api.utils.serialization import dumps
+from database.async_db import run_db
+from database.cache import CacheEntry, get_response_cache, platform_scopes
+
+# 순서와 중복이 의미 없는 콤마 구분 파라미터 (정렬/중복 제거 후 키에 사용)
+LIST_PARAMS = {"keywords", "platforms", "data_types", "naver_cafes"}
+# 키에서 제외할 파라미터 (의존성 주입)
+EXCLUDED_PARAMS = {"db", "request"}
+
+
+def _normalize(name: str, value: Any) -> Any:
+    if isinstance(value, Enum):
+        value = value.value
+    if name in LIST_PARAMS and isinstance(value, str):
+        return ",".join(sorted({item.strip() for item in value.split(",") if item.strip()}))
+    return value
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag 가 포함되는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+async def _cache_call(cache, method: Callable, *args):
+    """파일 백엔드는 DB 스레드 풀에서, 메모리 백엔드는 바로 호출"""
+    if getattr(cache, "blocking", False):
+        return await run_db(method, *args)
+    return method(*args)
+
+
+def cached_response(platforms: Callable[[Dict[str, Any]], Optional[List[str]]] = lambda params: None):
+    """
+    조회 엔드포인트 응답 캐시 데코레이터 (@router.get 아래에 붙임)
+
+    Args:
+        platforms: 정규화된 파라미터 -> 조회 대상 플랫폼 목록 (None 이면 전체 플랫폼)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters.values())
+        # If-None-Match 확인을 위해 Request 주입
+        parameters.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+
+        async def render(*args, **kwargs) -> CacheEntry:
+            body = dumps(await func(*args, **kwargs))
+            return make_etag(body), body
+
+        @functools.wraps(func)
+        async def wrapper(*args, request: Request = None, **kwargs):
+            cache = get_response_cache()
+            if cache is None:
+                entry = await render(*args, **kwargs)
+            else:
+                bound = signature.bind(*args, **kwargs)
+                params = {
+                    name: _normalize(name, value)
+                    for name, value in bound.arguments.items() if name not in EXCLUDED_PARAMS
+                }
+                generations = await _cache_call(cache, cache.generations, platform_scopes(platforms(params)))
+                key = json.dumps([func.__name__, params, generations], sort_keys=True, default=str)
+
+                entry = await _cache_call(cache, cache.get, key)
+                if entry is None:
+                    entry = await render(*args, **kwargs)
+                    await _cache_call(cache, cache.set, key, entry)
+
+            etag, body = entry
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if request is not None and etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)
+        return wrapper
+
+    return decorator
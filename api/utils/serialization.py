@@ -0,0 +1,44 @@
+"""
+응답 JSON 직렬화
+
+DB 에서 읽은 행은 이미 응답 형식(기본 타입 + ISO 날짜 문자열)이므로 Pydantic 모델 생성/재검증 없이
+바로 직렬화합니다. orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 으로 직렬화합니다. (pip install orjson)
+"""
+import json
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """기본 타입이 아닌 값 변환 (Pydantic 모델, Enum, datetime 등)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문 직렬화 (UTF-8 JSON bytes)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """검증 없이 dumps 로 직렬화하는 JSON 응답 (신뢰할 수 있는 DB 행 전용)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
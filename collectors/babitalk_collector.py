@@ -1,20 +1,24 @@
 import asyncio
 import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Tuple
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from platforms.babitalk import BabitalkAPI, BabitalkReview, BabitalkEventAskMemo, BabitalkTalk, BabitalkComment
 from database.models import DatabaseManager, Review, Community, Article
+from database.async_db import AsyncDatabase, run_db, run_db_write
 from utils.logger import LoggedClass
+from collectors.scheduler import CollectionScheduler, CollectionUnit
+from collectors.checkpoint import DateCheckpoint
 
 class BabitalkDataCollector(LoggedClass):
     def __init__(self):
         super().__init__("BabitalkCollector")
         self.api = BabitalkAPI()
         self.db = DatabaseManager()  # db_path 파라미터 제거
+        self.async_db = AsyncDatabase(self.db)  # async 메서드에서는 DB 스레드 풀로 실행
     
     async def collect_and_save_reviews(self, limit_per_page: int = 24, max_pages: int = 10) -> int:
         """
@@ -47,15 +51,10 @@ class BabitalkDataCollector(LoggedClass):
                 if not reviews:
                     break
                 
-                # 각 후기 처리
-                for review in reviews:
-                    try:
-                        # 후기 정보 저장
-                        review_id = await self._save_review(review, babitalk_community['id'])
-                        if review_id:
-                            total_reviews += 1
-                    except Exception:
-                        continue
+                # 페이지의 후기는 작업 단위 하나로 일괄 저장 (이미 저장된 후기는 건너뜀)
+                total_reviews += await self.async_db.run_unit_of_work(
+                    self._write_reviews, "babitalk_review", reviews, self._to_db_review, babitalk_community['id']
+                )
                 
                 # 다음 페이지 확인
                 if not pagination.has_next or not pagination.search_after:
@@ -81,44 +80,37 @@ class BabitalkDataCollector(LoggedClass):
             target_date: 수집할 날짜 (YYYY-MM-DD 형식)
         
         Returns:
-            int: 수집된 후기 수
+            int: 수집된 후기 수 (재개 전 저장분 포함)
         """
-        import time
-        start_time = time.time()
-        last_progress_time = start_time
-        
-        
         # 바비톡 커뮤니티 생성 또는 조회
         babitalk_community = await self._get_or_create_babitalk_community()
         
+        # 페이지마다 저장 후 search_after 커서를 체크포인트로 남겨 중단 시 이어서 수집
+        checkpoint = DateCheckpoint(self.db, "babitalk_review", target_date)
+        start_search_after, stats = await run_db(checkpoint.resume)
+        total_reviews = stats.get("reviews", 0)
+        
         try:
-            # API에서 해당 날짜의 후기 데이터 가져오기
-            reviews = await self.api.get_reviews_by_date(target_date)
-            
-            if not reviews:
-                return 0
+            async def save_page(reviews: List[BabitalkReview], next_search_after: Optional[int]):
+                nonlocal total_reviews
+                
+                # 페이지의 후기 저장은 writer 스레드 호출 하나(작업 단위)로 처리
+                total_reviews += await self.async_db.run_unit_of_work(
+                    self._write_reviews, "babitalk_review", reviews, self._to_db_review, babitalk_community['id']
+                )
+                
+                await run_db_write(checkpoint.save, next_search_after, reviews[-1].id if reviews else None, {"reviews": total_reviews})
             
-            # 각 후기 처리 및 저장
-            total_reviews = 0
-            for review in reviews:
-                try:
-                    # 중복 체크: 이미 저장된 후기인지 확인
-                    existing_review = self.db.get_review_by_platform_id_and_platform_review_id("babitalk", str(review.id))
-                    if existing_review:
-                        continue
-                    
-                    # 후기 정보 저장
-                    review_id = await self._save_review(review, babitalk_community['id'])
-                    if review_id:
-                        total_reviews += 1
-                except Exception:
-                    continue
+            # API에서 해당 날짜의 후기 데이터를 페이지 단위로 수집/저장
+            await self.api.get_reviews_by_date(target_date, start_search_after=start_search_after or 0, on_page=save_page,
+                                               on_complete=checkpoint.mark_end)
+            await run_db_write(checkpoint.complete_if_reached_end, {"reviews": total_reviews})
             
             return total_reviews
             
         except Exception as e:
             self.log_error(f"날짜별 후기 수집 실패: {e}")
-            return 0
+            return total_reviews
     
     async def collect_event_ask_memos_by_date(self, target_date: str, category_id: int) -> int:
         """
@@ -129,41 +121,39 @@ class BabitalkDataCollector(LoggedClass):
             category_id: 카테고리 ID (3000: 눈, 3100: 코, 3200: 지방흡입/이식, 3300: 안면윤곽/양악, 3400: 가슴, 3500: 남자성형, 3600: 기타)
         
         Returns:
-            int: 수집된 발품후기 수
+            int: 수집된 발품후기 수 (재개 전 저장분 포함)
         """
         category_name = self.api.EVENT_ASK_CATEGORIES.get(category_id, f"카테고리{category_id}")
         
         # 바비톡 커뮤니티 생성 또는 조회
         babitalk_community = await self._get_or_create_babitalk_community()
         
+        # 페이지마다 저장 후 search_after 커서를 체크포인트로 남겨 중단 시 이어서 수집
+        checkpoint = DateCheckpoint(self.db, "babitalk_event_ask", target_date, category_id)
+        start_search_after, stats = await run_db(checkpoint.resume)
+        total_memos = stats.get("memos", 0)
+        
         try:
-            # API에서 해당 날짜의 발품후기 데이터 가져오기
-            memos = await self.api.get_event_ask_memos_by_date(target_date, category_id)
-            
-            if not memos:
-                return 0
+            async def save_page(memos: List[BabitalkEventAskMemo], next_search_after: Optional[int]):
+                nonlocal total_memos
+                
+                # 페이지의 발품후기 저장은 writer 스레드 호출 하나(작업 단위)로 처리 (발품후기는 reviews 테이블에 저장됨)
+                total_memos += await self.async_db.run_unit_of_work(
+                    self._write_reviews, "babitalk_event_ask", memos, self._to_db_event_ask_memo, babitalk_community['id']
+                )
+                
+                await run_db_write(checkpoint.save, next_search_after, memos[-1].id if memos else None, {"memos": total_memos})
             
-            # 각 발품후기 처리 및 저장
-            total_memos = 0
-            for memo in memos:
-                try:
-                    # 중복 체크: 이미 저장된 발품후기인지 확인
-                    existing_article = self.db.get_article_by_platform_id_and_community_article_id("babitalk_event_ask", str(memo.id))
-                    if existing_article:
-                        continue
-                    
-                    # 발품후기 정보 저장
-                    memo_id = await self._save_event_ask_memo(memo, babitalk_community['id'])
-                    if memo_id:
-                        total_memos += 1
-                except Exception:
-                    continue
+            # API에서 해당 날짜의 발품후기 데이터를 페이지 단위로 수집/저장
+            await self.api.get_event_ask_memos_by_date(target_date, category_id, start_search_after=start_search_after or 0, on_page=save_page,
+                                                       on_complete=checkpoint.mark_end)
+            await run_db_write(checkpoint.complete_if_reached_end, {"memos": total_memos})
             
             return total_memos
             
         except Exception as e:
-            self.log_error(f"날짜별 발품후기 수집 실패: {e}")
-            return 0
+            self.log_error(f"날짜별 발품후기 수집 실패 ({category_name}): {e}")
+            return total_memos
     
     async def collect_all_event_ask_memos_by_date(self, target_date: str) -> Dict[int, int]:
         """
@@ -176,25 +166,17 @@ class BabitalkDataCollector(LoggedClass):
             Dict[int, int]: 카테고리별 수집된 발품후기 수
         """
         
-        results = {}
-        
-        # 모든 카테고리 순회
-        for category_id, category_name in self.api.EVENT_ASK_CATEGORIES.items():
-            try:
-                count = await self.collect_event_ask_memos_by_date(target_date, category_id)
-                results[category_id] = count
-                
-                # 카테고리 간 딜레이 (서버 부하 방지)
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                self.log_error(f"{category_name} 카테고리 수집 실패: {e}")
-                results[category_id] = 0
-        
-        # 전체 결과 요약
-        total_memos = sum(results.values())
+        # 카테고리별 수집을 플랫폼 예산 안에서 병렬 실행 (실패한 카테고리는 0개)
+        units = [
+            CollectionUnit(
+                category_id, category_name,
+                lambda category_id=category_id: self.collect_event_ask_memos_by_date(target_date, category_id)
+            )
+            for category_id, category_name in self.api.EVENT_ASK_CATEGORIES.items()
+        ]
+        report = await CollectionScheduler("babitalk").run(units)
         
-        return results
+        return report.values(default=0)
     
     async def collect_talks_by_date(self, target_date: str, service_id: int) -> int:
         """
@@ -205,66 +187,50 @@ class BabitalkDataCollector(LoggedClass):
             service_id: 서비스 ID (79: 성형, 71: 쁘띠/피부, 72: 일상)
         
         Returns:
-            int: 수집된 자유톡 수
+            int: 수집된 자유톡 수 (재개 전 저장분 포함)
         """
-        import time
-        start_time = time.time()
-        last_progress_time = start_time
-        
-        
         # 바비톡 커뮤니티 생성 또는 조회
         babitalk_community = await self._get_or_create_babitalk_community()
         
+        # 페이지마다 저장 후 search_after 커서를 체크포인트로 남겨 중단 시 이어서 수집
+        checkpoint = DateCheckpoint(self.db, "babitalk_talk", target_date, service_id)
+        start_search_after, stats = await run_db(checkpoint.resume)
+        total_talks = stats.get("talks", 0)
+        total_comments = stats.get("comments", 0)
+        
         try:
-            # API에서 해당 날짜의 자유톡 데이터 가져오기
-            talks = await self.api.get_talks_by_date(target_date, service_id)
-            
-            if not talks:
-                return 0
-            
-            # 각 자유톡 처리
-            total_talks = 0
-            total_comments = 0
-            for talk in talks:
-                try:
-                    # 중복 체크: 이미 저장된 자유톡인지 확인
-                    existing_article = self.db.get_article_by_platform_id_and_community_article_id("babitalk_talk", str(talk.id))
-                    article_id = None
-                    
-                    if existing_article:
-                        article_id = existing_article['id']  # 기존 게시글의 DB ID 사용
-                    else:
-                        # 자유톡 정보 저장
-                        article_id = await self._save_talk(talk, babitalk_community['id'])
-                        if article_id:
-                            total_talks += 1
-                    
-                    # 댓글이 있는 경우 댓글 수집 (자유톡이 중복이어도 댓글은 수집)
-                    if article_id and talk.total_comment > 0:
+            async def save_page(talks: List[BabitalkTalk], next_search_after: Optional[int]):
+                nonlocal total_talks, total_comments
+                
+                # 댓글이 있는 자유톡은 댓글을 먼저 조회 (자유톡이 중복이어도 댓글은 수집)
+                comments_by_talk = {}
+                for talk in talks:
+                    if talk.total_comment > 0:
                         try:
-                            comments, _ = await self.api.get_comments(talk.id, page=1)
-                            if comments:
-                                saved_comments = await self._save_comments(comments, article_id)
-                                total_comments += saved_comments
+                            comments_by_talk[talk.id], _ = await self.api.get_comments(talk.id, page=1)
                         except Exception as e:
                             self.log_error(f"❌ 댓글 수집 실패 (자유톡 ID: {talk.id}): {e}")
-                    
-                    # 10분마다 진행상태 로그
-                    current_time = time.time()
-                    if current_time - last_progress_time >= 1800:  # 30분 = 1800초
-                        last_progress_time = current_time
-                            
-                except Exception as e:
-                    self.log_error(f"❌ 자유톡 처리 실패 (ID: {talk.id}): {e}")
-                    continue
+                
+                # HTTP 조회를 끝낸 페이지의 자유톡과 댓글 저장은 writer 스레드 호출 하나(작업 단위)로 처리
+                saved_talks, saved_comments = await self.async_db.run_unit_of_work(
+                    self._write_talks, talks, comments_by_talk, babitalk_community['id']
+                )
+                total_talks += saved_talks
+                total_comments += saved_comments
+                
+                await run_db_write(checkpoint.save, next_search_after, talks[-1].id if talks else None,
+                                {"talks": total_talks, "comments": total_comments})
+            
+            # API에서 해당 날짜의 자유톡 데이터를 페이지 단위로 수집/저장
+            await self.api.get_talks_by_date(target_date, service_id, start_search_after=start_search_after or 0, on_page=save_page,
+                                             on_complete=checkpoint.mark_end)
+            await run_db_write(checkpoint.complete_if_reached_end, {"talks": total_talks, "comments": total_comments})
             
-            end_time = time.time()
-            elapsed_time = end_time - start_time
             return total_talks
             
         except Exception as e:
             self.log_error(f"자유톡 수집 실패: {e}")
-            return 0
+            return total_talks
     
     async def collect_all_talks_by_date(self, target_date: str) -> Dict[int, int]:
         """
@@ -277,18 +243,16 @@ class BabitalkDataCollector(LoggedClass):
             Dict[int, int]: 카테고리별 수집된 자유톡 수
         """
         
-        results = {}
-        
-        # 모든 자유톡 카테고리 수집
-        for service_id, category_name in self.api.TALK_SERVICE_CATEGORIES.items():
-            try:
-                count = await self.collect_talks_by_date(target_date, service_id)
-                results[service_id] = count
-                
-            except Exception as e:
-                print(f"❌ {category_name} 카테고리 수집 실패: {e}")
-                results[service_id] = 0
-                continue
+        # 서비스별 수집을 플랫폼 예산 안에서 병렬 실행 (실패한 서비스는 0개)
+        units = [
+            CollectionUnit(
+                service_id, category_name,
+                lambda service_id=service_id: self.collect_talks_by_date(target_date, service_id)
+            )
+            for service_id, category_name in self.api.TALK_SERVICE_CATEGORIES.items()
+        ]
+        report = await CollectionScheduler("babitalk").run(units)
+        results = report.values(default=0)
         
         # 전체 결과 요약
         total_talks = sum(results.values())
@@ -310,7 +274,7 @@ class BabitalkDataCollector(LoggedClass):
         
         try:
             # 먼저 해당 자유톡이 데이터베이스에 있는지 확인
-            article = self.db.get_article_by_platform_id_and_community_article_id("babitalk_talk", str(talk_id))
+            article = await self.async_db.get_article_by_platform_id_and_community_article_id("babitalk_talk", str(talk_id))
             
             if not article:
                 print(f"⚠️  자유톡 ID {talk_id}가 데이터베이스에 없습니다. 먼저 자유톡을 수집해주세요.")
@@ -369,13 +333,13 @@ class BabitalkDataCollector(LoggedClass):
                 return 0
             
             total_comments = 0
+            existing_talk_ids = await self.async_db.get_article_ids_by_community_article_ids("babitalk_talk", [str(talk.id) for talk in talks])
             
             # 각 자유톡의 댓글 수집
             for talk in talks:
                 try:
                     # 중복 체크: 이미 저장된 자유톡인지 확인
-                    existing_article = self.db.get_article_by_platform_id_and_community_article_id("babitalk_talk", str(talk.id))
-                    if not existing_article:
+                    if str(talk.id) not in existing_talk_ids:
                         # print(f"⏭️  자유톡 {talk.id}는 데이터베이스에 없습니다. 댓글 수집 건너뜀")
                         continue
                     
@@ -398,7 +362,7 @@ class BabitalkDataCollector(LoggedClass):
         """바비톡 커뮤니티 생성 또는 조회"""
         try:
             # 기존 바비톡 커뮤니티 조회
-            existing_community = self.db.get_community_by_name("바비톡")
+            existing_community = await self.async_db.get_community_by_name("바비톡")
             
             if existing_community:
                 return existing_community
@@ -411,7 +375,7 @@ class BabitalkDataCollector(LoggedClass):
                 description="바비톡 시술 후기 커뮤니티"
             )
             
-            community_id = self.db.insert_community(babitalk_community)
+            community_id = await self.async_db.insert_community(babitalk_community)
             
             return {
                 'id': community_id,
@@ -424,172 +388,223 @@ class BabitalkDataCollector(LoggedClass):
             print(f"    ⚠️  바비톡 커뮤니티 생성 실패: {e}")
             raise e
     
-    async def _save_review(self, review: BabitalkReview, community_id: int) -> Optional[int]:
-        """후기 정보를 데이터베이스에 저장"""
-        try:
-            # JSON 데이터 변환
-            categories_json = json.dumps(review.categories, ensure_ascii=False)
-            sub_categories_json = json.dumps(review.sub_categories, ensure_ascii=False)
-            images_json = json.dumps([{
-                'id': img.id,
-                'url': img.url,
-                'small_url': img.small_url,
-                'is_after': img.is_after,
-                'order': img.order,
-                'is_main': img.is_main,
-                'is_blur': img.is_blur
-            } for img in review.images], ensure_ascii=False)
-            
-            # 날짜 파싱
+    def _write_reviews(self, db: DatabaseManager, platform_id: str, items: List[Any],
+                       to_db_review: Callable[[Any, int], Review], community_id: int) -> int:
+        """
+        페이지의 후기/발품후기 저장 (AsyncDatabase.run_unit_of_work 로 작업 단위 안에서 실행)
+        
+        Args:
+            platform_id: 저장 시 사용하는 플랫폼 ID (중복 체크 기준)
+            items: 바비톡 후기 또는 발품후기 목록
+            to_db_review: 항목을 저장용 Review 로 변환하는 함수
+            community_id: 바비톡 커뮤니티 ID
+        
+        Returns:
+            int: 새로 저장한 수
+        """
+        if not items:
+            return 0
+        
+        # 중복 체크: 이미 저장된 ID를 한 번에 조회하고 새 항목만 일괄 저장
+        existing_ids = db.get_existing_review_ids(platform_id, [str(item.id) for item in items])
+        db_reviews = []
+        for item in items:
+            if str(item.id) in existing_ids:
+                continue
             try:
-                created_at = datetime.strptime(review.created_at, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                created_at = datetime.now()
-            
-            # 후기 제목 생성 (카테고리 정보 활용)
-            title = f"{', '.join(review.categories)} - {', '.join(review.sub_categories)}"
-            
-            # 병원명과 담당의명 추출
-            hospital_name = review.hospital.name if review.hospital else ""
-            doctor_name = review.search_doctor.name if review.search_doctor else ""
-            
-            db_review = Review(
-                id=None,
-                platform_id="babitalk_review",
-                platform_review_id=str(review.id),
-                community_id=community_id,
-                title=title,
-                content=review.text,
-                images=images_json,
-                writer_nickname=review.user.name,
-                writer_id=str(review.user.id),
-                like_count=0,  # 바비톡 API에는 좋아요 수가 없음
-                rating=review.rating,
-                price=review.price,
-                categories=categories_json,
-                sub_categories=sub_categories_json,
-                surgery_date=review.surgery_date,
-                hospital_name=hospital_name,
-                doctor_name=doctor_name,
-                is_blind=review.is_blind,
-                is_image_blur=review.is_image_blur,
-                is_certificated_review=review.is_certificated_review,
-                created_at=created_at,
-                collected_at=datetime.now()  # 수집 시간 기록
-            )
-            
-            review_id = self.db.insert_review(db_review)
-            return review_id
-            
-        except Exception as e:
-            print(f"    ⚠️  후기 저장 실패: {e}")
-            return None
+                db_reviews.append(to_db_review(item, community_id))
+            except Exception as e:
+                print(f"    ⚠️  후기 변환 실패 (ID: {item.id}): {e}")
+        return len(db.bulk_upsert_reviews(db_reviews))
     
-    async def _save_event_ask_memo(self, memo: BabitalkEventAskMemo, community_id: int) -> Optional[int]:
-        """발품후기 정보를 데이터베이스에 저장"""
+    def _to_db_review(self, review: BabitalkReview, community_id: int) -> Review:
+        """바비톡 후기를 저장용 Review 로 변환"""
+        # JSON 데이터 변환
+        categories_json = json.dumps(review.categories, ensure_ascii=False)
+        sub_categories_json = json.dumps(review.sub_categories, ensure_ascii=False)
+        images_json = json.dumps([{
+            'id': img.id,
+            'url': img.url,
+            'small_url': img.small_url,
+            'is_after': img.is_after,
+            'order': img.order,
+            'is_main': img.is_main,
+            'is_blur': img.is_blur
+        } for img in review.images], ensure_ascii=False)
+        
+        # 날짜 파싱
         try:
-            # 날짜 파싱 (first_write_at은 "20분전", "17시간전" 등의 형식이므로 현재 시간 기준으로 계산)
-            try:
-                created_at = self.api._parse_relative_time_to_date(memo.first_write_at)
-            except Exception:
-                created_at = datetime.now()
-            
-            # 발품후기 제목 생성 (카테고리 정보 활용)
-            title = f"{memo.category} - {memo.region}"
-            
-            # 카테고리 정보를 JSON으로 변환
-            categories_json = json.dumps([memo.category], ensure_ascii=False)
-            sub_categories_json = json.dumps([], ensure_ascii=False)  # 발품후기에는 서브카테고리가 없음
-            
-            # 이미지는 빈 배열 (발품후기에는 이미지가 없음)
-            images_json = json.dumps([], ensure_ascii=False)
-            
-            db_memo = Review(
-                id=None,
-                platform_id="babitalk_event_ask",  # 발품후기임을 구분하기 위한 플랫폼 ID
-                platform_review_id=str(memo.id),
-                community_id=community_id,
-                title=title,
-                content=memo.text,
-                images=images_json,
-                writer_nickname=memo.user.name,
-                writer_id=str(memo.user.id),
-                like_count=0,  # 바비톡 API에는 좋아요 수가 없음
-                rating=memo.star_score,
-                price=memo.real_price,
-                categories=categories_json,
-                sub_categories=sub_categories_json,
-                surgery_date="",  # 발품후기에는 수술 날짜가 없음
-                hospital_name=memo.hospital_name,
-                doctor_name="",  # 발품후기에는 담당의 정보가 없음
-                is_blind=False,  # 발품후기에는 블라인드 정보가 없음
-                is_image_blur=False,  # 발품후기에는 이미지 블러 정보가 없음
-                is_certificated_review=False,  # 발품후기에는 인증 후기 정보가 없음
-                created_at=created_at,
-                collected_at=datetime.now()  # 수집 시간 기록
-            )
-            
-            memo_id = self.db.insert_review(db_memo)
-            return memo_id
-            
-        except Exception as e:
-            print(f"    ⚠️  발품후기 저장 실패: {e}")
-            return None
+            created_at = datetime.strptime(review.created_at, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            created_at = datetime.now()
+        
+        # 후기 제목 생성 (카테고리 정보 활용)
+        title = f"{', '.join(review.categories)} - {', '.join(review.sub_categories)}"
+        
+        # 병원명과 담당의명 추출
+        hospital_name = review.hospital.name if review.hospital else ""
+        doctor_name = review.search_doctor.name if review.search_doctor else ""
+        
+        return Review(
+            id=None,
+            platform_id="babitalk_review",
+            platform_review_id=str(review.id),
+            community_id=community_id,
+            title=title,
+            content=review.text,
+            images=images_json,
+            writer_nickname=review.user.name,
+            writer_id=str(review.user.id),
+            like_count=0,  # 바비톡 API에는 좋아요 수가 없음
+            rating=review.rating,
+            price=review.price,
+            categories=categories_json,
+            sub_categories=sub_categories_json,
+            surgery_date=review.surgery_date,
+            hospital_name=hospital_name,
+            doctor_name=doctor_name,
+            is_blind=review.is_blind,
+            is_image_blur=review.is_image_blur,
+            is_certificated_review=review.is_certificated_review,
+            created_at=created_at,
+            collected_at=datetime.now()  # 수집 시간 기록
+        )
     
-    async def _save_talk(self, talk: BabitalkTalk, community_id: int) -> Optional[int]:
-        """자유톡 정보를 데이터베이스에 저장"""
+    def _to_db_event_ask_memo(self, memo: BabitalkEventAskMemo, community_id: int) -> Review:
+        """바비톡 발품후기를 저장용 Review 로 변환"""
+        # 날짜 파싱 (first_write_at은 "20분전", "17시간전" 등의 형식이므로 현재 시간 기준으로 계산)
         try:
-            # 날짜 파싱
+            created_at = self.api._parse_relative_time_to_date(memo.first_write_at)
+        except Exception:
+            created_at = datetime.now()
+        
+        # 발품후기 제목 생성 (카테고리 정보 활용)
+        title = f"{memo.category} - {memo.region}"
+        
+        # 카테고리 정보를 JSON으로 변환
+        categories_json = json.dumps([memo.category], ensure_ascii=False)
+        sub_categories_json = json.dumps([], ensure_ascii=False)  # 발품후기에는 서브카테고리가 없음
+        
+        # 이미지는 빈 배열 (발품후기에는 이미지가 없음)
+        images_json = json.dumps([], ensure_ascii=False)
+        
+        return Review(
+            id=None,
+            platform_id="babitalk_event_ask",  # 발품후기임을 구분하기 위한 플랫폼 ID
+            platform_review_id=str(memo.id),
+            community_id=community_id,
+            title=title,
+            content=memo.text,
+            images=images_json,
+            writer_nickname=memo.user.name,
+            writer_id=str(memo.user.id),
+            like_count=0,  # 바비톡 API에는 좋아요 수가 없음
+            rating=memo.star_score,
+            price=memo.real_price,
+            categories=categories_json,
+            sub_categories=sub_categories_json,
+            surgery_date="",  # 발품후기에는 수술 날짜가 없음
+            hospital_name=memo.hospital_name,
+            doctor_name="",  # 발품후기에는 담당의 정보가 없음
+            is_blind=False,  # 발품후기에는 블라인드 정보가 없음
+            is_image_blur=False,  # 발품후기에는 이미지 블러 정보가 없음
+            is_certificated_review=False,  # 발품후기에는 인증 후기 정보가 없음
+            created_at=created_at,
+            collected_at=datetime.now()  # 수집 시간 기록
+        )
+    
+    def _to_db_talk(self, talk: BabitalkTalk, community_id: int) -> Article:
+        """바비톡 자유톡을 저장용 Article 로 변환"""
+        # 날짜 파싱
+        try:
+            created_at = datetime.strptime(talk.created_at, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            created_at = datetime.now()
+        
+        # 이미지 정보를 JSON으로 변환
+        images_json = json.dumps([{
+            'id': img.id,
+            'url': img.url,
+            'small_url': img.small_url,
+            'is_after': img.is_after,
+            'order': img.order,
+            'is_main': img.is_main,
+            'is_blur': img.is_blur
+        } for img in talk.images], ensure_ascii=False)
+        
+        # 서비스 카테고리명 가져오기
+        service_category = self.api.TALK_SERVICE_CATEGORIES.get(talk.service_id, f"서비스{talk.service_id}")
+        
+        # 자유톡을 Article로 저장
+        return Article(
+            id=None,
+            platform_id="babitalk_talk",
+            community_article_id=str(talk.id),
+            community_id=community_id,
+            title=talk.title,
+            content=talk.text,
+            writer_nickname=talk.user.name,
+            writer_id=str(talk.user.id),
+            like_count=0,  # 바비톡 API에는 좋아요 수가 없음
+            comment_count=talk.total_comment,
+            view_count=0,  # 바비톡 API에는 조회수가 없음
+            images=images_json,
+            created_at=created_at,
+            category_name=service_category,
+            collected_at=datetime.now()  # 수집 시간 기록
+        )
+    
+    def _write_talks(self, db: DatabaseManager, talks: List[BabitalkTalk], comments_by_talk: Dict[int, List[BabitalkComment]],
+                     community_id: int) -> Tuple[int, int]:
+        """
+        페이지의 자유톡과 댓글 저장 (AsyncDatabase.run_unit_of_work 로 작업 단위 안에서 실행)
+        
+        Returns:
+            Tuple[int, int]: (새로 저장한 자유톡 수, 저장한 댓글 수)
+        """
+        if not talks:
+            return 0, 0
+        
+        # 중복 체크: 이미 저장된 자유톡의 DB ID를 한 번에 조회하고 새 자유톡만 일괄 저장
+        article_ids = db.get_article_ids_by_community_article_ids("babitalk_talk", [str(talk.id) for talk in talks])
+        db_articles = []
+        for talk in talks:
+            if str(talk.id) in article_ids:
+                continue
             try:
-                created_at = datetime.strptime(talk.created_at, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                created_at = datetime.now()
-            
-            # 이미지 정보를 JSON으로 변환
-            images_json = json.dumps([{
-                'id': img.id,
-                'url': img.url,
-                'small_url': img.small_url,
-                'is_after': img.is_after,
-                'order': img.order,
-                'is_main': img.is_main,
-                'is_blur': img.is_blur
-            } for img in talk.images], ensure_ascii=False)
-            
-            # 서비스 카테고리명 가져오기
-            service_category = self.api.TALK_SERVICE_CATEGORIES.get(talk.service_id, f"서비스{talk.service_id}")
-            
-            # 자유톡을 Article로 저장
-            db_article = Article(
-                id=None,
-                platform_id="babitalk_talk",
-                community_article_id=str(talk.id),
-                community_id=community_id,
-                title=talk.title,
-                content=talk.text,
-                writer_nickname=talk.user.name,
-                writer_id=str(talk.user.id),
-                like_count=0,  # 바비톡 API에는 좋아요 수가 없음
-                comment_count=talk.total_comment,
-                view_count=0,  # 바비톡 API에는 조회수가 없음
-                images=images_json,
-                created_at=created_at,
-                category_name=service_category,
-                collected_at=datetime.now()  # 수집 시간 기록
-            )
-            
-            article_id = self.db.insert_article(db_article)
-            return article_id
-            
-        except Exception as e:
-            print(f"    ⚠️  자유톡 저장 실패: {e}")
-            return None
+                db_articles.append(self._to_db_talk(talk, community_id))
+            except Exception as e:
+                self.log_error(f"❌ 자유톡 처리 실패 (ID: {talk.id}): {e}")
+        mapping = db.bulk_upsert_articles(db_articles)
+        for (_, community_article_id), article_id in mapping.items():
+            article_ids[community_article_id] = article_id
+        saved_talks = len(mapping)
+        
+        # 일괄 저장이 돌려준 DB ID 로 댓글 저장 (자유톡이 중복이어도 댓글은 저장)
+        saved_comments = 0
+        for talk in talks:
+            article_id = article_ids.get(str(talk.id))
+            comments = comments_by_talk.get(talk.id)
+            if article_id and comments:
+                saved_comments += self._write_comments(db, comments, article_id)
+        return saved_talks, saved_comments
     
     async def _save_comments(self, comments: List[BabitalkComment], article_id: int) -> int:
-        """댓글 정보를 데이터베이스에 저장"""
+        """댓글 정보를 데이터베이스에 저장 (작업 단위 하나)"""
+        return await self.async_db.run_unit_of_work(self._write_comments, comments, article_id)
+    
+    def _write_comments(self, db: DatabaseManager, comments: List[BabitalkComment], article_id: int) -> int:
+        """댓글 정보를 데이터베이스에 저장 (작업 단위 안에서 실행)"""
         from database.models import Comment as DBComment
         
-        saved_count = 0
+        db_comments = []
+        
+        try:
+            # 중복 체크: 이미 저장된 댓글 ID를 한 번에 조회
+            existing_comment_ids = db.get_existing_comment_ids(article_id, [str(comment.id) for comment in comments])
+        except Exception as e:
+            self.log_error(f"댓글 중복 조회 실패 (게시글 ID: {article_id}): {e}")
+            return 0
         
         for comment in comments:
             try:
@@ -598,9 +613,7 @@ class BabitalkDataCollector(LoggedClass):
                     continue
                 
                 # 중복 체크: 이미 저장된 댓글인지 확인
-                existing_comment = self.db.get_comment_by_article_id_and_comment_id(str(article_id), str(comment.id))
-                if existing_comment:
-                    # print(f"        ⏭️  댓글 {comment.id}는 이미 저장되어 있습니다. 건너뜀")
+                if str(comment.id) in existing_comment_ids:
                     continue
                 
                 # 날짜 파싱
@@ -624,16 +637,22 @@ class BabitalkDataCollector(LoggedClass):
                 # 플랫폼 정보 추가 (새로운 방식 지원)
                 db_comment.platform_id = "babitalk_talk"
                 
-                comment_id = self.db.insert_comment(db_comment)
-                if comment_id:
-                    saved_count += 1
-                    # self.log_info(f"댓글 저장 완료: 바비톡 ID {comment.id} -> DB ID {comment_id}")
+                db_comments.append(db_comment)
                 
             except Exception as e:
-                self.log_error(f"댓글 저장 실패 (바비톡 ID: {comment.id}): {e}")
+                self.log_error(f"댓글 변환 실패 (바비톡 ID: {comment.id}): {e}")
                 continue
         
-        return saved_count
+        if not db_comments:
+            return 0
+        
+        try:
+            # 중복으로 무시된 댓글을 빼고 실제 저장된 댓글 수 반환 (이미 저장된 댓글은 위에서 제외함)
+            saved = db.bulk_upsert_comments(db_comments)
+            return len(saved)
+        except Exception as e:
+            self.log_error(f"댓글 일괄 저장 실패 (게시글 ID: {article_id}): {e}")
+            return 0
     
     def get_statistics(self) -> Dict:
         """바비톡 데이터 통계 조회"""
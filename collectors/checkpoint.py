@@ -0,0 +1,106 @@
+"""
+날짜별 수집 체크포인트
+
+(플랫폼, 날짜, 카테고리) 수집 단위마다 다음에 요청할 페이지 커서와 마지막으로 처리한 항목을 저장합니다.
+페이지를 저장할 때마다 체크포인트를 갱신하므로, 서버 재시작/배포로 중단된 수집은 1페이지가 아니라
+마지막으로 저장한 페이지 다음부터 이어서 진행됩니다.
+
+플랫폼 메서드가 날짜의 끝(대상 날짜보다 오래된 항목, 마지막 페이지)에 도달했다고 알린 경우에만 완료로
+기록합니다. 요청 실패로 수집이 중간에 끝나면 체크포인트는 진행 중으로 남아 다음 실행에서 재개됩니다.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from utils.logger import LoggedClass
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+
+
+class DateCheckpoint(LoggedClass):
+    """(플랫폼, 날짜, 카테고리) 단위 수집 체크포인트"""
+
+    def __init__(self, db, platform_id: str, target_date: str, category: Any = ""):
+        """
+        Args:
+            db: 체크포인트 저장에 사용할 DB 매니저 (DatabaseManager / SQLAlchemyDatabaseManager)
+            platform_id: 플랫폼 ID (예: "gangnamunni", "babitalk_talk")
+            target_date: 수집 날짜 (YYYY-MM-DD)
+            category: 카테고리/서비스/게시판 ID (없으면 빈 문자열)
+        """
+        super().__init__("DateCheckpoint")
+        self.db = db
+        self.platform_id = platform_id
+        self.target_date = target_date
+        self.category = str(category)
+        self.cursor = None
+        self.last_item_id = None
+        self.reached_end = False
+
+    @property
+    def label(self) -> str:
+        return f"{self.platform_id}/{self.target_date}" + (f"/{self.category}" if self.category else "")
+
+    def resume(self) -> Tuple[Optional[Any], Dict[str, Any]]:
+        """
+        이어서 수집할 커서와 지금까지의 집계 반환
+
+        완료된 체크포인트는 재수집 요청으로 보고 처음부터 다시 수집합니다.
+
+        Returns:
+            Tuple[Optional[Any], Dict[str, Any]]: (다음 페이지 커서 또는 None, 저장된 집계)
+        """
+        try:
+            checkpoint = self.db.get_collection_checkpoint(self.platform_id, self.target_date, self.category)
+        except Exception as e:
+            self.log_warning(f"⚠️ {self.label} 체크포인트 조회 실패, 처음부터 수집합니다: {e}")
+            return None, {}
+
+        if not checkpoint or checkpoint["status"] != STATUS_IN_PROGRESS or checkpoint["cursor"] is None:
+            return None, {}
+
+        self.log_info(
+            f"⏯️ {self.label} 수집을 체크포인트부터 재개합니다 "
+            f"(커서: {checkpoint['cursor']}, 마지막 항목: {checkpoint['last_item_id']})"
+        )
+        self.cursor, self.last_item_id = checkpoint["cursor"], checkpoint["last_item_id"]
+        return checkpoint["cursor"], checkpoint["stats"] or {}
+
+    def save(self, cursor: Any, last_item_id: Any = None, stats: Optional[Dict[str, Any]] = None):
+        """페이지 처리 후 다음 페이지 커서 저장 (저장 실패는 수집을 중단하지 않음)"""
+        self.cursor, self.last_item_id = cursor, last_item_id
+        self._write(cursor, last_item_id, stats, STATUS_IN_PROGRESS)
+
+    async def mark_end(self):
+        """플랫폼 메서드의 on_complete 콜백: 날짜의 끝에 도달했음을 기록"""
+        self.reached_end = True
+
+    def complete(self, stats: Optional[Dict[str, Any]] = None):
+        """수집 단위 완료 기록"""
+        self._write(None, None, stats, STATUS_COMPLETED)
+
+    def complete_if_reached_end(self, stats: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        날짜의 끝에 도달한 경우에만 완료 기록
+
+        도달하지 못했으면(요청 실패로 중단) 마지막 커서를 유지한 채 집계만 갱신해 다음 실행에서 재개합니다.
+
+        Returns:
+            bool: 완료로 기록했는지 여부
+        """
+        if self.reached_end:
+            self.complete(stats)
+            return True
+
+        self.log_warning(f"⚠️ {self.label} 수집이 날짜 끝에 도달하지 못해 체크포인트를 진행 중으로 유지합니다 (커서: {self.cursor})")
+        if self.cursor is not None:
+            self._write(self.cursor, self.last_item_id, stats, STATUS_IN_PROGRESS)
+        return False
+
+    def _write(self, cursor: Any, last_item_id: Any, stats: Optional[Dict[str, Any]], status: str):
+        try:
+            self.db.save_collection_checkpoint(
+                self.platform_id, self.target_date, self.category,
+                cursor, str(last_item_id) if last_item_id is not None else None, stats, status
+            )
+        except Exception as e:
+            self.log_warning(f"⚠️ {self.label} 체크포인트 저장 실패: {e}")
@@ -1,20 +1,30 @@
 import asyncio
 import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Tuple
 from platforms.gannamunni import GangnamUnniAPI, Article, Comment, Review
-from database.models import DatabaseManager, Community, Article as DBArticle, Comment as DBComment
+from platforms.circuit_breaker import retry_delay, DEFAULT_MAX_RETRIES
+from collectors.scheduler import CollectionScheduler, CollectionUnit
+from collectors.checkpoint import DateCheckpoint
+from database.models import DatabaseManager, Community, Article as DBArticle, Comment as DBComment, Review as DBReview
+from database.async_db import AsyncDatabase, run_db, run_db_write
 from utils.logger import LoggedClass
 
+# 상세 조회(댓글/리뷰 상세)를 한 번에 병렬 실행할 단위 (실제 동시 요청 수는 호스트별 속도 제한기가 제어)
+DETAIL_FETCH_CHUNK_SIZE = 20
+
 class GangnamUnniDataCollector(LoggedClass):
     def __init__(self, token: str = None):
         super().__init__("GangnamUnniCollector")
-        self.api = GangnamUnniAPI(token=token)
+        # 토큰이 없으면(작업 재개 시 환경변수도 없는 경우 포함) API 기본 토큰 사용
+        self.api = GangnamUnniAPI(token=token) if token else GangnamUnniAPI()
         self.db = DatabaseManager()  # db_path 파라미터 제거
+        self.async_db = AsyncDatabase(self.db)  # async 메서드에서는 DB 스레드 풀로 실행
     
     async def collect_articles_by_date(self, target_date: str, category: str = "hospital_question", include_reviews: bool = True) -> Dict[str, int]:
         """
         특정 날짜의 강남언니 게시글과 리뷰를 수집하고 데이터베이스에 저장합니다.
+        리뷰는 카테고리와 무관하므로 여러 카테고리를 수집할 때는 collect_all_categories_by_date 를 사용하세요.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식)
@@ -24,211 +34,219 @@ class GangnamUnniDataCollector(LoggedClass):
         Returns:
             Dict[str, int]: {"articles": 수집된 게시글 수, "comments": 수집된 댓글 수, "reviews": 수집된 리뷰 수}
         """
+        if include_reviews:
+            # 리뷰 파이프라인과 게시글 파이프라인을 동시에 실행
+            article_result, review_result = await asyncio.gather(
+                self.collect_category_articles_by_date(target_date, category),
+                self.collect_reviews_by_date(target_date)
+            )
+        else:
+            article_result = await self.collect_category_articles_by_date(target_date, category)
+            review_result = {"reviews": 0}
+        
+        return {
+            "articles": article_result["articles"],
+            "comments": article_result["comments"],
+            "reviews": review_result["reviews"]
+        }
+    
+    async def collect_reviews_by_date(self, target_date: str) -> Dict[str, int]:
+        """
+        특정 날짜의 강남언니 리뷰를 수집하고 데이터베이스에 저장합니다. (날짜당 1회 실행)
+        페이지마다 저장 후 체크포인트를 남기므로 중단된 수집은 다음 페이지부터 재개합니다.
+        
+        Args:
+            target_date: 수집할 날짜 (YYYY-MM-DD 형식)
+        
+        Returns:
+            Dict[str, int]: {"reviews": 수집된 리뷰 수 (재개 전 저장분 포함)}
+        """
         import time
         start_time = time.time()
         last_progress_time = start_time
         
-        
-        # 강남언니 커뮤니티 생성 또는 조회
-        gangnamunni_community = await self._get_or_create_gannamunni_community()
+        checkpoint = DateCheckpoint(self.db, "gangnamunni_review", target_date)
+        start_page_index, stats = await run_db(checkpoint.resume)
+        total_reviews = stats.get("reviews", 0)
         
         try:
-            # API에서 해당 날짜의 게시글 데이터 가져오기
-            articles = await self.api.get_articles_by_date(target_date, category=category)
-            
-            # 실제 리뷰 API에서 리뷰 수집 (include_reviews가 True인 경우)
-            reviews = []
-            if include_reviews:
-                reviews = await self.api.get_reviews_by_date(target_date)
-            
-            if not articles and not reviews:
-                return {"articles": 0, "comments": 0, "reviews": 0}
-            
-            # 1. 리뷰 먼저 저장 (실제 리뷰 데이터만)
-            total_articles = 0
-            total_comments = 0
-            total_reviews = 0
-            
-            if reviews:
-                batch_size = 3  # 한 번에 처리할 리뷰 수 (상세 API 호출로 인해 작게 설정)
-                for i in range(0, len(reviews), batch_size):
-                    batch_reviews = reviews[i:i + batch_size]
+            # 강남언니 커뮤니티 생성 또는 조회
+            gangnamunni_community = await self._get_or_create_gannamunni_community()
+            
+            async def save_page(reviews: List[Review], next_page_index: int):
+                nonlocal total_reviews, last_progress_time
+                
+                # 중복 체크: 이미 저장된 리뷰 ID를 한 번에 조회
+                existing_review_ids = await self.async_db.get_existing_review_ids("gangnamunni_review", [str(review.id) for review in reviews]) if reviews else set()
+                new_reviews = [review for review in reviews if str(review.id) not in existing_review_ids]
+                
+                # 상세 조회는 호스트별 속도 제한 범위 안에서 병렬로 실행
+                db_reviews = []
+                for i in range(0, len(new_reviews), DETAIL_FETCH_CHUNK_SIZE):
+                    batch_reviews = new_reviews[i:i + DETAIL_FETCH_CHUNK_SIZE]
+                    review_details = await self.api.get_review_details([review.id for review in batch_reviews])
                     
-                    # 배치 내에서 순차 처리 (API 부하 방지)
                     for review in batch_reviews:
-                        try:
-                            # 중복 체크: 이미 저장된 리뷰인지 확인
-                            existing_review = self.db.get_review_by_platform_id_and_platform_review_id("gangnamunni_review", str(review.id))
-                            if existing_review:
-                                continue
-                            
-                            # 리뷰 정보 저장
-                            review_id = await self._save_review(review, gangnamunni_community['id'])
-                            if review_id:
-                                total_reviews += 1
-                            
-                        except Exception as e:
-                            self.log_error(f"❌ 리뷰 처리 실패 (ID: {review.id}): {e}")
-                            continue
-                    
-                    # 배치 간 딜레이 (API 부하 방지)
-                    if i + batch_size < len(reviews):
-                        await asyncio.sleep(3)
-                    
-                    # 10분마다 진행상태 로그
-                    current_time = time.time()
-                    if current_time - last_progress_time >= 600:  # 10분 = 600초
-                        self.log_info(f"📊 리뷰 수집 진행중... {i+1}/{len(reviews)} (저장: {total_reviews}개)")
-                        last_progress_time = current_time
-            
-            # 2. 게시글 저장 (리뷰가 아닌 일반 게시글)
-            if articles:
-                for i, article in enumerate(articles):
-                    try:
-                        # 중복 체크: 이미 저장된 게시글인지 확인
-                        existing_article = self.db.get_article_by_platform_id_and_community_article_id("gangnamunni", str(article.id))
-                        article_id = None
-                        
-                        if existing_article:
-                            article_id = existing_article['id']  # 기존 게시글의 DB ID 사용
-                        else:
-                            # 게시글 정보 저장 (리뷰가 아닌 일반 게시글)
-                            article_id = await self._save_article(article, gangnamunni_community['id'])
-                            if article_id:
-                                total_articles += 1
-                        
-                        # 댓글이 있는 경우 댓글 수집 (게시글이 중복이어도 댓글은 수집)
-                        if article_id and article.comment_count > 0:
-                            try:
-                                comments = await self.api.get_comments(article.id)
-                                if comments:
-                                    saved_comments = await self._save_comments(comments, article_id)
-                                    total_comments += saved_comments
-                            except Exception as e:
-                                # 404 에러 발생 시 failover 처리
-                                if "404" in str(e) or "Not Found" in str(e):
-                                    self.log_error(f"❌ 404 에러 발생: 게시글 ID {article.id} 댓글 수집 실패")
-                                    await self._handle_404_failover(target_date, category, gangnamunni_community, articles, i)
-                                    return {"articles": total_articles, "comments": total_comments, "reviews": total_reviews}
-                                else:
-                                    self.log_error(f"❌ 댓글 수집 실패 (게시글 ID: {article.id}): {e}")
-                        
-                        # 10분마다 진행상태 로그
-                        current_time = time.time()
-                        if current_time - last_progress_time >= 600:  # 10분 = 600초
-                            self.log_info(f"📊 게시글 수집 진행중... {i+1}/{len(articles)} (게시글: {total_articles}개, 댓글: {total_comments}개)")
-                            last_progress_time = current_time
-                        
-                    except Exception as e:
-                        # 404 에러 발생 시 failover 처리
-                        if "404" in str(e) or "Not Found" in str(e):
-                            self.log_error(f"❌ 404 에러 발생: 게시글 ID {article.id} 처리 실패")
-                            await self._handle_404_failover(target_date, category, gangnamunni_community, articles, i)
-                            return {"articles": total_articles, "comments": total_comments, "reviews": total_reviews}
-                        else:
-                            self.log_error(f"❌ 게시글 처리 실패 (ID: {article.id}): {e}")
-                            continue
-            
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            
-            # 수집 완료 로그
-            
-            return {"articles": total_articles, "comments": total_comments, "reviews": total_reviews}
+                        db_review = self._to_db_review(review, gangnamunni_community['id'], review_details.get(review.id))
+                        if db_review:
+                            db_reviews.append(db_review)
+                
+                # 페이지의 리뷰는 한 번에 일괄 저장
+                if db_reviews:
+                    total_reviews += len(await self.async_db.bulk_upsert_reviews(db_reviews))
+                
+                await run_db_write(checkpoint.save, next_page_index, reviews[-1].id if reviews else None, {"reviews": total_reviews})
+                
+                # 10분마다 진행상태 로그
+                current_time = time.time()
+                if current_time - last_progress_time >= 600:  # 10분 = 600초
+                    self.log_info(f"📊 리뷰 수집 진행중... {next_page_index}페이지 (저장: {total_reviews}개)")
+                    last_progress_time = current_time
+            
+            # 실제 리뷰 API에서 페이지 단위로 수집/저장
+            await self.api.get_reviews_by_date(target_date, start_page_index=start_page_index or 0, on_page=save_page,
+                                               on_complete=checkpoint.mark_end)
+            await run_db_write(checkpoint.complete_if_reached_end, {"reviews": total_reviews})
+            
+            return {"reviews": total_reviews}
             
         except Exception as e:
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            
-            # 404 에러 발생 시 failover 처리
-            if "404" in str(e) or "Not Found" in str(e):
-                self.log_error(f"❌ 404 에러 발생: {target_date} 날짜 게시글 목록 조회 실패 (소요시간: {elapsed_time:.2f}초)")
-                await self._handle_404_failover(target_date, category, gangnamunni_community, [], 0)
-                return {"articles": 0, "comments": 0}
-            else:
-                self.log_error(f"❌ 날짜별 게시글 수집 중 오류 발생: {e} (소요시간: {elapsed_time:.2f}초)")
-                return {"articles": 0, "comments": 0}
+            elapsed_time = time.time() - start_time
+            self.log_error(f"❌ 날짜별 리뷰 수집 중 오류 발생: {e} (소요시간: {elapsed_time:.2f}초)")
+            return {"reviews": total_reviews}
     
-    async def _handle_404_failover(self, target_date: str, category: str, 
-                                 gangnamunni_community: Dict, articles: List[Article], failed_index: int):
+    async def collect_category_articles_by_date(self, target_date: str, category: str = "hospital_question") -> Dict[str, int]:
         """
-        404 에러 발생 시 failover 처리를 수행합니다.
+        특정 날짜의 강남언니 카테고리 게시글과 댓글을 수집하고 데이터베이스에 저장합니다. (리뷰 제외)
         
         Args:
-            target_date: 수집할 날짜
-            category: 카테고리
-            gangnamunni_community: 강남언니 커뮤니티 정보
-            articles: 수집된 게시글 목록
-            failed_index: 실패한 게시글의 인덱스
+            target_date: 수집할 날짜 (YYYY-MM-DD 형식)
+            category: 카테고리 (기본값: "hospital_question")
+        
+        Returns:
+            Dict[str, int]: {"articles": 수집된 게시글 수, "comments": 수집된 댓글 수} (재개 전 저장분 포함)
         """
         import time
-        failover_start_time = time.time()
+        start_time = time.time()
+        last_progress_time = start_time
         
-        self.log_error(f"🔄 404 에러로 인한 수집 중단. 15분 후 실패 지점부터 재시작합니다.")
-        self.log_error(f"📊 실패 지점: {failed_index + 1}번째 게시글 (총 {len(articles)}개 중)")
+        # 페이지마다 저장 후 체크포인트를 남기므로 중단된 수집은 다음 페이지부터 재개
+        checkpoint = DateCheckpoint(self.db, "gangnamunni", target_date, category)
+        start_page, stats = await run_db(checkpoint.resume)
+        total_articles = stats.get("articles", 0)
+        total_comments = stats.get("comments", 0)
+        # 댓글 조회에 실패한 (게시글 ID, DB 게시글 ID) 목록도 체크포인트에 남겨 재시작 후 다시 시도
+        failed_targets = [tuple(target) for target in stats.get("failed_comment_targets", [])]
         
-        # 15분 대기
-        self.log_info("⏰ 15분 대기 중...")
-        await asyncio.sleep(15 * 60)  # 15분 = 900초
+        def checkpoint_stats() -> Dict[str, Any]:
+            return {"articles": total_articles, "comments": total_comments,
+                    "failed_comment_targets": [list(target) for target in failed_targets]}
         
-        self.log_info("🔄 수집 재개를 시작합니다.")
+        try:
+            # 강남언니 커뮤니티 생성 또는 조회
+            gangnamunni_community = await self._get_or_create_gannamunni_community()
+            
+            async def save_page(articles: List[Article], next_page: int):
+                nonlocal total_articles, total_comments, last_progress_time
+                
+                # 페이지의 게시글은 writer 스레드 호출 하나(작업 단위)로 저장하고 DB ID 를 받아 댓글 수집 대상 선정
+                article_ids, saved_articles = await self.async_db.run_unit_of_work(self._write_articles, articles, gangnamunni_community['id'])
+                total_articles += saved_articles
+                # 게시글이 중복이어도 댓글은 수집
+                comment_targets = [
+                    (article.id, article_ids[str(article.id)])
+                    for article in articles
+                    if str(article.id) in article_ids and article.comment_count > 0
+                ]
+                
+                # 댓글은 호스트별 속도 제한 범위 안에서 병렬로 수집
+                for start in range(0, len(comment_targets), DETAIL_FETCH_CHUNK_SIZE):
+                    batch_targets = comment_targets[start:start + DETAIL_FETCH_CHUNK_SIZE]
+                    comments_by_article = await self.api.get_comments_for_articles([platform_article_id for platform_article_id, _ in batch_targets])
+                    
+                    # HTTP 조회가 끝난 배치의 댓글 저장은 작업 단위 하나로 처리 (조회하지 못한 게시글은 재시도 대상에 추가)
+                    saved_comments, batch_failed = await self.async_db.run_unit_of_work(self._write_comment_batch, batch_targets, comments_by_article)
+                    total_comments += saved_comments
+                    failed_targets.extend(batch_failed)
+                
+                await run_db_write(checkpoint.save, next_page, articles[-1].id if articles else None, checkpoint_stats())
+                
+                # 10분마다 진행상태 로그
+                current_time = time.time()
+                if current_time - last_progress_time >= 600:  # 10분 = 600초
+                    self.log_info(f"📊 게시글 수집 진행중... {next_page - 1}페이지 (게시글: {total_articles}개, 댓글: {total_comments}개)")
+                    last_progress_time = current_time
+            
+            # API에서 해당 날짜의 게시글을 페이지 단위로 수집/저장
+            await self.api.get_articles_by_date(target_date, category=category, start_page=start_page or 1, on_page=save_page,
+                                                on_complete=checkpoint.mark_end)
+            
+            if failed_targets:
+                retried_comments, failed_targets = await self._retry_failed_comments(failed_targets)
+                total_comments += retried_comments
+            
+            if failed_targets:
+                # 재시도 후에도 실패한 게시글이 남으면 완료하지 않고 다음 실행에서 다시 재시도
+                await run_db_write(checkpoint.save, checkpoint.cursor, checkpoint.last_item_id, checkpoint_stats())
+            else:
+                await run_db_write(checkpoint.complete_if_reached_end, checkpoint_stats())
+            return {"articles": total_articles, "comments": total_comments}
+            
+        except Exception as e:
+            elapsed_time = time.time() - start_time
+            self.log_error(f"❌ 날짜별 게시글 수집 중 오류 발생: {e} (소요시간: {elapsed_time:.2f}초)")
+            return {"articles": total_articles, "comments": total_comments}
+    
+    async def _retry_failed_comments(self, failed_targets: List[tuple]) -> tuple:
+        """
+        댓글 조회에 실패한 게시글을 지수 백오프로 재시도합니다.
+        호스트가 차단된 경우의 대기는 서킷 브레이커가 담당하므로 고정 대기 없이 실패한 게시글만 다시 요청합니다.
         
-        # 실패한 게시글부터 다시 수집
-        remaining_articles = articles[failed_index:]
-        total_articles = len(articles) - failed_index
+        Args:
+            failed_targets: (게시글 ID, DB 게시글 ID) 목록
+        
+        Returns:
+            tuple: (재시도로 저장된 댓글 수, 최종 실패한 (게시글 ID, DB 게시글 ID) 목록)
+        """
         total_comments = 0
+        remaining = list(failed_targets)
         
-        for i, article in enumerate(remaining_articles):
-            try:
-                self.log_info(f"🔄 재시작 수집 진행 중: {i + 1}/{total_articles} (게시글 ID: {article.id})")
-                
-                # 게시글 정보 저장 (일반 게시글로 저장)
-                article_id = await self._save_article(article, gangnamunni_community['id'])
+        for attempt in range(1, DEFAULT_MAX_RETRIES + 1):
+            if not remaining:
+                break
+            
+            delay = retry_delay(attempt)
+            self.log_warning(f"🔄 댓글 조회 실패 게시글 {len(remaining)}개 재시도 ({attempt}/{DEFAULT_MAX_RETRIES}, {delay:.1f}초 후)")
+            await asyncio.sleep(delay)
+            
+            still_failed = []
+            for start in range(0, len(remaining), DETAIL_FETCH_CHUNK_SIZE):
+                batch_targets = remaining[start:start + DETAIL_FETCH_CHUNK_SIZE]
+                comments_by_article = await self.api.get_comments_for_articles([platform_article_id for platform_article_id, _ in batch_targets])
                 
-                if article_id:
-                    # 댓글이 있는 경우 댓글도 수집
-                    if article.comment_count > 0:
-                        try:
-                            comments = await self.api.get_comments(article.id)
-                            if comments:
-                                saved_comments = await self._save_comments(comments, article_id)
-                                total_comments += saved_comments
-                        except Exception as e:
-                            if "404" in str(e) or "Not Found" in str(e):
-                                self.log_error(f"❌ 재시작 중에도 404 에러 발생: 게시글 ID {article.id} 댓글 수집 실패")
-                                # 재시작 중에도 404 에러가 발생하면 다시 failover 처리
-                                await self._handle_404_failover(target_date, category, gangnamunni_community, remaining_articles, i)
-                                return
-                            else:
-                                self.log_error(f"❌ 재시작 중 댓글 수집 실패 (게시글 ID: {article.id}): {e}")
-                
-            except Exception as e:
-                if "404" in str(e) or "Not Found" in str(e):
-                    self.log_error(f"❌ 재시작 중에도 404 에러 발생: 게시글 ID {article.id} 처리 실패")
-                    # 재시작 중에도 404 에러가 발생하면 다시 failover 처리
-                    await self._handle_404_failover(target_date, category, gangnamunni_community, remaining_articles, i)
-                    return
-                else:
-                    self.log_error(f"❌ 재시작 중 게시글 처리 실패 (ID: {article.id}): {e}")
-                    continue
-        
-        failover_end_time = time.time()
-        failover_elapsed_time = failover_end_time - failover_start_time
-        
-        self.log_info(f"✅ 재시작 수집 완료!")
-        self.log_info(f"📊 재시작 수집 결과: 게시글 {total_articles}개, 댓글 {total_comments}개")
-        self.log_info(f"⏱️  재시작 소요시간: {failover_elapsed_time:.2f}초")
+                saved_comments, batch_failed = await self.async_db.run_unit_of_work(self._write_comment_batch, batch_targets, comments_by_article)
+                total_comments += saved_comments
+                still_failed.extend(batch_failed)
+            
+            remaining = still_failed
+        
+        if remaining:
+            self.log_error(f"❌ 댓글 조회 최종 실패 게시글 {len(remaining)}개: {[platform_article_id for platform_article_id, _ in remaining]}")
+        
+        return total_comments, remaining
 
-    async def collect_all_categories_by_date(self, target_date: str, include_reviews: bool = True) -> Dict[str, int]:
+    async def collect_all_categories_by_date(self, target_date: str, include_reviews: bool = True) -> Dict[str, Any]:
         """
         특정 날짜의 모든 카테고리 게시글과 리뷰를 수집하고 데이터베이스에 저장합니다.
+        리뷰 파이프라인은 날짜당 한 번만 실행되며 카테고리별 게시글 수집과 함께 플랫폼 예산 안에서 병렬로 진행됩니다.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식)
             include_reviews: True이면 실제 리뷰 API에서도 리뷰를 수집 (기본값: True)
         
         Returns:
-            Dict[str, int]: 카테고리별 수집된 게시글 수
+            Dict[str, Any]: {"categories": 카테고리별 게시글 수, "articles": 전체 게시글 수,
+                             "comments": 전체 댓글 수, "reviews": 리뷰 수, "errors": 실패한 단위별 오류}
         """
         import time
         start_time = time.time()
@@ -241,48 +259,29 @@ class GangnamUnniDataCollector(LoggedClass):
             "ask_doctor": "의사에게 물어보세요"
         }
         
+        # 카테고리별 게시글 수집과 리뷰 수집(날짜당 1회)을 플랫폼 예산 안에서 병렬 실행
+        units = []
+        if include_reviews:
+            units.append(CollectionUnit("reviews", "리뷰", lambda: self.collect_reviews_by_date(target_date)))
+        for category_key, category_name in categories.items():
+            units.append(CollectionUnit(
+                category_key, category_name,
+                lambda category_key=category_key: self.collect_category_articles_by_date(target_date, category_key)
+            ))
+        
+        report = await CollectionScheduler("gangnamunni").run(units)
+        
         results = {}
         total_articles = 0
         total_comments = 0
-        total_reviews = 0
+        for category_key in categories:
+            result = report.units[category_key].value or {"articles": 0, "comments": 0}
+            results[category_key] = result["articles"]
+            total_articles += result["articles"]
+            total_comments += result["comments"]
         
-        # 모든 카테고리 순회
-        for category_key, category_name in categories.items():
-            try:
-                self.log_info(f"🔄 {category_name} 카테고리 수집 중...")
-                result = await self.collect_articles_by_date(target_date, category_key, include_reviews)
-                results[category_key] = result["articles"]
-                total_articles += result["articles"]
-                total_comments += result["comments"]
-                total_reviews += result.get("reviews", 0)
-                
-                # 카테고리 간 딜레이 (서버 부하 방지)
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                # 404 에러 발생 시 failover 처리
-                if "404" in str(e) or "Not Found" in str(e):
-                    self.log_error(f"❌ 404 에러 발생: {category_name} 카테고리 수집 실패")
-                    self.log_error(f"🔄 15분 후 {category_name} 카테고리부터 재시작합니다.")
-                    
-                    # 15분 대기
-                    self.log_info("⏰ 15분 대기 중...")
-                    await asyncio.sleep(15 * 60)  # 15분 = 900초
-                    
-                    self.log_info(f"🔄 {category_name} 카테고리 수집 재개를 시작합니다.")
-                    
-                    try:
-                        result = await self.collect_articles_by_date(target_date, category_key, include_reviews)
-                        results[category_key] = result["articles"]
-                        total_articles += result["articles"]
-                        total_comments += result["comments"]
-                        total_reviews += result.get("reviews", 0)
-                    except Exception as retry_e:
-                        self.log_error(f"❌ 재시작 후에도 {category_name} 카테고리 수집 실패: {retry_e}")
-                        results[category_key] = 0
-                else:
-                    self.log_error(f"❌ {category_name} 카테고리 수집 실패: {e}")
-                    results[category_key] = 0
+        review_result = report.units["reviews"].value if include_reviews else None
+        total_reviews = review_result["reviews"] if review_result else 0
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -298,13 +297,19 @@ class GangnamUnniDataCollector(LoggedClass):
             count = results.get(category_key, 0)
             self.log_info(f"   - {category_name}: {count}개")
         
-        return results
+        return {
+            "categories": results,
+            "articles": total_articles,
+            "comments": total_comments,
+            "reviews": total_reviews,
+            "errors": report.errors
+        }
     
     async def _get_or_create_gannamunni_community(self) -> Dict:
         """강남언니 커뮤니티 생성 또는 조회"""
         try:
             # 기존 강남언니 커뮤니티 조회
-            existing_community = self.db.get_community_by_name("강남언니")
+            existing_community = await self.async_db.get_community_by_name("강남언니")
             
             if existing_community:
                 return existing_community
@@ -317,7 +322,7 @@ class GangnamUnniDataCollector(LoggedClass):
                 description="강남언니 커뮤니티"
             )
             
-            community_id = self.db.insert_community(gangnamunni_community)
+            community_id = await self.async_db.insert_community(gangnamunni_community)
             
             return {
                 'id': community_id,
@@ -330,46 +335,57 @@ class GangnamUnniDataCollector(LoggedClass):
             print(f"    ⚠️  강남언니 커뮤니티 생성 실패: {e}")
             raise e
     
-    async def _save_article(self, article: Article, community_id: int) -> Optional[int]:
-        """게시글 정보를 데이터베이스에 저장"""
+    def _write_articles(self, db: DatabaseManager, articles: List[Article], community_id: int) -> Tuple[Dict[str, int], int]:
+        """
+        페이지의 게시글 저장 (AsyncDatabase.run_unit_of_work 로 작업 단위 안에서 실행)
+        
+        Returns:
+            Tuple[Dict[str, int], int]: (이미 저장된 게시글을 포함한 게시글 ID -> DB ID 매핑, 새로 저장한 게시글 수)
+        """
+        if not articles:
+            return {}, 0
+        
+        # 중복 체크: 이미 저장된 게시글의 DB ID를 한 번에 조회하고 새 게시글만 일괄 저장
+        article_ids = db.get_article_ids_by_community_article_ids("gangnamunni", [str(article.id) for article in articles])
+        db_articles = [self._to_db_article(article, community_id) for article in articles if str(article.id) not in article_ids]
+        mapping = db.bulk_upsert_articles(db_articles)
+        for (_, community_article_id), article_id in mapping.items():
+            article_ids[community_article_id] = article_id
+        return article_ids, len(mapping)
+    
+    def _to_db_article(self, article: Article, community_id: int) -> DBArticle:
+        """강남언니 게시글을 저장용 Article 로 변환"""
+        # 날짜 파싱
         try:
-            # 날짜 파싱
-            try:
-                created_at = datetime.strptime(article.create_time, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                created_at = datetime.now()
-            
-            # 이미지 정보를 JSON으로 변환
-            images_json = json.dumps([{'url': photo.url} for photo in article.photos], ensure_ascii=False)
-            
-            # 게시글을 Article로 저장
-            db_article = DBArticle(
-                id=None,
-                platform_id="gangnamunni",
-                community_article_id=str(article.id),
-                community_id=community_id,
-                title=article.title or f"강남언니 게시글 {article.id}",
-                content=article.contents,
-                writer_nickname=article.writer.nickname,
-                writer_id=str(article.writer.id),
-                like_count=article.thumb_up_count,
-                comment_count=article.comment_count,
-                view_count=article.view_count,
-                images=images_json,
-                created_at=created_at,
-                category_name=article.category_name,
-                collected_at=datetime.now()  # 수집 시간 기록
-            )
-            
-            article_id = self.db.insert_article(db_article)
-            return article_id
-            
-        except Exception as e:
-            print(f"    ⚠️  게시글 저장 실패: {e}")
-            return None
+            created_at = datetime.strptime(article.create_time, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            created_at = datetime.now()
+        
+        # 이미지 정보를 JSON으로 변환
+        images_json = json.dumps([{'url': photo.url} for photo in article.photos], ensure_ascii=False)
+        
+        # 게시글을 Article로 저장
+        return DBArticle(
+            id=None,
+            platform_id="gangnamunni",
+            community_article_id=str(article.id),
+            community_id=community_id,
+            title=article.title or f"강남언니 게시글 {article.id}",
+            content=article.contents,
+            writer_nickname=article.writer.nickname,
+            writer_id=str(article.writer.id),
+            like_count=article.thumb_up_count,
+            comment_count=article.comment_count,
+            view_count=article.view_count,
+            images=images_json,
+            created_at=created_at,
+            category_name=article.category_name,
+            collected_at=datetime.now()  # 수집 시간 기록
+        )
     
-    async def _save_as_review(self, article: Article, community_id: int) -> Optional[int]:
+    async def _save_as_review(self, article: Article, community_id: int, db: Optional[AsyncDatabase] = None) -> Optional[int]:
         """게시글을 후기로 저장 (강남언니 후기 데이터용)"""
+        db = db or self.async_db
         try:
             from database.models import Review
             
@@ -408,68 +424,101 @@ class GangnamUnniDataCollector(LoggedClass):
                 collected_at=datetime.now()  # 수집 시간 기록
             )
             
-            review_id = self.db.insert_review(db_review)
+            review_id = await db.insert_review(db_review)
             return review_id
             
         except Exception as e:
             print(f"    ⚠️  후기 저장 실패: {e}")
             return None
     
-    async def _save_comments(self, comments: List[Comment], article_id: int) -> int:
-        """댓글 정보를 데이터베이스에 저장"""
-        saved_count = 0
+    def _write_comment_batch(self, db: DatabaseManager, targets: List[tuple], comments_by_article: Dict[Any, Optional[List[Comment]]]) -> Tuple[int, List[tuple]]:
+        """
+        댓글 조회가 끝난 게시글 배치의 댓글 저장 (AsyncDatabase.run_unit_of_work 로 작업 단위 안에서 실행)
+        
+        Args:
+            targets: (게시글 ID, DB 게시글 ID) 목록
+            comments_by_article: 게시글 ID -> 댓글 목록 (HTTP 오류로 조회하지 못한 게시글은 None)
+        
+        Returns:
+            Tuple[int, List[tuple]]: (저장된 댓글 수, 댓글을 조회하지 못한 (게시글 ID, DB 게시글 ID) 목록)
+        """
+        saved = 0
+        failed = []
+        for platform_article_id, article_id in targets:
+            comments = comments_by_article.get(platform_article_id)
+            if comments is None:
+                failed.append((platform_article_id, article_id))
+            elif comments:
+                saved += self._write_comments(db, comments, article_id)
+        return saved, failed
+    
+    def _write_comments(self, db: DatabaseManager, comments: List[Comment], article_id: int) -> int:
+        """댓글 정보를 데이터베이스에 저장 (대댓글 포함 일괄 저장)"""
+        try:
+            # 중복 체크: 대댓글까지 포함한 댓글 ID를 모아 한 번에 조회
+            existing_comment_ids = db.get_existing_comment_ids(article_id, self._collect_comment_ids(comments))
+            db_comments = self._build_db_comments(comments, article_id, existing_comment_ids)
+            if not db_comments:
+                return 0
+            
+            # 중복으로 무시된 댓글을 빼고 실제 저장된 댓글 수 반환 (이미 저장된 댓글은 위에서 제외함)
+            saved = db.bulk_upsert_comments(db_comments)
+            return len(saved)
+        except Exception as e:
+            self.log_error(f"        ❌ 댓글 일괄 저장 실패 (게시글 ID: {article_id}): {e}")
+            return 0
+    
+    def _collect_comment_ids(self, comments: List[Comment]) -> List[str]:
+        """대댓글을 포함한 모든 댓글 ID 목록 반환"""
+        comment_ids = []
+        for comment in comments:
+            comment_ids.append(str(comment.id))
+            if comment.replies:
+                comment_ids.extend(self._collect_comment_ids(comment.replies))
+        return comment_ids
+    
+    def _build_db_comments(self, comments: List[Comment], article_id: int, existing_comment_ids: set) -> List[DBComment]:
+        """저장할 댓글 목록 생성 (이미 저장된 댓글 제외, 대댓글은 재귀적으로 포함)"""
+        db_comments = []
         
         for comment in comments:
             try:
-                # 중복 체크: 이미 저장된 댓글인지 확인
-                existing_comment = self.db.get_comment_by_article_id_and_comment_id(str(article_id), str(comment.id))
-                if existing_comment:
-                    continue
-                
-                # 날짜 파싱
-                try:
-                    created_at = datetime.strptime(comment.create_time, "%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    created_at = datetime.now()
-                
-                # 댓글 저장 - 개선된 방식 사용
-                db_comment = DBComment(
-                    id=str(comment.id),  # 강남언니 댓글 ID
-                    article_id=article_id,  # 데이터베이스의 article ID (숫자)
-                    content=comment.contents,
-                    writer_nickname=comment.writer.nickname,
-                    writer_id=str(comment.writer.id),
-                    created_at=created_at,
-                    parent_comment_id=str(comment.reply_comment_id) if comment.reply_comment_id else None,
-                    collected_at=datetime.now()
-                )
-                
-                # 플랫폼 정보 추가
-                db_comment.platform_id = "gangnamunni"
-                
-                self.db.insert_comment(db_comment)
-                saved_count += 1
+                if str(comment.id) not in existing_comment_ids:
+                    # 날짜 파싱
+                    try:
+                        created_at = datetime.strptime(comment.create_time, "%Y-%m-%d %H:%M:%S")
+                    except ValueError:
+                        created_at = datetime.now()
+                    
+                    # 댓글 저장 - 개선된 방식 사용
+                    db_comment = DBComment(
+                        id=str(comment.id),  # 강남언니 댓글 ID
+                        article_id=article_id,  # 데이터베이스의 article ID (숫자)
+                        content=comment.contents,
+                        writer_nickname=comment.writer.nickname,
+                        writer_id=str(comment.writer.id),
+                        created_at=created_at,
+                        parent_comment_id=str(comment.reply_comment_id) if comment.reply_comment_id else None,
+                        collected_at=datetime.now()
+                    )
+                    
+                    # 플랫폼 정보 추가
+                    db_comment.platform_id = "gangnamunni"
+                    db_comments.append(db_comment)
                 
-                # 대댓글이 있는 경우 재귀적으로 저장
+                # 대댓글이 있는 경우 재귀적으로 포함
                 if comment.replies:
-                    replies_saved = await self._save_comments(comment.replies, article_id)
-                    saved_count += replies_saved
+                    db_comments.extend(self._build_db_comments(comment.replies, article_id, existing_comment_ids))
                 
             except Exception as e:
-                self.log_error(f"        ❌ 댓글 저장 실패 (ID: {comment.id}): {e}")
+                self.log_error(f"        ❌ 댓글 변환 실패 (ID: {comment.id}): {e}")
                 continue
         
-        return saved_count
+        return db_comments
     
-    async def _save_review(self, review: Review, community_id: int) -> Optional[int]:
-        """리뷰 정보를 데이터베이스에 저장 (상세 API 호출)"""
+    def _to_db_review(self, review: Review, community_id: int, review_detail: Optional[dict]) -> Optional[DBReview]:
+        """리뷰를 저장용 Review 로 변환 (상세 정보를 조회하지 못했거나 변환에 실패하면 None)"""
         try:
-            from database.models import Review as DBReview
-            
-            # 리뷰 상세 정보 조회
-            # self.log_info(f"🔍 리뷰 상세 정보 조회 중... (ID: {review.id})")
-            review_detail = await self.api.get_review_detail(review.id)
-            
             if not review_detail:
                 # self.log_error(f"❌ 리뷰 상세 정보 조회 실패 (ID: {review.id})")
                 return None
@@ -538,7 +587,7 @@ class GangnamUnniDataCollector(LoggedClass):
                 content = description_info['source'].get('contents', review.description)
             
             # 리뷰를 Review로 저장
-            db_review = DBReview(
+            return DBReview(
                 id=None,
                 platform_id="gangnamunni_review",
                 platform_review_id=str(review.id),
@@ -562,13 +611,8 @@ class GangnamUnniDataCollector(LoggedClass):
                 created_at=created_at,
                 collected_at=datetime.now()  # 수집 시간 기록
             )
-            
-            review_id = self.db.insert_review(db_review)
-            # self.log_info(f"✅ 리뷰 저장 완료 (ID: {review.id}, DB ID: {review_id})")
-            return review_id
-            
         except Exception as e:
-            self.log_error(f"❌ 리뷰 저장 실패 (ID: {review.id}): {e}")
+            self.log_error(f"❌ 리뷰 변환 실패 (ID: {review.id}): {e}")
             return None
     
     def get_statistics(self) -> Dict:
@@ -5,7 +5,7 @@
 import os
 import sys
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # utils 모듈 import를 위한 경로 추가
@@ -13,7 +13,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.logger import LoggedClass
 from platforms.naver import NaverCafeAPI, NaverCafeMenu, NaverCafeArticle
+from collectors.scheduler import CollectionScheduler, CollectionUnit
+from collectors.checkpoint import DateCheckpoint
 from database.models import DatabaseManager, Article
+from database.async_db import AsyncDatabase, run_db, run_db_write
 
 class NaverDataCollector(LoggedClass):
     """네이버 카페 데이터 수집기"""
@@ -23,6 +26,7 @@ class NaverDataCollector(LoggedClass):
         self.naver_cookies = naver_cookies
         self.api = NaverCafeAPI(naver_cookies)
         self.db = DatabaseManager()  # db_path 파라미터 제거
+        self.async_db = AsyncDatabase(self.db)  # async 메서드에서는 DB 스레드 풀로 실행
         
         # 네이버 커뮤니티 ID 설정 (존재하지 않으면 생성)
         self.naver_community_id = self._ensure_naver_community()
@@ -101,36 +105,26 @@ class NaverDataCollector(LoggedClass):
             failed_count = 0
             details = []
             
-            for i, article in enumerate(articles):
-                try:
-                    
-                    if await self._save_article(cafe_id, article):
-                        saved_count += 1
-                        details.append({
-                            "article_id": article.article_id,
-                            "title": article.subject,
-                            "status": "success",
-                            "content_length": len(article.content or "")
-                        })
-                    else:
-                        failed_count += 1
-                        details.append({
-                            "article_id": article.article_id,
-                            "title": article.subject,
-                            "status": "failed",
-                            "reason": "이미 저장된 게시글이거나 저장 실패"
-                        })
-                        
-                except Exception as e:
+            # 게시글은 작업 단위 하나로 일괄 저장
+            article_ids = await self.async_db.run_unit_of_work(self._write_articles, cafe_id, articles)
+            
+            for article in articles:
+                if str(article.article_id) in article_ids:
+                    saved_count += 1
+                    details.append({
+                        "article_id": article.article_id,
+                        "title": article.subject,
+                        "status": "success",
+                        "content_length": len(article.content or "")
+                    })
+                else:
                     failed_count += 1
-                    self.log_error(f"게시글 {article.article_id} 저장 실패: {str(e)}")
                     details.append({
                         "article_id": article.article_id,
                         "title": article.subject,
-                        "status": "error",
-                        "reason": str(e)
+                        "status": "failed",
+                        "reason": "이미 저장된 게시글이거나 저장 실패"
                     })
-                    continue
             
             result = {
                 "total": len(articles),
@@ -178,52 +172,44 @@ class NaverDataCollector(LoggedClass):
             comments_saved_count = 0
             details = []
             
-            for i, article_data in enumerate(articles_data):
-                try:
-                    
-                    article = article_data['article']
-                    comments = article_data['comments']
-                    
-                    # 중복 체크: 이미 저장된 게시글인지 먼저 확인
-                    existing_article = self.db.get_article_by_platform_id_and_community_article_id("naver", article.article_id)
-                    if existing_article:
-                        continue
-                    
-                    # 게시글 저장
-                    if await self._save_article(cafe_id, article):
-                        saved_count += 1
-                        
-                        # 댓글 저장
-                        if comments:
-                            comment_saved = await self._save_comments(cafe_id, article.article_id, comments)
-                            comments_saved_count += comment_saved
-                        
-                        details.append({
-                            "article_id": article.article_id,
-                            "title": article.subject,
-                            "status": "success",
-                            "content_length": len(article.content or ""),
-                            "comments_saved": len(comments)
-                        })
-                    else:
-                        failed_count += 1
-                        details.append({
-                            "article_id": article.article_id,
-                            "title": article.subject,
-                            "status": "failed",
-                            "reason": "이미 저장된 게시글이거나 저장 실패"
-                        })
-                        
-                except Exception as e:
+            # 중복 체크: 이미 저장된 게시글 ID를 한 번에 조회
+            existing_article_ids = await self.async_db.get_article_ids_by_community_article_ids(
+                "naver", [str(article_data['article'].article_id) for article_data in articles_data]
+            )
+            
+            # 중복 체크: 이미 저장된 게시글은 건너뜀
+            new_articles_data = [
+                article_data for article_data in articles_data
+                if str(article_data['article'].article_id) not in existing_article_ids
+            ]
+            
+            # 게시글과 댓글 저장은 작업 단위 하나로 처리 (게시글은 일괄 저장 후 DB ID 로 댓글 저장)
+            write_results = await self.async_db.run_unit_of_work(
+                self._write_articles_with_comments, cafe_id,
+                [(article_data['article'], article_data['comments']) for article_data in new_articles_data]
+            )
+            
+            for article_data, (article_saved, comment_saved) in zip(new_articles_data, write_results):
+                article = article_data['article']
+                comments = article_data['comments']
+                if article_saved:
+                    saved_count += 1
+                    comments_saved_count += comment_saved
+                    details.append({
+                        "article_id": article.article_id,
+                        "title": article.subject,
+                        "status": "success",
+                        "content_length": len(article.content or ""),
+                        "comments_saved": len(comments)
+                    })
+                else:
                     failed_count += 1
-                    self.log_error(f"게시글 {article.article_id} 저장 실패: {str(e)}")
                     details.append({
                         "article_id": article.article_id,
                         "title": article.subject,
-                        "status": "error",
-                        "reason": str(e)
+                        "status": "failed",
+                        "reason": "이미 저장된 게시글이거나 저장 실패"
                     })
-                    continue
             
             result = {
                 "total": len(articles_data),
@@ -266,20 +252,12 @@ class NaverDataCollector(LoggedClass):
                 self.log_warning("수집된 게시글이 없습니다")
                 return 0
             
-            # 데이터베이스에 저장
-            saved_count = 0
-            for article in articles:
-                try:
-                    # 중복 체크: 이미 저장된 게시글인지 먼저 확인
-                    existing_article = self.db.get_article_by_platform_id_and_community_article_id("naver", article.article_id)
-                    if existing_article:
-                        continue
-                    
-                    if await self._save_article(cafe_id, article):
-                        saved_count += 1
-                except Exception as e:
-                    self.log_error(f"게시글 {article.article_id} 저장 실패: {str(e)}")
-                    continue
+            # 중복 체크: 이미 저장된 게시글 ID를 한 번에 조회
+            existing_article_ids = await self.async_db.get_article_ids_by_community_article_ids("naver", [str(article.article_id) for article in articles])
+            
+            # 이미 저장된 게시글을 빼고 작업 단위 하나로 일괄 저장
+            new_articles = [article for article in articles if str(article.article_id) not in existing_article_ids]
+            saved_count = len(await self.async_db.run_unit_of_work(self._write_articles, cafe_id, new_articles))
             
             return saved_count
             
@@ -288,114 +266,86 @@ class NaverDataCollector(LoggedClass):
             return 0
     
     async def collect_articles_by_date_with_comments(self, cafe_id: str, target_date: str, menu_id: str = "") -> Dict[str, Any]:
-        """특정 날짜의 모든 게시글을 수집하고 댓글까지 포함하여 저장 (여러 게시판 지원)"""
+        """
+        특정 날짜의 모든 게시글을 수집하고 댓글까지 포함하여 저장 (여러 게시판 지원)
+        목록 페이지마다 저장 후 체크포인트를 남기므로 중단된 수집은 다음 목록 페이지부터 재개합니다.
+        """
         import time
         start_time = time.time()
         last_progress_time = start_time
         
+        try:
+            datetime.strptime(target_date, "%Y-%m-%d")
+        except ValueError as e:
+            self.log_error(f"날짜 형식 오류: {target_date}, 예상 형식: YYYY-MM-DD")
+            return {"total": 0, "saved": 0, "failed": 0, "comments_saved": 0, "details": [], "error": f"날짜 형식 오류: {str(e)}"}
+        
+        checkpoint = DateCheckpoint(self.db, "naver", target_date, f"{cafe_id}:{menu_id}")
+        start_page, stats = await run_db(checkpoint.resume)
+        total_count = stats.get("total", 0)
+        saved_count = stats.get("saved", 0)
+        failed_count = stats.get("failed", 0)
+        comments_saved_count = stats.get("comments_saved", 0)
+        details = []
+        
         try:
             self.log_info(f"🚀 네이버 카페 수집 시작 - {target_date} (카페: {cafe_id})")
             
-            # 날짜를 datetime 객체로 변환
-            from datetime import datetime
-            try:
-                target_datetime = datetime.strptime(target_date, "%Y-%m-%d")
-            except ValueError as e:
-                self.log_error(f"날짜 형식 오류: {target_date}, 예상 형식: YYYY-MM-DD")
-                return {"total": 0, "saved": 0, "failed": 0, "comments_saved": 0, "details": [], "error": f"날짜 형식 오류: {str(e)}"}
-            
-            # 게시글 목록 조회 (페이지네이션 없이 모든 게시글)
-            all_articles = []
-            page = 1
-            per_page = 100  # 한 번에 100개씩 조회
-            
-            while True:
-                try:
-                    # 여러 게시판 지원: menu_id에 콤마가 있으면 여러 게시판 조회
-                    if ',' in menu_id:
-                        articles = await self.api.get_article_list_multi_menus(cafe_id, menu_id, page, per_page)
-                    else:
-                        articles = await self.api.get_article_list(cafe_id, menu_id, page, per_page)
-                    
-                    if not articles:
-                        break
-                    
-                    # 해당 날짜의 게시글만 필터링
-                    date_filtered_articles = []
-                    older_than_target = 0  # 대상 날짜보다 오래된 게시글 수
-                    
-                    for article in articles:
-                        if article.created_at:
-                            article_date = article.created_at.date()
-                            if article_date == target_datetime.date():
-                                date_filtered_articles.append(article)
-                            elif article_date < target_datetime.date():
-                                older_than_target += 1
-                    
-                    if date_filtered_articles:
-                        all_articles.extend(date_filtered_articles)
-                    
-                    # 조기 종료 조건 개선
-                    # 1. 전체 게시글이 대상 날짜보다 오래된 경우
-                    if older_than_target > 0 and len(date_filtered_articles) == 0:
-                        break
-                    
-                    # 2. 너무 많은 페이지를 조회한 경우 (무한 루프 방지)
-                    if page >= 50:  # 최대 50페이지까지만 조회
-                        break
-                    
-                    page += 1
-                    
-                    # API 호출 간격 조절
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    self.log_error(f"페이지 {page} 조회 실패: {str(e)}")
-                    break
-            
-            if not all_articles:
-                self.log_warning(f"📭 {target_date} 수집할 데이터 없음")
-                return {"total": 0, "saved": 0, "failed": 0, "comments_saved": 0, "details": [], "message": "해당 날짜의 게시글이 없습니다"}
-            
-            # 각 게시글의 내용과 댓글 조회
-            saved_count = 0
-            failed_count = 0
-            comments_saved_count = 0
-            details = []
-            
-            for i, article in enumerate(all_articles):
-                try:
-                    # 중복 체크: 이미 저장된 게시글인지 먼저 확인
-                    existing_article = self.db.get_article_by_platform_id_and_community_article_id("naver", article.article_id)
-                    article_saved = False
-                    
-                    if existing_article:
-                        article_saved = True
-                    else:
-                        # 게시글 내용 조회
-                        content_html, created_at = await self.api.get_article_content(cafe_id, article.article_id)
-                        if content_html:
-                            article.content = self.api.parse_content_html(content_html)
-                            
-                            # 생성일이 없는 경우 내용 조회에서 얻은 정보로 업데이트
-                            if not article.created_at and created_at:
-                                article.created_at = created_at
-                        else:
-                            article.content = ""
+            async def save_page(page_articles: List[NaverCafeArticle], next_page: int):
+                nonlocal total_count, saved_count, failed_count, comments_saved_count, last_progress_time
+                total_count += len(page_articles)
+                
+                # 중복 체크: 이미 저장된 게시글 ID를 한 번에 조회
+                existing_article_ids = await self.async_db.get_article_ids_by_community_article_ids("naver", [str(article.article_id) for article in page_articles]) if page_articles else {}
+                
+                # 각 게시글의 내용과 댓글 조회 (저장할 게시글과 댓글을 모아 두고 페이지 단위로 저장)
+                fetched = []
+                for article in page_articles:
+                    try:
+                        # 중복 체크: 이미 저장된 게시글인지 먼저 확인
+                        existing_article = str(article.article_id) in existing_article_ids
                         
-                        # 게시글 저장
-                        if await self._save_article(cafe_id, article):
-                            saved_count += 1
-                            article_saved = True
-                    
-                    # 댓글 조회 및 저장 (게시글이 중복이어도 댓글은 수집)
-                    if article_saved:
-                        comments = await self.api.get_article_comments(cafe_id, article.article_id)
+                        # 게시글 내용과 댓글을 한 번의 요청으로 조회
+                        detail = await self.api.get_article_detail(cafe_id, article.article_id)
+                        
+                        if not existing_article:
+                            content_html = detail['content_html'] if detail else None
+                            created_at = detail['created_at'] if detail else None
+                            if content_html:
+                                article.content = self.api.parse_content_html(content_html)
+                                
+                                # 생성일이 없는 경우 내용 조회에서 얻은 정보로 업데이트
+                                if not article.created_at and created_at:
+                                    article.created_at = created_at
+                            else:
+                                article.content = ""
+                        
+                        # 댓글은 게시글이 중복이어도 수집
+                        fetched.append((article, detail['comments'] if detail else [], existing_article))
                         
-                        if comments:
-                            comment_saved = await self._save_comments(cafe_id, article.article_id, comments)
-                            comments_saved_count += comment_saved
+                        # API 호출 간격 조절
+                        await asyncio.sleep(0.3)
                         
+                    except Exception as e:
+                        failed_count += 1
+                        self.log_error(f"게시글 {article.article_id} 처리 실패: {str(e)}")
+                        details.append({
+                            "article_id": article.article_id,
+                            "title": article.subject,
+                            "status": "error",
+                            "reason": str(e)
+                        })
+                        continue
+                
+                # 페이지의 게시글과 댓글 저장은 writer 스레드 호출 하나(작업 단위)로 처리
+                write_results = await self.async_db.run_unit_of_work(
+                    self._write_articles_with_comments, cafe_id, [(article, comments) for article, comments, _ in fetched]
+                )
+                for (article, comments, existing_article), (article_saved, comment_saved) in zip(fetched, write_results):
+                    comments_saved_count += comment_saved
+                    if article_saved:
+                        if not existing_article:
+                            saved_count += 1
                         details.append({
                             "article_id": article.article_id,
                             "title": article.subject,
@@ -403,7 +353,7 @@ class NaverDataCollector(LoggedClass):
                             "content_length": len(article.content or ""),
                             "comments_saved": len(comments),
                             "created_at": article.created_at.isoformat() if article.created_at else None,
-                            "is_duplicate": existing_article is not None
+                            "is_duplicate": existing_article
                         })
                     else:
                         failed_count += 1
@@ -413,40 +363,44 @@ class NaverDataCollector(LoggedClass):
                             "status": "failed",
                             "reason": "저장 실패"
                         })
-                    
-                    # 10분마다 진행상태 로그
-                    current_time = time.time()
-                    if current_time - last_progress_time >= 600:  # 10분 = 600초
-                        self.log_info(f"📊 네이버 수집 진행중... {i+1}/{len(all_articles)} (게시글: {saved_count}개, 댓글: {comments_saved_count}개)")
-                        last_progress_time = current_time
-                    
-                    # API 호출 간격 조절
-                    await asyncio.sleep(0.3)
-                    
-                except Exception as e:
-                    failed_count += 1
-                    self.log_error(f"게시글 {article.article_id} 처리 실패: {str(e)}")
-                    details.append({
-                        "article_id": article.article_id,
-                        "title": article.subject,
-                        "status": "error",
-                        "reason": str(e)
-                    })
-                    continue
+                
+                # 10분마다 진행상태 로그
+                current_time = time.time()
+                if current_time - last_progress_time >= 600:  # 10분 = 600초
+                    self.log_info(f"📊 네이버 수집 진행중... {next_page - 1}페이지 (게시글: {saved_count}개, 댓글: {comments_saved_count}개)")
+                    last_progress_time = current_time
+                
+                await run_db_write(checkpoint.save, next_page, page_articles[-1].article_id if page_articles else None, {
+                    "total": total_count,
+                    "saved": saved_count,
+                    "failed": failed_count,
+                    "comments_saved": comments_saved_count
+                })
+            
+            # 게시글 목록 조회 (목록 단계에서 날짜 필터링, 대상 날짜보다 오래된 페이지에서 중단) 후 페이지 단위로 저장
+            await self.api.get_article_list_by_date(cafe_id, menu_id, target_date, per_page=100,
+                                                    start_page=start_page or 1, on_page=save_page,
+                                                    on_complete=checkpoint.mark_end)
             
             result = {
-                "total": len(all_articles),
+                "total": total_count,
                 "saved": saved_count,
                 "failed": failed_count,
                 "comments_saved": comments_saved_count,
                 "target_date": target_date,
                 "details": details
             }
+            await run_db_write(checkpoint.complete_if_reached_end, {key: result[key] for key in ("total", "saved", "failed", "comments_saved")})
+            
+            if total_count == 0:
+                self.log_warning(f"📭 {target_date} 수집할 데이터 없음")
+                result["message"] = "해당 날짜의 게시글이 없습니다"
+                return result
             
             end_time = time.time()
             elapsed_time = end_time - start_time
             self.log_info(f"✅ 네이버 카페 수집 완료 - {target_date}")
-            self.log_info(f"📊 결과: 게시글 {saved_count}/{len(all_articles)}개, 댓글 {comments_saved_count}개 (소요시간: {elapsed_time:.2f}초)")
+            self.log_info(f"📊 결과: 게시글 {saved_count}/{total_count}개, 댓글 {comments_saved_count}개 (소요시간: {elapsed_time:.2f}초)")
             return result
             
         except Exception as e:
@@ -468,15 +422,8 @@ class NaverDataCollector(LoggedClass):
             # 날짜 필터링 (필요시 구현)
             # 현재는 모든 게시글을 수집
             
-            # 데이터베이스에 저장
-            saved_count = 0
-            for article in articles:
-                try:
-                    if await self._save_article(cafe_id, article):
-                        saved_count += 1
-                except Exception as e:
-                    self.log_error(f"게시글 {article.article_id} 저장 실패: {str(e)}")
-                    continue
+            # 데이터베이스에 일괄 저장 (작업 단위 하나)
+            saved_count = len(await self.async_db.run_unit_of_work(self._write_articles, cafe_id, articles))
             
             return saved_count
             
@@ -496,23 +443,16 @@ class NaverDataCollector(LoggedClass):
                 self.log_warning("수집할 게시판이 없습니다")
                 return {}
             
-            results = {}
-            
-            # 각 게시판별로 게시글 수집
-            for board in boards:
-                try:
-                    self.log_info(f"게시판 '{board.menu_name}' 게시글 수집 시작")
-                    
-                    count = await self.collect_articles_by_menu(cafe_id, board.menu_id, per_page)
-                    results[board.menu_name] = count
-                    
-                    # API 호출 간격 조절
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    self.log_error(f"게시판 '{board.menu_name}' 게시글 수집 실패: {str(e)}")
-                    results[board.menu_name] = 0
-                    continue
+            # 게시판별 수집을 플랫폼 예산 안에서 병렬 실행 (실패한 게시판은 0개)
+            units = [
+                CollectionUnit(
+                    board.menu_id, board.menu_name,
+                    lambda board=board: self.collect_articles_by_menu(cafe_id, board.menu_id, per_page)
+                )
+                for board in boards
+            ]
+            report = await CollectionScheduler("naver").run(units)
+            results = {unit.name: (unit.value if unit.ok else 0) for unit in report.units.values()}
             
             total_articles = sum(results.values())
             self.log_info(f"전체 게시판 게시글 수집 완료: 총 {total_articles}개")
@@ -523,67 +463,75 @@ class NaverDataCollector(LoggedClass):
             self.log_error(f"전체 게시판 게시글 수집 실패: {str(e)}")
             return {}
     
-    async def _save_article(self, cafe_id: str, article: NaverCafeArticle) -> bool:
-        """게시글을 데이터베이스에 저장"""
-        try:
-            # 카페 이름 조회
-            cafe_name = self.api.get_cafe_name_by_id(cafe_id)
-            if not cafe_name:
-                cafe_name = f"카페_{cafe_id}"
-            
-            # Article 객체 생성
-            db_article = Article(
-                id=None,
-                platform_id="naver",
-                community_article_id=str(article.article_id),
-                community_id=self.naver_community_id,
-                title=article.subject,
-                content=article.content or "",
-                images="[]",  # 네이버 카페는 이미지 정보를 별도로 처리하지 않음
-                writer_nickname=article.writer_nickname,
-                writer_id=article.writer_id,
-                like_count=article.like_count or 0,
-                comment_count=article.comment_count or 0,
-                view_count=article.view_count or 0,
-                created_at=article.created_at,
-                category_name=cafe_name,
-                collected_at=datetime.now()
-            )
-            
-            # 데이터베이스에 저장
-            article_id = self.db.insert_article(db_article)
-            
-            if article_id:
-                return True
-            else:
-                self.log_error(f"게시글 {article.article_id} 저장 실패")
-                return False
-                
-        except Exception as e:
-            self.log_error(f"게시글 저장 중 오류 발생: {str(e)}")
-            return False
+    def _write_articles_with_comments(self, db: DatabaseManager, cafe_id: str,
+                                      articles_with_comments: List[Tuple[NaverCafeArticle, List[Dict[str, Any]]]]) -> List[Tuple[bool, int]]:
+        """
+        게시글과 댓글 저장 (AsyncDatabase.run_unit_of_work 로 작업 단위 안에서 실행)
+        
+        Args:
+            articles_with_comments: (게시글, 댓글 목록) 목록
+        
+        Returns:
+            List[Tuple[bool, int]]: 게시글별 (게시글 저장 여부 (중복 포함), 저장한 댓글 수)
+        """
+        article_ids = self._write_articles(db, cafe_id, [article for article, _ in articles_with_comments])
+        results = []
+        for article, comments in articles_with_comments:
+            # 일괄 저장이 돌려준 DB ID 로 댓글 저장 (게시글이 중복이어도 댓글은 저장)
+            article_id = article_ids.get(str(article.article_id))
+            comment_saved = self._write_comments(db, cafe_id, article_id, comments) if article_id and comments else 0
+            results.append((article_id is not None, comment_saved))
+        return results
+    
+    def _write_articles(self, db: DatabaseManager, cafe_id: str, articles: List[NaverCafeArticle]) -> Dict[str, int]:
+        """
+        게시글 일괄 저장 (AsyncDatabase.run_unit_of_work 로 작업 단위 안에서 실행, 이미 저장된 게시글은 그대로 둠)
+        
+        Returns:
+            Dict[str, int]: 이미 저장된 게시글을 포함한 네이버 게시글 ID -> DB ID 매핑
+        """
+        if not articles:
+            return {}
+        
+        # 카페 이름 조회
+        cafe_name = self.api.get_cafe_name_by_id(cafe_id)
+        if not cafe_name:
+            cafe_name = f"카페_{cafe_id}"
+        
+        mapping = db.bulk_upsert_articles([self._to_db_article(article, cafe_name) for article in articles])
+        return {community_article_id: article_id for (_, community_article_id), article_id in mapping.items()}
     
-    async def _save_comments(self, cafe_id: str, article_id: str, comments: List[Dict[str, Any]]) -> int:
-        """댓글을 데이터베이스에 저장"""
+    def _to_db_article(self, article: NaverCafeArticle, cafe_name: str) -> Article:
+        """네이버 카페 게시글을 저장용 Article 로 변환"""
+        return Article(
+            id=None,
+            platform_id="naver",
+            community_article_id=str(article.article_id),
+            community_id=self.naver_community_id,
+            title=article.subject,
+            content=article.content or "",
+            images="[]",  # 네이버 카페는 이미지 정보를 별도로 처리하지 않음
+            writer_nickname=article.writer_nickname,
+            writer_id=article.writer_id,
+            like_count=article.like_count or 0,
+            comment_count=article.comment_count or 0,
+            view_count=article.view_count or 0,
+            created_at=article.created_at,
+            category_name=cafe_name,
+            collected_at=datetime.now()
+        )
+    
+    def _write_comments(self, db: DatabaseManager, cafe_id: str, db_article_id: int, comments: List[Dict[str, Any]]) -> int:
+        """댓글을 데이터베이스에 저장 (작업 단위 안에서 실행, db_article_id 는 articles 테이블의 id)"""
         try:
-            saved_count = 0
-            
-            # article_id는 articles 테이블의 id 필드여야 함
-            # 먼저 네이버 게시글 ID로 articles 테이블의 id를 찾아야 함
-            db_article = self.db.get_article_by_platform_id_and_community_article_id("naver", article_id)
-            if not db_article:
-                self.log_error(f"게시글 {article_id}를 데이터베이스에서 찾을 수 없습니다")
-                return 0
-            
-            db_article_id = db_article['id']
-            # self.log_info(f"게시글 {article_id}의 DB ID: {db_article_id}")
+            # 이미 저장된 댓글 ID를 한 번에 조회
+            existing_comment_ids = db.get_existing_comment_ids(db_article_id, [comment['comment_id'] for comment in comments])
             
+            db_comments = []
             for comment in comments:
                 try:
-                    # 이미 저장된 댓글인지 확인 (기존 테이블 구조 사용)
-                    existing = self.db.get_comment_by_article_id_and_comment_id(str(db_article_id), comment['comment_id'])
-                    if existing:
-                        # self.log_info(f"댓글 {comment['comment_id']}는 이미 저장되어 있습니다")
+                    # 이미 저장된 댓글인지 확인
+                    if comment['comment_id'] in existing_comment_ids:
                         continue
                     
                     # Comment 객체 생성 - 개선된 방식 사용
@@ -602,20 +550,19 @@ class NaverDataCollector(LoggedClass):
                     # 플랫폼 정보 추가
                     db_comment.platform_id = f"naver_cafe_{cafe_id}"
                     
-                    # 데이터베이스에 저장
-                    comment_id = self.db.insert_comment(db_comment)
-                    
-                    if comment_id:
-                        saved_count += 1
-                        # self.log_info(f"댓글 {comment['comment_id']} 저장 완료 (DB ID: {comment_id})")
-                    else:
-                        self.log_error(f"댓글 {comment['comment_id']} 저장 실패")
+                    db_comments.append(db_comment)
                         
                 except Exception as e:
-                    self.log_error(f"댓글 {comment['comment_id']} 저장 중 오류 발생: {str(e)}")
+                    self.log_error(f"댓글 {comment['comment_id']} 변환 중 오류 발생: {str(e)}")
                     continue
             
-            return saved_count
+            if not db_comments:
+                return 0
+            
+            # 데이터베이스에 일괄 저장
+            # 중복으로 무시된 댓글을 빼고 실제 저장된 댓글 수 반환 (이미 저장된 댓글은 위에서 제외함)
+            saved = db.bulk_upsert_comments(db_comments)
+            return len(saved)
             
         except Exception as e:
             self.log_error(f"댓글 저장 중 오류 발생: {str(e)}")
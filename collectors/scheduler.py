@@ -0,0 +1,167 @@
+"""
+수집 단위 동시 실행 스케줄러
+
+카테고리/서비스/게시판처럼 서로 독립적인 수집 단위를 병렬로 실행합니다.
+플랫폼별 동시 실행 수와 단위 시작 속도(예산)를 공유하며, 단위별 결과와 오류를 모아서 반환합니다.
+실제 HTTP 요청 속도는 호스트별 속도 제한기/서킷 브레이커가 별도로 제어합니다.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from platforms.rate_limiter import RateLimiter
+from utils.logger import LoggedClass
+
+# 플랫폼별 수집 예산: 플랫폼 -> (초당 시작 가능한 단위 수, 최대 동시 실행 단위 수)
+PLATFORM_BUDGETS: Dict[str, Tuple[float, int]] = {
+    "gangnamunni": (1.0, 3),
+    "babitalk": (1.0, 4),
+    "naver": (0.5, 2),
+}
+DEFAULT_PLATFORM_BUDGET = (1.0, 2)
+
+# 플랫폼별 공유 예산 (여러 수집 작업이 동시에 실행되어도 같은 예산을 사용)
+_platform_budgets: Dict[str, RateLimiter] = {}
+
+
+def get_platform_budget(platform: str) -> RateLimiter:
+    """플랫폼의 공유 수집 예산 반환 (없으면 설정값으로 생성)"""
+    budget = _platform_budgets.get(platform)
+    if budget is None:
+        units_per_second, max_concurrency = PLATFORM_BUDGETS.get(platform, DEFAULT_PLATFORM_BUDGET)
+        budget = RateLimiter(units_per_second, max_concurrency)
+        _platform_budgets[platform] = budget
+    return budget
+
+
+def configure_platform_budget(platform: str, units_per_second: float, max_concurrency: int):
+    """플랫폼별 수집 예산 변경 (기존 예산은 교체됨)"""
+    PLATFORM_BUDGETS[platform] = (units_per_second, max_concurrency)
+    _platform_budgets[platform] = RateLimiter(units_per_second, max_concurrency)
+
+
+@dataclass
+class CollectionUnit:
+    """독립적으로 실행 가능한 수집 단위"""
+    key: Any
+    name: str
+    factory: Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class UnitResult:
+    """수집 단위 실행 결과"""
+    key: Any
+    name: str
+    value: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ScheduleReport:
+    """스케줄러 실행 결과 (단위별 결과와 오류)"""
+    platform: str
+    units: Dict[Any, UnitResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def values(self, default: Any = None) -> Dict[Any, Any]:
+        """단위별 결과값 (실패한 단위는 default)"""
+        return {key: (unit.value if unit.ok else default) for key, unit in self.units.items()}
+
+    @property
+    def errors(self) -> Dict[Any, str]:
+        """실패한 단위의 오류 메시지"""
+        return {key: unit.error for key, unit in self.units.items() if not unit.ok}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 변환"""
+        return {
+            "platform": self.platform,
+            "elapsed": round(self.elapsed, 2),
+            "units": {
+                str(key): {
+                    "name": unit.name,
+                    "status": "success" if unit.ok else "error",
+                    "error": unit.error,
+                    "elapsed": round(unit.elapsed, 2),
+                }
+                for key, unit in self.units.items()
+            },
+        }
+
+
+class CollectionScheduler(LoggedClass):
+    """플랫폼 예산 안에서 수집 단위를 병렬 실행하는 스케줄러"""
+
+    def __init__(self, platform: str, use_platform_budget: bool = True):
+        """
+        Args:
+            platform: 플랫폼명 (예: "gangnamunni", "babitalk", "naver")
+            use_platform_budget: False이면 예산 없이 모든 단위를 바로 실행
+                                 (내부에서 다시 스케줄러를 사용하는 상위 단위용)
+        """
+        super().__init__("CollectionScheduler")
+        self.platform = platform
+        self.budget = get_platform_budget(platform) if use_platform_budget else None
+
+    async def _run_unit(self, unit: CollectionUnit) -> UnitResult:
+        """수집 단위 1개 실행 (예외는 결과에 기록하고 전파하지 않음)"""
+        if self.budget is not None:
+            async with self.budget:
+                return await self._execute(unit)
+        return await self._execute(unit)
+
+    async def _execute(self, unit: CollectionUnit) -> UnitResult:
+        start_time = time.monotonic()
+        try:
+            value = await unit.factory()
+            return UnitResult(unit.key, unit.name, value=value, elapsed=time.monotonic() - start_time)
+        except Exception as e:
+            self.log_error(f"❌ {self.platform} {unit.name} 수집 실패: {e}")
+            return UnitResult(unit.key, unit.name, error=str(e), elapsed=time.monotonic() - start_time)
+
+    async def run(self, units: List[CollectionUnit],
+                  on_unit_done: Optional[Callable[[UnitResult, int, int], None]] = None) -> ScheduleReport:
+        """
+        수집 단위를 병렬로 실행합니다.
+        호출자가 취소되면 진행 중인 모든 단위도 함께 취소됩니다.
+
+        Args:
+            units: 수집 단위 목록 (목록 순서대로 예산을 배정받음)
+            on_unit_done: 단위 완료 시 호출되는 콜백 (결과, 완료 수, 전체 수)
+
+        Returns:
+            ScheduleReport: 단위별 결과 (units 순서 유지)
+        """
+        start_time = time.monotonic()
+        total = len(units)
+        completed = 0
+
+        async def run_and_report(unit: CollectionUnit) -> UnitResult:
+            nonlocal completed
+            result = await self._run_unit(unit)
+            completed += 1
+            if on_unit_done:
+                try:
+                    on_unit_done(result, completed, total)
+                except Exception as e:
+                    self.log_warning(f"⚠️ 진행률 콜백 실패: {e}")
+            return result
+
+        results = await asyncio.gather(*(run_and_report(unit) for unit in units))
+
+        report = ScheduleReport(platform=self.platform, elapsed=time.monotonic() - start_time)
+        for result in results:
+            report.units[result.key] = result
+
+        failed = len(report.errors)
+        self.log_info(
+            f"📋 {self.platform} 수집 단위 {total}개 완료 (실패 {failed}개, 소요시간 {report.elapsed:.2f}초)"
+        )
+        return report
@@ -0,0 +1,133 @@
+"""
+비동기 코드용 DB 접근
+
+SQLAlchemy 매니저는 동기 API 이므로 async 라우터/수집기에서 직접 호출하면 쿼리 동안 이벤트 루프가 멈추고,
+동시에 처리 중인 API 요청과 HTTP 수집이 함께 지연됩니다.
+DB 호출은 크기가 제한된 DB 전용 스레드 풀에서 실행하고 이벤트 루프는 결과만 await 합니다.
+
+- run_db(func, *args, **kwargs): 동기 함수를 DB 스레드 풀에서 실행
+- run_db_write(func, *args, **kwargs): 쓰기 함수를 DB writer 스레드에서 실행 (SQLite 단일 writer)
+- AsyncDatabase(manager): 매니저의 모든 메서드를 await 가능한 형태로 감싼 프록시
+- AsyncDatabase.run_unit_of_work(func, ...): func(db) 의 여러 호출을 작업 단위 하나로 실행 (database/unit_of_work.py)
+
+스레드 풀 크기(DB_THREAD_POOL_SIZE)는 커넥션 풀 크기(기본 5 + overflow 10)를 넘지 않게 설정합니다.
+
+SQLite 는 동시에 하나의 쓰기 트랜잭션만 허용하므로 쓰기 호출은 전용 writer 스레드 하나에서 차례로 실행하고,
+조회는 WAL 모드에서 스레드 풀로 동시에 실행합니다. 쓰기 잠금을 기다리는 스레드가 writer 스레드 하나뿐이므로
+쓰기가 몰려도 조회용 스레드 풀이 잠금 대기로 막히지 않습니다.
+"""
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from database.config import db_config
+from database.sqlalchemy_manager import WRITE_METHODS
+
+logger = logging.getLogger(__name__)
+
+DB_THREAD_POOL_SIZE = int(os.getenv("DB_THREAD_POOL_SIZE", "8"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_writer: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """DB 전용 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DB_THREAD_POOL_SIZE, thread_name_prefix="db")
+                logger.info(f"🧵 DB 스레드 풀 생성 (최대 {DB_THREAD_POOL_SIZE}개)")
+    return _executor
+
+
+def get_db_writer() -> ThreadPoolExecutor:
+    """DB writer 스레드 (쓰기 호출을 차례로 실행, 처음 사용할 때 생성)"""
+    global _writer
+    if _writer is None:
+        with _executor_lock:
+            if _writer is None:
+                _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+                logger.info("🧵 DB writer 스레드 생성")
+    return _writer
+
+
+def shutdown_db_executor():
+    """DB 스레드 풀과 writer 스레드 종료 (서버 종료 시 호출, 실행 중인 쿼리는 끝날 때까지 대기)"""
+    global _executor, _writer
+    with _executor_lock:
+        if _writer is not None:
+            _writer.shutdown(wait=True)
+            _writer = None
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+            logger.info("🧵 DB 스레드 풀 종료")
+
+
+async def run_db(func: Callable, *args, **kwargs) -> Any:
+    """동기 DB 함수를 DB 스레드 풀에서 실행하고 결과 반환"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def _run_on_writer(func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_writer(), functools.partial(func, *args, **kwargs))
+
+
+async def run_db_write(func: Callable, *args, **kwargs) -> Any:
+    """쓰기 함수를 DB writer 스레드에서 실행 (SQLite 단일 writer 를 쓰지 않으면 DB 스레드 풀에서 실행)"""
+    if db_config.write_lock is None:
+        return await run_db(func, *args, **kwargs)
+    return await _run_on_writer(func, *args, **kwargs)
+
+
+class AsyncDatabase:
+    """
+    동기 DB 매니저의 메서드를 DB 스레드 풀에서 실행하는 프록시
+
+    예: `articles = await AsyncDatabase(DatabaseManager()).get_articles_by_filters(filters)`
+    """
+
+    def __init__(self, manager: Any):
+        self.sync = manager
+
+    def _runner(self, write: bool) -> Callable:
+        """쓰기는 writer 스레드에서 실행 (작업 단위 안에서는 작업 단위가 writer 잠금을 관리하므로 스레드 풀)"""
+        if write and getattr(self.sync, "serialize_writes", False):
+            return _run_on_writer
+        return run_db
+
+    def _call_in_unit(self, func: Callable, write: bool, args: tuple, kwargs: dict) -> Any:
+        with self.sync.unit_of_work(write=write) as db:
+            return func(db, *args, **kwargs)
+
+    async def run_unit_of_work(self, func: Callable, *args, write: bool = True, **kwargs) -> Any:
+        """
+        작업 단위 하나를 DB 스레드 호출 하나에서 실행하고 func(db, *args, **kwargs) 의 결과 반환
+
+        func 는 동기 함수이며 작업 단위 매니저(db)로 저장합니다. 쓰기 작업 단위는 writer 스레드에서
+        BEGIN IMMEDIATE 부터 COMMIT 까지 한 번에 실행하므로 writer 잠금이 await 사이에 유지되지 않습니다.
+        HTTP 조회 등 await 가 필요한 작업은 먼저 끝내고 저장할 행만 넘깁니다.
+        """
+        return await self._runner(write)(self._call_in_unit, func, write, args, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.sync, name)
+        if not callable(attr):
+            return attr
+
+        runner = self._runner(name in WRITE_METHODS)
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await runner(attr, *args, **kwargs)
+
+        return call
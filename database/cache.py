@@ -0,0 +1,234 @@
+"""
+데이터 조회 응답 캐시와 플랫폼별 데이터 세대(generation) 카운터
+
+대시보드가 같은 조건으로 몇 초마다 조회하는 데이터 뷰어 응답을 캐시하고,
+수집 경로가 새 데이터를 저장할 때 해당 플랫폼의 세대를 올려 캐시를 무효화합니다.
+
+- 캐시 키에 조회 대상 플랫폼들의 현재 세대가 포함되므로, 세대가 바뀌면 이전 항목은 더 이상 조회되지 않고
+  LRU/TTL 로 밀려납니다. 다른 플랫폼 수집은 해당 플랫폼 필터 조회의 캐시를 무효화하지 않습니다.
+- 플랫폼 필터가 없는 조회는 모든 수집에 따라 올라가는 ANY 세대를 사용합니다.
+- 통합 검색 문서/일별 집계 재생성처럼 전체가 바뀌는 작업은 invalidate_all() 로 EPOCH 세대를 올립니다.
+
+백엔드 (VIEWER_CACHE_BACKEND)
+- memory (기본값): 프로세스 내 LRU/TTL. 같은 프로세스의 수집(비동기 수집 작업)만 무효화에 반영됩니다.
+- sqlite: 같은 서버의 여러 API 워커/수집 스크립트가 공유하는 로컬 SQLite 파일 (VIEWER_CACHE_PATH)
+- none: 캐시 사용 안 함
+
+다른 프로세스가 세대를 올리지 않고 데이터를 바꾸는 경우를 위해 항목은 VIEWER_CACHE_TTL 초 후 만료됩니다.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+VIEWER_CACHE_BACKEND = os.getenv("VIEWER_CACHE_BACKEND", "memory")
+VIEWER_CACHE_TTL = float(os.getenv("VIEWER_CACHE_TTL", "60"))
+VIEWER_CACHE_MAX_ENTRIES = int(os.getenv("VIEWER_CACHE_MAX_ENTRIES", "1024"))
+VIEWER_CACHE_PATH = os.getenv("VIEWER_CACHE_PATH", "data/viewer_cache.db")
+
+EPOCH_SCOPE = "_epoch"
+ANY_SCOPE = "_any"
+
+# (ETag, 응답 본문)
+CacheEntry = Tuple[str, bytes]
+
+
+def platform_scopes(platforms: Optional[Iterable[str]]) -> List[str]:
+    """
+    조회 플랫폼 필터 -> 세대 범위 목록
+
+    후기는 gangnamunni_review / babitalk_review 처럼 별도 플랫폼 ID 로 저장되므로 함께 포함합니다.
+    """
+    if not platforms:
+        return [ANY_SCOPE]
+    scopes = set()
+    for platform in platforms:
+        scopes.add(platform)
+        if not platform.endswith("_review"):
+            scopes.add(f"{platform}_review")
+    return sorted(scopes)
+
+
+class MemoryResponseCache:
+    """프로세스 내 LRU/TTL 캐시 + 세대 카운터"""
+
+    blocking = False
+
+    def __init__(self, ttl: float = VIEWER_CACHE_TTL, max_entries: int = VIEWER_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generations(self, scopes: List[str]) -> Dict[str, int]:
+        with self._lock:
+            return {scope: self._generations.get(scope, 0) for scope in [EPOCH_SCOPE] + scopes}
+
+    def bump(self, scopes: Iterable[str]):
+        with self._lock:
+            for scope in scopes:
+                self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache:
+    """같은 서버의 프로세스들이 공유하는 로컬 SQLite 파일 캐시 + 세대 카운터"""
+
+    blocking = True  # 파일 I/O 가 있으므로 async 코드에서는 DB 스레드 풀로 호출
+    PRUNE_INTERVAL = 50  # set 호출 N 회마다 만료/초과 항목 정리
+
+    def __init__(self, path: str = VIEWER_CACHE_PATH, ttl: float = VIEWER_CACHE_TTL,
+                 max_entries: int = VIEWER_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._set_count = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed_at ON cache_entries (accessed_at)")
+        conn.execute("CREATE TABLE IF NOT EXISTS generations (scope TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (autocommit)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def generations(self, scopes: List[str]) -> Dict[str, int]:
+        scopes = [EPOCH_SCOPE] + scopes
+        placeholders = ",".join("?" for _ in scopes)
+        rows = dict(self._connection().execute(
+            f"SELECT scope, value FROM generations WHERE scope IN ({placeholders})", scopes
+        ).fetchall())
+        return {scope: rows.get(scope, 0) for scope in scopes}
+
+    def bump(self, scopes: Iterable[str]):
+        self._connection().executemany(
+            "INSERT INTO generations (scope, value) VALUES (?, 1) "
+            "ON CONFLICT(scope) DO UPDATE SET value = value + 1",
+            [(scope,) for scope in scopes]
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT etag, body FROM cache_entries WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0], bytes(row[1])
+
+    def set(self, key: str, entry: CacheEntry):
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, etag, body, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (key, entry[0], entry[1], now + self.ttl, now)
+        )
+        self._set_count += 1
+        if self._set_count % self.PRUNE_INTERVAL == 0:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                "SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entries")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """설정된 응답 캐시 (VIEWER_CACHE_BACKEND=none 이면 None)"""
+    global _cache
+    if _cache is None and VIEWER_CACHE_BACKEND != "none":
+        with _cache_lock:
+            if _cache is None:
+                if VIEWER_CACHE_BACKEND == "sqlite":
+                    _cache = SQLiteResponseCache()
+                else:
+                    _cache = MemoryResponseCache()
+                logger.info(f"🗄️ 조회 응답 캐시 사용: {VIEWER_CACHE_BACKEND} (TTL {VIEWER_CACHE_TTL}초)")
+    return _cache
+
+
+def set_response_cache(cache):
+    """응답 캐시 교체 (None 이면 다음 사용 시 설정값으로 다시 생성)"""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def bump_generation(platform_ids: Iterable[str]):
+    """
+    수집 경로에서 호출: 새 데이터가 저장된 플랫폼의 세대를 올림
+
+    캐시 오류가 수집을 실패시키지 않도록 예외는 기록만 합니다.
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return
+    scopes = {platform_id for platform_id in platform_ids if platform_id}
+    if not scopes:
+        return
+    try:
+        cache.bump(sorted(scopes) + [ANY_SCOPE])
+    except Exception as e:
+        logger.warning(f"⚠️ 조회 캐시 세대 갱신 실패: {e}")
+
+
+def invalidate_all():
+    """전체 데이터가 바뀌는 작업 후 모든 캐시 항목 무효화"""
+    cache = get_response_cache()
+    if cache is None:
+        return
+    try:
+        cache.bump([EPOCH_SCOPE])
+    except Exception as e:
+        logger.warning(f"⚠️ 조회 캐시 무효화 실패: {e}")
@@ -1,11 +1,15 @@
 import os
-from sqlalchemy import create_engine
+import threading
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
-from typing import Generator
+from typing import Dict, Generator
 import logging
 
 from dotenv import load_dotenv
 
+from database.fulltext import ensure_fulltext_indexes
+
 load_dotenv()
 
 # 로거 설정
@@ -20,6 +24,47 @@ logging.getLogger('sqlalchemy.orm').setLevel(logging.WARNING)
 # Base 클래스 생성
 Base = declarative_base()
 
+# SQLite 운영 설정 (연결마다 적용하는 PRAGMA)
+# - WAL: 쓰기 중에도 읽기가 막히지 않음 (수집 중 data_viewer 조회)
+# - synchronous=NORMAL: WAL 에서는 커밋마다 fsync 하지 않아도 DB 가 손상되지 않음 (전원 장애 시 마지막 커밋만 유실 가능)
+# - busy_timeout: 다른 프로세스가 쓰는 중이면 바로 "database is locked" 오류 대신 대기
+SQLITE_PRAGMAS: Dict[str, str] = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "30000"),
+    "cache_size": str(-int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))),  # 음수는 KB 단위
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+    "temp_store": "MEMORY",
+}
+# 프로세스의 쓰기 트랜잭션을 하나씩 실행 (단일 writer)
+SQLITE_SINGLE_WRITER = os.getenv("SQLITE_SINGLE_WRITER", "true").lower() == "true"
+
+_sqlite_writer = threading.local()
+
+def _configure_sqlite_engine(engine):
+    """
+    SQLite 연결 설정 (connect/begin 이벤트)
+    
+    - 연결마다 SQLITE_PRAGMAS 적용
+    - pysqlite 드라이버의 자체 트랜잭션 관리를 끄고 SQLAlchemy 가 BEGIN 을 직접 실행
+      (pysqlite 는 SAVEPOINT 를 해제할 때 바깥 트랜잭션까지 커밋하므로 작업 단위의 SAVEPOINT 를 위해 SQLAlchemy 문서의 방식대로 설정)
+    - 단일 writer 구간(DatabaseConfig.writer)에서 시작하는 트랜잭션은 BEGIN IMMEDIATE 로 시작해
+      읽기 후 쓰기로 잠금을 올리다 실패(SQLITE_BUSY)하지 않도록 처음부터 쓰기 잠금을 잡음
+    """
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if getattr(_sqlite_writer, "held", False) else "BEGIN")
+
 class DatabaseConfig:
     """데이터베이스 설정 클래스"""
     
@@ -38,6 +83,12 @@ class DatabaseConfig:
             echo=enable_sql_logging,  # 환경변수로 제어 가능
             pool_pre_ping=True if self.db_type == "mysql" else False
         )
+        # SQLite 단일 writer 잠금 (MySQL 은 행 잠금을 사용하므로 None)
+        self.write_lock = None
+        if self.db_type != "mysql":
+            _configure_sqlite_engine(self.engine)
+            if SQLITE_SINGLE_WRITER:
+                self.write_lock = threading.Lock()
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
     
     def _get_database_url(self) -> str:
@@ -65,11 +116,42 @@ class DatabaseConfig:
         try:
             logger.info(f"🗄️ local 환경에서 데이터베이스 테이블 자동 생성 중...")
             Base.metadata.create_all(bind=self.engine)
+            ensure_fulltext_indexes(self.engine)
             logger.info("✅ 데이터베이스 테이블이 성공적으로 생성되었습니다.")
         except Exception as e:
             logger.error(f"❌ 테이블 생성 중 오류 발생: {e}")
             raise
     
+    @contextmanager
+    def writer(self):
+        """
+        단일 writer 구간: 프로세스의 쓰기 트랜잭션을 하나씩 실행하고 BEGIN IMMEDIATE 로 시작
+        
+        잠금은 이 구간(메서드 호출 하나) 동안만 유지합니다.
+        읽기는 WAL 덕분에 이 잠금과 관계없이 동시에 실행됩니다. 같은 스레드에서 다시 들어오면 그대로 통과합니다.
+        """
+        if self.write_lock is None or getattr(_sqlite_writer, "held", False):
+            yield
+            return
+        self.write_lock.acquire()
+        _sqlite_writer.held = True
+        try:
+            yield
+        finally:
+            _sqlite_writer.held = False
+            self.write_lock.release()
+    
+    def begin_write(self, session):
+        """세션 트랜잭션을 BEGIN IMMEDIATE 로 시작 (쓰기 작업 단위가 writer 잠금을 잡은 직후 호출)"""
+        if self.write_lock is None or session.in_transaction():
+            return
+        previous = getattr(_sqlite_writer, "held", False)
+        _sqlite_writer.held = True
+        try:
+            session.connection()
+        finally:
+            _sqlite_writer.held = previous
+    
     def get_session(self) -> Generator:
         """데이터베이스 세션 생성"""
         session = self.SessionLocal()
@@ -0,0 +1,299 @@
+"""
+전문 검색(Full-text) 인덱스 관리
+
+한글 검색을 위해 SQLite 는 FTS5 trigram 토크나이저, MySQL 은 ngram 파서 FULLTEXT 인덱스를 사용합니다.
+- SQLite: 외부 콘텐츠 FTS5 테이블(<테이블>_fts)과 INSERT/UPDATE/DELETE 트리거로 수집 시점에 인덱스 동기화
+- MySQL: InnoDB FULLTEXT 인덱스 (INSERT/UPDATE 시 자동 반영)
+
+검색 문서(search_documents)는 수집 시 매니저가 원본과 같은 트랜잭션에서 저장하고,
+원본 게시글/댓글/후기의 삭제/수정은 원본 테이블의 트리거로 검색 문서에 반영합니다 (수집 밖에서 지우거나 고친 경우 포함).
+
+인덱스 토큰보다 짧은 키워드(SQLite 3자 미만, MySQL 2자 미만)는 인덱스로 찾을 수 없으므로 LIKE 로 검색합니다.
+FTS5 trigram(SQLite 3.34 이상)이나 ngram 파서를 쓸 수 없는 환경에서는 인덱스 없이 모든 키워드를 LIKE 로 검색합니다.
+"""
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import inspect, or_, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 전문 검색 대상 테이블 -> 검색 컬럼
+# 게시글/댓글/후기의 검색 텍스트는 search_documents 테이블에 모아 하나의 인덱스로 검색합니다.
+FULLTEXT_TABLES: Dict[str, Tuple[str, ...]] = {
+    "search_documents": ("text",),
+}
+
+# 통합 검색 문서 도입 전 테이블별로 만들던 인덱스 (남아 있으면 제거)
+LEGACY_FULLTEXT_TABLES: Tuple[str, ...] = ("articles", "comments", "reviews")
+
+# 원본 테이블 -> (검색 문서 타입, 검색 텍스트 컬럼, 카테고리 SQL 식, 트리거를 거는 컬럼)
+# 검색 텍스트/카테고리는 SQLAlchemyDatabaseManager._index_search_documents 와 같은 규칙으로 만듭니다.
+SEARCH_SOURCE_TABLES: Dict[str, Tuple[str, Tuple[str, ...], Dict[str, str], Tuple[str, ...]]] = {
+    "articles": ("article", ("title", "content"), {
+        "sqlite": "new.category_name", "mysql": "NEW.category_name",
+    }, ("title", "content", "category_name", "created_at", "platform_id")),
+    "comments": ("comment", ("content",), {
+        "sqlite": "(SELECT category_name FROM articles WHERE id = new.article_id)",
+        "mysql": "(SELECT category_name FROM articles WHERE id = NEW.article_id)",
+    }, ("content", "created_at", "platform_id")),
+    "reviews": ("review", ("title", "content", "hospital_name", "doctor_name"), {
+        "sqlite": "substr(new.categories, 1, 255)", "mysql": "LEFT(NEW.categories, 255)",
+    }, ("title", "content", "hospital_name", "doctor_name", "categories", "created_at", "platform_id")),
+}
+
+SQLITE_MIN_TOKEN_LENGTH = 3  # trigram
+MYSQL_MIN_TOKEN_LENGTH = 2   # ngram_token_size 기본값
+
+# 엔진별 전문 검색 인덱스 사용 가능 여부 캐시
+_availability: Dict[int, bool] = {}
+
+
+def _fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def _mysql_index_name(table: str) -> str:
+    return f"ft_{table}_text"
+
+
+def _sqlite_statements(table: str, columns: Tuple[str, ...]) -> List[str]:
+    """SQLite FTS5 테이블과 동기화 트리거 생성 SQL"""
+    fts = _fts_table(table)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_list}, content='{table}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def _search_text_sql(dialect: str, columns: Tuple[str, ...]) -> str:
+    """빈 값을 제외하고 줄바꿈으로 이은 검색 텍스트 SQL 식 (SQLAlchemyDatabaseManager._search_text 와 동일)"""
+    if dialect == "mysql":
+        return "CONCAT_WS(CHAR(10), " + ", ".join(f"NULLIF(NEW.{column}, '')" for column in columns) + ")"
+    parts = " || ".join(
+        f"CASE WHEN COALESCE(new.{column}, '') = '' THEN '' ELSE char(10) || new.{column} END" for column in columns
+    )
+    return f"substr({parts}, 2)"
+
+
+def _search_document_trigger_statements(dialect: str, table: str) -> Dict[str, str]:
+    """원본 테이블의 삭제/수정을 search_documents 에 반영하는 트리거 (트리거 이름 -> 생성 SQL)"""
+    doc_type, text_columns, category_sql, watched_columns = SEARCH_SOURCE_TABLES[table]
+    delete_name, update_name = f"search_documents_{table}_ad", f"search_documents_{table}_au"
+    if dialect == "mysql":
+        changed = " OR ".join(f"NOT (OLD.{column} <=> NEW.{column})" for column in watched_columns)
+        return {
+            delete_name: f"CREATE TRIGGER {delete_name} AFTER DELETE ON {table} FOR EACH ROW "
+                         f"DELETE FROM search_documents WHERE doc_type = '{doc_type}' AND source_id = OLD.id",
+            update_name: f"CREATE TRIGGER {update_name} AFTER UPDATE ON {table} FOR EACH ROW "
+                         f"UPDATE search_documents SET platform_id = NEW.platform_id, category = {category_sql['mysql']}, "
+                         f"created_at = COALESCE(NEW.created_at, created_at), text = {_search_text_sql(dialect, text_columns)} "
+                         f"WHERE doc_type = '{doc_type}' AND source_id = NEW.id AND ({changed})",
+        }
+    return {
+        delete_name: f"CREATE TRIGGER IF NOT EXISTS {delete_name} AFTER DELETE ON {table} BEGIN "
+                     f"DELETE FROM search_documents WHERE doc_type = '{doc_type}' AND source_id = old.id; END",
+        update_name: f"CREATE TRIGGER IF NOT EXISTS {update_name} AFTER UPDATE OF {', '.join(watched_columns)} ON {table} BEGIN "
+                     f"UPDATE search_documents SET platform_id = new.platform_id, category = {category_sql['sqlite']}, "
+                     f"created_at = COALESCE(new.created_at, created_at), text = {_search_text_sql(dialect, text_columns)} "
+                     f"WHERE doc_type = '{doc_type}' AND source_id = new.id; END",
+    }
+
+
+def _ensure_search_document_triggers(conn, dialect: str, existing_tables: set):
+    """원본 테이블 삭제/수정 동기화 트리거 생성 (이미 있으면 건너뜀)"""
+    if "search_documents" not in existing_tables or dialect not in ("sqlite", "mysql"):
+        return
+    existing_triggers = set()
+    if dialect == "mysql":
+        existing_triggers = {name for (name,) in conn.execute(text(
+            "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = DATABASE()"
+        ))}
+    for table in SEARCH_SOURCE_TABLES:
+        if table not in existing_tables:
+            continue
+        for name, statement in _search_document_trigger_statements(dialect, table).items():
+            if name not in existing_triggers:
+                conn.execute(text(statement))
+
+
+def _fulltext_supported(conn, dialect: str) -> bool:
+    """현재 데이터베이스에서 한글 전문 검색 인덱스(FTS5 trigram / ngram 파서)를 만들 수 있는지 여부"""
+    try:
+        if dialect == "sqlite":
+            # trigram 토크나이저는 SQLite 3.34 부터 지원되고 FTS5 가 빠진 빌드도 있으므로 임시 테이블로 직접 확인
+            conn.execute(text("CREATE VIRTUAL TABLE temp.fulltext_probe USING fts5(text, tokenize='trigram')"))
+            conn.execute(text("DROP TABLE temp.fulltext_probe"))
+            return True
+        if dialect == "mysql":
+            status = conn.execute(text(
+                "SELECT PLUGIN_STATUS FROM information_schema.PLUGINS WHERE PLUGIN_NAME = 'ngram'"
+            )).scalar()
+            return status == "ACTIVE"
+    except Exception as e:
+        logger.debug(f"전문 검색 지원 여부 확인 실패: {e}")
+    return False
+
+
+def _drop_legacy_indexes(conn, dialect: str, existing_tables: set):
+    """원본 테이블마다 만들던 이전 전문 검색 인덱스/트리거 제거 (수집 시 불필요한 인덱스 갱신 방지)"""
+    for table in LEGACY_FULLTEXT_TABLES:
+        if dialect == "sqlite" and _fts_table(table) in existing_tables:
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {_fts_table(table)}_{suffix}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {_fts_table(table)}"))
+            logger.info(f"🧹 {table} 이전 전문 검색 인덱스 제거")
+        elif dialect == "mysql" and table in existing_tables:
+            index_names = {index["name"] for index in inspect(conn).get_indexes(table)}
+            if _mysql_index_name(table) in index_names:
+                conn.execute(text(f"ALTER TABLE {table} DROP INDEX {_mysql_index_name(table)}"))
+                logger.info(f"🧹 {table} 이전 전문 검색 인덱스 제거")
+
+
+def ensure_fulltext_indexes(engine: Engine) -> bool:
+    """
+    전문 검색 인덱스와 검색 문서 동기화 트리거 생성 (이미 있으면 건너뜀)
+    새로 만든 SQLite FTS 테이블은 기존 데이터로 한 번 채웁니다.
+
+    이전 테이블별 인덱스는 새 인덱스와 트리거가 모두 만들어진 뒤에만 제거합니다.
+    (MySQL DDL 은 바로 커밋되므로 먼저 지우면 새 인덱스 생성이 실패했을 때 검색 인덱스가 하나도 남지 않음)
+
+    Returns:
+        bool: 전문 검색 인덱스 사용 가능 여부 (False 면 LIKE 검색)
+    """
+    dialect = engine.dialect.name
+    existing_tables = set(inspect(engine).get_table_names())
+
+    with engine.begin() as conn:
+        _ensure_search_document_triggers(conn, dialect, existing_tables)
+
+        if not _fulltext_supported(conn, dialect):
+            logger.warning(
+                f"⚠️ {dialect} 에서 한글 전문 검색 인덱스(FTS5 trigram / ngram 파서)를 사용할 수 없어 "
+                f"키워드 검색은 LIKE 로 수행합니다."
+            )
+            _availability.pop(id(engine), None)
+            return False
+
+        for table, columns in FULLTEXT_TABLES.items():
+            if table not in existing_tables:
+                continue
+
+            if dialect == "sqlite":
+                is_new = _fts_table(table) not in existing_tables
+                for statement in _sqlite_statements(table, columns):
+                    conn.execute(text(statement))
+                if is_new:
+                    conn.execute(text(f"INSERT INTO {_fts_table(table)}({_fts_table(table)}) VALUES ('rebuild')"))
+                    logger.info(f"✅ {table} 전문 검색 인덱스(FTS5 trigram) 생성 완료")
+
+            elif dialect == "mysql":
+                index_names = {index["name"] for index in inspect(conn).get_indexes(table)}
+                if _mysql_index_name(table) not in index_names:
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ADD FULLTEXT INDEX {_mysql_index_name(table)} "
+                        f"({', '.join(columns)}) WITH PARSER ngram"
+                    ))
+                    logger.info(f"✅ {table} 전문 검색 인덱스(FULLTEXT ngram) 생성 완료")
+
+    _availability.pop(id(engine), None)
+    if not fulltext_available(engine):
+        logger.warning("⚠️ 검색 문서 전문 검색 인덱스가 준비되지 않아 이전 전문 검색 인덱스를 유지합니다.")
+        return False
+
+    with engine.begin() as conn:
+        _drop_legacy_indexes(conn, dialect, existing_tables)
+    return True
+
+
+def rebuild_fulltext_indexes(engine: Engine):
+    """SQLite FTS 인덱스를 원본 테이블 기준으로 다시 생성 (MySQL 은 자동 관리되므로 해당 없음)"""
+    if engine.dialect.name != "sqlite" or not fulltext_available(engine):
+        return
+    with engine.begin() as conn:
+        for table in FULLTEXT_TABLES:
+            conn.execute(text(f"INSERT INTO {_fts_table(table)}({_fts_table(table)}) VALUES ('rebuild')"))
+
+
+def fulltext_available(engine: Engine) -> bool:
+    """전문 검색 인덱스가 모두 준비되어 있는지 여부 (엔진별 캐시)"""
+    key = id(engine)
+    if key not in _availability:
+        try:
+            inspector = inspect(engine)
+            if engine.dialect.name == "sqlite":
+                tables = set(inspector.get_table_names())
+                available = all(_fts_table(table) in tables for table in FULLTEXT_TABLES)
+            elif engine.dialect.name == "mysql":
+                available = all(
+                    _mysql_index_name(table) in {index["name"] for index in inspector.get_indexes(table)}
+                    for table in FULLTEXT_TABLES
+                )
+            else:
+                available = False
+        except Exception as e:
+            logger.warning(f"⚠️ 전문 검색 인덱스 확인 실패, LIKE 검색을 사용합니다: {e}")
+            available = False
+        _availability[key] = available
+    return _availability[key]
+
+
+def _like_condition(model, columns: Tuple[str, ...], keyword: str):
+    return or_(*[getattr(model, column).like(f"%{keyword}%") for column in columns])
+
+
+def _fts5_query(keywords: List[str]) -> str:
+    """FTS5 MATCH 쿼리 (각 키워드를 구문으로 묶어 OR 결합)"""
+    return " OR ".join('"' + keyword.replace('"', '""') + '"' for keyword in keywords)
+
+
+def _mysql_boolean_query(keywords: List[str]) -> str:
+    """MySQL BOOLEAN MODE 쿼리 (연산자 없는 구문은 OR 로 결합됨)"""
+    return " ".join('"' + keyword.replace('"', ' ') + '"' for keyword in keywords)
+
+
+def keyword_condition(engine: Engine, model, keywords: List[str]):
+    """
+    키워드 중 하나라도 포함하는 행을 찾는 조건 (전문 검색 인덱스 사용, 없으면 LIKE)
+
+    Args:
+        engine: 검색할 데이터베이스 엔진
+        model: 검색 대상 모델 (SearchDocument)
+        keywords: 검색 키워드 목록 (OR 조건)
+    """
+    table = model.__tablename__
+    columns = FULLTEXT_TABLES[table]
+    keywords = [keyword for keyword in keywords if keyword]
+    dialect = engine.dialect.name
+
+    if not fulltext_available(engine):
+        return or_(*[_like_condition(model, columns, keyword) for keyword in keywords])
+
+    min_length = SQLITE_MIN_TOKEN_LENGTH if dialect == "sqlite" else MYSQL_MIN_TOKEN_LENGTH
+    indexed_keywords = [keyword for keyword in keywords if len(keyword) >= min_length]
+    conditions = [_like_condition(model, columns, keyword) for keyword in keywords if len(keyword) < min_length]
+
+    if indexed_keywords:
+        if dialect == "sqlite":
+            fts = _fts_table(table)
+            conditions.append(text(
+                f"{table}.id IN (SELECT rowid FROM {fts} WHERE {fts} MATCH :{fts}_query)"
+            ).bindparams(**{f"{fts}_query": _fts5_query(indexed_keywords)}))
+        else:
+            column_list = ", ".join(f"{table}.{column}" for column in columns)
+            conditions.append(text(
+                f"MATCH ({column_list}) AGAINST (:{table}_ft_query IN BOOLEAN MODE)"
+            ).bindparams(**{f"{table}_ft_query": _mysql_boolean_query(indexed_keywords)}))
+
+    return or_(*conditions)
@@ -3,8 +3,10 @@
 이 파일은 config 기반 데이터베이스 시스템을 사용합니다.
 """
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple, Set, Iterator
 from dataclasses import dataclass
+from contextlib import contextmanager
+import copy
 
 # 하위 호환성을 위한 데이터클래스들 (SQLAlchemy 매니저와 함께 사용)
 @dataclass
@@ -101,6 +103,27 @@ class DatabaseManager:
         """데이터베이스 초기화 - SQLAlchemy에서 자동 처리"""
         pass  # SQLAlchemy 매니저가 자동으로 테이블 생성
     
+    @contextmanager
+    def unit_of_work(self, write: bool = True):
+        """작업 단위 시작: 블록 안의 호출이 세션 하나를 공유하고 블록이 끝날 때 커밋 (SQLAlchemyDatabaseManager.unit_of_work 참고)"""
+        with self._sqlalchemy_manager.unit_of_work(write) as sqlalchemy_manager:
+            manager = copy.copy(self)
+            manager._sqlalchemy_manager = sqlalchemy_manager
+            yield manager
+    
+    @property
+    def serialize_writes(self) -> bool:
+        """쓰기 호출을 DB writer 스레드로 보낼지 (SQLite 단일 writer 이고 작업 단위 밖일 때)"""
+        return self._sqlalchemy_manager.serialize_writes
+    
+    def flush(self):
+        """작업 단위의 변경을 DB 로 전송 (커밋하지 않음)"""
+        self._sqlalchemy_manager.flush()
+    
+    def commit(self):
+        """작업 단위 중간 커밋"""
+        self._sqlalchemy_manager.commit()
+    
     def insert_community(self, community: Community) -> int:
         """커뮤니티 추가 (중복 체크 포함)"""
         return self._sqlalchemy_manager.insert_community(community.name, community.description)
@@ -112,7 +135,38 @@ class DatabaseManager:
     
     def insert_article(self, article: Article) -> int:
         """게시글 추가 (중복 체크 포함)"""
-        article_data = {
+        return self._sqlalchemy_manager.insert_article(self._article_to_data(article))
+    
+    def insert_comment(self, comment: Comment) -> int:
+        """댓글 추가"""
+        return self._sqlalchemy_manager.insert_comment(self._comment_to_data(comment))
+    
+    def insert_review(self, review: Review) -> int:
+        """후기 추가 (중복 체크 포함)"""
+        return self._sqlalchemy_manager.insert_review(self._review_to_data(review))
+    
+    def bulk_upsert_articles(self, articles: List[Article], update_fields: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """게시글 일괄 저장 ((platform_id, community_article_id) -> ID 매핑 반환)"""
+        return self._sqlalchemy_manager.bulk_upsert_articles(
+            [self._article_to_data(article) for article in articles], update_fields
+        )
+    
+    def bulk_upsert_comments(self, comments: List[Comment], update_fields: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """댓글 일괄 저장 ((platform_id, community_comment_id) -> ID 매핑 반환)"""
+        return self._sqlalchemy_manager.bulk_upsert_comments(
+            [self._comment_to_data(comment) for comment in comments], update_fields
+        )
+    
+    def bulk_upsert_reviews(self, reviews: List[Review], update_fields: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """후기 일괄 저장 ((platform_id, platform_review_id) -> ID 매핑 반환)"""
+        return self._sqlalchemy_manager.bulk_upsert_reviews(
+            [self._review_to_data(review) for review in reviews], update_fields
+        )
+    
+    @staticmethod
+    def _article_to_data(article: Article) -> Dict:
+        """Article 데이터클래스를 SQLAlchemy 매니저용 딕셔너리로 변환"""
+        return {
             "platform_id": article.platform_id,
             "community_article_id": article.community_article_id,
             "community_id": article.community_id,
@@ -128,13 +182,13 @@ class DatabaseManager:
             "category_name": article.category_name,
             "collected_at": article.collected_at or datetime.now()
         }
-        return self._sqlalchemy_manager.insert_article(article_data)
     
-    def insert_comment(self, comment: Comment) -> int:
-        """댓글 추가"""
+    @staticmethod
+    def _comment_to_data(comment: Comment) -> Dict:
+        """Comment 데이터클래스를 SQLAlchemy 매니저용 딕셔너리로 변환"""
         # article_id가 숫자인 경우 직접 사용 (추천 방식)
         if hasattr(comment, 'article_id') and str(comment.article_id).isdigit():
-            comment_data = {
+            return {
                 "article_id": int(comment.article_id),
                 "community_comment_id": str(comment.id or ""),
                 "content": comment.content,
@@ -144,24 +198,23 @@ class DatabaseManager:
                 "parent_comment_id": comment.parent_comment_id,
                 "collected_at": comment.collected_at or datetime.now()
             }
-        else:
-            # 레거시 방식 - platform_id와 community_article_id 사용
-            comment_data = {
-                "platform_id": getattr(comment, 'platform_id', 'legacy'),
-                "community_article_id": comment.article_id,
-                "community_comment_id": str(comment.id or ""),
-                "content": comment.content,
-                "writer_nickname": comment.writer_nickname,
-                "writer_id": comment.writer_id,
-                "created_at": comment.created_at,
-                "parent_comment_id": comment.parent_comment_id,
-                "collected_at": comment.collected_at or datetime.now()
-            }
-        return self._sqlalchemy_manager.insert_comment(comment_data)
+        # 레거시 방식 - platform_id와 community_article_id 사용
+        return {
+            "platform_id": getattr(comment, 'platform_id', 'legacy'),
+            "community_article_id": comment.article_id,
+            "community_comment_id": str(comment.id or ""),
+            "content": comment.content,
+            "writer_nickname": comment.writer_nickname,
+            "writer_id": comment.writer_id,
+            "created_at": comment.created_at,
+            "parent_comment_id": comment.parent_comment_id,
+            "collected_at": comment.collected_at or datetime.now()
+        }
     
-    def insert_review(self, review: Review) -> int:
-        """후기 추가 (중복 체크 포함)"""
-        review_data = {
+    @staticmethod
+    def _review_to_data(review: Review) -> Dict:
+        """Review 데이터클래스를 SQLAlchemy 매니저용 딕셔너리로 변환"""
+        return {
             "platform_id": review.platform_id,
             "platform_review_id": review.platform_review_id,
             "community_id": review.community_id,
@@ -184,7 +237,6 @@ class DatabaseManager:
             "created_at": review.created_at,
             "collected_at": review.collected_at or datetime.now()
         }
-        return self._sqlalchemy_manager.insert_review(review_data)
     
     def get_articles_by_date(self, date: str, community_id: Optional[int] = None) -> List[Dict]:
         """특정 날짜의 게시글 조회"""
@@ -227,25 +279,28 @@ class DatabaseManager:
             "category_statistics": {}
         }
     
-    def get_articles_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0) -> List[Dict]:
+    def get_articles_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0,
+                                cursor: Optional[str] = None) -> List[Dict]:
         """필터 조건에 따라 게시글을 조회합니다."""
-        return self._sqlalchemy_manager.get_articles_by_filters(filters, limit, offset)
+        return self._sqlalchemy_manager.get_articles_by_filters(filters, limit, offset, cursor)
     
     def get_articles_count_by_filters(self, filters: Dict) -> int:
         """필터 조건에 따른 게시글 수를 반환합니다."""
         return self._sqlalchemy_manager.get_articles_count_by_filters(filters)
     
-    def get_reviews_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0) -> List[Dict]:
+    def get_reviews_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0,
+                               cursor: Optional[str] = None) -> List[Dict]:
         """필터 조건에 따라 후기를 조회합니다."""
-        return self._sqlalchemy_manager.get_reviews_by_filters(filters, limit, offset)
+        return self._sqlalchemy_manager.get_reviews_by_filters(filters, limit, offset, cursor)
     
     def get_reviews_count_by_filters(self, filters: Dict) -> int:
         """필터 조건에 따른 후기 수를 반환합니다."""
         return self._sqlalchemy_manager.get_reviews_count_by_filters(filters)
     
-    def get_comments_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0) -> List[Dict]:
+    def get_comments_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0,
+                                cursor: Optional[str] = None) -> List[Dict]:
         """필터 조건에 따라 댓글을 조회합니다."""
-        return self._sqlalchemy_manager.get_comments_by_filters(filters, limit, offset)
+        return self._sqlalchemy_manager.get_comments_by_filters(filters, limit, offset, cursor)
     
     def get_comments_count_by_filters(self, filters: Dict) -> int:
         """필터 조건에 따른 댓글 수를 반환합니다."""
@@ -259,6 +314,28 @@ class DatabaseManager:
         """플랫폼 ID와 커뮤니티 게시글 ID로 게시글 조회"""
         return self._sqlalchemy_manager.get_article_by_platform_id_and_community_article_id(platform_id, community_article_id)
     
+    def get_article_ids_by_community_article_ids(self, platform_id: str, community_article_ids: List[str]) -> Dict[str, int]:
+        """이미 저장된 게시글의 커뮤니티 게시글 ID -> DB ID 매핑을 한 번에 조회"""
+        return self._sqlalchemy_manager.get_article_ids_by_community_article_ids(platform_id, community_article_ids)
+    
+    def get_existing_review_ids(self, platform_id: str, platform_review_ids: List[str]) -> Set[str]:
+        """이미 저장된 후기의 플랫폼 후기 ID 집합을 한 번에 조회"""
+        return self._sqlalchemy_manager.get_existing_review_ids(platform_id, platform_review_ids)
+    
+    def get_existing_comment_ids(self, article_id: int, community_comment_ids: List[str]) -> Set[str]:
+        """게시글에 이미 저장된 댓글 ID 집합을 한 번에 조회"""
+        return self._sqlalchemy_manager.get_existing_comment_ids(article_id, community_comment_ids)
+    
+    def get_collection_checkpoint(self, platform_id: str, target_date: str, category: str = "") -> Optional[Dict]:
+        """플랫폼/날짜/카테고리 단위 수집 체크포인트 조회"""
+        return self._sqlalchemy_manager.get_collection_checkpoint(platform_id, target_date, category)
+    
+    def save_collection_checkpoint(self, platform_id: str, target_date: str, category: str, cursor: Any,
+                                   last_item_id: Optional[str] = None, stats: Optional[Dict] = None,
+                                   status: str = "in_progress") -> Dict:
+        """수집 체크포인트 저장 (없으면 생성, 있으면 갱신)"""
+        return self._sqlalchemy_manager.save_collection_checkpoint(platform_id, target_date, category, cursor, last_item_id, stats, status)
+    
     def get_review_by_id(self, review_id: int) -> Optional[Dict]:
         """ID로 후기를 조회합니다."""
         return self._sqlalchemy_manager.get_review_by_id(review_id)
@@ -290,32 +367,48 @@ class DatabaseManager:
     
     def get_platform_statistics(self, platform_id: str) -> Dict:
         """특정 플랫폼의 통계를 반환합니다."""
-        return {
-            "articles": 0,
-            "reviews": 0,
-            "comments": 0
-        }
+        return self._sqlalchemy_manager.get_platform_statistics(platform_id)
     
     def get_daily_statistics(self, date: str) -> Dict:
         """특정 날짜의 통계를 반환합니다."""
-        return {
-            "articles": 0,
-            "reviews": 0,
-            "comments": 0
-        }
+        return self._sqlalchemy_manager.get_daily_statistics(date)
     
     def get_trend_statistics(self, days: int) -> Dict:
         """최근 N일간의 트렌드 통계를 반환합니다."""
-        return {
-            "article_trends": [],
-            "review_trends": []
-        }
+        return self._sqlalchemy_manager.get_trend_statistics(days)
+    
+    def rebuild_daily_stats(self) -> Dict[str, int]:
+        """원본 데이터로 일별 집계를 다시 계산합니다."""
+        return self._sqlalchemy_manager.rebuild_daily_stats()
     
     def get_connection(self):
         """데이터베이스 연결을 반환합니다."""
         from database.config import get_db
         return get_db()
     
+    def search_documents_by_keywords(self, keywords: List[str], platforms: List[str] = None, 
+                                     data_types: List[str] = None, start_date: str = None, 
+                                     end_date: str = None, naver_cafes: List[str] = None, 
+                                     limit: int = 100, offset: int = 0, cursor: Optional[str] = None,
+                                     with_counts: bool = True) -> Dict[str, Any]:
+        """게시글, 댓글, 후기를 통합 검색 인덱스에서 작성일 역순으로 검색합니다."""
+        return self._sqlalchemy_manager.search_documents_by_keywords(
+            keywords, platforms, data_types, start_date, end_date, naver_cafes, limit, offset, cursor, with_counts
+        )
+    
+    def get_export_fields(self, data_type: str) -> List[str]:
+        """내보내기 필드명 목록을 반환합니다."""
+        return self._sqlalchemy_manager.get_export_fields(data_type)
+    
+    def iter_export_batches(self, data_type: str, platforms: List[str] = None, start_date: str = None,
+                            end_date: str = None, batch_size: int = 500) -> Iterator[List[Dict]]:
+        """조건에 맞는 전체 데이터를 작성일 순서로 batch_size 건씩 반환합니다."""
+        return self._sqlalchemy_manager.iter_export_batches(data_type, platforms, start_date, end_date, batch_size)
+    
+    def rebuild_search_documents(self) -> Dict[str, int]:
+        """기존 데이터로 통합 검색 문서를 다시 채웁니다."""
+        return self._sqlalchemy_manager.rebuild_search_documents()
+    
     def search_data_by_keywords(self, keywords: List[str], platforms: List[str] = None, 
                                data_types: List[str] = None, start_date: str = None, 
                                end_date: str = None, naver_cafes: List[str] = None, 
@@ -0,0 +1,66 @@
+"""
+키셋(커서) 페이지네이션
+
+목록은 (created_at DESC, id DESC) 순서로 정렬하고, 다음 페이지는 마지막 항목의 (created_at, id) 보다
+뒤에 있는 행부터 조회합니다. OFFSET 처럼 앞 페이지 행을 건너뛰며 읽지 않으므로
+(created_at, id) 복합 인덱스만 있으면 페이지 깊이와 관계없이 조회 비용이 일정합니다.
+
+커서는 (created_at, id) 를 base64 로 인코딩한 불투명 문자열이며, 클라이언트는 받은 값을 그대로 전달합니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, desc, or_
+
+
+def encode_cursor(created_at: Any, row_id: int) -> str:
+    """(created_at, id) 를 커서 문자열로 인코딩"""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    payload = json.dumps({"c": created_at, "i": int(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id) 로 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except Exception as e:
+        raise ValueError(f"유효하지 않은 커서입니다: {cursor}") from e
+
+
+def keyset_order(model) -> List[Any]:
+    """커서 페이지네이션 정렬 순서 (작성일 역순, 같은 작성일은 ID 역순)"""
+    return [desc(model.created_at), desc(model.id)]
+
+
+def keyset_condition(model, cursor: str):
+    """커서 위치 다음 행 조건: created_at < c OR (created_at = c AND id < i)"""
+    created_at, row_id = decode_cursor(cursor)
+    return or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < row_id)
+    )
+
+
+def split_page(items: List[Dict], limit: int) -> Tuple[List[Dict], Optional[str]]:
+    """
+    limit + 1 개로 조회한 결과를 페이지와 다음 커서로 분리
+
+    Returns:
+        Tuple[List[Dict], Optional[str]]: (limit 개 이하의 항목, 다음 페이지 커서 또는 None)
+    """
+    if len(items) <= limit:
+        return items, None
+    page = items[:limit]
+    last = page[-1]
+    return page, encode_cursor(last["created_at"], last["id"])
@@ -0,0 +1,264 @@
+"""
+분석용 컬럼형(Parquet) 스냅샷 내보내기
+
+분석 작업이 수집 DB(articles/comments/reviews)에 무거운 집계 쿼리를 보내지 않도록,
+작성일(created_at) 기준으로 파티션된 Parquet 파일을 만들어 로컬에서 DuckDB/Polars/pandas 등으로 분석합니다.
+
+    {output_dir}/articles/date=2025-08-05/part-<실행ID>-0.parquet
+    {output_dir}/comments/date=.../...
+    {output_dir}/reviews/date=.../...
+    {output_dir}/_snapshot_state.json   (타입별 collected_at 워터마크)
+
+- 증분 실행: 지난 실행의 워터마크 이후에 수집(collected_at)된 행만 새 파트 파일로 추가합니다.
+  아직 커밋되지 않은 수집 트랜잭션을 건너뛰지 않도록 현재 시각보다 lag_seconds 이전까지만 내보냅니다.
+- JSON 문자열 컬럼은 타입 컬럼으로 변환합니다.
+  categories / sub_categories → list<string>, images → image_urls(list<string>) + image_count (원문 images 도 유지)
+- 파트 파일은 임시 이름으로 쓴 뒤 모든 타입이 끝나면 이름을 바꾸고 워터마크를 저장하므로,
+  중간에 실패하면 워터마크가 그대로 남아 다음 실행에서 같은 구간을 다시 내보냅니다.
+- 갱신(upsert)으로 collected_at 이 바뀐 행은 새 파트에 다시 기록되므로, 분석 시 id 별 최신 collected_at 행을 사용합니다.
+
+pyarrow 는 선택 의존성입니다. (pip install pyarrow)
+"""
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from database.sqlalchemy_manager import SQLAlchemyDatabaseManager, BULK_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DATA_TYPES = ("article", "comment", "review")
+STATE_FILE_NAME = "_snapshot_state.json"
+DEFAULT_LAG_SECONDS = 60
+MAX_OPEN_FILES = 64
+
+_INT_FIELDS = {"id", "community_id", "article_id", "like_count", "comment_count", "view_count", "rating", "price"}
+_DATETIME_FIELDS = {"created_at", "collected_at"}
+_BOOL_FIELDS = {"is_blind", "is_image_blur", "is_certificated_review"}
+_LIST_FIELDS = {"categories", "sub_categories"}
+
+
+def _import_pyarrow():
+    """pyarrow 지연 import (선택 의존성)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet 스냅샷 내보내기에는 pyarrow 가 필요합니다. pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+
+def decode_string_list(value: Optional[str]) -> Optional[List[str]]:
+    """JSON 배열 문자열을 문자열 리스트로 변환 (형식이 다르면 None)"""
+    if not value:
+        return None
+    try:
+        decoded = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(decoded, list):
+        return None
+    return [str(item) for item in decoded if item is not None]
+
+
+def extract_image_urls(value: Optional[str]) -> Optional[List[str]]:
+    """
+    images JSON 문자열에서 이미지 URL 목록 추출
+
+    플랫폼마다 형식이 다르므로 (URL 배열, {'url': ...} 배열, {'beforePhotos': [...], ...} 객체)
+    중첩 구조를 모두 따라가며 문자열 URL 과 'url' 키 값을 순서대로 모읍니다.
+    """
+    if not value:
+        return None
+    try:
+        decoded = json.loads(value)
+    except (TypeError, ValueError):
+        return None
+
+    urls = []
+
+    def collect(node: Any):
+        if isinstance(node, str):
+            if node.startswith("http"):
+                urls.append(node)
+        elif isinstance(node, list):
+            for item in node:
+                collect(item)
+        elif isinstance(node, dict):
+            if isinstance(node.get("url"), str):
+                if node["url"]:
+                    urls.append(node["url"])
+            else:
+                for item in node.values():
+                    collect(item)
+
+    collect(decoded)
+    return urls
+
+
+class ParquetSnapshotExporter:
+    """collected_at 워터마크 기반 증분 Parquet 스냅샷 내보내기"""
+
+    def __init__(self, output_dir: str, db_manager: Optional[SQLAlchemyDatabaseManager] = None,
+                 batch_size: int = BULK_CHUNK_SIZE, lag_seconds: int = DEFAULT_LAG_SECONDS,
+                 max_open_files: int = MAX_OPEN_FILES):
+        self.output_dir = output_dir
+        self.db = db_manager or SQLAlchemyDatabaseManager()
+        self.batch_size = batch_size
+        self.lag_seconds = lag_seconds
+        self.max_open_files = max_open_files
+        self.state_path = os.path.join(output_dir, STATE_FILE_NAME)
+
+    # 워터마크
+    def load_state(self) -> Dict[str, str]:
+        """타입별 워터마크 (collected_at ISO 문자열)"""
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_state(self, state: Dict[str, str]):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    # 스키마/행 변환
+    def schema(self, data_type: str):
+        """타입별 Arrow 스키마 (JSON 컬럼은 타입 컬럼으로 변환)"""
+        pa, _ = _import_pyarrow()
+        fields = []
+        for name in self.db.get_export_fields(data_type):
+            if name in _INT_FIELDS:
+                fields.append(pa.field(name, pa.int64()))
+            elif name in _DATETIME_FIELDS:
+                fields.append(pa.field(name, pa.timestamp("us")))
+            elif name in _BOOL_FIELDS:
+                fields.append(pa.field(name, pa.bool_()))
+            elif name in _LIST_FIELDS:
+                fields.append(pa.field(name, pa.list_(pa.string())))
+            else:
+                fields.append(pa.field(name, pa.string()))
+            if name == "images":
+                fields.append(pa.field("image_urls", pa.list_(pa.string())))
+                fields.append(pa.field("image_count", pa.int32()))
+        return pa.schema(fields)
+
+    @staticmethod
+    def transform_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """DB 행을 스키마에 맞게 변환"""
+        for name in _LIST_FIELDS:
+            if name in row:
+                row[name] = decode_string_list(row[name])
+        if "images" in row:
+            urls = extract_image_urls(row["images"])
+            row["image_urls"] = urls
+            row["image_count"] = len(urls) if urls is not None else None
+        return row
+
+    @staticmethod
+    def partition_of(row: Dict[str, Any]) -> str:
+        created_at = row.get("created_at")
+        return created_at.strftime("%Y-%m-%d") if created_at else "unknown"
+
+    # 내보내기
+    def export(self, data_types: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        워터마크 이후 수집된 데이터를 파티션별 Parquet 파일로 내보내고 워터마크를 갱신합니다.
+
+        Returns:
+            Dict[str, int]: 타입별 내보낸 행 수
+        """
+        data_types = data_types or list(SNAPSHOT_DATA_TYPES)
+        state = self.load_state()
+        collected_until = datetime.now().replace(microsecond=0) - timedelta(seconds=self.lag_seconds)
+        run_id = f"{collected_until.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        written_files: List[str] = []
+        totals = {}
+        try:
+            for data_type in data_types:
+                watermark = state.get(data_type)
+                collected_after = datetime.fromisoformat(watermark) if watermark else None
+                if collected_after is not None and collected_after >= collected_until:
+                    totals[data_type] = 0
+                    continue
+
+                totals[data_type] = self._export_type(data_type, collected_after, collected_until, run_id, written_files)
+                logger.info(f"📦 {data_type} 스냅샷 {totals[data_type]}건 ({watermark or '처음'} ~ {collected_until.isoformat()})")
+
+            # 모든 타입이 성공한 뒤에 파일 공개 + 워터마크 갱신
+            for tmp_path in written_files:
+                os.replace(tmp_path, tmp_path[:-len(".tmp")])
+            for data_type in data_types:
+                state[data_type] = max(state.get(data_type) or "", collected_until.isoformat())
+            self._save_state(state)
+
+            return totals
+
+        except Exception as e:
+            for tmp_path in written_files:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            logger.error(f"Parquet 스냅샷 내보내기 실패 (워터마크 유지): {e}")
+            raise
+
+    def _export_type(self, data_type: str, collected_after: Optional[datetime], collected_until: datetime,
+                     run_id: str, written_files: List[str]) -> int:
+        """한 타입을 파티션별 파일로 기록 (파티션별 버퍼가 batch_size 에 차면 row group 으로 기록)"""
+        pa, pq = _import_pyarrow()
+        schema = self.schema(data_type)
+        base_dir = os.path.join(self.output_dir, f"{data_type}s")
+
+        writers: "OrderedDict[str, Any]" = OrderedDict()
+        file_seq: Dict[str, int] = {}
+        buffers: Dict[str, List[Dict[str, Any]]] = {}
+        exported = 0
+
+        def flush(partition: str):
+            rows = buffers.pop(partition, None)
+            if not rows:
+                return
+            writer = writers.get(partition)
+            if writer is None:
+                # 열린 파일 수 제한: 가장 오래 쓰지 않은 파티션을 닫고, 다시 쓰게 되면 새 파트 파일로 기록
+                if len(writers) >= self.max_open_files:
+                    _, oldest = writers.popitem(last=False)
+                    oldest.close()
+                seq = file_seq.get(partition, 0)
+                file_seq[partition] = seq + 1
+                partition_dir = os.path.join(base_dir, f"date={partition}")
+                os.makedirs(partition_dir, exist_ok=True)
+                path = os.path.join(partition_dir, f"part-{run_id}-{seq}.parquet.tmp")
+                written_files.append(path)
+                writer = pq.ParquetWriter(path, schema)
+                writers[partition] = writer
+            writers.move_to_end(partition)
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+
+        try:
+            for batch in self.db.iter_snapshot_batches(data_type, collected_after, collected_until, self.batch_size):
+                for row in batch:
+                    row = self.transform_row(row)
+                    partition = self.partition_of(row)
+                    buffers.setdefault(partition, []).append(row)
+                    if len(buffers[partition]) >= self.batch_size:
+                        flush(partition)
+                exported += len(batch)
+
+                # 여러 파티션에 흩어진 작은 버퍼가 쌓이지 않도록 제한
+                if sum(len(rows) for rows in buffers.values()) >= self.batch_size * 4:
+                    for partition in list(buffers):
+                        flush(partition)
+
+            for partition in list(buffers):
+                flush(partition)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        return exported
@@ -1,25 +1,119 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, func, desc, text
 from database.config import db_config
+from database.cache import bump_generation, invalidate_all
+from database.fulltext import keyword_condition
+from database.pagination import keyset_condition, keyset_order, encode_cursor
+from database.unit_of_work import UnitOfWork
 from database.sqlalchemy_models import (
-    Community, Client, Article, Comment, ExcludedArticle, Review
+    Community, Client, Article, Comment, ExcludedArticle, Review, CollectionTask,
+    CollectionCheckpoint, SearchDocument, DailyStat
 )
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from typing import List, Dict, Optional, Any, Tuple, Set, Union, Iterator, Iterable
+from datetime import date, datetime, time, timedelta
+from collections import Counter
+from contextlib import contextmanager
+import copy
+import functools
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# bulk insert 한 번에 전송할 최대 행 수
+BULK_CHUNK_SIZE = 500
+# 다중 행 INSERT 문 하나의 최대 바인드 파라미터 수 (SQLite 3.32 이전 기본 제한 999)
+BULK_MAX_PARAMS = 999
+
+def _writes(method):
+    """
+    쓰기 메서드 표시: SQLite 에서는 단일 writer 구간(DatabaseConfig.writer)에서 실행
+    
+    작업 단위 안에서는 작업 단위가 writer 잠금을 잡고 작업 단위가 끝날 때 놓습니다.
+    AsyncDatabase 는 이 표시(db_write)가 있는 메서드를 DB writer 스레드에서 실행합니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._unit is not None:
+            self._unit.acquire_writer()
+            return method(self, *args, **kwargs)
+        with self.db_config.writer():
+            return method(self, *args, **kwargs)
+    
+    wrapper.db_write = True
+    return wrapper
+
 class SQLAlchemyDatabaseManager:
     """SQLAlchemy 기반 데이터베이스 매니저"""
     
+    # unit_of_work() 가 반환한 매니저에서만 설정됨
+    _unit: Optional[UnitOfWork] = None
+    
     def __init__(self):
         self.db_config = db_config
     
     def get_session(self) -> Session:
-        """데이터베이스 세션 반환"""
+        """데이터베이스 세션 반환 (작업 단위 안에서는 작업 단위 세션)"""
+        if self._unit is not None:
+            return self._unit.session_for_call()
         return next(self.db_config.get_session())
     
+    @contextmanager
+    def unit_of_work(self, write: bool = True):
+        """
+        작업 단위 시작: 블록 안의 매니저 호출이 세션 하나를 공유하고 블록이 끝날 때 커밋
+        
+        예외로 끝나면 전체를 롤백합니다. 이미 작업 단위 안이면 같은 작업 단위를 그대로 사용합니다.
+        
+        Args:
+            write: 쓰기 작업 단위 여부 (SQLite 에서는 시작할 때 단일 writer 잠금을 잡음, 조회만 하면 False)
+        
+        Yields:
+            SQLAlchemyDatabaseManager: 작업 단위 세션을 사용하는 매니저
+        """
+        if self._unit is not None:
+            yield self
+            return
+        
+        unit = UnitOfWork(self.db_config.SessionLocal(), self.db_config)
+        manager = copy.copy(self)
+        manager._unit = unit
+        try:
+            if write:
+                unit.acquire_writer()
+            yield manager
+            unit.commit()
+        except Exception as e:
+            unit.rollback()
+            logger.warning(f"작업 단위 롤백: {e}")
+            raise
+        finally:
+            unit.close()
+    
+    @property
+    def serialize_writes(self) -> bool:
+        """쓰기 호출을 DB writer 스레드로 보낼지 (SQLite 단일 writer 이고 작업 단위 밖일 때)"""
+        return self.db_config.write_lock is not None and self._unit is None
+    
+    def flush(self):
+        """작업 단위의 변경을 DB 로 전송 (커밋하지 않음, 작업 단위 밖에서는 아무것도 하지 않음)"""
+        if self._unit is not None:
+            self._unit.flush()
+    
+    def commit(self):
+        """작업 단위 중간 커밋 (작업 단위 밖에서는 메서드마다 커밋하므로 아무것도 하지 않음)"""
+        if self._unit is not None:
+            self._unit.commit_and_continue()
+    
+    def _bump_generation(self, platform_ids):
+        """조회 캐시 세대 갱신 (작업 단위 안에서는 커밋 후로 미룸)"""
+        if self._unit is not None:
+            self._unit.bump_generation(platform_ids)
+        else:
+            bump_generation(platform_ids)
+    
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
@@ -30,6 +124,7 @@ class SQLAlchemyDatabaseManager:
             raise
     
     # Community 관련 메서드
+    @_writes
     def insert_community(self, name: str, description: str = "") -> int:
         """커뮤니티 추가 (중복 체크 포함)"""
         session = self.get_session()
@@ -72,6 +167,7 @@ class SQLAlchemyDatabaseManager:
             session.close()
     
     # Client 관련 메서드
+    @_writes
     def insert_client(self, hospital_name: str, description: str = "") -> int:
         """클라이언트 추가"""
         session = self.get_session()
@@ -92,6 +188,7 @@ class SQLAlchemyDatabaseManager:
             session.close()
     
     # Article 관련 메서드
+    @_writes
     def insert_article(self, article_data: Dict) -> int:
         """게시글 추가 (중복 체크 포함)"""
         session = self.get_session()
@@ -125,7 +222,11 @@ class SQLAlchemyDatabaseManager:
                 collected_at=article_data.get('collected_at', datetime.now())
             )
             session.add(article)
+            session.flush()
+            self._index_search_documents(session, 'article', [article.id])
+            self._increment_daily_stats(session, 'article', [article.id])
             session.commit()
+            self._bump_generation([article.platform_id])
             return article.id
         except Exception as e:
             session.rollback()
@@ -138,7 +239,7 @@ class SQLAlchemyDatabaseManager:
         """특정 날짜의 게시글 조회"""
         session = self.get_session()
         try:
-            query = session.query(Article).filter(func.date(Article.created_at) == date)
+            query = session.query(Article).filter(self._date_range(Article.created_at, date, date))
             
             if community_id:
                 query = query.filter(Article.community_id == community_id)
@@ -205,11 +306,16 @@ class SQLAlchemyDatabaseManager:
         finally:
             session.close()
     
-    def get_articles_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0) -> List[Dict]:
-        """필터 조건에 따라 게시글 조회"""
+    def get_articles_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0,
+                                cursor: Optional[str] = None) -> List[Dict]:
+        """
+        필터 조건에 따라 게시글 조회 (작성일 역순)
+        
+        cursor 가 주어지면 offset 대신 커서 위치 다음부터 조회합니다. (키셋 페이지네이션)
+        """
         session = self.get_session()
         try:
-            query = session.query(Article)
+            query = self._row_query(session, 'article')
             
             if "platform_id" in filters:
                 query = query.filter(Article.platform_id == filters["platform_id"])
@@ -217,9 +323,13 @@ class SQLAlchemyDatabaseManager:
             if "category_name" in filters:
                 query = query.filter(Article.category_name == filters["category_name"])
             
-            articles = query.order_by(desc(Article.created_at)).offset(offset).limit(limit).all()
+            query = query.order_by(*keyset_order(Article))
+            if cursor:
+                query = query.filter(keyset_condition(Article, cursor))
+            else:
+                query = query.offset(offset)
             
-            return [self._article_to_dict(article) for article in articles]
+            return [self._row_to_dict(row._fields, row) for row in query.limit(limit)]
         finally:
             session.close()
     
@@ -240,6 +350,7 @@ class SQLAlchemyDatabaseManager:
             session.close()
     
     # Comment 관련 메서드
+    @_writes
     def insert_comment(self, comment_data: Dict) -> int:
         """댓글 추가 (중복 체크 포함)"""
         session = self.get_session()
@@ -305,7 +416,11 @@ class SQLAlchemyDatabaseManager:
                 article_id=article_id
             )
             session.add(comment)
+            session.flush()
+            self._index_search_documents(session, 'comment', [comment.id])
+            self._increment_daily_stats(session, 'comment', [comment.id])
             session.commit()
+            self._bump_generation([comment.platform_id])
             # logger.info(f"댓글 저장 완료: ID {comment.id}, 게시글 ID {article_id}")
             return comment.id
             
@@ -316,11 +431,16 @@ class SQLAlchemyDatabaseManager:
         finally:
             session.close()
     
-    def get_comments_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0) -> List[Dict]:
-        """필터 조건에 따라 댓글 조회"""
+    def get_comments_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0,
+                                cursor: Optional[str] = None) -> List[Dict]:
+        """
+        필터 조건에 따라 댓글 조회 (작성일 역순)
+        
+        cursor 가 주어지면 offset 대신 커서 위치 다음부터 조회합니다. (키셋 페이지네이션)
+        """
         session = self.get_session()
         try:
-            query = session.query(Comment)
+            query = self._row_query(session, 'comment')
             
             if "platform_id" in filters:
                 query = query.filter(Comment.platform_id == filters["platform_id"])
@@ -331,9 +451,13 @@ class SQLAlchemyDatabaseManager:
             if "article_id" in filters:
                 query = query.filter(Comment.article_id == filters["article_id"])
             
-            comments = query.order_by(desc(Comment.created_at)).offset(offset).limit(limit).all()
+            query = query.order_by(*keyset_order(Comment))
+            if cursor:
+                query = query.filter(keyset_condition(Comment, cursor))
+            else:
+                query = query.offset(offset)
             
-            return [self._comment_to_dict(comment) for comment in comments]
+            return [self._row_to_dict(row._fields, row) for row in query.limit(limit)]
         finally:
             session.close()
     
@@ -341,7 +465,7 @@ class SQLAlchemyDatabaseManager:
         """ID로 댓글 조회"""
         session = self.get_session()
         try:
-            comment = session.query(Comment).filter(Comment.id == comment_id).first()
+            comment = self._comment_query(session).filter(Comment.id == comment_id).first()
             if comment:
                 return self._comment_to_dict(comment)
             return None
@@ -376,6 +500,7 @@ class SQLAlchemyDatabaseManager:
             session.close()
     
     # Review 관련 메서드
+    @_writes
     def insert_review(self, review_data: Dict) -> int:
         """후기 추가 (중복 체크 포함)"""
         session = self.get_session()
@@ -416,7 +541,11 @@ class SQLAlchemyDatabaseManager:
                 collected_at=review_data.get('collected_at', datetime.now())
             )
             session.add(review)
+            session.flush()
+            self._index_search_documents(session, 'review', [review.id])
+            self._increment_daily_stats(session, 'review', [review.id])
             session.commit()
+            self._bump_generation([review.platform_id])
             return review.id
         except Exception as e:
             session.rollback()
@@ -425,11 +554,16 @@ class SQLAlchemyDatabaseManager:
         finally:
             session.close()
     
-    def get_reviews_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0) -> List[Dict]:
-        """필터 조건에 따라 후기 조회"""
+    def get_reviews_by_filters(self, filters: Dict, limit: int = 20, offset: int = 0,
+                               cursor: Optional[str] = None) -> List[Dict]:
+        """
+        필터 조건에 따라 후기 조회 (작성일 역순)
+        
+        cursor 가 주어지면 offset 대신 커서 위치 다음부터 조회합니다. (키셋 페이지네이션)
+        """
         session = self.get_session()
         try:
-            query = session.query(Review)
+            query = self._row_query(session, 'review')
             
             if "platform_id" in filters:
                 query = query.filter(Review.platform_id == filters["platform_id"])
@@ -437,9 +571,13 @@ class SQLAlchemyDatabaseManager:
             if "category_name" in filters:
                 query = query.filter(Review.title.contains(filters["category_name"]))
             
-            reviews = query.order_by(desc(Review.created_at)).offset(offset).limit(limit).all()
+            query = query.order_by(*keyset_order(Review))
+            if cursor:
+                query = query.filter(keyset_condition(Review, cursor))
+            else:
+                query = query.offset(offset)
             
-            return [self._review_to_dict(review) for review in reviews]
+            return [self._row_to_dict(row._fields, row) for row in query.limit(limit)]
         finally:
             session.close()
     
@@ -470,37 +608,341 @@ class SQLAlchemyDatabaseManager:
     
     # 통계 관련 메서드
     def get_statistics(self) -> Dict:
-        """데이터베이스 통계 조회"""
+        """데이터베이스 통계 조회 (daily_stats 집계 기준)"""
+        rows = self.get_daily_stat_counts(['entity_type', 'platform_id'])
+        totals = self._entity_counts(rows)
+        
+        platform_stats: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            platform_stats.setdefault(row['platform_id'], self._entity_counts([]))
+            platform_stats[row['platform_id']][self._STAT_ENTITY_KEYS[row['entity_type']]] += row['count']
+        
+        # 카테고리별 게시글 수
+        category_stats = {
+            row['category']: row['count']
+            for row in self.get_daily_stat_counts(['category'], entity_type='article')
+            if row['category']
+        }
+        
+        # 오늘 게시글 수
+        today = datetime.now().date()
+        today_articles = sum(
+            row['count'] for row in self.get_daily_stat_counts([], entity_type='article', start_date=today, end_date=today)
+        )
+        
+        return {
+            'total_articles': totals['articles'],
+            'total_comments': totals['comments'],
+            'total_reviews': totals['reviews'],
+            'category_stats': category_stats,
+            'platform_stats': platform_stats,
+            'today_articles': today_articles
+        }
+    
+    # 일별 집계(DailyStat) 관련 메서드
+    # 작성일(created_at)이 없는 원본 행은 증분 갱신과 rebuild_daily_stats 모두 집계에서 제외합니다.
+    # 댓글의 카테고리는 저장 시점의 게시글 카테고리를 따르므로, 이후 게시글 카테고리가 바뀌면 rebuild_daily_stats 로 보정합니다.
+    _STAT_ENTITY_KEYS = {'article': 'articles', 'comment': 'comments', 'review': 'reviews'}
+    # 집계 키(작성일, 플랫폼, 카테고리)를 만드는 원본 컬럼 (중복 갱신 시 집계 이동 여부 판단)
+    _STAT_SOURCE_FIELDS = {
+        'article': ('created_at', 'platform_id', 'category_name'),
+        'comment': ('created_at', 'platform_id'),
+        'review': ('created_at', 'platform_id', 'categories'),
+    }
+    
+    def _daily_stat_source(self, session: Session, entity_type: str, day_column=None):
+        """
+        집계 원본 조회 쿼리 (작성일, 플랫폼, 카테고리)
+        
+        Args:
+            day_column: 작성일 컬럼을 감쌀 함수 (예: func.date, GROUP BY 재생성용)
+        
+        Returns:
+            Tuple[Query, model]: 조회 쿼리와 원본 모델
+        """
+        if entity_type == 'article':
+            model, category = Article, Article.category_name
+        elif entity_type == 'comment':
+            # 댓글의 카테고리(네이버 카페명)는 게시글 기준
+            model, category = Comment, Article.category_name
+        elif entity_type == 'review':
+            model, category = Review, Review.categories
+        else:
+            raise ValueError(f"알 수 없는 집계 타입: {entity_type}")
+        
+        day = model.created_at if day_column is None else day_column(model.created_at)
+        query = session.query(day, model.platform_id, category)
+        if entity_type == 'comment':
+            query = query.outerjoin(Article, Comment.article_id == Article.id)
+        return query, model
+    
+    @staticmethod
+    def _to_date(value: Any) -> date:
+        """날짜 문자열(YYYY-MM-DD...)/날짜시간을 date 로 변환"""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    
+    def _stat_key(self, day: Any, platform_id: str, category: Optional[str]) -> Tuple[date, str, str]:
+        """집계 키 정규화 (카테고리 None -> 빈 문자열)"""
+        return self._to_date(day), platform_id, (category or '')[:255]
+    
+    def _daily_stat_counter(self, session: Session, entity_type: str, ids: Iterable[int]) -> Counter:
+        """원본 행의 집계 키별 건수 (작성일이 없는 행은 제외)"""
+        ids = list({int(row_id) for row_id in ids if row_id is not None})
+        counter: Counter = Counter()
+        for chunk in self._chunks(ids):
+            query, model = self._daily_stat_source(session, entity_type)
+            for created_at, platform_id, category in query.filter(model.id.in_(chunk)):
+                if created_at is None:
+                    continue
+                counter[self._stat_key(created_at, platform_id, category)] += 1
+        return counter
+    
+    def _increment_daily_stats(self, session: Session, entity_type: str, ids: List[int]) -> None:
+        """새로 저장된 원본 행을 daily_stats 에 더함 (원본 저장과 같은 트랜잭션, 커밋은 호출자가 수행)"""
+        self._upsert_daily_stats(session, entity_type, self._daily_stat_counter(session, entity_type, ids), increment=True)
+    
+    def _daily_stats_before_update(self, session: Session, entity_type: str, ids: Iterable[int],
+                                   update_fields: Optional[List[str]]) -> Optional[Counter]:
+        """중복 갱신이 집계 키 컬럼을 바꾸면 갱신 전 기존 행의 집계 (아니면 None)"""
+        if not update_fields or not set(update_fields) & set(self._STAT_SOURCE_FIELDS[entity_type]):
+            return None
+        return self._daily_stat_counter(session, entity_type, ids)
+    
+    def _move_daily_stats(self, session: Session, entity_type: str, ids: Iterable[int],
+                          before: Optional[Counter]) -> None:
+        """갱신 전후 집계 차이를 daily_stats 에 반영 (이전 날짜/카테고리에서 빼고 새 값에 더함)"""
+        if before is None:
+            return
+        delta = self._daily_stat_counter(session, entity_type, ids)
+        delta.subtract(before)
+        self._upsert_daily_stats(
+            session, entity_type, Counter({key: count for key, count in delta.items() if count}), increment=True
+        )
+    
+    def _upsert_daily_stats(self, session: Session, entity_type: str, counter: Counter, increment: bool) -> None:
+        """집계 행 저장 (increment=True 면 기존 건수에 더하고, 아니면 덮어씀)"""
+        now = datetime.now()
+        rows = [
+            {'stat_date': day, 'platform_id': platform_id, 'category': category,
+             'entity_type': entity_type, 'item_count': count, 'updated_at': now}
+            for (day, platform_id, category), count in counter.items()
+        ]
+        if not rows:
+            return
+        
+        dialect = session.bind.dialect.name
+        conflict_columns = ['stat_date', 'platform_id', 'category', 'entity_type']
+        for chunk in self._chunks(rows, self._rows_per_statement(rows)):
+            if dialect == "sqlite":
+                stmt = sqlite_insert(DailyStat).values(chunk)
+                new_count = stmt.excluded.item_count
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={'item_count': DailyStat.item_count + new_count if increment else new_count,
+                          'updated_at': stmt.excluded.updated_at}
+                )
+                session.execute(stmt)
+            elif dialect == "mysql":
+                stmt = mysql_insert(DailyStat).values(chunk)
+                new_count = stmt.inserted.item_count
+                stmt = stmt.on_duplicate_key_update({
+                    'item_count': DailyStat.item_count + new_count if increment else new_count,
+                    'updated_at': stmt.inserted.updated_at
+                })
+                session.execute(stmt)
+            else:
+                for row in chunk:
+                    stat = session.query(DailyStat).filter(
+                        and_(*[getattr(DailyStat, column) == row[column] for column in conflict_columns])
+                    ).first()
+                    if stat:
+                        stat.item_count = (stat.item_count if increment else 0) + row['item_count']
+                        stat.updated_at = now
+                    else:
+                        session.add(DailyStat(**row))
+                session.flush()
+    
+    @_writes
+    def rebuild_daily_stats(self) -> Dict[str, int]:
+        """
+        원본 테이블로 daily_stats 를 다시 계산 (마이그레이션/보정용 유지보수 작업)
+        
+        Returns:
+            Dict[str, int]: 타입별 집계한 원본 건수
+        """
         session = self.get_session()
         try:
-            # 전체 게시글 수
-            total_articles = session.query(Article).count()
+            session.query(DailyStat).delete(synchronize_session=False)
             
-            # 전체 댓글 수
-            total_comments = session.query(Comment).count()
+            totals = {}
+            for entity_type in self._STAT_ENTITY_KEYS:
+                query, model = self._daily_stat_source(session, entity_type, func.date)
+                counter: Counter = Counter()
+                for day, platform_id, category, count in query.add_columns(func.count(model.id)).group_by(
+                    *[column['expr'] for column in query.column_descriptions]
+                ):
+                    if day is None:
+                        continue
+                    counter[self._stat_key(day, platform_id, category)] += count
+                self._upsert_daily_stats(session, entity_type, counter, increment=False)
+                totals[entity_type] = sum(counter.values())
             
-            # 카테고리별 게시글 수
-            category_stats = session.query(
-                Article.category_name, func.count(Article.id)
-            ).group_by(Article.category_name).all()
-            category_stats = {cat: count for cat, count in category_stats if cat}
+            session.commit()
+            invalidate_all()
+            logger.info(f"✅ 일별 집계 재생성 완료: {totals}")
+            return totals
+        except Exception as e:
+            session.rollback()
+            logger.error(f"일별 집계 재생성 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def get_daily_stat_counts(self, group_by: List[str], entity_type: Optional[str] = None,
+                              platform_id: Optional[str] = None, start_date: Union[str, date, None] = None,
+                              end_date: Union[str, date, None] = None) -> List[Dict]:
+        """
+        daily_stats 합계 조회
+        
+        Args:
+            group_by: 묶을 컬럼 ('stat_date', 'platform_id', 'category', 'entity_type')
+            entity_type / platform_id: 필터
+            start_date / end_date: 작성일 범위 (YYYY-MM-DD, 양 끝 포함)
+        
+        Returns:
+            List[Dict]: group_by 컬럼과 'count' 를 가진 딕셔너리 목록 (stat_date 는 YYYY-MM-DD 문자열)
+        """
+        session = self.get_session()
+        try:
+            columns = [getattr(DailyStat, column) for column in group_by]
+            query = session.query(*columns, func.sum(DailyStat.item_count))
             
-            # 오늘 게시글 수
-            today = datetime.now().date()
-            today_articles = session.query(Article).filter(
-                func.date(Article.created_at) == today
-            ).count()
+            if entity_type:
+                query = query.filter(DailyStat.entity_type == entity_type)
+            if platform_id:
+                query = query.filter(DailyStat.platform_id == platform_id)
+            if start_date:
+                query = query.filter(DailyStat.stat_date >= self._to_date(start_date))
+            if end_date:
+                query = query.filter(DailyStat.stat_date <= self._to_date(end_date))
             
-            return {
-                'total_articles': total_articles,
-                'total_comments': total_comments,
-                'category_stats': category_stats,
-                'today_articles': today_articles
-            }
+            results = []
+            for row in query.group_by(*columns).order_by(*columns):
+                item = dict(zip(group_by, row[:-1]))
+                if 'stat_date' in item:
+                    item['stat_date'] = item['stat_date'].isoformat()
+                item['count'] = int(row[-1] or 0)
+                results.append(item)
+            return results
         finally:
             session.close()
     
+    def _entity_counts(self, rows: List[Dict]) -> Dict[str, int]:
+        """entity_type 별 합계를 {'articles', 'comments', 'reviews'} 형태로 변환"""
+        counts = {key: 0 for key in self._STAT_ENTITY_KEYS.values()}
+        for row in rows:
+            counts[self._STAT_ENTITY_KEYS[row['entity_type']]] += row['count']
+        return counts
+    
+    def get_platform_statistics(self, platform_id: str) -> Dict:
+        """특정 플랫폼의 데이터 타입별 건수"""
+        return self._entity_counts(self.get_daily_stat_counts(['entity_type'], platform_id=platform_id))
+    
+    def get_daily_statistics(self, target_date: str) -> Dict:
+        """특정 날짜의 데이터 타입별 건수와 플랫폼별 건수"""
+        rows = self.get_daily_stat_counts(['entity_type', 'platform_id'], start_date=target_date, end_date=target_date)
+        by_platform: Dict[str, List[Dict]] = {}
+        for row in rows:
+            by_platform.setdefault(row['platform_id'], []).append(row)
+        return {
+            'date': target_date,
+            **self._entity_counts(rows),
+            'by_platform': {platform_id: self._entity_counts(items) for platform_id, items in by_platform.items()}
+        }
+    
+    def get_trend_statistics(self, days: int) -> Dict:
+        """최근 N일(오늘 포함)의 날짜별 건수 (데이터가 없는 날은 0)"""
+        end = datetime.now().date()
+        start = end - timedelta(days=max(days, 1) - 1)
+        dates = [(start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+        
+        counts = {(row['entity_type'], row['stat_date']): row['count']
+                  for row in self.get_daily_stat_counts(['entity_type', 'stat_date'], start_date=start, end_date=end)}
+        return {
+            f"{entity_type}_trends": [{'date': day, 'count': counts.get((entity_type, day), 0)} for day in dates]
+            for entity_type in self._STAT_ENTITY_KEYS
+        }
+    
     # 헬퍼 메서드들
+    @staticmethod
+    def _date_range(column, start_date: Union[str, date, None] = None, end_date: Union[str, date, None] = None):
+        """
+        날짜 조건을 반열린 구간(start 0시 이상, end 다음날 0시 미만)으로 변환
+        
+        컬럼을 func.date() 로 감싸면 created_at 인덱스를 사용할 수 없으므로 컬럼은 그대로 비교합니다.
+        """
+        def to_datetime(value) -> datetime:
+            if isinstance(value, str):
+                return datetime.strptime(value, '%Y-%m-%d')
+            return datetime.combine(value, time.min)
+        
+        conditions = []
+        if start_date:
+            conditions.append(column >= to_datetime(start_date))
+        if end_date:
+            conditions.append(column < to_datetime(end_date) + timedelta(days=1))
+        return and_(*conditions)
+    
+    @staticmethod
+    def _row_columns(data_type: str) -> List[Any]:
+        """
+        조회 컬럼 프로젝션 (키는 _*_to_dict 와 동일)
+        
+        목록/일괄 조회/내보내기는 ORM 객체를 만들지 않고 이 컬럼만 튜플로 읽어 바로 딕셔너리로 변환합니다.
+        """
+        if data_type == 'article':
+            return [
+                Article.id, Article.platform_id, Article.community_article_id, Article.community_id,
+                Article.title, Article.content, Article.images, Article.writer_nickname, Article.writer_id,
+                Article.like_count, Article.comment_count, Article.view_count, Article.created_at,
+                Article.category_name, Article.collected_at
+            ]
+        if data_type == 'comment':
+            return [
+                Comment.id, Comment.platform_id, Comment.community_article_id, Comment.community_comment_id,
+                Comment.content, Comment.writer_nickname, Comment.writer_id, Comment.created_at,
+                Comment.parent_comment_id, Comment.collected_at, Comment.article_id,
+                Article.title.label('article_title'), Article.platform_id.label('article_platform_id')
+            ]
+        if data_type == 'review':
+            return [
+                Review.id, Review.platform_id, Review.platform_review_id, Review.community_id, Review.title,
+                Review.content, Review.images, Review.writer_nickname, Review.writer_id, Review.like_count,
+                Review.rating, Review.price, Review.categories, Review.sub_categories, Review.surgery_date,
+                Review.hospital_name, Review.doctor_name, Review.is_blind, Review.is_image_blur,
+                Review.is_certificated_review, Review.created_at, Review.collected_at
+            ]
+        raise ValueError(f"지원하지 않는 데이터 타입: {data_type}")
+    
+    def _row_query(self, session: Session, data_type: str):
+        """_row_columns 프로젝션 쿼리 (댓글은 게시글 제목/플랫폼을 같은 쿼리에서 JOIN)"""
+        query = session.query(*self._row_columns(data_type))
+        if data_type == 'comment':
+            query = query.outerjoin(Article, Comment.article_id == Article.id)
+        return query
+    
+    @staticmethod
+    def _row_to_dict(fields: List[str], row) -> Dict:
+        """프로젝션 결과 행을 _*_to_dict 와 같은 형식의 딕셔너리로 변환"""
+        return {
+            field: value.isoformat() if isinstance(value, datetime) else value
+            for field, value in zip(fields, row)
+        }
+    
     def _article_to_dict(self, article: Article) -> Dict:
         """Article 객체를 딕셔너리로 변환"""
         return {
@@ -521,6 +963,18 @@ class SQLAlchemyDatabaseManager:
             'collected_at': article.collected_at.isoformat() if article.collected_at else None
         }
     
+    @staticmethod
+    def _comment_query(session: Session):
+        """
+        댓글 조회 쿼리 (_comment_to_dict 에서 쓰는 게시글 컬럼을 JOIN 으로 함께 로드)
+        
+        댓글마다 게시글을 지연 로딩하면 N건 조회에 N+1 쿼리가 실행되므로 ORM 객체로 조회할 때는 항상 이 쿼리를 사용합니다.
+        (목록/일괄 조회는 _row_query 프로젝션 사용)
+        """
+        return session.query(Comment).options(
+            joinedload(Comment.article).load_only(Article.title, Article.platform_id)
+        )
+    
     def _comment_to_dict(self, comment: Comment) -> Dict:
         """Comment 객체를 딕셔너리로 변환"""
         return {
@@ -571,7 +1025,7 @@ class SQLAlchemyDatabaseManager:
         """게시글 ID와 댓글 ID로 댓글 조회"""
         session = self.get_session()
         try:
-            comment = session.query(Comment).filter(
+            comment = self._comment_query(session).filter(
                 and_(
                     Comment.article_id == int(article_id),
                     Comment.community_comment_id == comment_id
@@ -588,305 +1042,376 @@ class SQLAlchemyDatabaseManager:
         finally:
             session.close()
     
-    def search_data_by_keywords(self, keywords: List[str], platforms: List[str] = None, 
-                               data_types: List[str] = None, start_date: str = None, 
-                               end_date: str = None, naver_cafes: List[str] = None, 
-                               limit: int = 100, offset: int = 0) -> Dict[str, List[Dict]]:
-        """키워드로 게시글, 댓글, 후기를 검색합니다."""
+    # 통합 검색(SearchDocument) 관련 메서드
+    # 검색 문서 타입 -> (원본 모델, 검색 텍스트/필터에 영향을 주는 컬럼)
+    _SEARCH_SOURCE_FIELDS = {
+        'article': ('title', 'content', 'category_name', 'created_at', 'platform_id'),
+        'comment': ('content', 'created_at', 'platform_id'),
+        'review': ('title', 'content', 'hospital_name', 'doctor_name', 'categories', 'created_at', 'platform_id'),
+    }
+    
+    @staticmethod
+    def _search_text(*parts: Optional[str]) -> str:
+        """검색 대상 텍스트 조합 (빈 값 제외)"""
+        return "\n".join(part for part in parts if part)
+    
+    def _index_search_documents(self, session: Session, doc_type: str, ids: List[int], refresh: bool = True) -> int:
+        """
+        원본 게시글/댓글/후기를 search_documents 에 반영 (커밋은 호출자가 수행)
+        
+        Args:
+            session: 원본 저장과 같은 트랜잭션의 세션
+            doc_type: 'article', 'comment', 'review'
+            ids: 원본 테이블 ID 목록
+            refresh: False 이면 아직 검색 문서가 없는 ID만 반영
+        
+        Returns:
+            int: 반영한 검색 문서 수
+        """
+        ids = list({int(row_id) for row_id in ids if row_id is not None})
+        if not ids:
+            return 0
+        
+        if not refresh:
+            indexed = set()
+            for chunk in self._chunks(ids):
+                indexed.update(source_id for (source_id,) in session.query(SearchDocument.source_id).filter(
+                    and_(SearchDocument.doc_type == doc_type, SearchDocument.source_id.in_(chunk))
+                ))
+            ids = [row_id for row_id in ids if row_id not in indexed]
+        
+        docs = []
+        for chunk in self._chunks(ids):
+            if doc_type == 'article':
+                for row in session.query(
+                    Article.id, Article.platform_id, Article.category_name, Article.created_at,
+                    Article.title, Article.content
+                ).filter(Article.id.in_(chunk)):
+                    docs.append({
+                        'doc_type': doc_type, 'source_id': row.id, 'platform_id': row.platform_id,
+                        'category': row.category_name, 'created_at': row.created_at,
+                        'text': self._search_text(row.title, row.content)
+                    })
+            elif doc_type == 'comment':
+                # 댓글의 카테고리(네이버 카페명)는 게시글 기준
+                for row in session.query(
+                    Comment.id, Comment.platform_id, Article.category_name, Comment.created_at, Comment.content
+                ).outerjoin(Article, Comment.article_id == Article.id).filter(Comment.id.in_(chunk)):
+                    docs.append({
+                        'doc_type': doc_type, 'source_id': row.id, 'platform_id': row.platform_id,
+                        'category': row.category_name, 'created_at': row.created_at,
+                        'text': self._search_text(row.content)
+                    })
+            elif doc_type == 'review':
+                for row in session.query(
+                    Review.id, Review.platform_id, Review.categories, Review.created_at,
+                    Review.title, Review.content, Review.hospital_name, Review.doctor_name
+                ).filter(Review.id.in_(chunk)):
+                    docs.append({
+                        'doc_type': doc_type, 'source_id': row.id, 'platform_id': row.platform_id,
+                        'category': row.categories[:255] if row.categories else None, 'created_at': row.created_at,
+                        'text': self._search_text(row.title, row.content, row.hospital_name, row.doctor_name)
+                    })
+            else:
+                raise ValueError(f"알 수 없는 검색 문서 타입: {doc_type}")
+        
+        self._bulk_insert_ignore(
+            session, SearchDocument, docs, ['doc_type', 'source_id'],
+            ['platform_id', 'category', 'created_at', 'text']
+        )
+        return len(docs)
+    
+    def _search_refresh_needed(self, doc_type: str, update_fields: Optional[List[str]]) -> bool:
+        """중복 갱신 컬럼이 검색 문서 내용에 영향을 주는지 여부"""
+        return bool(update_fields) and bool(set(update_fields) & set(self._SEARCH_SOURCE_FIELDS[doc_type]))
+    
+    @_writes
+    def rebuild_search_documents(self, batch_size: int = BULK_CHUNK_SIZE) -> Dict[str, int]:
+        """
+        기존 게시글/댓글/후기로 search_documents 를 채움 (마이그레이션/백필용)
+        
+        Returns:
+            Dict[str, int]: 타입별 반영한 검색 문서 수
+        """
+        counts = {}
+        for doc_type, model in (('article', Article), ('comment', Comment), ('review', Review)):
+            counts[doc_type] = 0
+            last_id = 0
+            while True:
+                session = self.get_session()
+                try:
+                    ids = [row_id for (row_id,) in session.query(model.id).filter(
+                        model.id > last_id
+                    ).order_by(model.id).limit(batch_size)]
+                    if not ids:
+                        break
+                    counts[doc_type] += self._index_search_documents(session, doc_type, ids)
+                    session.commit()
+                    last_id = ids[-1]
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"검색 문서 재생성 중 오류 발생: {e}")
+                    raise
+                finally:
+                    session.close()
+            logger.info(f"✅ 검색 문서 재생성 완료: {doc_type} {counts[doc_type]}건")
+        invalidate_all()
+        return counts
+    
+    @staticmethod
+    def _expand_search_platforms(platforms: List[str]) -> List[str]:
+        """gangnamunni, babitalk 검색 시 각각의 _review 플랫폼도 포함"""
+        platform_filters = []
+        for platform in platforms:
+            if platform in ["gangnamunni", "babitalk"]:
+                platform_filters.extend([platform, f"{platform}_review"])
+            else:
+                platform_filters.append(platform)
+        return platform_filters
+    
+    def search_documents_by_keywords(self, keywords: List[str], platforms: List[str] = None, 
+                                     data_types: List[str] = None, start_date: str = None, 
+                                     end_date: str = None, naver_cafes: List[str] = None, 
+                                     limit: int = 100, offset: int = 0, cursor: Optional[str] = None,
+                                     with_counts: bool = True) -> Dict[str, Any]:
+        """
+        게시글/댓글/후기를 하나의 검색 인덱스에서 작성일 역순으로 검색합니다.
+        
+        페이지 조회 1회 + 타입별 개수 조회 1회 후, 페이지에 포함된 원본만 타입별 IN 쿼리로 가져옵니다.
+        cursor 가 주어지면 offset 대신 커서 위치 다음부터 조회합니다. (키셋 페이지네이션)
+        
+        Args:
+            with_counts: False 이면 타입별 개수 조회를 생략 (커서로 전체를 순회하는 경우)
+        
+        Returns:
+            Dict[str, Any]: {
+                'results': 전체 정렬 순서의 [{'type', 'id', 'data'}],
+                'articles' / 'comments' / 'reviews': 타입별 원본 (페이지 내 순서 유지),
+                'total_counts': 타입별 총 개수 {'articles', 'comments', 'reviews'},
+                'total': 전체 개수 (with_counts=False 이면 None),
+                'next_cursor': 다음 페이지 커서 (마지막 페이지면 None)
+            }
+        """
+        results = {
+            'results': [],
+            'articles': [],
+            'comments': [],
+            'reviews': [],
+            'total_counts': {'articles': 0, 'comments': 0, 'reviews': 0},
+            'total': 0 if with_counts else None,
+            'next_cursor': None
+        }
+        
+        if not keywords:
+            return results
+        
         session = self.get_session()
         try:
-            results = {
-                'articles': [],
-                'comments': [],
-                'reviews': []
-            }
+            conditions = [keyword_condition(self.db_config.engine, SearchDocument, keywords)]
             
-            if not keywords:
-                return results
+            if data_types:
+                conditions.append(SearchDocument.doc_type.in_(data_types))
             
-            # 게시글 검색
-            if not data_types or 'article' in data_types:
-                article_query = session.query(Article)
-                
-                # 게시글용 키워드 조건 (title과 content 모두 검색)
-                article_keyword_conditions = []
-                for keyword in keywords:
-                    article_keyword_conditions.append(
-                        or_(
-                            Article.title.like(f'%{keyword}%'),
-                            Article.content.like(f'%{keyword}%')
-                        )
-                    )
-                
-                if article_keyword_conditions:
-                    article_query = article_query.filter(or_(*article_keyword_conditions))
-                
-                if platforms:
-                    article_query = article_query.filter(Article.platform_id.in_(platforms))
-                
-                # 네이버 카페 필터 (네이버 플랫폼인 경우에만 적용)
-                if naver_cafes and ('naver' in platforms if platforms else True):
-                    article_query = article_query.filter(
-                        or_(
-                            Article.platform_id != 'naver',
-                            Article.category_name.in_(naver_cafes)
-                        )
-                    )
-                
-                if start_date:
-                    article_query = article_query.filter(func.date(Article.created_at) >= start_date)
-                
-                if end_date:
-                    article_query = article_query.filter(func.date(Article.created_at) <= end_date)
-                
-                articles = article_query.order_by(desc(Article.created_at)).offset(offset).limit(limit).all()
-                results['articles'] = [self._article_to_dict(article) for article in articles]
+            if platforms:
+                conditions.append(SearchDocument.platform_id.in_(self._expand_search_platforms(platforms)))
             
-            # 댓글 검색
-            if not data_types or 'comment' in data_types:
-                comment_query = session.query(Comment)
-                
-                # 댓글용 키워드 조건 (content만 검색, title 없음)
-                comment_keyword_conditions = []
-                for keyword in keywords:
-                    comment_keyword_conditions.append(
-                        Comment.content.like(f'%{keyword}%')
-                    )
-                
-                if comment_keyword_conditions:
-                    comment_query = comment_query.filter(or_(*comment_keyword_conditions))
-                
-                if platforms:
-                    comment_query = comment_query.filter(Comment.platform_id.in_(platforms))
-                
-                # 네이버 카페 필터 (댓글의 경우 게시글과 조인하여 필터링)
-                if naver_cafes and ('naver' in platforms if platforms else True):
-                    comment_query = comment_query.join(Article, Comment.community_article_id == Article.community_article_id)
-                    comment_query = comment_query.filter(
-                        or_(
-                            Comment.platform_id != 'naver',
-                            Article.category_name.in_(naver_cafes)
-                        )
-                    )
-                
-                if start_date:
-                    comment_query = comment_query.filter(func.date(Comment.created_at) >= start_date)
-                
-                if end_date:
-                    comment_query = comment_query.filter(func.date(Comment.created_at) <= end_date)
-                
-                comments = comment_query.order_by(desc(Comment.created_at)).offset(offset).limit(limit).all()
-                results['comments'] = [self._comment_to_dict(comment) for comment in comments]
+            # 네이버 카페 필터 (게시글/댓글은 게시글 카테고리, 후기는 categories 기준)
+            if naver_cafes and ('naver' in platforms if platforms else True):
+                conditions.append(or_(
+                    SearchDocument.platform_id != 'naver',
+                    SearchDocument.category.in_(naver_cafes)
+                ))
             
-            # 후기 검색
-            if not data_types or 'review' in data_types:
-                review_query = session.query(Review)
-                
-                # 후기용 키워드 조건 (title, content, hospital_name, doctor_name 모두 검색)
-                review_keyword_conditions = []
-                for keyword in keywords:
-                    review_keyword_conditions.append(
-                        or_(
-                            Review.title.like(f'%{keyword}%'),
-                            Review.content.like(f'%{keyword}%'),
-                            Review.hospital_name.like(f'%{keyword}%'),
-                            Review.doctor_name.like(f'%{keyword}%')
-                        )
-                    )
-                
-                if review_keyword_conditions:
-                    review_query = review_query.filter(or_(*review_keyword_conditions))
-                
-                if platforms:
-                    # gangnamunni, babitalk로 검색할 때 각각의 _review도 포함하도록 수정
-                    platform_filters = []
-                    for platform in platforms:
-                        if platform in ["gangnamunni", "babitalk"]:
-                            platform_filters.extend([platform, f"{platform}_review"])
-                        else:
-                            platform_filters.append(platform)
-                    review_query = review_query.filter(Review.platform_id.in_(platform_filters))
-                
-                # 네이버 카페 필터 (후기의 경우 categories 필드로 필터링)
-                if naver_cafes and ('naver' in platforms if platforms else True):
-                    review_query = review_query.filter(
-                        or_(
-                            Review.platform_id != 'naver',
-                            Review.categories.in_(naver_cafes)
-                        )
-                    )
-                
-                if start_date:
-                    review_query = review_query.filter(func.date(Review.created_at) >= start_date)
-                
-                if end_date:
-                    # end_date에 23:59:59까지 포함하도록 수정
-                    from datetime import datetime, time
-                    end_datetime = datetime.strptime(end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59)
-                    review_query = review_query.filter(Review.created_at <= end_datetime)
+            if start_date or end_date:
+                conditions.append(self._date_range(SearchDocument.created_at, start_date, end_date))
+            
+            # 타입별 총 개수 (1회)
+            if with_counts:
+                for doc_type, count in session.query(
+                    SearchDocument.doc_type, func.count(SearchDocument.id)
+                ).filter(*conditions).group_by(SearchDocument.doc_type):
+                    results['total_counts'][f"{doc_type}s"] = count
+                results['total'] = sum(results['total_counts'].values())
                 
-                reviews = review_query.order_by(desc(Review.created_at)).offset(offset).limit(limit).all()
-                results['reviews'] = [self._review_to_dict(review) for review in reviews]
+                if results['total'] == 0:
+                    return results
+            
+            if limit <= 0:
+                return results
+            
+            # 전체 정렬된 페이지 (1회, 다음 페이지 확인용으로 1건 더 조회)
+            page_query = session.query(
+                SearchDocument.id, SearchDocument.created_at, SearchDocument.doc_type, SearchDocument.source_id
+            ).filter(*conditions).order_by(*keyset_order(SearchDocument))
+            if cursor:
+                page_query = page_query.filter(keyset_condition(SearchDocument, cursor))
+            else:
+                page_query = page_query.offset(offset)
+            page = page_query.limit(limit + 1).all()
+            
+            if len(page) > limit:
+                page = page[:limit]
+                results['next_cursor'] = encode_cursor(page[-1].created_at, page[-1].id)
+            
+            # 원본 일괄 조회 (타입별 IN 쿼리)
+            ids_by_type: Dict[str, List[int]] = {}
+            for _, _, doc_type, source_id in page:
+                ids_by_type.setdefault(doc_type, []).append(source_id)
+            
+            hydrated = {}
+            for doc_type, model in (('article', Article), ('comment', Comment), ('review', Review)):
+                if doc_type in ids_by_type:
+                    query = self._row_query(session, doc_type).filter(model.id.in_(ids_by_type[doc_type]))
+                    for row in query:
+                        hydrated[(doc_type, row.id)] = self._row_to_dict(row._fields, row)
+            
+            for _, _, doc_type, source_id in page:
+                data = hydrated.get((doc_type, source_id))
+                if data is None:
+                    continue
+                results['results'].append({'type': doc_type, 'id': source_id, 'data': data})
+                results[f"{doc_type}s"].append(data)
             
             return results
             
         except Exception as e:
-            logger.error(f"키워드 검색 중 오류 발생: {e}")
+            logger.error(f"통합 키워드 검색 중 오류 발생: {e}")
             raise
         finally:
             session.close()
     
+    def search_data_by_keywords(self, keywords: List[str], platforms: List[str] = None, 
+                               data_types: List[str] = None, start_date: str = None, 
+                               end_date: str = None, naver_cafes: List[str] = None, 
+                               limit: int = 100, offset: int = 0) -> Dict[str, List[Dict]]:
+        """키워드로 게시글, 댓글, 후기를 검색합니다. (limit/offset 은 전체 작성일 순서 기준)"""
+        results = self.search_documents_by_keywords(
+            keywords, platforms, data_types, start_date, end_date, naver_cafes, limit, offset
+        )
+        return {
+            'articles': results['articles'],
+            'comments': results['comments'],
+            'reviews': results['reviews']
+        }
+    
     def search_data_count_by_keywords(self, keywords: List[str], platforms: List[str] = None, 
                                      data_types: List[str] = None, start_date: str = None, 
                                      end_date: str = None, naver_cafes: List[str] = None) -> Dict[str, int]:
         """키워드 검색 결과의 개수를 반환합니다."""
+        return self.search_documents_by_keywords(
+            keywords, platforms, data_types, start_date, end_date, naver_cafes, limit=0
+        )['total_counts']
+    
+    # 대량 내보내기 메서드들
+    def get_export_fields(self, data_type: str) -> List[str]:
+        """내보내기 필드명 목록 (CSV 헤더)"""
+        return [column.key for column in self._row_columns(data_type)]
+    
+    def iter_export_batches(self, data_type: str, platforms: List[str] = None, start_date: str = None,
+                            end_date: str = None, batch_size: int = BULK_CHUNK_SIZE) -> Iterator[List[Dict]]:
+        """
+        조건에 맞는 전체 데이터를 작성일 순서로 batch_size 건씩 반환하는 제너레이터
+        
+        yield_per 로 서버 측 커서(MySQL 은 SSCursor)에서 batch_size 건씩만 가져오므로
+        전체 건수와 관계없이 메모리 사용량이 일정합니다. 세션은 순회가 끝나거나 close() 될 때 닫힙니다.
+        
+        Args:
+            data_type: article / comment / review
+            platforms: 플랫폼 필터 (gangnamunni, babitalk 은 _review 플랫폼 포함)
+            start_date / end_date: 작성일 범위 (YYYY-MM-DD, 양 끝 포함)
+        """
+        columns = self._row_columns(data_type)
+        model = columns[0].class_
+        fields = [column.key for column in columns]
+        
         session = self.get_session()
         try:
-            counts = {
-                'articles': 0,
-                'comments': 0,
-                'reviews': 0
-            }
+            query = self._row_query(session, data_type)
             
-            if not keywords:
-                return counts
+            if platforms:
+                query = query.filter(model.platform_id.in_(self._expand_search_platforms(platforms)))
             
-            # 게시글 개수
-            if not data_types or 'article' in data_types:
-                article_query = session.query(Article)
-                
-                # 게시글용 키워드 조건 (title과 content 모두 검색)
-                article_keyword_conditions = []
-                for keyword in keywords:
-                    article_keyword_conditions.append(
-                        or_(
-                            Article.title.like(f'%{keyword}%'),
-                            Article.content.like(f'%{keyword}%')
-                        )
-                    )
-                
-                if article_keyword_conditions:
-                    article_query = article_query.filter(or_(*article_keyword_conditions))
-                
-                if platforms:
-                    article_query = article_query.filter(Article.platform_id.in_(platforms))
-                
-                # 네이버 카페 필터 (네이버 플랫폼인 경우에만 적용)
-                if naver_cafes and ('naver' in platforms if platforms else True):
-                    article_query = article_query.filter(
-                        or_(
-                            Article.platform_id != 'naver',
-                            Article.category_name.in_(naver_cafes)
-                        )
-                    )
-                
-                if start_date:
-                    article_query = article_query.filter(func.date(Article.created_at) >= start_date)
-                
-                if end_date:
-                    article_query = article_query.filter(func.date(Article.created_at) <= end_date)
-                
-                counts['articles'] = article_query.count()
+            if start_date or end_date:
+                query = query.filter(self._date_range(model.created_at, start_date, end_date))
             
-            # 댓글 개수
-            if not data_types or 'comment' in data_types:
-                comment_query = session.query(Comment)
-                
-                # 댓글용 키워드 조건 (content만 검색, title 없음)
-                comment_keyword_conditions = []
-                for keyword in keywords:
-                    comment_keyword_conditions.append(
-                        Comment.content.like(f'%{keyword}%')
-                    )
-                
-                if comment_keyword_conditions:
-                    comment_query = comment_query.filter(or_(*comment_keyword_conditions))
-                
-                if platforms:
-                    comment_query = comment_query.filter(Comment.platform_id.in_(platforms))
-                
-                # 네이버 카페 필터 (댓글의 경우 게시글과 조인하여 필터링)
-                if naver_cafes and ('naver' in platforms if platforms else True):
-                    comment_query = comment_query.join(Article, Comment.community_article_id == Article.community_article_id)
-                    comment_query = comment_query.filter(
-                        or_(
-                            Comment.platform_id != 'naver',
-                            Article.category_name.in_(naver_cafes)
-                        )
-                    )
-                
-                if start_date:
-                    comment_query = comment_query.filter(func.date(Comment.created_at) >= start_date)
-                
-                if end_date:
-                    comment_query = comment_query.filter(func.date(Comment.created_at) <= end_date)
-                
-                counts['comments'] = comment_query.count()
+            rows = query.order_by(model.created_at, model.id).yield_per(batch_size)
             
-            # 후기 개수
-            if not data_types or 'review' in data_types:
-                review_query = session.query(Review)
-                
-                # 후기용 키워드 조건 (title, content, hospital_name, doctor_name 모두 검색)
-                review_keyword_conditions = []
-                for keyword in keywords:
-                    review_keyword_conditions.append(
-                        or_(
-                            Review.title.like(f'%{keyword}%'),
-                            Review.content.like(f'%{keyword}%'),
-                            Review.hospital_name.like(f'%{keyword}%'),
-                            Review.doctor_name.like(f'%{keyword}%')
-                        )
-                    )
-                
-                if review_keyword_conditions:
-                    review_query = review_query.filter(or_(*review_keyword_conditions))
-                
-                if platforms:
-                    # gangnamunni, babitalk로 검색할 때 각각의 _review도 포함하도록 수정
-                    platform_filters = []
-                    for platform in platforms:
-                        if platform in ["gangnamunni", "babitalk"]:
-                            platform_filters.extend([platform, f"{platform}_review"])
-                        else:
-                            platform_filters.append(platform)
-                    review_query = review_query.filter(Review.platform_id.in_(platform_filters))
-                
-                # 네이버 카페 필터 (후기의 경우 categories 필드로 필터링)
-                if naver_cafes and ('naver' in platforms if platforms else True):
-                    review_query = review_query.filter(
-                        or_(
-                            Review.platform_id != 'naver',
-                            Review.categories.in_(naver_cafes)
-                        )
-                    )
-                
-                if start_date:
-                    review_query = review_query.filter(func.date(Review.created_at) >= start_date)
-                
-                if end_date:
-                    # end_date에 23:59:59까지 포함하도록 수정
-                    from datetime import datetime, time
-                    end_datetime = datetime.strptime(end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59)
-                    review_query = review_query.filter(Review.created_at <= end_datetime)
-                
-                counts['reviews'] = review_query.count()
+            exported = 0
+            for batch in self._row_batches(rows, fields, batch_size, iso_dates=True):
+                exported += len(batch)
+                yield batch
             
-            return counts
+            logger.info(f"📤 {data_type} 내보내기 완료: {exported}건")
+        
+        except Exception as e:
+            logger.error(f"데이터 내보내기 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def iter_snapshot_batches(self, data_type: str, collected_after: Optional[datetime],
+                              collected_until: datetime, batch_size: int = BULK_CHUNK_SIZE) -> Iterator[List[Dict]]:
+        """
+        collected_after < collected_at <= collected_until 인 데이터를 수집 순서로 batch_size 건씩 반환 (스냅샷 증분 내보내기용)
+        
+        날짜 값은 문자열로 바꾸지 않고 datetime 그대로 반환합니다.
+        """
+        columns = self._row_columns(data_type)
+        model = columns[0].class_
+        fields = [column.key for column in columns]
+        
+        session = self.get_session()
+        try:
+            query = self._row_query(session, data_type)
             
+            if collected_after is not None:
+                query = query.filter(model.collected_at > collected_after)
+            query = query.filter(model.collected_at <= collected_until)
+            
+            rows = query.order_by(model.collected_at, model.id).yield_per(batch_size)
+            yield from self._row_batches(rows, fields, batch_size)
+        
         except Exception as e:
-            logger.error(f"키워드 검색 개수 조회 중 오류 발생: {e}")
+            logger.error(f"스냅샷 데이터 조회 중 오류 발생: {e}")
             raise
         finally:
             session.close()
     
+    def _row_batches(self, rows, fields: List[str], batch_size: int, iso_dates: bool = False) -> Iterator[List[Dict]]:
+        """컬럼 조회 결과를 batch_size 건씩 딕셔너리 리스트로 묶어 반환"""
+        batch = []
+        for row in rows:
+            if iso_dates:
+                batch.append(self._row_to_dict(fields, row))
+            else:
+                batch.append(dict(zip(fields, row)))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
     # Bulk Get 메서드들
+    def _get_rows_by_ids(self, session: Session, data_type: str, id_column, ids: List[int]) -> List[Dict]:
+        """
+        ID 목록 조회 공통 처리
+        
+        IN 절 바인드 파라미터 수 제한(SQLite)/패킷 크기 제한(MySQL)을 넘지 않도록 BULK_CHUNK_SIZE 단위로 나눠 조회하고,
+        결과는 요청한 ID 순서대로 반환합니다. 중복 ID 는 한 번만, 없는 ID 는 결과에서 빠집니다.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        rows_by_id = {}
+        for chunk in self._chunks(unique_ids):
+            for row in self._row_query(session, data_type).filter(id_column.in_(chunk)):
+                item = self._row_to_dict(row._fields, row)
+                rows_by_id[item['id']] = item
+        return [rows_by_id[id] for id in unique_ids if id in rows_by_id]
+    
     def get_articles_by_ids(self, ids: List[int]) -> List[Dict]:
-        """ID 목록으로 게시글들을 조회합니다."""
+        """ID 목록으로 게시글들을 조회합니다. (요청 ID 순서 유지)"""
         session = self.get_session()
         try:
-            articles = session.query(Article).filter(Article.id.in_(ids)).all()
-            return [self._article_to_dict(article) for article in articles]
+            return self._get_rows_by_ids(session, 'article', Article.id, ids)
         except Exception as e:
             logger.error(f"게시글 bulk 조회 중 오류 발생: {e}")
             raise
@@ -894,11 +1419,10 @@ class SQLAlchemyDatabaseManager:
             session.close()
     
     def get_reviews_by_ids(self, ids: List[int]) -> List[Dict]:
-        """ID 목록으로 후기들을 조회합니다."""
+        """ID 목록으로 후기들을 조회합니다. (요청 ID 순서 유지)"""
         session = self.get_session()
         try:
-            reviews = session.query(Review).filter(Review.id.in_(ids)).all()
-            return [self._review_to_dict(review) for review in reviews]
+            return self._get_rows_by_ids(session, 'review', Review.id, ids)
         except Exception as e:
             logger.error(f"후기 bulk 조회 중 오류 발생: {e}")
             raise
@@ -906,13 +1430,723 @@ class SQLAlchemyDatabaseManager:
             session.close()
     
     def get_comments_by_ids(self, ids: List[int]) -> List[Dict]:
-        """ID 목록으로 댓글들을 조회합니다."""
+        """ID 목록으로 댓글들을 조회합니다. (요청 ID 순서 유지)"""
         session = self.get_session()
         try:
-            comments = session.query(Comment).filter(Comment.id.in_(ids)).all()
-            return [self._comment_to_dict(comment) for comment in comments]
+            return self._get_rows_by_ids(session, 'comment', Comment.id, ids)
         except Exception as e:
             logger.error(f"댓글 bulk 조회 중 오류 발생: {e}")
             raise
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+    
+    # 중복 체크용 일괄 조회 메서드들
+    def get_article_ids_by_community_article_ids(self, platform_id: str, community_article_ids: List[str]) -> Dict[str, int]:
+        """
+        이미 저장된 게시글의 커뮤니티 게시글 ID -> DB ID 매핑 조회 (IN 쿼리 1회)
+        
+        Returns:
+            Dict[str, int]: 존재하는 게시글만 포함된 매핑
+        """
+        if not community_article_ids:
+            return {}
+        
+        session = self.get_session()
+        try:
+            mapping = {}
+            for chunk in self._chunks(list({str(article_id) for article_id in community_article_ids})):
+                rows = session.query(Article.id, Article.community_article_id).filter(
+                    and_(
+                        Article.platform_id == platform_id,
+                        Article.community_article_id.in_(chunk)
+                    )
+                )
+                for article_id, community_article_id in rows:
+                    mapping[community_article_id] = article_id
+            return mapping
+        except Exception as e:
+            logger.error(f"게시글 존재 여부 일괄 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def get_existing_review_ids(self, platform_id: str, platform_review_ids: List[str]) -> Set[str]:
+        """이미 저장된 후기의 플랫폼 후기 ID 집합 조회 (IN 쿼리 1회)"""
+        if not platform_review_ids:
+            return set()
+        
+        session = self.get_session()
+        try:
+            existing = set()
+            for chunk in self._chunks(list({str(review_id) for review_id in platform_review_ids})):
+                rows = session.query(Review.platform_review_id).filter(
+                    and_(
+                        Review.platform_id == platform_id,
+                        Review.platform_review_id.in_(chunk)
+                    )
+                )
+                existing.update(row[0] for row in rows)
+            return existing
+        except Exception as e:
+            logger.error(f"후기 존재 여부 일괄 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def get_existing_comment_ids(self, article_id: int, community_comment_ids: List[str]) -> Set[str]:
+        """게시글에 이미 저장된 댓글의 커뮤니티 댓글 ID 집합 조회 (IN 쿼리 1회)"""
+        if not community_comment_ids:
+            return set()
+        
+        session = self.get_session()
+        try:
+            existing = set()
+            for chunk in self._chunks(list({str(comment_id) for comment_id in community_comment_ids})):
+                rows = session.query(Comment.community_comment_id).filter(
+                    and_(
+                        Comment.article_id == int(article_id),
+                        Comment.community_comment_id.in_(chunk)
+                    )
+                )
+                existing.update(row[0] for row in rows)
+            return existing
+        except Exception as e:
+            logger.error(f"댓글 존재 여부 일괄 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    # Bulk Upsert 메서드들
+    @_writes
+    def bulk_upsert_articles(self, articles_data: List[Dict], update_fields: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """
+        게시글 일괄 저장 (중복은 무시하거나 update_fields만 갱신)
+        
+        Args:
+            articles_data: insert_article 과 같은 형식의 게시글 딕셔너리 목록
+            update_fields: 중복 시 갱신할 컬럼 목록 (None이면 중복 무시)
+        
+        Returns:
+            Dict[(platform_id, community_article_id), id]: 기존 게시글을 포함한 ID 매핑
+        """
+        if not articles_data:
+            return {}
+        
+        now = datetime.now()
+        rows = [
+            {
+                'platform_id': data['platform_id'],
+                'community_article_id': str(data['community_article_id']),
+                'community_id': data['community_id'],
+                'title': data.get('title'),
+                'content': data['content'],
+                'images': data.get('images'),
+                'writer_nickname': data['writer_nickname'],
+                'writer_id': data['writer_id'],
+                'like_count': data.get('like_count', 0),
+                'comment_count': data.get('comment_count', 0),
+                'view_count': data.get('view_count', 0),
+                'created_at': data.get('created_at') or now,
+                'category_name': data.get('category_name'),
+                'collected_at': data.get('collected_at') or now
+            }
+            for data in articles_data
+        ]
+        
+        session = self.get_session()
+        try:
+            existing = self._fetch_id_mapping(session, Article, Article.community_article_id, rows, 'community_article_id')
+            stats_before = self._daily_stats_before_update(session, 'article', existing.values(), update_fields)
+            self._bulk_insert_ignore(session, Article, rows, ['platform_id', 'community_article_id'], update_fields)
+            mapping = self._fetch_id_mapping(session, Article, Article.community_article_id, rows, 'community_article_id')
+            new_ids = [row_id for key, row_id in mapping.items() if key not in existing]
+            self._increment_daily_stats(session, 'article', new_ids)
+            self._move_daily_stats(session, 'article', existing.values(), stats_before)
+            self._index_search_documents(
+                session, 'article', list(mapping.values()), refresh=self._search_refresh_needed('article', update_fields)
+            )
+            session.commit()
+            if new_ids or update_fields:
+                self._bump_generation(row['platform_id'] for row in rows)
+            return mapping
+        except Exception as e:
+            session.rollback()
+            logger.error(f"게시글 일괄 저장 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def bulk_upsert_comments(self, comments_data: List[Dict], update_fields: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """
+        댓글 일괄 저장 (중복은 무시하거나 update_fields만 갱신)
+        
+        각 댓글은 article_id 또는 (platform_id, community_article_id)를 가져야 하며,
+        게시글 정보는 배치 단위로 한 번에 조회합니다.
+        
+        Args:
+            comments_data: insert_comment 와 같은 형식의 댓글 딕셔너리 목록
+            update_fields: 중복 시 갱신할 컬럼 목록 (None이면 중복 무시)
+        
+        Returns:
+            Dict[(platform_id, community_comment_id), id]: 기존 댓글을 포함한 ID 매핑
+        """
+        if not comments_data:
+            return {}
+        
+        session = self.get_session()
+        try:
+            # 게시글 정보 일괄 조회 (article_id 방식)
+            article_ids = {int(data['article_id']) for data in comments_data if data.get('article_id')}
+            articles_by_id = {}
+            for chunk in self._chunks(list(article_ids)):
+                for article_id, platform_id, community_article_id in session.query(
+                    Article.id, Article.platform_id, Article.community_article_id
+                ).filter(Article.id.in_(chunk)):
+                    articles_by_id[article_id] = (platform_id, community_article_id)
+            
+            # 게시글 정보 일괄 조회 (레거시 방식: platform_id + community_article_id)
+            legacy_keys = {
+                (data['platform_id'], str(data['community_article_id']))
+                for data in comments_data
+                if not data.get('article_id') and 'platform_id' in data and 'community_article_id' in data
+            }
+            articles_by_key = {}
+            for platform_id in {key[0] for key in legacy_keys}:
+                community_article_ids = [key[1] for key in legacy_keys if key[0] == platform_id]
+                for chunk in self._chunks(community_article_ids):
+                    for article_id, community_article_id in session.query(
+                        Article.id, Article.community_article_id
+                    ).filter(
+                        and_(Article.platform_id == platform_id, Article.community_article_id.in_(chunk))
+                    ):
+                        articles_by_key[(platform_id, community_article_id)] = article_id
+            
+            now = datetime.now()
+            rows = []
+            for data in comments_data:
+                if data.get('article_id'):
+                    article_id = int(data['article_id'])
+                    if article_id not in articles_by_id:
+                        logger.warning(f"article_id {article_id}에 해당하는 게시글이 없어 댓글을 건너뜁니다.")
+                        continue
+                    platform_id, community_article_id = articles_by_id[article_id]
+                else:
+                    key = (data.get('platform_id'), str(data.get('community_article_id')))
+                    if key not in articles_by_key:
+                        logger.warning(f"플랫폼 ID '{key[0]}', 게시글 ID '{key[1]}'에 해당하는 게시글이 없어 댓글을 건너뜁니다.")
+                        continue
+                    platform_id, community_article_id = key
+                    article_id = articles_by_key[key]
+                
+                rows.append({
+                    'platform_id': platform_id,
+                    'community_article_id': community_article_id,
+                    'community_comment_id': str(data.get('community_comment_id', '')),
+                    'content': data['content'],
+                    'writer_nickname': data['writer_nickname'],
+                    'writer_id': data['writer_id'],
+                    'created_at': data.get('created_at') or now,
+                    'parent_comment_id': data.get('parent_comment_id'),
+                    'collected_at': data.get('collected_at') or now,
+                    'article_id': article_id
+                })
+            
+            existing = self._fetch_id_mapping(session, Comment, Comment.community_comment_id, rows, 'community_comment_id')
+            stats_before = self._daily_stats_before_update(session, 'comment', existing.values(), update_fields)
+            self._bulk_insert_ignore(session, Comment, rows, ['platform_id', 'community_comment_id'], update_fields)
+            mapping = self._fetch_id_mapping(session, Comment, Comment.community_comment_id, rows, 'community_comment_id')
+            new_ids = [row_id for key, row_id in mapping.items() if key not in existing]
+            self._increment_daily_stats(session, 'comment', new_ids)
+            self._move_daily_stats(session, 'comment', existing.values(), stats_before)
+            self._index_search_documents(
+                session, 'comment', list(mapping.values()), refresh=self._search_refresh_needed('comment', update_fields)
+            )
+            session.commit()
+            if new_ids or update_fields:
+                self._bump_generation(row['platform_id'] for row in rows)
+            return mapping
+        except Exception as e:
+            session.rollback()
+            logger.error(f"댓글 일괄 저장 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def bulk_upsert_reviews(self, reviews_data: List[Dict], update_fields: Optional[List[str]] = None) -> Dict[Tuple[str, str], int]:
+        """
+        후기 일괄 저장 (중복은 무시하거나 update_fields만 갱신)
+        
+        Args:
+            reviews_data: insert_review 와 같은 형식의 후기 딕셔너리 목록
+            update_fields: 중복 시 갱신할 컬럼 목록 (None이면 중복 무시)
+        
+        Returns:
+            Dict[(platform_id, platform_review_id), id]: 기존 후기를 포함한 ID 매핑
+        """
+        if not reviews_data:
+            return {}
+        
+        now = datetime.now()
+        rows = [
+            {
+                'platform_id': data['platform_id'],
+                'platform_review_id': str(data['platform_review_id']),
+                'community_id': data['community_id'],
+                'title': data.get('title'),
+                'content': data['content'],
+                'images': data.get('images'),
+                'writer_nickname': data['writer_nickname'],
+                'writer_id': data['writer_id'],
+                'like_count': data.get('like_count', 0),
+                'rating': data.get('rating', 0),
+                'price': data.get('price', 0),
+                'categories': data.get('categories'),
+                'sub_categories': data.get('sub_categories'),
+                'surgery_date': data.get('surgery_date'),
+                'hospital_name': data.get('hospital_name'),
+                'doctor_name': data.get('doctor_name'),
+                'is_blind': data.get('is_blind', False),
+                'is_image_blur': data.get('is_image_blur', False),
+                'is_certificated_review': data.get('is_certificated_review', False),
+                'created_at': data.get('created_at') or now,
+                'collected_at': data.get('collected_at') or now
+            }
+            for data in reviews_data
+        ]
+        
+        session = self.get_session()
+        try:
+            existing = self._fetch_id_mapping(session, Review, Review.platform_review_id, rows, 'platform_review_id')
+            stats_before = self._daily_stats_before_update(session, 'review', existing.values(), update_fields)
+            self._bulk_insert_ignore(session, Review, rows, ['platform_id', 'platform_review_id'], update_fields)
+            mapping = self._fetch_id_mapping(session, Review, Review.platform_review_id, rows, 'platform_review_id')
+            new_ids = [row_id for key, row_id in mapping.items() if key not in existing]
+            self._increment_daily_stats(session, 'review', new_ids)
+            self._move_daily_stats(session, 'review', existing.values(), stats_before)
+            self._index_search_documents(
+                session, 'review', list(mapping.values()), refresh=self._search_refresh_needed('review', update_fields)
+            )
+            session.commit()
+            if new_ids or update_fields:
+                self._bump_generation(row['platform_id'] for row in rows)
+            return mapping
+        except Exception as e:
+            session.rollback()
+            logger.error(f"후기 일괄 저장 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _chunks(items: List[Any], size: int = BULK_CHUNK_SIZE):
+        """리스트를 size 단위로 나누어 반환"""
+        for i in range(0, len(items), size):
+            yield items[i:i + size]
+    
+    @staticmethod
+    def _rows_per_statement(rows: List[Dict]) -> int:
+        """다중 행 INSERT 문 하나의 행 수 (바인드 파라미터 수 = 행 수 x 컬럼 수가 BULK_MAX_PARAMS 이하)"""
+        column_count = max(len(row) for row in rows)
+        return max(1, min(BULK_CHUNK_SIZE, BULK_MAX_PARAMS // column_count))
+    
+    def _bulk_insert_ignore(self, session: Session, model, rows: List[Dict], conflict_columns: List[str],
+                            update_fields: Optional[List[str]] = None) -> int:
+        """
+        방언별 네이티브 구문으로 일괄 INSERT (중복 키 무시 또는 갱신)
+        
+        - SQLite: INSERT ... ON CONFLICT DO NOTHING / DO UPDATE
+        - MySQL: INSERT IGNORE / INSERT ... ON DUPLICATE KEY UPDATE
+        - 그 외: 중복 확인 후 개별 INSERT
+        
+        Returns:
+            int: 실제로 추가된 행 수 (드라이버가 지원하는 경우)
+        """
+        if not rows:
+            return 0
+        
+        dialect = session.bind.dialect.name
+        inserted = 0
+        
+        for chunk in self._chunks(rows, self._rows_per_statement(rows)):
+            if dialect == "sqlite":
+                stmt = sqlite_insert(model).values(chunk)
+                if update_fields:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=conflict_columns,
+                        set_={field: stmt.excluded[field] for field in update_fields}
+                    )
+                else:
+                    stmt = stmt.on_conflict_do_nothing()
+                inserted += session.execute(stmt).rowcount or 0
+            elif dialect == "mysql":
+                stmt = mysql_insert(model).values(chunk)
+                if update_fields:
+                    stmt = stmt.on_duplicate_key_update({field: stmt.inserted[field] for field in update_fields})
+                else:
+                    stmt = stmt.prefix_with("IGNORE")
+                inserted += session.execute(stmt).rowcount or 0
+            else:
+                for row in chunk:
+                    exists = session.query(model.id).filter(
+                        and_(*[getattr(model, column) == row[column] for column in conflict_columns])
+                    ).first()
+                    if exists:
+                        continue
+                    session.add(model(**row))
+                    inserted += 1
+                session.flush()
+        
+        return inserted
+    
+    def _fetch_id_mapping(self, session: Session, model, key_column, rows: List[Dict], key_name: str) -> Dict[Tuple[str, str], int]:
+        """(platform_id, 플랫폼 고유 ID) -> DB ID 매핑을 플랫폼별 IN 쿼리로 조회"""
+        keys_by_platform: Dict[str, set] = {}
+        for row in rows:
+            keys_by_platform.setdefault(row['platform_id'], set()).add(row[key_name])
+        
+        mapping = {}
+        for platform_id, keys in keys_by_platform.items():
+            for chunk in self._chunks(list(keys)):
+                for row_id, key in session.query(model.id, key_column).filter(
+                    and_(model.platform_id == platform_id, key_column.in_(chunk))
+                ):
+                    mapping[(platform_id, key)] = row_id
+        return mapping
+    
+    # 수집 작업(CollectionTask) 관련 메서드
+    _TASK_JSON_FIELDS = ('task_data', 'call_args', 'checkpoint', 'result', 'logs')
+    
+    @_writes
+    def create_collection_task(self, task_id: str, task_type: str, task_data: Dict,
+                               call_args: Optional[Dict] = None) -> Dict:
+        """수집 작업 생성"""
+        session = self.get_session()
+        try:
+            task = CollectionTask(
+                id=task_id,
+                task_type=task_type,
+                status="pending",
+                progress=0,
+                total=0,
+                current_step="",
+                task_data=json.dumps(task_data, ensure_ascii=False, default=str),
+                call_args=json.dumps(call_args, ensure_ascii=False, default=str) if call_args is not None else None,
+                logs=json.dumps([], ensure_ascii=False),
+                attempts=0,
+                created_at=datetime.now()
+            )
+            session.add(task)
+            session.commit()
+            return self._collection_task_to_dict(task)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 작업 생성 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def get_collection_task(self, task_id: str) -> Optional[Dict]:
+        """수집 작업 조회"""
+        session = self.get_session()
+        try:
+            task = session.query(CollectionTask).filter(CollectionTask.id == task_id).first()
+            return self._collection_task_to_dict(task) if task else None
+        except Exception as e:
+            logger.error(f"수집 작업 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def list_collection_tasks(self, statuses: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """수집 작업 목록 조회 (최신순)"""
+        session = self.get_session()
+        try:
+            query = session.query(CollectionTask)
+            if statuses:
+                query = query.filter(CollectionTask.status.in_(statuses))
+            query = query.order_by(desc(CollectionTask.created_at))
+            if limit:
+                query = query.limit(limit)
+            return [self._collection_task_to_dict(task) for task in query.all()]
+        except Exception as e:
+            logger.error(f"수집 작업 목록 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def update_collection_task(self, task_id: str, fields: Dict[str, Any], expected_worker_id: Optional[str] = None) -> bool:
+        """
+        수집 작업 필드 업데이트 (JSON 필드는 자동 직렬화)
+        
+        Args:
+            expected_worker_id: 지정 시 해당 워커가 소유한 작업만 업데이트
+        
+        Returns:
+            bool: 업데이트 여부
+        """
+        values = {}
+        for key, value in fields.items():
+            if key in self._TASK_JSON_FIELDS and value is not None:
+                value = json.dumps(value, ensure_ascii=False, default=str)
+            values[getattr(CollectionTask, key)] = value
+        
+        session = self.get_session()
+        try:
+            query = session.query(CollectionTask).filter(CollectionTask.id == task_id)
+            if expected_worker_id is not None:
+                query = query.filter(CollectionTask.worker_id == expected_worker_id)
+            updated = query.update(values, synchronize_session=False)
+            session.commit()
+            return updated > 0
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 작업 업데이트 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def claim_collection_task(self, task_id: str, worker_id: str, stale_before: Optional[datetime] = None) -> bool:
+        """
+        수집 작업 실행 권한 획득 (조건부 UPDATE 로 여러 워커 중 하나만 성공)
+        대기 중인 작업, 또는 stale_before 이전부터 하트비트가 끊긴 실행 중 작업만 획득할 수 있습니다.
+        
+        Returns:
+            bool: 획득 성공 여부
+        """
+        now = datetime.now()
+        condition = CollectionTask.status == "pending"
+        if stale_before is not None:
+            condition = or_(
+                condition,
+                and_(
+                    CollectionTask.status == "running",
+                    or_(CollectionTask.heartbeat_at.is_(None), CollectionTask.heartbeat_at < stale_before)
+                )
+            )
+        
+        session = self.get_session()
+        try:
+            updated = session.query(CollectionTask).filter(
+                and_(CollectionTask.id == task_id, condition)
+            ).update({
+                CollectionTask.status: "running",
+                CollectionTask.worker_id: worker_id,
+                CollectionTask.heartbeat_at: now,
+                CollectionTask.attempts: CollectionTask.attempts + 1,
+                CollectionTask.started_at: func.coalesce(CollectionTask.started_at, now)
+            }, synchronize_session=False)
+            session.commit()
+            return updated == 1
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 작업 획득 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def heartbeat_collection_tasks(self, worker_id: str, task_ids: List[str]) -> Set[str]:
+        """
+        실행 중인 작업의 하트비트 갱신
+        
+        Returns:
+            Set[str]: 더 이상 이 워커가 실행 중으로 소유하지 않는 작업 ID (취소/다른 워커가 인수 등)
+        """
+        if not task_ids:
+            return set()
+        
+        session = self.get_session()
+        try:
+            session.query(CollectionTask).filter(
+                and_(
+                    CollectionTask.id.in_(task_ids),
+                    CollectionTask.worker_id == worker_id,
+                    CollectionTask.status == "running"
+                )
+            ).update({CollectionTask.heartbeat_at: datetime.now()}, synchronize_session=False)
+            session.commit()
+            
+            owned = {
+                row[0] for row in session.query(CollectionTask.id).filter(
+                    and_(
+                        CollectionTask.id.in_(task_ids),
+                        CollectionTask.worker_id == worker_id,
+                        CollectionTask.status == "running"
+                    )
+                )
+            }
+            return set(task_ids) - owned
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 작업 하트비트 갱신 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def find_resumable_collection_tasks(self, stale_before: datetime, pending_before: datetime) -> List[str]:
+        """하트비트가 끊긴 실행 중 작업과 오래 대기 중인 작업의 ID 조회 (생성순)"""
+        session = self.get_session()
+        try:
+            rows = session.query(CollectionTask.id).filter(
+                or_(
+                    and_(
+                        CollectionTask.status == "running",
+                        or_(CollectionTask.heartbeat_at.is_(None), CollectionTask.heartbeat_at < stale_before)
+                    ),
+                    and_(CollectionTask.status == "pending", CollectionTask.created_at < pending_before)
+                )
+            ).order_by(CollectionTask.created_at).all()
+            return [row[0] for row in rows]
+        except Exception as e:
+            logger.error(f"재개 대상 수집 작업 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def delete_collection_tasks(self, statuses: List[str], created_before: datetime) -> int:
+        """오래된 수집 작업 삭제"""
+        session = self.get_session()
+        try:
+            deleted = session.query(CollectionTask).filter(
+                and_(CollectionTask.status.in_(statuses), CollectionTask.created_at < created_before)
+            ).delete(synchronize_session=False)
+            session.commit()
+            return deleted
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 작업 삭제 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def _collection_task_to_dict(self, task: CollectionTask) -> Dict:
+        """CollectionTask 객체를 딕셔너리로 변환 (JSON 필드 역직렬화)"""
+        data = {
+            'id': task.id,
+            'type': task.task_type,
+            'status': task.status,
+            'progress': task.progress or 0,
+            'total': task.total or 0,
+            'current_step': task.current_step or "",
+            'error': task.error,
+            'worker_id': task.worker_id,
+            'attempts': task.attempts or 0,
+            'heartbeat_at': task.heartbeat_at.isoformat() if task.heartbeat_at else None,
+            'created_at': task.created_at.isoformat() if task.created_at else None,
+            'started_at': task.started_at.isoformat() if task.started_at else None,
+            'completed_at': task.completed_at.isoformat() if task.completed_at else None
+        }
+        for field in self._TASK_JSON_FIELDS:
+            value = getattr(task, field)
+            data[field] = json.loads(value) if value else None
+        return data
+    
+    # 수집 체크포인트(CollectionCheckpoint) 관련 메서드
+    def get_collection_checkpoint(self, platform_id: str, target_date: str, category: str = "") -> Optional[Dict]:
+        """플랫폼/날짜/카테고리 단위 수집 체크포인트 조회"""
+        session = self.get_session()
+        try:
+            checkpoint = session.query(CollectionCheckpoint).filter(
+                and_(
+                    CollectionCheckpoint.platform_id == platform_id,
+                    CollectionCheckpoint.target_date == target_date,
+                    CollectionCheckpoint.category == category
+                )
+            ).first()
+            return self._collection_checkpoint_to_dict(checkpoint) if checkpoint else None
+        except Exception as e:
+            logger.error(f"수집 체크포인트 조회 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def save_collection_checkpoint(self, platform_id: str, target_date: str, category: str,
+                                   cursor: Any, last_item_id: Optional[str] = None,
+                                   stats: Optional[Dict] = None, status: str = "in_progress") -> Dict:
+        """
+        수집 체크포인트 저장 (없으면 생성, 있으면 갱신)
+        
+        Args:
+            cursor: 다음에 요청할 페이지 커서 (JSON 직렬화 가능 값)
+            last_item_id: 마지막으로 처리한 항목 ID
+            stats: 지금까지 저장한 건수 등
+            status: "in_progress" 또는 "completed"
+        """
+        session = self.get_session()
+        try:
+            checkpoint = session.query(CollectionCheckpoint).filter(
+                and_(
+                    CollectionCheckpoint.platform_id == platform_id,
+                    CollectionCheckpoint.target_date == target_date,
+                    CollectionCheckpoint.category == category
+                )
+            ).first()
+            if checkpoint is None:
+                checkpoint = CollectionCheckpoint(
+                    platform_id=platform_id,
+                    target_date=target_date,
+                    category=category,
+                    created_at=datetime.now()
+                )
+                session.add(checkpoint)
+            
+            checkpoint.status = status
+            checkpoint.cursor = json.dumps(cursor, ensure_ascii=False, default=str)
+            checkpoint.last_item_id = str(last_item_id) if last_item_id is not None else checkpoint.last_item_id
+            checkpoint.stats = json.dumps(stats or {}, ensure_ascii=False, default=str)
+            checkpoint.updated_at = datetime.now()
+            session.commit()
+            return self._collection_checkpoint_to_dict(checkpoint)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 체크포인트 저장 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    @_writes
+    def delete_collection_checkpoint(self, platform_id: str, target_date: str, category: str = "") -> bool:
+        """수집 체크포인트 삭제"""
+        session = self.get_session()
+        try:
+            deleted = session.query(CollectionCheckpoint).filter(
+                and_(
+                    CollectionCheckpoint.platform_id == platform_id,
+                    CollectionCheckpoint.target_date == target_date,
+                    CollectionCheckpoint.category == category
+                )
+            ).delete(synchronize_session=False)
+            session.commit()
+            return deleted > 0
+        except Exception as e:
+            session.rollback()
+            logger.error(f"수집 체크포인트 삭제 중 오류 발생: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def _collection_checkpoint_to_dict(self, checkpoint: CollectionCheckpoint) -> Dict:
+        """CollectionCheckpoint 객체를 딕셔너리로 변환 (JSON 필드 역직렬화)"""
+        return {
+            'platform_id': checkpoint.platform_id,
+            'target_date': checkpoint.target_date,
+            'category': checkpoint.category,
+            'status': checkpoint.status,
+            'cursor': json.loads(checkpoint.cursor) if checkpoint.cursor else None,
+            'last_item_id': checkpoint.last_item_id,
+            'stats': json.loads(checkpoint.stats) if checkpoint.stats else {},
+            'created_at': checkpoint.created_at.isoformat() if checkpoint.created_at else None,
+            'updated_at': checkpoint.updated_at.isoformat() if checkpoint.updated_at else None
+        }
+
+
+# 쓰기 메서드 이름 (AsyncDatabase 가 같은 이름으로 위임하는 DatabaseManager 호출도 writer 스레드로 보냄)
+WRITE_METHODS = frozenset(
+    name for name, attr in vars(SQLAlchemyDatabaseManager).items() if getattr(attr, "db_write", False)
+)
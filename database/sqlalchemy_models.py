@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database.config import Base
@@ -67,8 +67,11 @@ class Article(Base):
     # 인덱스 설정
     __table_args__ = (
         Index('idx_articles_platform_community', 'platform_id', 'community_article_id', unique=True),
-        Index('idx_articles_community_id', 'community_id'),
-        Index('idx_articles_created_at', 'created_at'),
+        Index('idx_articles_community_created_at', 'community_id', 'created_at'),  # 커뮤니티별 날짜 조회
+        Index('idx_articles_created_at_id', 'created_at', 'id'),  # 작성일 역순 키셋 페이지네이션
+        Index('idx_articles_platform_created_at', 'platform_id', 'created_at', 'id'),  # 플랫폼별 목록
+        Index('idx_articles_platform_category_created_at', 'platform_id', 'category_name', 'created_at', 'id'),  # 플랫폼+카테고리별 목록
+        Index('idx_articles_collected_at_id', 'collected_at', 'id'),  # 스냅샷 증분 내보내기
     )
     
     def __repr__(self):
@@ -97,10 +100,13 @@ class Comment(Base):
     
     # 인덱스 설정 (성능 최적화)
     __table_args__ = (
-        Index('idx_comments_article_id', 'article_id'),
+        Index('idx_comments_article_comment', 'article_id', 'community_comment_id'),  # 게시글별 댓글 조회/중복 확인
         Index('idx_comments_platform_article', 'platform_id', 'community_article_id'),
+        Index('idx_comments_community_article_created_at', 'community_article_id', 'created_at', 'id'),  # 게시글 ID 필터 목록
         Index('idx_comments_parent_id', 'parent_comment_id'),
-        Index('idx_comments_created_at', 'created_at'),
+        Index('idx_comments_created_at_id', 'created_at', 'id'),  # 작성일 역순 키셋 페이지네이션
+        Index('idx_comments_platform_created_at', 'platform_id', 'created_at', 'id'),  # 플랫폼별 목록
+        Index('idx_comments_collected_at_id', 'collected_at', 'id'),  # 스냅샷 증분 내보내기
         # 복합 인덱스로 댓글 중복 방지
         Index('idx_comments_unique', 'platform_id', 'community_comment_id', unique=True),
         {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
@@ -160,10 +166,114 @@ class Review(Base):
     # 인덱스 설정
     __table_args__ = (
         Index('idx_reviews_platform_review', 'platform_id', 'platform_review_id', unique=True),
-        Index('idx_reviews_platform_id', 'platform_id'),
+        Index('idx_reviews_platform_created_at', 'platform_id', 'created_at', 'id'),  # 플랫폼별 목록
         Index('idx_reviews_community_id', 'community_id'),
-        Index('idx_reviews_created_at', 'created_at'),
+        Index('idx_reviews_created_at_id', 'created_at', 'id'),  # 작성일 역순 키셋 페이지네이션
+        Index('idx_reviews_collected_at_id', 'collected_at', 'id'),  # 스냅샷 증분 내보내기
     )
     
     def __repr__(self):
         return f"<Review(id={self.id}, platform_id='{self.platform_id}', hospital_name='{self.hospital_name}')>"
+
+class CollectionTask(Base):
+    """비동기 수집 작업 테이블 (API 워커 간 공유, 재시작 시 복구용)"""
+    __tablename__ = "collection_tasks"
+    
+    id = Column(String(36), primary_key=True)  # UUID
+    task_type = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    progress = Column(Integer, default=0)
+    total = Column(Integer, default=0)
+    current_step = Column(Text)
+    task_data = Column(Text)  # JSON 문자열 (요청 정보)
+    call_args = Column(Text)  # JSON 문자열 (재실행용 인자)
+    checkpoint = Column(Text)  # JSON 문자열 (완료된 수집 단위 등)
+    result = Column(Text)  # JSON 문자열
+    error = Column(Text)
+    logs = Column(Text)  # JSON 문자열 (최근 로그)
+    worker_id = Column(String(100))  # 실행 중인 워커
+    attempts = Column(Integer, default=0)  # 실행(재개 포함) 횟수
+    heartbeat_at = Column(DateTime)
+    created_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    
+    # 인덱스 설정
+    __table_args__ = (
+        Index('idx_collection_tasks_status_heartbeat', 'status', 'heartbeat_at'),
+        Index('idx_collection_tasks_created_at', 'created_at'),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+    
+    def __repr__(self):
+        return f"<CollectionTask(id='{self.id}', task_type='{self.task_type}', status='{self.status}')>"
+
+class CollectionCheckpoint(Base):
+    """날짜별 수집 체크포인트 테이블 (플랫폼/날짜/카테고리 단위, 중단된 수집 재개용)"""
+    __tablename__ = "collection_checkpoints"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    platform_id = Column(String(50), nullable=False)
+    target_date = Column(String(10), nullable=False)  # YYYY-MM-DD
+    category = Column(String(100), nullable=False)  # 카테고리/서비스/게시판 ID (없으면 빈 문자열)
+    status = Column(String(20), nullable=False, default="in_progress")  # in_progress, completed
+    cursor = Column(Text)  # JSON 문자열 (다음에 요청할 페이지 커서)
+    last_item_id = Column(String(100))  # 마지막으로 처리한 항목 ID
+    stats = Column(Text)  # JSON 문자열 (지금까지 저장한 건수)
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now())
+    
+    # 인덱스 설정
+    __table_args__ = (
+        UniqueConstraint('platform_id', 'target_date', 'category', name='uq_collection_checkpoints_unit'),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+    
+    def __repr__(self):
+        return f"<CollectionCheckpoint(platform_id='{self.platform_id}', target_date='{self.target_date}', category='{self.category}', status='{self.status}')>"
+
+class SearchDocument(Base):
+    """통합 검색 문서 테이블 (게시글/댓글/후기를 하나의 인덱스로 검색하기 위한 비정규화 테이블)"""
+    __tablename__ = "search_documents"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    doc_type = Column(String(10), nullable=False)  # article, comment, review
+    source_id = Column(Integer, nullable=False)  # 원본 테이블의 ID
+    platform_id = Column(String(50), nullable=False)
+    category = Column(String(255))  # 게시글/댓글: 게시글 카테고리(네이버 카페명), 후기: categories
+    created_at = Column(DateTime, nullable=False)
+    text = Column(Text, nullable=False)  # 검색 대상 텍스트 (제목, 본문, 병원명 등)
+    
+    # 인덱스 설정
+    __table_args__ = (
+        UniqueConstraint('doc_type', 'source_id', name='uq_search_documents_source'),
+        Index('idx_search_documents_created_at', 'created_at', 'id'),
+        Index('idx_search_documents_type_created_at', 'doc_type', 'created_at'),
+        Index('idx_search_documents_platform_created_at', 'platform_id', 'created_at'),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+    
+    def __repr__(self):
+        return f"<SearchDocument(doc_type='{self.doc_type}', source_id={self.source_id}, platform_id='{self.platform_id}')>"
+
+class DailyStat(Base):
+    """일별 집계 테이블 (날짜/플랫폼/카테고리/데이터 타입별 건수, 수집 시 증분 갱신)"""
+    __tablename__ = "daily_stats"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    stat_date = Column(Date, nullable=False)  # 작성일
+    platform_id = Column(String(50), nullable=False)
+    category = Column(String(255), nullable=False, default="")  # 게시글/댓글: 게시글 카테고리, 후기: categories (없으면 빈 문자열)
+    entity_type = Column(String(10), nullable=False)  # article, comment, review
+    item_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now())
+    
+    # 인덱스 설정
+    __table_args__ = (
+        UniqueConstraint('stat_date', 'platform_id', 'category', 'entity_type', name='uq_daily_stats_unit'),
+        Index('idx_daily_stats_entity_date', 'entity_type', 'stat_date'),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+    
+    def __repr__(self):
+        return f"<DailyStat(stat_date='{self.stat_date}', platform_id='{self.platform_id}', entity_type='{self.entity_type}', item_count={self.item_count})>"
@@ -0,0 +1,143 @@
+"""
+작업 단위(unit of work) 세션
+
+매니저 메서드는 호출마다 세션(커넥션)을 새로 열고 커밋하므로, 게시글 하나와 댓글 50개를 저장하는 동안
+세션과 트랜잭션이 메서드 호출 수만큼 생깁니다. 작업 단위를 열면 그 안의 모든 매니저 호출이 세션 하나를 공유하고,
+커밋은 작업 단위가 끝날 때 한 번만 합니다.
+
+    with manager.unit_of_work() as db:
+        article_id = db.insert_article(article_data)
+        db.bulk_upsert_comments(comments_data)
+        db.flush()   # 필요하면 중간에 DB 로 전송 (커밋하지 않음)
+        db.commit()  # 필요하면 중간 커밋
+
+- 매니저 메서드 안의 commit()/rollback() 은 메서드마다 연 SAVEPOINT 에만 적용됩니다.
+  메서드 하나가 실패해도 그 메서드의 변경만 취소되고, 같은 작업 단위의 앞선 저장은 유지됩니다.
+- 작업 단위가 예외로 끝나면 전체를 롤백합니다.
+- 조회 캐시 세대는 실제 커밋 후에 올립니다. 커밋 전 데이터로 만든 응답이 새 세대로 캐시되지 않습니다.
+- 작업 단위는 시작부터 커밋까지 한 스레드에서 실행합니다 (세션은 스레드 안전하지 않음).
+  async 코드는 저장할 행을 먼저 모은 뒤 AsyncDatabase.run_unit_of_work 로 작업 단위 전체를
+  DB writer 스레드 호출 하나에서 실행합니다. 작업 단위 안에서 await 하지 않습니다.
+- SQLite 에서 쓰기 작업 단위(write=True, 기본값)는 시작할 때 단일 writer 잠금을 잡고 끝날 때 놓습니다.
+  잠금은 BEGIN IMMEDIATE 부터 COMMIT 까지의 동기 구간에서만 유지되므로 다른 쓰기는 그 동안만 기다립니다.
+  작업 단위 안에서는 작업 단위 밖의 매니저로 쓰지 않습니다 (같은 잠금을 기다리며 멈춤).
+"""
+import logging
+import threading
+from typing import Iterable, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from database.cache import bump_generation
+from database.config import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWork:
+    """작업 단위 하나가 공유하는 세션과 커밋 후 처리"""
+
+    def __init__(self, session: Session, db_config: Optional[DatabaseConfig] = None):
+        self.session = session
+        self.lock = threading.RLock()
+        self._db_config = db_config
+        self._writer_held = False
+        self._pending_platforms: Set[str] = set()
+
+    def acquire_writer(self):
+        """단일 writer 잠금을 잡고 (작업 단위가 끝날 때까지 유지) 트랜잭션을 BEGIN IMMEDIATE 로 시작"""
+        write_lock = self._db_config.write_lock if self._db_config is not None else None
+        if write_lock is None or self._writer_held:
+            return
+        write_lock.acquire()
+        self._writer_held = True
+        with self.lock:
+            self._db_config.begin_write(self.session)
+
+    def session_for_call(self) -> "UnitOfWorkSession":
+        """매니저 메서드 호출 하나가 사용할 세션 (SAVEPOINT)"""
+        return UnitOfWorkSession(self)
+
+    def bump_generation(self, platform_ids: Iterable[str]):
+        """조회 캐시 세대 갱신을 커밋 후로 미룸"""
+        self._pending_platforms.update(platform_id for platform_id in platform_ids if platform_id)
+
+    def flush(self):
+        with self.lock:
+            self.session.flush()
+
+    def commit(self):
+        with self.lock:
+            self.session.commit()
+            platforms, self._pending_platforms = self._pending_platforms, set()
+        if platforms:
+            bump_generation(platforms)
+
+    def commit_and_continue(self):
+        """작업 단위 중간 커밋 (쓰기 작업 단위는 다음 트랜잭션도 BEGIN IMMEDIATE 로 시작)"""
+        self.commit()
+        if self._writer_held:
+            with self.lock:
+                self._db_config.begin_write(self.session)
+
+    def rollback(self):
+        with self.lock:
+            self.session.rollback()
+            self._pending_platforms.clear()
+
+    def close(self):
+        try:
+            self.session.close()
+        finally:
+            if self._writer_held:
+                self._writer_held = False
+                self._db_config.write_lock.release()
+
+
+class UnitOfWorkSession:
+    """
+    작업 단위 안에서 매니저 메서드가 get_session() 으로 받는 세션
+
+    commit() 은 SAVEPOINT 해제, rollback() 은 SAVEPOINT 롤백, close() 는 SAVEPOINT 해제만 하고
+    나머지 속성은 작업 단위 세션으로 전달합니다.
+    """
+
+    def __init__(self, unit: UnitOfWork):
+        unit.lock.acquire()
+        self._unit = unit
+        self._session = unit.session
+        try:
+            self._savepoint = self._session.begin_nested()
+        except Exception:
+            unit.lock.release()
+            raise
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def _savepoint_open(self) -> bool:
+        """이 호출의 SAVEPOINT 가 아직 끝나지 않았는지 (flush 실패로 비활성화된 경우 포함)"""
+        return self._savepoint is not None and self._session.get_nested_transaction() is self._savepoint
+
+    def commit(self):
+        if self._savepoint_open():
+            self._savepoint.commit()
+        self._savepoint = self._session.begin_nested()
+
+    def rollback(self):
+        if self._savepoint_open():
+            self._savepoint.rollback()
+        self._savepoint = self._session.begin_nested()
+
+    def close(self):
+        if self._savepoint is None:
+            return
+        try:
+            if self._savepoint_open():
+                if self._savepoint.is_active:
+                    self._savepoint.commit()
+                else:
+                    self._savepoint.rollback()
+        finally:
+            self._savepoint = None
+            self._unit.lock.release()
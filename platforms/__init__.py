@@ -4,8 +4,26 @@
 
 from .babitalk import BabitalkAPI
 from .gannamunni import GangnamUnniAPI
+from .http_session import HttpSessionManager, http_session_manager
+from .rate_limiter import RateLimiter, rate_limiters, get_rate_limiter
+from .circuit_breaker import (
+    CircuitBreaker, PlatformHTTPError, NotFoundError, TooManyRequestsError, ServerError,
+    circuit_breakers, get_circuit_breaker
+)
 
 __all__ = [
     'BabitalkAPI',
-    'GangnamUnniAPI'
+    'GangnamUnniAPI',
+    'HttpSessionManager',
+    'http_session_manager',
+    'RateLimiter',
+    'rate_limiters',
+    'get_rate_limiter',
+    'CircuitBreaker',
+    'PlatformHTTPError',
+    'NotFoundError',
+    'TooManyRequestsError',
+    'ServerError',
+    'circuit_breakers',
+    'get_circuit_breaker'
 ] 
\ No newline at end of file
@@ -1,7 +1,7 @@
 import asyncio
 import aiohttp
 import json
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import sys
@@ -11,6 +11,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.logger import LoggedClass
+from platforms.http_session import get_platform_session
+from platforms.circuit_breaker import (
+    PlatformHTTPError, get_circuit_breaker, raise_for_status, retry_delay, DEFAULT_MAX_RETRIES
+)
+
+# 서킷 브레이커/속도 제한 키로 사용하는 API 호스트
+BABITALK_API_HOST = "web-api.babitalk.com"
 
 @dataclass
 class BabitalkUser:
@@ -163,48 +170,49 @@ class BabitalkAPI(LoggedClass):
             tuple[List[BabitalkReview], BabitalkPagination]: 후기 목록과 페이지네이션 정보
         """
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                # API 엔드포인트
-                url = f"{self.base_url}/v2/reviews"
-                
-                # 파라미터 구성
-                params = {
-                    "service": "TREATMENTS",
-                    "limit": limit,
-                    "sort": sort
-                }
-                
-                if search_after is not None:
-                    params["search_after"] = search_after
-                
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_msg = f"HTTP {response.status}: {response.reason}"
-                        raise Exception(error_msg)
-                    
-                    json_data = await response.json()
-                    
-                    # 데이터 파싱
-                    reviews_data = json_data.get("data", [])
-                    pagination_data = json_data.get("pagination", {})
-                    
-                    # 후기 객체 생성
-                    reviews = []
-                    for review_data in reviews_data:
-                        try:
-                            review = self._parse_review(review_data)
-                            reviews.append(review)
-                        except Exception:
-                            continue
-                    
-                    # 페이지네이션 객체 생성
-                    pagination = BabitalkPagination(
-                        has_next=pagination_data.get("has_next", False),
-                        search_after=pagination_data.get("search_after")
-                    )
-                    
-                    return reviews, pagination
-                    
+            session = await get_platform_session("babitalk")
+            # API 엔드포인트
+            url = f"{self.base_url}/v2/reviews"
+            
+            # 파라미터 구성
+            params = {
+                "service": "TREATMENTS",
+                "limit": limit,
+                "sort": sort
+            }
+            
+            if search_after is not None:
+                params["search_after"] = search_after
+            
+            async with get_circuit_breaker(BABITALK_API_HOST), session.get(url, params=params, headers=self.headers) as response:
+                raise_for_status(response)
+                
+                json_data = await response.json()
+                
+                # 데이터 파싱
+                reviews_data = json_data.get("data", [])
+                pagination_data = json_data.get("pagination", {})
+                
+                # 후기 객체 생성
+                reviews = []
+                for review_data in reviews_data:
+                    try:
+                        review = self._parse_review(review_data)
+                        reviews.append(review)
+                    except Exception:
+                        continue
+                
+                # 페이지네이션 객체 생성
+                pagination = BabitalkPagination(
+                    has_next=pagination_data.get("has_next", False),
+                    search_after=pagination_data.get("search_after")
+                )
+                
+                return reviews, pagination
+                
+        except PlatformHTTPError:
+            # HTTP 오류는 호출자가 재시도 여부를 판단하도록 전달
+            raise
         except Exception as e:
             self.log_error(f"❌ 시술 후기 수집 실패: {e}")
             self.log_error(f"🔍 에러 타입: {type(e).__name__}")
@@ -213,38 +221,55 @@ class BabitalkAPI(LoggedClass):
             return [], BabitalkPagination(has_next=False, search_after=None)
     
     
-    async def get_reviews_by_date(self, target_date: str) -> List[BabitalkReview]:
+    async def get_reviews_by_date(self, target_date: str, start_search_after: int = 0,
+                                  on_page: Optional[Callable[[List[BabitalkReview], Optional[int]], Awaitable[None]]] = None,
+                                  on_complete: Optional[Callable[[], Awaitable[None]]] = None) -> List[BabitalkReview]:
         """
         특정 날짜의 후기를 수집합니다.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식)
+            start_search_after: 시작 커서 (체크포인트에서 재개할 때 사용, 기본값: 0 - 최신순 처음부터)
+            on_page: 페이지마다 호출되는 콜백 (해당 날짜 후기, 다음 페이지 커서)
+            on_complete: 날짜 끝에 도달했을 때만 호출되는 콜백 (요청 실패로 중단되면 호출하지 않음)
         
         Returns:
             List[BabitalkReview]: 해당 날짜의 후기 목록
         """
         all_reviews = []
-        search_after = 0  # 최신순으로 시작
+        search_after = start_search_after  # 최신순으로 시작
         page = 1
         target_date_obj = datetime.strptime(target_date, "%Y-%m-%d")
         
         try:
-            consecutive_404_errors = 0
-            max_404_errors = 5
+            page_retries = 0  # 현재 페이지 재시도 횟수
             
             while True:
                 # API에서 후기 데이터 가져오기 (최신순, 24개씩)
-                reviews, pagination = await self.get_surgery_reviews(
-                    limit=24,  # API 최대 제한
-                    search_after=search_after,
-                    sort="recent"
-                )
+                try:
+                    reviews, pagination = await self.get_surgery_reviews(
+                        limit=24,  # API 최대 제한
+                        search_after=search_after,
+                        sort="recent"
+                    )
+                except PlatformHTTPError as e:
+                    # 호스트 차단은 서킷 브레이커가 담당하고, 여기서는 같은 페이지를 백오프 후 재시도
+                    page_retries += 1
+                    if page_retries > DEFAULT_MAX_RETRIES:
+                        self.log_error(f"❌ 후기 페이지 {page} 재시도 {DEFAULT_MAX_RETRIES}회 실패, 수집을 중단합니다: {e}")
+                        return all_reviews
+                    delay = retry_delay(page_retries)
+                    self.log_warning(f"⚠️ 후기 페이지 {page} 요청 실패 ({e}). {delay:.1f}초 후 재시도 ({page_retries}/{DEFAULT_MAX_RETRIES})")
+                    await asyncio.sleep(delay)
+                    continue
+                page_retries = 0
                 
                 if not reviews:
                     break
                 
                 # 날짜 필터링
                 date_filtered_reviews = []
+                older_reviews_found = False
                 for review in reviews:
                     try:
                         # created_at 파싱 (예: "2025-01-15 16:45:01")
@@ -255,7 +280,8 @@ class BabitalkAPI(LoggedClass):
                             date_filtered_reviews.append(review)
                         elif review_date.date() < target_date_obj.date():
                             # 과거 날짜를 만나면 더 이상 해당 날짜의 후기가 없으므로 중단
-                            return all_reviews
+                            older_reviews_found = True
+                            break
                             
                     except Exception:
                         continue
@@ -263,6 +289,12 @@ class BabitalkAPI(LoggedClass):
                 # 필터링된 후기 추가
                 all_reviews.extend(date_filtered_reviews)
                 
+                if on_page:
+                    await on_page(date_filtered_reviews, pagination.search_after)
+                
+                if older_reviews_found:
+                    break
+                
                 # 다음 페이지 확인
                 if not pagination.has_next or not pagination.search_after:
                     break
@@ -273,22 +305,12 @@ class BabitalkAPI(LoggedClass):
                 # 페이지 간 딜레이 (서버 부하 방지)
                 await asyncio.sleep(1)
             
+            if on_complete:
+                await on_complete()
             return all_reviews
             
         except Exception as e:
-            error_msg = str(e)
-            if "404" in error_msg or "Not Found" in error_msg:
-                consecutive_404_errors += 1
-                self.log_error(f"❌ 404 에러 발생 (연속 {consecutive_404_errors}회): {e}")
-                
-                if consecutive_404_errors >= max_404_errors:
-                    self.log_error(f"🚫 연속 404 에러 {max_404_errors}회 발생. 20분 대기 후 재시도합니다.")
-                    await asyncio.sleep(20 * 60)  # 20분 대기
-                    consecutive_404_errors = 0  # 카운터 리셋
-                else:
-                    await asyncio.sleep(5)  # 5초 대기
-            else:
-                self.log_error(f"❌ 날짜별 후기 수집 중 오류 발생: {e}")
+            self.log_error(f"❌ 날짜별 후기 수집 중 오류 발생: {e}")
             return all_reviews
     
     # 카테고리별 발품후기 수집을 위한 카테고리 정보
@@ -328,50 +350,52 @@ class BabitalkAPI(LoggedClass):
             tuple[List[BabitalkEventAskMemo], BabitalkEventAskMemoPagination]: 발품후기 목록과 페이지네이션 정보
         """
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                # API 엔드포인트
-                url = f"{self.base_url}/v2/event-ask-memos"
-                
-                # 파라미터 구성
-                params = {
-                    "limit": limit,
-                    "category_type": 305,
-                    "sort": sort,
-                    "category_id": category_id
-                }
-                
-                if search_after is not None:
-                    params["search_after"] = search_after
-                
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_msg = f"HTTP {response.status}: {response.reason}"
-                        self.log_error(f"❌ 발품후기 수집 실패: url: {url}, params: {params}")
-                        raise Exception(error_msg)
-                    
-                    json_data = await response.json()
-                    
-                    # 데이터 파싱
-                    memos_data = json_data.get("data", [])
-                    pagination_data = json_data.get("pagination", {})
-                    
-                    # 발품후기 객체 생성
-                    memos = []
-                    for memo_data in memos_data:
-                        try:
-                            memo = self._parse_event_ask_memo(memo_data)
-                            memos.append(memo)
-                        except Exception:
-                            continue
-                    
-                    # 페이지네이션 객체 생성
-                    pagination = BabitalkEventAskMemoPagination(
-                        has_next=pagination_data.get("has_next", False),
-                        search_after=pagination_data.get("search_after")
-                    )
-                    
-                    return memos, pagination
-                    
+            session = await get_platform_session("babitalk")
+            # API 엔드포인트
+            url = f"{self.base_url}/v2/event-ask-memos"
+            
+            # 파라미터 구성
+            params = {
+                "limit": limit,
+                "category_type": 305,
+                "sort": sort,
+                "category_id": category_id
+            }
+            
+            if search_after is not None:
+                params["search_after"] = search_after
+            
+            async with get_circuit_breaker(BABITALK_API_HOST), session.get(url, params=params, headers=self.headers) as response:
+                if response.status != 200:
+                    self.log_error(f"❌ 발품후기 수집 실패: url: {url}, params: {params}")
+                raise_for_status(response)
+                
+                json_data = await response.json()
+                
+                # 데이터 파싱
+                memos_data = json_data.get("data", [])
+                pagination_data = json_data.get("pagination", {})
+                
+                # 발품후기 객체 생성
+                memos = []
+                for memo_data in memos_data:
+                    try:
+                        memo = self._parse_event_ask_memo(memo_data)
+                        memos.append(memo)
+                    except Exception:
+                        continue
+                
+                # 페이지네이션 객체 생성
+                pagination = BabitalkEventAskMemoPagination(
+                    has_next=pagination_data.get("has_next", False),
+                    search_after=pagination_data.get("search_after")
+                )
+                
+                return memos, pagination
+                
+        except PlatformHTTPError:
+            # HTTP 오류는 호출자가 재시도 여부를 판단하도록 전달
+            raise
         except Exception as e:
             self.log_error(f"❌ 발품후기 수집 실패: {e}")
             self.log_error(f"🔍 에러 타입: {type(e).__name__}")
@@ -380,31 +404,50 @@ class BabitalkAPI(LoggedClass):
             return [], BabitalkEventAskMemoPagination(has_next=False, search_after=None)
     
     
-    async def get_event_ask_memos_by_date(self, target_date: str, category_id: int) -> List[BabitalkEventAskMemo]:
+    async def get_event_ask_memos_by_date(self, target_date: str, category_id: int, start_search_after: int = 0,
+                                          on_page: Optional[Callable[[List[BabitalkEventAskMemo], Optional[int]], Awaitable[None]]] = None,
+                                          on_complete: Optional[Callable[[], Awaitable[None]]] = None) -> List[BabitalkEventAskMemo]:
         """
         특정 날짜의 모든 발품후기를 수집합니다.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식)
             category_id: 카테고리 ID
+            start_search_after: 시작 커서 (체크포인트에서 재개할 때 사용, 기본값: 0 - 최신순 처음부터)
+            on_page: 페이지마다 호출되는 콜백 (해당 날짜 발품후기, 다음 페이지 커서)
+            on_complete: 날짜 끝에 도달했을 때만 호출되는 콜백 (요청 실패로 중단되면 호출하지 않음)
         
         Returns:
             List[BabitalkEventAskMemo]: 해당 날짜의 모든 발품후기 목록
         """
         all_memos = []
-        search_after = 0  # 최신순으로 시작
+        search_after = start_search_after  # 최신순으로 시작
         page = 1
         target_date_obj = datetime.strptime(target_date, "%Y-%m-%d")
         
         try:
+            page_retries = 0  # 현재 페이지 재시도 횟수
+            
             while True:
                 # API에서 발품후기 데이터 가져오기 (최신순, 24개씩)
-                memos, pagination = await self.get_event_ask_memos(
-                    category_id=category_id,
-                    limit=24,  # API 최대 제한
-                    search_after=search_after,
-                    sort="recent"
-                )
+                try:
+                    memos, pagination = await self.get_event_ask_memos(
+                        category_id=category_id,
+                        limit=24,  # API 최대 제한
+                        search_after=search_after,
+                        sort="recent"
+                    )
+                except PlatformHTTPError as e:
+                    # 호스트 차단은 서킷 브레이커가 담당하고, 여기서는 같은 페이지를 백오프 후 재시도
+                    page_retries += 1
+                    if page_retries > DEFAULT_MAX_RETRIES:
+                        self.log_error(f"❌ 발품후기 페이지 {page} 재시도 {DEFAULT_MAX_RETRIES}회 실패, 수집을 중단합니다: {e}")
+                        return all_memos
+                    delay = retry_delay(page_retries)
+                    self.log_warning(f"⚠️ 발품후기 페이지 {page} 요청 실패 ({e}). {delay:.1f}초 후 재시도 ({page_retries}/{DEFAULT_MAX_RETRIES})")
+                    await asyncio.sleep(delay)
+                    continue
+                page_retries = 0
                 
                 if not memos:
                     break
@@ -434,13 +477,16 @@ class BabitalkAPI(LoggedClass):
                 # 필터링된 발품후기 추가
                 all_memos.extend(date_filtered_memos)
                 
+                if on_page:
+                    await on_page(date_filtered_memos, pagination.search_after)
+                
                 # 중단 조건 확인
                 if should_stop:
-                    return all_memos
+                    break
                 
                 # 목표 날짜 데이터를 찾지 못했으면 페이지네이션 중단
                 if not found_target_date and page > 1:
-                    return all_memos
+                    break
                 
                 # 다음 페이지 확인
                 if not pagination.has_next or not pagination.search_after:
@@ -452,6 +498,8 @@ class BabitalkAPI(LoggedClass):
                 # 페이지 간 딜레이 (서버 부하 방지)
                 await asyncio.sleep(1)
             
+            if on_complete:
+                await on_complete()
             return all_memos
             
         except Exception as e:
@@ -628,48 +676,49 @@ class BabitalkAPI(LoggedClass):
             tuple[List[BabitalkTalk], BabitalkTalkPagination]: 자유톡 목록과 페이지네이션 정보
         """
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                # API 엔드포인트
-                url = f"{self.base_url}/v2/community/talks"
-                
-                # 파라미터 구성
-                params = {
-                    "service_id": service_id,
-                    "limit": limit,
-                    "sort": sort
-                }
-                
-                if search_after is not None:
-                    params["search_after"] = search_after
-                
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_msg = f"HTTP {response.status}: {response.reason}"
-                        raise Exception(error_msg)
-                    
-                    json_data = await response.json()
-                    
-                    # 데이터 파싱
-                    talks_data = json_data.get("data", [])
-                    pagination_data = json_data.get("pagination", {})
-                    
-                    # 자유톡 객체 생성
-                    talks = []
-                    for talk_data in talks_data:
-                        try:
-                            talk = self._parse_talk(talk_data)
-                            talks.append(talk)
-                        except Exception:
-                            continue
-                    
-                    # 페이지네이션 객체 생성
-                    pagination = BabitalkTalkPagination(
-                        has_next=pagination_data.get("has_next", False),
-                        search_after=pagination_data.get("search_after")
-                    )
-                    
-                    return talks, pagination
-                    
+            session = await get_platform_session("babitalk")
+            # API 엔드포인트
+            url = f"{self.base_url}/v2/community/talks"
+            
+            # 파라미터 구성
+            params = {
+                "service_id": service_id,
+                "limit": limit,
+                "sort": sort
+            }
+            
+            if search_after is not None:
+                params["search_after"] = search_after
+            
+            async with get_circuit_breaker(BABITALK_API_HOST), session.get(url, params=params, headers=self.headers) as response:
+                raise_for_status(response)
+                
+                json_data = await response.json()
+                
+                # 데이터 파싱
+                talks_data = json_data.get("data", [])
+                pagination_data = json_data.get("pagination", {})
+                
+                # 자유톡 객체 생성
+                talks = []
+                for talk_data in talks_data:
+                    try:
+                        talk = self._parse_talk(talk_data)
+                        talks.append(talk)
+                    except Exception:
+                        continue
+                
+                # 페이지네이션 객체 생성
+                pagination = BabitalkTalkPagination(
+                    has_next=pagination_data.get("has_next", False),
+                    search_after=pagination_data.get("search_after")
+                )
+                
+                return talks, pagination
+                
+        except PlatformHTTPError:
+            # HTTP 오류는 호출자가 재시도 여부를 판단하도록 전달
+            raise
         except Exception as e:
             self.log_error(f"❌ 자유톡 수집 실패: {e}")
             self.log_error(f"🔍 에러 타입: {type(e).__name__}")
@@ -678,31 +727,50 @@ class BabitalkAPI(LoggedClass):
             return [], BabitalkTalkPagination(has_next=False, search_after=None)
     
     
-    async def get_talks_by_date(self, target_date: str, service_id: int) -> List[BabitalkTalk]:
+    async def get_talks_by_date(self, target_date: str, service_id: int, start_search_after: int = 0,
+                                on_page: Optional[Callable[[List[BabitalkTalk], Optional[int]], Awaitable[None]]] = None,
+                                on_complete: Optional[Callable[[], Awaitable[None]]] = None) -> List[BabitalkTalk]:
         """
         특정 날짜의 모든 자유톡을 수집합니다.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식)
             service_id: 서비스 ID (79: 성형, 71: 쁘띠/피부, 72: 일상)
+            start_search_after: 시작 커서 (체크포인트에서 재개할 때 사용, 기본값: 0 - 최신순 처음부터)
+            on_page: 페이지마다 호출되는 콜백 (해당 날짜 자유톡, 다음 페이지 커서)
+            on_complete: 날짜 끝에 도달했을 때만 호출되는 콜백 (요청 실패로 중단되면 호출하지 않음)
         
         Returns:
             List[BabitalkTalk]: 해당 날짜의 모든 자유톡 목록
         """
         all_talks = []
-        search_after = 0  # 최신순으로 시작
+        search_after = start_search_after  # 최신순으로 시작
         page = 1
         target_date_obj = datetime.strptime(target_date, "%Y-%m-%d")
         
         try:
+            page_retries = 0  # 현재 페이지 재시도 횟수
+            
             while True:
                 # API에서 자유톡 데이터 가져오기 (최신순, 24개씩)
-                talks, pagination = await self.get_talks(
-                    service_id=service_id,
-                    limit=24,  # API 최대 제한
-                    search_after=search_after,
-                    sort="recent"
-                )
+                try:
+                    talks, pagination = await self.get_talks(
+                        service_id=service_id,
+                        limit=24,  # API 최대 제한
+                        search_after=search_after,
+                        sort="recent"
+                    )
+                except PlatformHTTPError as e:
+                    # 호스트 차단은 서킷 브레이커가 담당하고, 여기서는 같은 페이지를 백오프 후 재시도
+                    page_retries += 1
+                    if page_retries > DEFAULT_MAX_RETRIES:
+                        self.log_error(f"❌ 자유톡 페이지 {page} 재시도 {DEFAULT_MAX_RETRIES}회 실패, 수집을 중단합니다: {e}")
+                        return all_talks
+                    delay = retry_delay(page_retries)
+                    self.log_warning(f"⚠️ 자유톡 페이지 {page} 요청 실패 ({e}). {delay:.1f}초 후 재시도 ({page_retries}/{DEFAULT_MAX_RETRIES})")
+                    await asyncio.sleep(delay)
+                    continue
+                page_retries = 0
                 
                 if not talks:
                     break
@@ -740,9 +808,12 @@ class BabitalkAPI(LoggedClass):
                 # 필터링된 자유톡 추가
                 all_talks.extend(date_filtered_talks)
                 
+                if on_page:
+                    await on_page(date_filtered_talks, pagination.search_after)
+                
                 # 중단 조건 확인 - 과거 날짜를 만났으면 중단
                 if should_stop:
-                    return all_talks
+                    break
                 
                 # 다음 페이지 확인
                 if not pagination.has_next or not pagination.search_after:
@@ -754,6 +825,8 @@ class BabitalkAPI(LoggedClass):
                 # 페이지 간 딜레이 (서버 부하 방지)
                 await asyncio.sleep(1)
             
+            if on_complete:
+                await on_complete()
             return all_talks
             
         except Exception as e:
@@ -822,42 +895,40 @@ class BabitalkAPI(LoggedClass):
             tuple[List[BabitalkComment], BabitalkCommentPagination]: 댓글 목록과 페이지네이션 정보
         """
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                # API 엔드포인트
-                url = f"{self.base_url}/v2/community/talks/{talk_id}/comments"
-                
-                # 파라미터 구성
-                params = {
-                    "page": page
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        error_msg = f"HTTP {response.status}: {response.reason}"
-                        raise Exception(error_msg)
-                    
-                    json_data = await response.json()
-                    
-                    # 데이터 파싱
-                    comments_data = json_data.get("data", [])
-                    pagination_data = json_data.get("pagination", {})
-                    
-                    # 댓글 객체 생성
-                    comments = []
-                    for comment_data in comments_data:
-                        try:
-                            comment = self._parse_comment(comment_data)
-                            comments.append(comment)
-                        except Exception:
-                            continue
-                    
-                    # 페이지네이션 객체 생성
-                    pagination = BabitalkCommentPagination(
-                        has_next=pagination_data.get("has_next", False)
-                    )
-                    
-                    return comments, pagination
-                    
+            session = await get_platform_session("babitalk")
+            # API 엔드포인트
+            url = f"{self.base_url}/v2/community/talks/{talk_id}/comments"
+            
+            # 파라미터 구성
+            params = {
+                "page": page
+            }
+            
+            async with get_circuit_breaker(BABITALK_API_HOST), session.get(url, params=params, headers=self.headers) as response:
+                raise_for_status(response)
+                
+                json_data = await response.json()
+                
+                # 데이터 파싱
+                comments_data = json_data.get("data", [])
+                pagination_data = json_data.get("pagination", {})
+                
+                # 댓글 객체 생성
+                comments = []
+                for comment_data in comments_data:
+                    try:
+                        comment = self._parse_comment(comment_data)
+                        comments.append(comment)
+                    except Exception:
+                        continue
+                
+                # 페이지네이션 객체 생성
+                pagination = BabitalkCommentPagination(
+                    has_next=pagination_data.get("has_next", False)
+                )
+                
+                return comments, pagination
+                
         except Exception as e:
             self.log_error(f"❌ 댓글 수집 실패: {e}")
             self.log_error(f"🔍 에러 타입: {type(e).__name__}")
@@ -0,0 +1,301 @@
+"""
+호스트별 서킷 브레이커와 HTTP 오류 타입
+
+연속 실패가 임계값을 넘으면 해당 호스트로의 요청만 지수 백오프(+지터) 동안 멈추고,
+대기 시간이 지나면 요청 1건으로 상태를 확인(half-open)한 뒤 정상화 여부를 판단합니다.
+고정 15/20분 대기와 예외 메시지 문자열 비교를 대체합니다.
+"""
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+from utils.logger import LoggedClass
+
+# 서킷 브레이커 기본 설정
+DEFAULT_FAILURE_THRESHOLD = 5       # 연속 실패 허용 횟수 (초과 시 OPEN)
+DEFAULT_BASE_OPEN_SECONDS = 30.0    # 첫 차단 시간 (초)
+DEFAULT_MAX_OPEN_SECONDS = 600.0    # 최대 차단 시간 (초)
+DEFAULT_JITTER_RATIO = 0.2          # 차단 시간에 더할 무작위 편차 비율
+
+# 페이지 단위 재시도 설정
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BASE_SECONDS = 2.0
+DEFAULT_RETRY_MAX_SECONDS = 60.0
+
+# 호스트 이상 신호로 간주하는 상태 코드 (강남언니는 차단 시 404를 반환함)
+FAILURE_STATUSES = {403, 404, 408, 429}
+
+
+class PlatformHTTPError(Exception):
+    """플랫폼 API 가 200 이외의 상태 코드를 반환한 경우"""
+
+    def __init__(self, status: int, reason: str = "", url: str = ""):
+        self.status = status
+        self.reason = reason or ""
+        self.url = url or ""
+        super().__init__(f"HTTP {status}: {self.reason}" + (f" ({self.url})" if self.url else ""))
+
+    @property
+    def is_failure(self) -> bool:
+        """서킷 브레이커 실패로 집계할 오류인지 여부"""
+        return self.status in FAILURE_STATUSES or self.status >= 500
+
+
+class NotFoundError(PlatformHTTPError):
+    """404 Not Found"""
+
+
+class TooManyRequestsError(PlatformHTTPError):
+    """429 Too Many Requests"""
+
+
+class ServerError(PlatformHTTPError):
+    """5xx 서버 오류"""
+
+
+def http_error_for_status(status: int, reason: str = "", url: str = "") -> PlatformHTTPError:
+    """상태 코드에 맞는 HTTP 오류 객체 생성"""
+    if status == 404:
+        return NotFoundError(status, reason, url)
+    if status == 429:
+        return TooManyRequestsError(status, reason, url)
+    if status >= 500:
+        return ServerError(status, reason, url)
+    return PlatformHTTPError(status, reason, url)
+
+
+def raise_for_status(response: aiohttp.ClientResponse):
+    """응답 상태 코드가 200이 아니면 타입이 지정된 HTTP 오류 발생"""
+    if response.status != 200:
+        raise http_error_for_status(response.status, response.reason or "", str(response.url))
+
+
+def is_failure_exception(exc: BaseException) -> bool:
+    """서킷 브레이커 실패로 집계할 예외인지 여부"""
+    if isinstance(exc, PlatformHTTPError):
+        return exc.is_failure
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def retry_delay(attempt: int, base: float = DEFAULT_RETRY_BASE_SECONDS,
+                cap: float = DEFAULT_RETRY_MAX_SECONDS) -> float:
+    """
+    재시도 대기 시간 계산 (지수 백오프 + 지터)
+
+    Args:
+        attempt: 재시도 횟수 (1부터 시작)
+
+    Returns:
+        float: 대기 시간 (초) - 계산된 백오프의 50~100% 범위
+    """
+    delay = min(cap, base * (2 ** max(0, attempt - 1)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class CircuitState:
+    """서킷 브레이커 상태"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker(LoggedClass):
+    """
+    호스트 단위 서킷 브레이커
+
+    async with 로 요청을 감싸면 OPEN 상태에서는 차단 시간이 끝날 때까지 대기하고,
+    HALF_OPEN 상태에서는 확인 요청 1건만 통과시킨 뒤 결과에 따라 CLOSED/OPEN 으로 전환합니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 base_open_seconds: float = DEFAULT_BASE_OPEN_SECONDS,
+                 max_open_seconds: float = DEFAULT_MAX_OPEN_SECONDS,
+                 jitter_ratio: float = DEFAULT_JITTER_RATIO):
+        super().__init__("CircuitBreaker")
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold는 0보다 커야 합니다.")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_open_seconds = base_open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.jitter_ratio = jitter_ratio
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0             # 정상화 전까지 연속으로 차단된 횟수 (백오프 지수)
+        self.total_failures = 0
+        self.total_opens = 0
+        self.opened_at: Optional[float] = None
+        self.open_until: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+        # asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._state_changed: Optional[asyncio.Event] = None
+
+    def _ensure_primitives(self):
+        """현재 이벤트 루프용 이벤트 준비"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._state_changed = asyncio.Event()
+            self._probe_in_flight = False
+
+    def _notify(self):
+        """대기 중인 요청에 상태 변경 알림"""
+        if self._state_changed is not None:
+            self._state_changed.set()
+            self._state_changed = asyncio.Event()
+
+    def _open_duration(self) -> float:
+        """현재 차단 횟수에 따른 차단 시간 (지수 백오프 + 지터)"""
+        delay = min(self.max_open_seconds, self.base_open_seconds * (2 ** max(0, self.open_count - 1)))
+        jitter = delay * self.jitter_ratio
+        return max(0.0, delay + random.uniform(-jitter, jitter))
+
+    def _open(self):
+        """OPEN 상태로 전환"""
+        self.open_count += 1
+        self.total_opens += 1
+        duration = self._open_duration()
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.open_until = self.opened_at + duration
+        self._probe_in_flight = False
+        self.log_warning(
+            f"🚫 {self.name} 서킷 OPEN: 연속 실패 {self.consecutive_failures}회, "
+            f"{duration:.1f}초 동안 요청 중단 (마지막 오류: {self.last_error})"
+        )
+        self._notify()
+
+    def record_success(self):
+        """요청 성공 기록"""
+        if self.state != CircuitState.CLOSED:
+            self.log_info(f"✅ {self.name} 서킷 CLOSED: 확인 요청 성공")
+            self._notify()
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.opened_at = None
+        self.open_until = None
+        self._probe_in_flight = False
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        """요청 실패 기록"""
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        if error is not None:
+            self.last_error = f"{type(error).__name__}: {error}"
+
+        if self.state == CircuitState.HALF_OPEN:
+            # 확인 요청이 실패하면 더 긴 시간 동안 다시 차단
+            self._open()
+        elif self.state == CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    async def before_request(self):
+        """요청 전 호출: OPEN 이면 차단 시간이 끝날 때까지, 확인 요청 진행 중이면 결과가 나올 때까지 대기"""
+        self._ensure_primitives()
+        while True:
+            if self.state == CircuitState.CLOSED:
+                return
+
+            if self.state == CircuitState.OPEN:
+                remaining = (self.open_until or 0) - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+                self.state = CircuitState.HALF_OPEN
+                self.log_info(f"🔎 {self.name} 서킷 HALF-OPEN: 확인 요청 1건 진행")
+
+            if self.state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+
+            # 다른 요청이 확인 중이면 결과가 나올 때까지 대기
+            await self._state_changed.wait()
+
+    async def __aenter__(self):
+        await self.before_request()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc is None:
+            self.record_success()
+        elif is_failure_exception(exc):
+            self.record_failure(exc)
+        elif isinstance(exc, Exception):
+            # 서버가 응답했으나 파싱 등에서 실패한 경우는 호스트 정상으로 간주
+            self.record_success()
+        elif self._probe_in_flight:
+            # 확인 요청이 취소된 경우 다른 요청이 다시 확인할 수 있도록 해제
+            self._probe_in_flight = False
+            self._notify()
+        return False
+
+    def get_state(self) -> Dict:
+        """서킷 상태 반환"""
+        remaining = None
+        if self.state == CircuitState.OPEN and self.open_until is not None:
+            remaining = round(max(0.0, self.open_until - time.monotonic()), 1)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "open_count": self.open_count,
+            "total_failures": self.total_failures,
+            "total_opens": self.total_opens,
+            "open_remaining_seconds": remaining,
+            "last_error": self.last_error,
+        }
+
+
+class CircuitBreakerRegistry(LoggedClass):
+    """호스트별 공유 서킷 브레이커 관리자"""
+
+    def __init__(self):
+        super().__init__("CircuitBreakerRegistry")
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        """호스트의 공유 서킷 브레이커 반환 (없으면 기본값으로 생성)"""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host)
+            self._breakers[host] = breaker
+        return breaker
+
+    def configure(self, host: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                  base_open_seconds: float = DEFAULT_BASE_OPEN_SECONDS,
+                  max_open_seconds: float = DEFAULT_MAX_OPEN_SECONDS):
+        """호스트별 서킷 설정 변경 (기존 브레이커는 교체됨)"""
+        self._breakers[host] = CircuitBreaker(host, failure_threshold, base_open_seconds, max_open_seconds)
+        self.log_info(
+            f"⚙️ {host} 서킷 설정: 연속 실패 {failure_threshold}회, "
+            f"차단 {base_open_seconds}~{max_open_seconds}초"
+        )
+
+    def reset(self, host: Optional[str] = None):
+        """서킷 상태 초기화 (host 미지정 시 전체)"""
+        targets = [host] if host else list(self._breakers.keys())
+        for target in targets:
+            breaker = self._breakers.get(target)
+            if breaker:
+                breaker.record_success()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """호스트별 서킷 상태 반환"""
+        return {host: breaker.get_state() for host, breaker in self._breakers.items()}
+
+
+# 전역 서킷 브레이커 레지스트리
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """호스트의 공유 서킷 브레이커 반환 (편의 함수)"""
+    return circuit_breakers.get(host)
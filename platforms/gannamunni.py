@@ -2,7 +2,7 @@ import asyncio
 import aiohttp
 import json
 import re
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime, date
 import sys
@@ -12,6 +12,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.logger import LoggedClass
+from platforms.http_session import get_platform_session
+from platforms.rate_limiter import get_rate_limiter
+from platforms.circuit_breaker import (
+    PlatformHTTPError, get_circuit_breaker, raise_for_status, retry_delay, DEFAULT_MAX_RETRIES
+)
 
 @dataclass
 class Writer:
@@ -213,42 +218,48 @@ class GangnamUnniAPI(LoggedClass):
                 "categoryIds": category_id
             }
             
-            async with aiohttp.ClientSession() as session:
+            session = await get_platform_session("gangnamunni")
+            async with get_circuit_breaker("www.gangnamunni.com"):
                 async with session.get(url, params=params, headers=api_headers) as response:
-                    if response.status == 404:
-                        raise Exception(f"404 Not Found: 게시글을 찾을 수 없습니다")
-                    elif response.status != 200:
-                        raise Exception(f"HTTP {response.status}: {response.reason}")
-                    
+                    raise_for_status(response)
                     json_data = await response.json()
-                    
-                    # SUCCESS 응답 확인
-                    if json_data.get("reason") != "SUCCESS":
-                        self.log_error(f"API 응답 오류: {json_data.get('reason')}")
-                        return []
-                    
-                    # data 배열에서 게시글 목록 추출
-                    articles_data = json_data.get("data", [])
-                    
-                    articles = []
-                    for item in articles_data:
-                        article = self._parse_article_from_solar_api(item)
-                        articles.append(article)
-                    
-                    return articles
-                    
+                
+            # SUCCESS 응답 확인
+            if json_data.get("reason") != "SUCCESS":
+                self.log_error(f"API 응답 오류: {json_data.get('reason')}")
+                return []
+            
+            # data 배열에서 게시글 목록 추출
+            articles_data = json_data.get("data", [])
+            
+            articles = []
+            for item in articles_data:
+                article = self._parse_article_from_solar_api(item)
+                articles.append(article)
+            
+            return articles
+                
+        except PlatformHTTPError:
+            # HTTP 오류는 호출자가 재시도 여부를 판단하도록 전달
+            raise
         except Exception as e:
             self.log_error(f"게시글 목록 가져오기 실패: {e}")
             # API 실패 시 빈 리스트 반환
             return []
     
-    async def get_articles_by_date(self, target_date: str, category: str = "hospital_question") -> List[Article]:
+    async def get_articles_by_date(self, target_date: str, category: str = "hospital_question",
+                                   start_page: int = 1,
+                                   on_page: Optional[Callable[[List[Article], int], Awaitable[None]]] = None,
+                                   on_complete: Optional[Callable[[], Awaitable[None]]] = None) -> List[Article]:
         """
         특정 날짜의 게시글을 수집합니다.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식, 예: "2024-01-15")
             category: 카테고리 (기본값: "hospital_question" - 병원질문)
+            start_page: 시작 페이지 (체크포인트에서 재개할 때 사용, 기본값: 1)
+            on_page: 페이지마다 호출되는 콜백 (해당 날짜 게시글, 다음 페이지 번호)
+            on_complete: 날짜 끝에 도달했을 때만 호출되는 콜백 (요청 실패로 중단되면 호출하지 않음)
         
         Returns:
             List[Article]: 해당 날짜의 게시글 목록
@@ -261,18 +272,18 @@ class GangnamUnniAPI(LoggedClass):
             return []
         
         all_articles = []
-        page = 1
+        page = start_page
         max_pages = 100  # 최대 페이지 수 제한
         consecutive_empty_pages = 0  # 연속으로 빈 페이지가 나온 횟수
         max_consecutive_empty = 3  # 최대 연속 빈 페이지 수
         found_target_date = False  # 목표 날짜 게시글을 찾았는지 확인
-        consecutive_404_errors = 0  # 연속 404 에러 횟수
-        max_404_errors = 5  # 최대 연속 404 에러 허용 횟수
+        page_retries = 0  # 현재 페이지 재시도 횟수
         
         while page <= max_pages and consecutive_empty_pages < max_consecutive_empty:
             try:
                 # 현재 페이지의 게시글 가져오기
                 page_articles = await self.get_article_list(category=category, page=page)
+                page_retries = 0
                 
                 if not page_articles:
                     consecutive_empty_pages += 1
@@ -307,34 +318,41 @@ class GangnamUnniAPI(LoggedClass):
                 if target_date_articles:
                     all_articles.extend(target_date_articles)
                 
-                # 더 오래된 게시글이 발견되면 수집 중단
-                if older_articles_found:
-                    break
-                
-                # 페이지 간 딜레이 (서버 부하 방지)
-                await asyncio.sleep(1)
+            except PlatformHTTPError as e:
+                # 호스트 차단은 서킷 브레이커가 담당하고, 여기서는 같은 페이지를 백오프 후 재시도
+                page_retries += 1
+                if page_retries <= DEFAULT_MAX_RETRIES:
+                    delay = retry_delay(page_retries)
+                    self.log_warning(f"⚠️ 페이지 {page} 요청 실패 ({e}). {delay:.1f}초 후 재시도 ({page_retries}/{DEFAULT_MAX_RETRIES})")
+                    await asyncio.sleep(delay)
+                    continue
                 
-                page += 1
+                # 실패한 페이지를 건너뛰면 체크포인트 커서가 그 뒤로 넘어가므로 여기서 중단하고 재개에 맡김
+                self.log_error(f"❌ 페이지 {page} 재시도 {DEFAULT_MAX_RETRIES}회 실패, 수집을 중단합니다: {e}")
+                return all_articles
                 
             except Exception as e:
-                error_msg = str(e)
-                if "404" in error_msg or "Not Found" in error_msg:
-                    consecutive_404_errors += 1
-                    self.log_error(f"❌ 404 에러 발생 (연속 {consecutive_404_errors}회): {e}")
-                    
-                    if consecutive_404_errors >= max_404_errors:
-                        self.log_error(f"🚫 연속 404 에러 {max_404_errors}회 발생. 20분 대기 후 재시도합니다.")
-                        await asyncio.sleep(20 * 60)  # 20분 대기
-                        consecutive_404_errors = 0  # 카운터 리셋
-                    else:
-                        await asyncio.sleep(5)  # 5초 대기
-                else:
-                    self.log_error(f"페이지 {page} 수집 실패: {e}")
-                    consecutive_empty_pages += 1
-                
+                self.log_error(f"페이지 {page} 수집 실패: {e}")
+                consecutive_empty_pages += 1
                 page += 1
                 await asyncio.sleep(2)
+                continue
+            
+            # 저장 콜백은 요청 실패 처리 밖에서 호출: 저장 오류를 실패한 페이지로 삼켜 체크포인트가 넘어가지 않도록 그대로 전파
+            if on_page:
+                await on_page(target_date_articles, page + 1)
+            
+            # 더 오래된 게시글이 발견되면 수집 중단
+            if older_articles_found:
+                break
+            
+            # 페이지 간 딜레이 (서버 부하 방지)
+            await asyncio.sleep(1)
+            
+            page += 1
         
+        if on_complete:
+            await on_complete()
         return all_articles
     
     def _parse_article_date(self, time_str: str) -> date:
@@ -356,68 +374,64 @@ class GangnamUnniAPI(LoggedClass):
             # 오류 발생 시 오늘 날짜 반환
             return datetime.now().date()
     
-    async def get_comments(self, article_id: int) -> List[Comment]:
+    async def get_comments(self, article_id: int, raise_http_errors: bool = False) -> List[Comment]:
         """
         특정 게시글의 댓글 목록을 가져옵니다.
         
         Args:
             article_id: 게시글 ID
+            raise_http_errors: True이면 HTTP 오류를 빈 리스트 대신 PlatformHTTPError로 전달 (기본값: False)
         
         Returns:
             List[Comment]: 댓글 목록
         """
-        
-        # 게시글별 5초 딜레이 (과부하 방지)
-        await asyncio.sleep(5)
-        
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                # 게시글 상세 페이지 URL
-                url = f"{self.base_url}/community/{article_id}"
-                async with session.get(url) as response:
-                    
-                    if response.status == 404:
-                        error_msg = f"404 Not Found: 게시글 ID {article_id}를 찾을 수 없습니다"
-                        self.log_error(f"        ❌ HTTP 오류: {error_msg}")
-                        raise Exception(error_msg)
-                    elif response.status != 200:
-                        error_msg = f"HTTP {response.status}: {response.reason}"
-                        self.log_error(f"        ❌ HTTP 오류: {error_msg}")
-                        raise Exception(error_msg)
-                    
+            session = await get_platform_session("gangnamunni")
+            # 게시글 상세 페이지 URL
+            url = f"{self.base_url}/community/{article_id}"
+            # 호스트별 속도 제한 (고정 딜레이 대신 초당 요청 수/동시 요청 수로 제어)
+            # 서킷 브레이커가 열려 있으면 이 호스트 요청만 대기
+            async with get_circuit_breaker("www.gangnamunni.com"), get_rate_limiter("www.gangnamunni.com"):
+                async with session.get(url, headers=self.headers) as response:
+                    raise_for_status(response)
                     html_content = await response.text()
-                    
-                    # __NEXT_DATA__ 스크립트에서 댓글 데이터 추출
-                    import re
-                    import json
-                    
-                    # __NEXT_DATA__ 스크립트 태그 찾기
-                    next_data_pattern = r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>'
-                    match = re.search(next_data_pattern, html_content, re.DOTALL)
-                    
-                    if not match:
-                        self.log_error(f"        ❌ __NEXT_DATA__ 스크립트를 찾을 수 없습니다.")
-                        return []
-                    
+                
+            # __NEXT_DATA__ 스크립트에서 댓글 데이터 추출
+            import re
+            import json
+            
+            # __NEXT_DATA__ 스크립트 태그 찾기
+            next_data_pattern = r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>'
+            match = re.search(next_data_pattern, html_content, re.DOTALL)
+            
+            if not match:
+                self.log_error(f"        ❌ __NEXT_DATA__ 스크립트를 찾을 수 없습니다.")
+                return []
+            
+            try:
+                next_data = json.loads(match.group(1))
+                # 댓글 데이터 추출
+                comments_data = next_data.get("props", {}).get("pageProps", {}).get("communityDocumentComments", [])
+                
+                comments = []
+                for i, comment_data in enumerate(comments_data):
                     try:
-                        next_data = json.loads(match.group(1))
-                        # 댓글 데이터 추출
-                        comments_data = next_data.get("props", {}).get("pageProps", {}).get("communityDocumentComments", [])
-                        
-                        comments = []
-                        for i, comment_data in enumerate(comments_data):
-                            try:
-                                comment = self._parse_comment_from_ssr(comment_data)
-                                comments.append(comment)
-                            except Exception as parse_error:
-                                self.log_warning(f"        ⚠️  댓글 {i+1} 파싱 실패: {parse_error}")
-                        
-                        return comments
-                        
-                    except json.JSONDecodeError as e:
-                        self.log_error(f"        ❌ JSON 파싱 실패: {e}")
-                        return []
-                    
+                        comment = self._parse_comment_from_ssr(comment_data)
+                        comments.append(comment)
+                    except Exception as parse_error:
+                        self.log_warning(f"        ⚠️  댓글 {i+1} 파싱 실패: {parse_error}")
+                
+                return comments
+                
+            except json.JSONDecodeError as e:
+                self.log_error(f"        ❌ JSON 파싱 실패: {e}")
+                return []
+            
+        except PlatformHTTPError as e:
+            self.log_error(f"        ❌ HTTP 오류 (게시글 ID {article_id}): {e}")
+            if raise_http_errors:
+                raise
+            return []
         except Exception as e:
             self.log_error(f"        ❌ 댓글 수집 실패: {e}")
             self.log_error(f"        🔍 에러 타입: {type(e).__name__}")
@@ -794,34 +808,41 @@ class GangnamUnniAPI(LoggedClass):
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
+            session = await get_platform_session("gangnamunni")
+            async with get_circuit_breaker("env.gnsister.com"):
                 async with session.post(url, json=payload, headers=headers) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}: {response.reason}")
-                    
+                    raise_for_status(response)
                     json_data = await response.json()
-                    
-                    # contents 배열에서 리뷰 목록 추출
-                    reviews_data = json_data.get("contents", [])
-                    
-                    reviews = []
-                    for item in reviews_data:
-                        review = self._parse_review_from_api(item)
-                        reviews.append(review)
-                    
-                    return reviews
-                    
+                
+            # contents 배열에서 리뷰 목록 추출
+            reviews_data = json_data.get("contents", [])
+            
+            reviews = []
+            for item in reviews_data:
+                review = self._parse_review_from_api(item)
+                reviews.append(review)
+            
+            return reviews
+                
+        except PlatformHTTPError:
+            # HTTP 오류는 호출자가 재시도 여부를 판단하도록 전달
+            raise
         except Exception as e:
             self.log_error(f"리뷰 목록 가져오기 실패: {e}")
             return []
 
-    async def get_reviews_by_date(self, target_date: str, max_pages: int = 50) -> List[Review]:
+    async def get_reviews_by_date(self, target_date: str, max_pages: int = 50, start_page_index: int = 0,
+                                  on_page: Optional[Callable[[List[Review], int], Awaitable[None]]] = None,
+                                  on_complete: Optional[Callable[[], Awaitable[None]]] = None) -> List[Review]:
         """
         특정 날짜의 리뷰를 수집합니다.
         
         Args:
             target_date: 수집할 날짜 (YYYY-MM-DD 형식, 예: "2024-01-15")
             max_pages: 최대 수집할 페이지 수 (기본값: 50)
+            start_page_index: 시작 페이지 인덱스 (체크포인트에서 재개할 때 사용, 기본값: 0)
+            on_page: 페이지마다 호출되는 콜백 (해당 날짜 리뷰, 다음 페이지 인덱스)
+            on_complete: 날짜 끝에 도달했을 때만 호출되는 콜백 (요청 실패로 중단되면 호출하지 않음)
         
         Returns:
             List[Review]: 해당 날짜의 리뷰 목록
@@ -834,18 +855,17 @@ class GangnamUnniAPI(LoggedClass):
             return []
         
         all_reviews = []
-        page_index = 0
+        page_index = start_page_index
         consecutive_empty_pages = 0
         max_consecutive_empty = 3
         found_target_date = False
-        consecutive_404_errors = 0
-        max_404_errors = 5
+        page_retries = 0
         
         while page_index < max_pages and consecutive_empty_pages < max_consecutive_empty:
             try:
                 # 현재 페이지의 리뷰 가져오기
                 page_reviews = await self.get_reviews(page_index=page_index, page_size=20)
-                
+                page_retries = 0
                 
                 if not page_reviews:
                     consecutive_empty_pages += 1
@@ -882,34 +902,41 @@ class GangnamUnniAPI(LoggedClass):
                 if target_date_reviews:
                     all_reviews.extend(target_date_reviews)
                 
-                # 더 오래된 리뷰가 발견되면 수집 중단
-                if older_reviews_found:
-                    break
-                
-                # 페이지 간 딜레이 (서버 부하 방지)
-                await asyncio.sleep(1)
+            except PlatformHTTPError as e:
+                # 호스트 차단은 서킷 브레이커가 담당하고, 여기서는 같은 페이지를 백오프 후 재시도
+                page_retries += 1
+                if page_retries <= DEFAULT_MAX_RETRIES:
+                    delay = retry_delay(page_retries)
+                    self.log_warning(f"⚠️ 리뷰 페이지 {page_index} 요청 실패 ({e}). {delay:.1f}초 후 재시도 ({page_retries}/{DEFAULT_MAX_RETRIES})")
+                    await asyncio.sleep(delay)
+                    continue
                 
-                page_index += 1
+                # 실패한 페이지를 건너뛰면 체크포인트 커서가 그 뒤로 넘어가므로 여기서 중단하고 재개에 맡김
+                self.log_error(f"❌ 리뷰 페이지 {page_index} 재시도 {DEFAULT_MAX_RETRIES}회 실패, 수집을 중단합니다: {e}")
+                return all_reviews
                 
             except Exception as e:
-                error_msg = str(e)
-                if "404" in error_msg or "Not Found" in error_msg:
-                    consecutive_404_errors += 1
-                    self.log_error(f"❌ 404 에러 발생 (연속 {consecutive_404_errors}회): {e}")
-                    
-                    if consecutive_404_errors >= max_404_errors:
-                        self.log_error(f"🚫 연속 404 에러 {max_404_errors}회 발생. 20분 대기 후 재시도합니다.")
-                        await asyncio.sleep(20 * 60)  # 20분 대기
-                        consecutive_404_errors = 0  # 카운터 리셋
-                    else:
-                        await asyncio.sleep(5)  # 5초 대기
-                else:
-                    self.log_error(f"페이지 {page_index} 수집 실패: {e}")
-                    consecutive_empty_pages += 1
-                
+                self.log_error(f"페이지 {page_index} 수집 실패: {e}")
+                consecutive_empty_pages += 1
                 page_index += 1
                 await asyncio.sleep(2)
+                continue
+            
+            # 저장 콜백은 요청 실패 처리 밖에서 호출: 저장 오류를 실패한 페이지로 삼켜 체크포인트가 넘어가지 않도록 그대로 전파
+            if on_page:
+                await on_page(target_date_reviews, page_index + 1)
+            
+            # 더 오래된 리뷰가 발견되면 수집 중단
+            if older_reviews_found:
+                break
+            
+            # 페이지 간 딜레이 (서버 부하 방지)
+            await asyncio.sleep(1)
+            
+            page_index += 1
         
+        if on_complete:
+            await on_complete()
         return all_reviews
 
     async def get_review_detail(self, review_id: int) -> Optional[dict]:
@@ -923,19 +950,57 @@ class GangnamUnniAPI(LoggedClass):
         payload = {"id": review_id}
         
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await get_platform_session("gangnamunni")
+            async with get_circuit_breaker("env.gnsister.com"), get_rate_limiter("env.gnsister.com"):
                 async with session.post(url, json=payload, headers=headers) as response:
-                    if response.status != 200:
-                        self.log_error(f"❌ 리뷰 상세 조회 실패 (ID: {review_id}): HTTP {response.status}")
-                        return None
-                    
+                    raise_for_status(response)
                     json_data = await response.json()
                     return json_data
-                    
+                
+        except PlatformHTTPError as e:
+            self.log_error(f"❌ 리뷰 상세 조회 실패 (ID: {review_id}): {e}")
+            return None
         except Exception as e:
             self.log_error(f"❌ 리뷰 상세 조회 중 오류 (ID: {review_id}): {e}")
             return None
 
+    async def get_comments_for_articles(self, article_ids: List[int]) -> Dict[int, Optional[List[Comment]]]:
+        """
+        여러 게시글의 댓글을 병렬로 가져옵니다. (호스트별 속도 제한 적용)
+        
+        Args:
+            article_ids: 게시글 ID 목록
+        
+        Returns:
+            Dict[int, Optional[List[Comment]]]: 게시글 ID -> 댓글 목록 (HTTP 오류로 조회하지 못한 경우 None)
+        """
+        results = await asyncio.gather(
+            *(self.get_comments(article_id, raise_http_errors=True) for article_id in article_ids),
+            return_exceptions=True
+        )
+        comments_by_article = {}
+        for article_id, result in zip(article_ids, results):
+            if isinstance(result, PlatformHTTPError):
+                comments_by_article[article_id] = None
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                comments_by_article[article_id] = result
+        return comments_by_article
+
+    async def get_review_details(self, review_ids: List[int]) -> Dict[int, Optional[dict]]:
+        """
+        여러 리뷰의 상세 정보를 병렬로 가져옵니다. (호스트별 속도 제한 적용)
+        
+        Args:
+            review_ids: 리뷰 ID 목록
+        
+        Returns:
+            Dict[int, Optional[dict]]: 리뷰 ID -> 상세 정보 (실패 시 None)
+        """
+        results = await asyncio.gather(*(self.get_review_detail(review_id) for review_id in review_ids))
+        return dict(zip(review_ids, results))
+
     def _parse_review_date(self, utc_time_str: str) -> date:
         """
         리뷰의 UTC 시간 문자열을 날짜로 파싱합니다.
@@ -0,0 +1,159 @@
+"""
+플랫폼 공용 HTTP 세션 관리자
+
+플랫폼별로 하나의 aiohttp.ClientSession 을 유지하여
+DNS 조회/TCP/TLS 핸드셰이크를 요청마다 반복하지 않도록 합니다.
+"""
+import asyncio
+import aiohttp
+from typing import Dict, Optional, Tuple
+
+from utils.logger import LoggedClass
+
+# 커넥션 풀 기본 설정
+DEFAULT_CONNECTION_LIMIT = 100      # 세션 전체 동시 연결 수
+DEFAULT_LIMIT_PER_HOST = 10         # 호스트별 동시 연결 수
+DEFAULT_DNS_CACHE_TTL = 300         # DNS 캐시 유지 시간 (초)
+DEFAULT_KEEPALIVE_TIMEOUT = 30      # 유휴 연결 유지 시간 (초)
+DEFAULT_REQUEST_TIMEOUT = 60        # 요청 전체 타임아웃 (초)
+
+
+class HttpSessionManager(LoggedClass):
+    """플랫폼별 공유 aiohttp 세션 관리자"""
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        ttl_dns_cache: int = DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout: int = DEFAULT_KEEPALIVE_TIMEOUT,
+        request_timeout: int = DEFAULT_REQUEST_TIMEOUT
+    ):
+        super().__init__("HttpSessionManager")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+        # 플랫폼명 -> (세션, 세션이 생성된 이벤트 루프)
+        self._sessions: Dict[str, Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """현재 이벤트 루프용 락 반환"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """커넥션 풀이 설정된 새 세션 생성"""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        # 쿠키는 요청 헤더로만 전달하고, 응답 쿠키가 인스턴스 간에 공유되지 않도록 저장하지 않음
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            cookie_jar=aiohttp.DummyCookieJar()
+        )
+
+    async def get_session(self, platform: str) -> aiohttp.ClientSession:
+        """
+        플랫폼 공유 세션을 반환합니다.
+        세션이 없거나 닫혔거나 다른 이벤트 루프에서 생성된 경우 새로 생성합니다.
+
+        Args:
+            platform: 플랫폼명 (예: "gangnamunni", "babitalk", "naver")
+
+        Returns:
+            aiohttp.ClientSession: 공유 세션 (호출자가 닫지 않아야 함)
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(platform)
+        if entry and not entry[0].closed and entry[1] is loop:
+            return entry[0]
+
+        async with self._get_lock():
+            entry = self._sessions.get(platform)
+            if entry and not entry[0].closed and entry[1] is loop:
+                return entry[0]
+
+            if entry and not entry[0].closed:
+                self.log_warning(f"⚠️ {platform} 세션이 다른 이벤트 루프에 속해 있어 새로 생성합니다.")
+                await self._close_stale_session(platform, *entry)
+
+            session = self._create_session()
+            self._sessions[platform] = (session, loop)
+            self.log_info(f"🌐 {platform} HTTP 세션 생성 (limit={self.limit}, limit_per_host={self.limit_per_host})")
+            return session
+
+    async def _close_stale_session(self, platform: str, session: aiohttp.ClientSession, session_loop: asyncio.AbstractEventLoop):
+        """
+        다른 이벤트 루프에서 생성된 세션 종료
+
+        해당 루프가 아직 실행 중이면 그 루프에서 닫도록 예약하고, 이미 끝났으면 현재 루프에서 닫습니다.
+        끝난 루프의 연결은 닫을 수 없으므로 그 경우 커넥터를 분리해 세션을 닫힌 상태로 만듭니다.
+        """
+        if session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            self.log_info(f"🔌 {platform} 이전 이벤트 루프의 HTTP 세션 종료 예약")
+            return
+
+        try:
+            await session.close()
+        except RuntimeError as e:
+            self.log_warning(f"⚠️ {platform} 이전 이벤트 루프의 연결을 닫지 못해 커넥터를 분리합니다: {e}")
+            session.detach()
+        self.log_info(f"🔌 {platform} 이전 이벤트 루프의 HTTP 세션 종료")
+
+    async def close_platform(self, platform: str):
+        """특정 플랫폼 세션 종료"""
+        entry = self._sessions.pop(platform, None)
+        if entry and not entry[0].closed:
+            await entry[0].close()
+            self.log_info(f"🔌 {platform} HTTP 세션 종료")
+
+    async def close_all(self):
+        """모든 플랫폼 세션 종료 (다른 이벤트 루프에서 생성된 세션도 정리)"""
+        loop = asyncio.get_running_loop()
+        for platform in list(self._sessions.keys()):
+            session, session_loop = self._sessions.pop(platform)
+            if session.closed:
+                continue
+            if session_loop is loop:
+                await session.close()
+                self.log_info(f"🔌 {platform} HTTP 세션 종료")
+            else:
+                await self._close_stale_session(platform, session, session_loop)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """플랫폼별 세션 상태 반환"""
+        stats = {}
+        for platform, (session, _) in self._sessions.items():
+            connector = session.connector
+            stats[platform] = {
+                "closed": session.closed,
+                "limit": connector.limit if connector else None,
+                "limit_per_host": connector.limit_per_host if connector else None
+            }
+        return stats
+
+
+# 전역 세션 관리자 인스턴스
+http_session_manager = HttpSessionManager()
+
+
+async def get_platform_session(platform: str) -> aiohttp.ClientSession:
+    """플랫폼 공유 세션 반환 (편의 함수)"""
+    return await http_session_manager.get_session(platform)
+
+
+async def close_platform_sessions():
+    """모든 플랫폼 공유 세션 종료 (편의 함수)"""
+    await http_session_manager.close_all()
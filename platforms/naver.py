@@ -4,13 +4,15 @@
 """
 import aiohttp
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import Awaitable, Callable, List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import html
 import logging
 
 from utils.logger import LoggedClass
+from platforms.http_session import get_platform_session
+from platforms.circuit_breaker import PlatformHTTPError, get_circuit_breaker, raise_for_status
 
 @dataclass
 class NaverCafeMenu:
@@ -75,38 +77,39 @@ class NaverCafeAPI(LoggedClass):
                 "requestFrom": "A"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=self.headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
+            session = await get_platform_session("naver")
+            async with session.get(url, params=params, headers=self.headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    if 'result' in data and 'menus' in data['result']:
+                        menus = data['result']['menus']
+                        menu_list = []
+                        for menu in menus:
+                            # P(프로필), L(링크), F(폴더) 제외
+                            if menu.get('menuType') not in ['P', 'L', 'F']:
+                                menu_list.append(NaverCafeMenu(
+                                    menu_id=int(menu.get('id', 0)),
+                                    menu_name=html.unescape(menu.get('name', '')),
+                                    menu_type=menu.get('menuType', ''),
+                                    board_type=menu.get('boardType', ''),
+                                    sort=menu.get('sort', 0)
+                                ))
                         
-                        if 'result' in data and 'menus' in data['result']:
-                            menus = data['result']['menus']
-                            menu_list = []
-                            for menu in menus:
-                                # P(프로필), L(링크), F(폴더) 제외
-                                if menu.get('menuType') not in ['P', 'L', 'F']:
-                                    menu_list.append(NaverCafeMenu(
-                                        menu_id=int(menu.get('id', 0)),
-                                        menu_name=html.unescape(menu.get('name', '')),
-                                        menu_type=menu.get('menuType', ''),
-                                        board_type=menu.get('boardType', ''),
-                                        sort=menu.get('sort', 0)
-                                    ))
-                            
-                            menu_list.sort(key=lambda x: x.sort)
-                            return menu_list
-                        else:
-                            return []
+                        menu_list.sort(key=lambda x: x.sort)
+                        return menu_list
                     else:
                         return []
-                        
+                else:
+                    return []
+                    
         except Exception as e:
             self.log_error(f"게시판 목록 조회 실패: {str(e)}")
             return []
     
-    async def get_article_list(self, cafe_id: str, menu_id: str = "", page: int = 1, per_page: int = 20) -> List[NaverCafeArticle]:
-        """게시글 목록 조회"""
+    async def get_article_list(self, cafe_id: str, menu_id: str = "", page: int = 1, per_page: int = 20,
+                               raise_http_errors: bool = False) -> List[NaverCafeArticle]:
+        """게시글 목록 조회 (raise_http_errors=True이면 HTTP 오류를 빈 리스트 대신 PlatformHTTPError로 전달)"""
         try:
             
             url = f"{self.base_url}/cafe-web/cafe2/ArticleListV2dot1.json"
@@ -119,55 +122,61 @@ class NaverCafeAPI(LoggedClass):
                 "adUnit": "MW_CAFE_ARTICLE_LIST_RS"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=self.headers) as response:
-                    # self.log_info(f"응답 상태 코드: {response.status}")
+            session = await get_platform_session("naver")
+            async with get_circuit_breaker("apis.naver.com"), session.get(url, params=params, headers=self.headers) as response:
+                # self.log_info(f"응답 상태 코드: {response.status}")
+                
+                if response.status == 200:
+                    data = await response.json()
+                    # self.log_info(f"응답 데이터 키: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        # self.log_info(f"응답 데이터 키: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+                    article_list = []
+                    if 'message' in data and 'result' in data['message'] and 'articleList' in data['message']['result']:
+                        articles = data['message']['result']['articleList']
+                        # 게시글 ID 순으로 정렬
+                        articles.sort(key=lambda x: x['articleId'])
                         
-                        article_list = []
-                        if 'message' in data and 'result' in data['message'] and 'articleList' in data['message']['result']:
-                            articles = data['message']['result']['articleList']
-                            # 게시글 ID 순으로 정렬
-                            articles.sort(key=lambda x: x['articleId'])
+                        for article in articles:
+                            # writeDate를 Unix timestamp (밀리초)에서 datetime으로 변환
+                            created_at = self._convert_write_date(article.get('writeDateTimestamp'))
                             
-                            for article in articles:
-                                # writeDate를 Unix timestamp (밀리초)에서 datetime으로 변환
-                                created_at = self._convert_write_date(article.get('writeDateTimestamp'))
-                                
-                                article_list.append(NaverCafeArticle(
-                                    article_id=article['articleId'],
-                                    subject=article['subject'],
-                                    writer_nickname=article['writerNickname'],
-                                    writer_id=article.get('writerId', ''),
-                                    created_at=created_at,
-                                    view_count=article.get('readCount', 0),
-                                    comment_count=article.get('commentCount', 0),
-                                    like_count=article.get('likeCount', 0)
-                                ))
-                            
-                            return article_list
-                        else:
-                            self.log_error("게시글 목록 데이터 구조가 올바르지 않습니다")
-                            self.log_error(f"응답 구조: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                            if 'result' in data:
-                                self.log_error(f"result 구조: {list(data['result'].keys()) if isinstance(data['result'], dict) else 'Not a dict'}")
-                            return []
+                            article_list.append(NaverCafeArticle(
+                                article_id=article['articleId'],
+                                subject=article['subject'],
+                                writer_nickname=article['writerNickname'],
+                                writer_id=article.get('writerId', ''),
+                                created_at=created_at,
+                                view_count=article.get('readCount', 0),
+                                comment_count=article.get('commentCount', 0),
+                                like_count=article.get('likeCount', 0)
+                            ))
+                        
+                        return article_list
                     else:
-                        response_text = await response.text()
-                        self.log_error(f"게시글 목록 조회 실패: HTTP {response.status}")
-                        self.log_error(f"응답 내용: {response_text}")
+                        self.log_error("게시글 목록 데이터 구조가 올바르지 않습니다")
+                        self.log_error(f"응답 구조: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+                        if 'result' in data:
+                            self.log_error(f"result 구조: {list(data['result'].keys()) if isinstance(data['result'], dict) else 'Not a dict'}")
                         return []
-                        
+                else:
+                    response_text = await response.text()
+                    self.log_error(f"게시글 목록 조회 실패: HTTP {response.status}")
+                    self.log_error(f"응답 내용: {response_text}")
+                    # 서킷 브레이커가 실패로 집계하도록 타입이 지정된 오류 발생
+                    raise_for_status(response)
+                    
+        except PlatformHTTPError:
+            if raise_http_errors:
+                raise
+            return []
         except Exception as e:
             self.log_error(f"게시글 목록 조회 중 오류 발생: {str(e)}")
             import traceback
             self.log_error(f"상세 오류: {traceback.format_exc()}")
             return []
     
-    async def get_article_list_multi_menus(self, cafe_id: str, menu_ids: str, page: int = 1, per_page: int = 20) -> List[NaverCafeArticle]:
+    async def get_article_list_multi_menus(self, cafe_id: str, menu_ids: str, page: int = 1, per_page: int = 20,
+                                           raise_http_errors: bool = False) -> List[NaverCafeArticle]:
         """여러 게시판의 게시글 목록 조회 (콤마로 구분된 menu_id)"""
         try:
             # menu_ids를 콤마로 분리하고 공백 제거
@@ -183,7 +192,7 @@ class NaverCafeAPI(LoggedClass):
             # 각 게시판별로 병렬 처리
             tasks = []
             for menu_id in menu_list:
-                task = self.get_article_list(cafe_id, menu_id, page, per_page)
+                task = self.get_article_list(cafe_id, menu_id, page, per_page, raise_http_errors=raise_http_errors)
                 tasks.append(task)
             
             # 모든 게시판의 결과를 병렬로 조회
@@ -191,6 +200,8 @@ class NaverCafeAPI(LoggedClass):
             
             # 결과 합치기
             for i, result in enumerate(results):
+                if raise_http_errors and isinstance(result, PlatformHTTPError):
+                    raise result
                 if isinstance(result, Exception):
                     self.log_error(f"게시판 {menu_list[i]} 조회 실패: {result}")
                     continue
@@ -203,154 +214,213 @@ class NaverCafeAPI(LoggedClass):
             
             return all_articles
             
+        except PlatformHTTPError:
+            raise
         except Exception as e:
             self.log_error(f"여러 게시판 게시글 목록 조회 중 오류 발생: {str(e)}")
             import traceback
             self.log_error(f"상세 오류: {traceback.format_exc()}")
             return []
     
-    async def get_article_content(self, cafe_id: str, article_id: str, retry_count: int = 0) -> Optional[tuple[str, datetime]]:
-        """게시글 내용 조회 (재시도 로직 포함)"""
-        try:
+    async def get_article_list_by_date(self, cafe_id: str, menu_id: str, target_date: str, per_page: int = 50, max_pages: int = 50,
+                                       start_page: int = 1,
+                                       on_page: Optional[Callable[[List[NaverCafeArticle], int], Awaitable[None]]] = None,
+                                       on_complete: Optional[Callable[[], Awaitable[None]]] = None) -> List[NaverCafeArticle]:
+        """
+        특정 날짜에 작성된 게시글 목록만 조회 (목록 단계 날짜 필터링)
+        
+        목록 API의 writeDateTimestamp 로 날짜를 판별하므로 상세 조회 없이 대상 게시글만 골라냅니다.
+        최신순으로 페이지를 넘기다가 페이지 전체가 대상 날짜보다 오래되면 즉시 중단합니다.
+        
+        Args:
+            cafe_id: 카페 ID
+            menu_id: 메뉴 ID (콤마로 구분된 여러 게시판 지원)
+            target_date: 대상 날짜 (YYYY-MM-DD)
+            per_page: 페이지당 게시글 수 (기본값: 50)
+            max_pages: 최대 조회 페이지 수 (무한 루프 방지, 기본값: 50)
+            start_page: 시작 페이지 (체크포인트에서 재개할 때 사용, 기본값: 1)
+            on_page: 페이지마다 호출되는 콜백 (페이지의 대상 날짜 게시글, 다음 페이지 번호)
+            on_complete: 날짜 끝에 도달했을 때만 호출되는 콜백 (목록 요청 실패로 중단되면 호출하지 않음)
+        
+        Returns:
+            List[NaverCafeArticle]: 대상 날짜의 게시글 목록 (게시글 ID 오름차순)
+        """
+        target = datetime.strptime(target_date, "%Y-%m-%d").date()
+        
+        matched_articles = []
+        # 페이지 조회 사이에 새 게시글이 올라오면 이전 페이지 게시글이 다음 페이지로 밀려나므로 이미 본 게시글은 건너뜀
+        seen_ids = set()
+        page = start_page
+        
+        while page <= max_pages:
+            # 실패 응답을 빈 페이지(마지막 페이지)로 오인하지 않도록 HTTP 오류는 전달받아 중단
+            try:
+                if ',' in menu_id:
+                    articles = await self.get_article_list_multi_menus(cafe_id, menu_id, page, per_page, raise_http_errors=True)
+                else:
+                    articles = await self.get_article_list(cafe_id, menu_id, page, per_page, raise_http_errors=True)
+            except PlatformHTTPError as e:
+                self.log_error(f"❌ {target_date} 게시글 목록 {page}페이지 조회 실패, 수집을 중단합니다: {e}")
+                matched_articles.sort(key=lambda x: x.article_id)
+                return matched_articles
             
-            # 올바른 네이버 API 엔드포인트 사용
-            url = f"https://article.cafe.naver.com/gw/v3/cafes/{cafe_id}/articles/{article_id}"
-            params = {
-                "query": "",
-                "boardType": "L",  # 기본값, 필요시 동적으로 설정
-                "useCafeId": "true",
-                "requestFrom": "A"
-            }
+            if not articles:
+                break
             
-            # self.log_info(f"요청 URL: {url}")
-            # self.log_info(f"요청 파라미터: {params}")
-            # self.log_info(f"요청 헤더: {self.headers}")
+            newest_date = None
+            page_matched = []
+            for article in articles:
+                if not article.created_at:
+                    continue
+                
+                article_date = article.created_at.date()
+                if newest_date is None or article_date > newest_date:
+                    newest_date = article_date
+                
+                if article_date != target:
+                    continue
+                
+                if article.article_id in seen_ids:
+                    continue
+                seen_ids.add(article.article_id)
+                page_matched.append(article)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=self.headers) as response:
-                    # self.log_info(f"응답 상태 코드: {response.status}")
-                    # self.log_info(f"응답 헤더: {dict(response.headers)}")
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        # self.log_info(f"응답 데이터 키: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                        
-                        # 시스템 에러 체크
-                        if 'error_code' in data and data['error_code'] == '000':
-                            error_msg = data.get('message', 'Unknown system error')
-                            self.log_error(f"네이버 시스템 에러 발생: {error_msg}")
-                            
-                            # 재시도 로직 (최대 3회)
-                            if retry_count < 3:
-                                self.log_info(f"시스템 에러로 인한 재시도 {retry_count + 1}/3")
-                                await asyncio.sleep(2 ** retry_count)  # 지수 백오프
-                                return await self.get_article_content(cafe_id, article_id, retry_count + 1)
-                            else:
-                                self.log_error(f"최대 재시도 횟수 초과: {article_id}")
-                                return None, None
-                        
-                        # 새로운 API 응답 구조에 맞춰 수정
-                        if 'result' in data and 'article' in data['result'] and 'contentHtml' in data['result']['article']:
-                            content = data['result']['article']['contentHtml']
-                            # 생성일 정보 변환
-                            write_date = data['result']['article'].get('writeDate')
-                            created_at = self._convert_write_date(write_date)
-                            
-                            # content와 created_at을 함께 반환 (튜플 형태)
-                            return content, created_at
-                        else:
-                            self.log_error(f"게시글 내용 데이터 구조가 올바르지 않습니다")
-                            self.log_error(f"응답 구조: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                            if 'result' in data:
-                                self.log_error(f"result 구조: {list(data['result'].keys()) if isinstance(data['result'], dict) else 'Not a dict'}")
-                            if 'result' in data and 'article' in data['result']:
-                                self.log_error(f"article 구조: {list(data['result']['article'].keys()) if isinstance(data['result']['article'], dict) else 'Not a dict'}")
-                            return None, None
-                    else:
-                        response_text = await response.text()
-                        # self.log_error(f"게시글 내용 조회 실패: HTTP {response.status}")
-                        # self.log_error(f"응답 내용: {response_text}")
-                        return None, None
-                        
-        except Exception as e:
-            self.log_error(f"게시글 내용 조회 중 오류 발생: {str(e)}")
-            import traceback
-            self.log_error(f"상세 오류: {traceback.format_exc()}")
-            return None, None
+            matched_articles.extend(page_matched)
+            if on_page:
+                await on_page(sorted(page_matched, key=lambda x: x.article_id), page + 1)
+            
+            # 페이지 전체가 대상 날짜보다 오래된 경우 이후 페이지는 모두 더 오래된 게시글이므로 중단
+            if newest_date is not None and newest_date < target:
+                break
+            
+            # 마지막 페이지 (요청 개수보다 적게 반환된 경우)
+            if ',' not in menu_id and len(articles) < per_page:
+                break
+            
+            page += 1
+            
+            # API 호출 간격 조절
+            await asyncio.sleep(0.5)
+        
+        matched_articles.sort(key=lambda x: x.article_id)
+        self.log_info(f"📅 {target_date} 게시글 {len(matched_articles)}개 확인 (목록 {page}페이지 조회)")
+        if on_complete:
+            await on_complete()
+        return matched_articles
     
-    async def get_article_comments(self, cafe_id: str, article_id: str) -> List[Dict[str, Any]]:
-        """게시글의 댓글 목록 조회"""
+    async def get_article_detail(self, cafe_id: str, article_id: str, retry_count: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        게시글 상세 조회 (내용, 작성일, 댓글을 한 번의 요청으로 조회, 재시도 로직 포함)
+        
+        Returns:
+            Optional[Dict]: {'content_html', 'created_at', 'comments'} 또는 실패 시 None
+        """
         try:
             
-            # 댓글 조회 API 엔드포인트 (게시글 내용 조회 시 함께 받아옴)
-            # 실제로는 게시글 내용 조회 시 comments 정보가 함께 포함됨
+            # 올바른 네이버 API 엔드포인트 사용 (게시글 내용 조회 시 댓글 정보가 함께 포함됨)
             url = f"https://article.cafe.naver.com/gw/v3/cafes/{cafe_id}/articles/{article_id}"
             params = {
                 "query": "",
-                "boardType": "L",
+                "boardType": "L",  # 기본값, 필요시 동적으로 설정
                 "useCafeId": "true",
                 "requestFrom": "A"
             }
             
-            # self.log_info(f"요청 URL: {url}")
-            # self.log_info(f"요청 파라미터: {params}")
+            session = await get_platform_session("naver")
+            async with get_circuit_breaker("article.cafe.naver.com"), session.get(url, params=params, headers=self.headers) as response:
+                raise_for_status(response)
+                data = await response.json()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=self.headers) as response:
-                    # self.log_info(f"응답 상태 코드: {response.status}")
+            # 시스템 에러 체크
+            if 'error_code' in data and data['error_code'] == '000':
+                error_msg = data.get('message', 'Unknown system error')
+                self.log_error(f"네이버 시스템 에러 발생: {error_msg}")
+                
+                # 재시도 로직 (최대 3회)
+                if retry_count < 3:
+                    self.log_info(f"시스템 에러로 인한 재시도 {retry_count + 1}/3")
+                    await asyncio.sleep(2 ** retry_count)  # 지수 백오프
+                    return await self.get_article_detail(cafe_id, article_id, retry_count + 1)
+                else:
+                    self.log_error(f"최대 재시도 횟수 초과: {article_id}")
+                    return None
+            
+            result = data.get('result') if isinstance(data, dict) else None
+            if not isinstance(result, dict):
+                self.log_error(f"게시글 상세 데이터 구조가 올바르지 않습니다")
+                self.log_error(f"응답 구조: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
+                return None
+            
+            # 게시글 내용과 생성일 정보 변환
+            content_html = None
+            created_at = None
+            article_data = result.get('article')
+            if isinstance(article_data, dict) and 'contentHtml' in article_data:
+                content_html = article_data['contentHtml']
+                created_at = self._convert_write_date(article_data.get('writeDate'))
+            else:
+                self.log_error(f"게시글 내용 데이터 구조가 올바르지 않습니다")
+                self.log_error(f"result 구조: {list(result.keys())}")
+                if isinstance(article_data, dict):
+                    self.log_error(f"article 구조: {list(article_data.keys())}")
+            
+            return {
+                'content_html': content_html,
+                'created_at': created_at,
+                'comments': self._parse_comments(result)
+            }
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # 댓글 정보 추출
-                        if 'result' in data and 'comments' in data['result']:
-                            comments_data = data['result']['comments']
-                            
-                            if 'items' in comments_data:
-                                comments = comments_data['items']
-                                # self.log_info(f"댓글 {len(comments)}개 조회 완료")
-                                
-                                # 댓글 데이터 정리
-                                processed_comments = []
-                                for comment in comments:
-                                    # updateDate를 datetime으로 변환
-                                    created_at = self._convert_write_date(comment.get('updateDate'))
-                                    
-                                    processed_comment = {
-                                        'comment_id': str(comment.get('id', '')),
-                                        'ref_id': str(comment.get('refId', '')),
-                                        'writer_nickname': comment.get('writer', {}).get('nick', ''),
-                                        'writer_id': comment.get('writer', {}).get('id', ''),
-                                        'writer_member_key': comment.get('writer', {}).get('memberKey', ''),
-                                        'content': comment.get('content', ''),
-                                        'created_at': created_at,
-                                        'member_level': comment.get('memberLevel', 0),
-                                        'is_deleted': comment.get('isDeleted', False),
-                                        'is_article_writer': comment.get('isArticleWriter', False),
-                                        'is_new': comment.get('isNew', False)
-                                    }
-                                    processed_comments.append(processed_comment)
-                                    
-                                    # self.log_info(f"댓글 {processed_comment['comment_id']} 처리 완료: {processed_comment['writer_nickname']}")
-                                
-                                return processed_comments
-                            else:
-                                self.log_info("댓글이 없습니다")
-                                return []
-                        else:
-                            self.log_info("댓글 데이터 구조가 올바르지 않습니다")
-                            return []
-                    else:
-                        response_text = await response.text()
-                        # self.log_error(f"댓글 조회 실패: HTTP {response.status}")
-                        # self.log_error(f"응답 내용: {response_text}")
-                        return []
-                        
+        except PlatformHTTPError as e:
+            # 호스트 차단 여부는 서킷 브레이커가 판단하므로 해당 게시글만 건너뜀
+            self.log_warning(f"게시글 {article_id} 상세 조회 실패: {e}")
+            return None
         except Exception as e:
-            self.log_error(f"댓글 목록 조회 중 오류 발생: {str(e)}")
+            self.log_error(f"게시글 상세 조회 중 오류 발생: {str(e)}")
             import traceback
             self.log_error(f"상세 오류: {traceback.format_exc()}")
+            return None
+    
+    def _parse_comments(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """게시글 상세 응답의 result에서 댓글 목록 정리"""
+        comments_data = result.get('comments')
+        if not isinstance(comments_data, dict) or 'items' not in comments_data:
             return []
+        
+        processed_comments = []
+        for comment in comments_data['items']:
+            # updateDate를 datetime으로 변환
+            created_at = self._convert_write_date(comment.get('updateDate'))
+            writer = comment.get('writer', {}) or {}
+            
+            processed_comments.append({
+                'comment_id': str(comment.get('id', '')),
+                'ref_id': str(comment.get('refId', '')),
+                'writer_nickname': writer.get('nick', ''),
+                'writer_id': writer.get('id', ''),
+                'writer_member_key': writer.get('memberKey', ''),
+                'content': comment.get('content', ''),
+                'created_at': created_at,
+                'member_level': comment.get('memberLevel', 0),
+                'is_deleted': comment.get('isDeleted', False),
+                'is_article_writer': comment.get('isArticleWriter', False),
+                'is_new': comment.get('isNew', False)
+            })
+        
+        return processed_comments
+    
+    async def get_article_content(self, cafe_id: str, article_id: str, retry_count: int = 0) -> Optional[tuple[str, datetime]]:
+        """게시글 내용 조회 (get_article_detail 기반, 내용과 생성일만 반환)"""
+        detail = await self.get_article_detail(cafe_id, article_id, retry_count)
+        if not detail or not detail['content_html']:
+            return None, None
+        return detail['content_html'], detail['created_at']
+    
+    async def get_article_comments(self, cafe_id: str, article_id: str) -> List[Dict[str, Any]]:
+        """게시글의 댓글 목록 조회 (get_article_detail 기반, 댓글만 반환)"""
+        detail = await self.get_article_detail(cafe_id, article_id)
+        if not detail:
+            return []
+        return detail['comments']
     
     async def get_articles_with_content(self, cafe_id: str, menu_id: str = "", per_page: int = 20) -> List[NaverCafeArticle]:
         """게시글 목록과 내용을 함께 조회 (개선된 버전)"""
@@ -471,13 +541,21 @@ class NaverCafeAPI(LoggedClass):
         try:
             self.log_info(f"게시글과 내용, 댓글 조회 시작 (카페 ID: {cafe_id}, 메뉴 ID: {menu_id}, 날짜: {target_date})")
             
-            # limit이 설정된 경우 페이지당 개수를 limit에 맞춰 조정
-            if limit > 0:
-                initial_per_page = min(per_page * 4, limit) if target_date else min(per_page, limit)
+            if target_date:
+                # 목록 단계에서 날짜로 먼저 거른 뒤 대상 게시글만 상세 조회
+                try:
+                    articles = await self.get_article_list_by_date(cafe_id, menu_id, target_date)
+                except ValueError:
+                    self.log_error(f"날짜 형식 오류: {target_date}, 예상 형식: YYYY-MM-DD")
+                    return []
+                
+                # 목록 API 순서(최신순)로 먼저 자른 뒤 게시글 ID 오름차순으로 되돌림 (오래된 게시글만 남지 않도록)
+                max_articles = min(per_page, limit) if limit > 0 else per_page
+                newest_first = sorted(articles, key=lambda x: x.article_id, reverse=True)[:max_articles]
+                articles = sorted(newest_first, key=lambda x: x.article_id)
             else:
-                initial_per_page = per_page * 4 if target_date else per_page
-            
-            articles = await self.get_article_list(cafe_id, menu_id, 1, initial_per_page)
+                initial_per_page = min(per_page, limit) if limit > 0 else per_page
+                articles = await self.get_article_list(cafe_id, menu_id, 1, initial_per_page)
             
             if not articles:
                 self.log_warning("수집할 게시글이 없습니다")
@@ -487,8 +565,6 @@ class NaverCafeAPI(LoggedClass):
             
             # 각 게시글의 내용과 댓글 조회 (생성일 정보 포함)
             articles_with_content_and_comments = []
-            consecutive_404_errors = 0
-            max_404_errors = 5
             
             for i, article in enumerate(articles):
                 try:
@@ -502,8 +578,10 @@ class NaverCafeAPI(LoggedClass):
                     # 게시글별 5초 딜레이 (과부하 방지)
                     await asyncio.sleep(5)
                     
-                    # 게시글 내용 조회
-                    content_html, created_at = await self.get_article_content(cafe_id, article.article_id)
+                    # 게시글 내용과 댓글을 한 번의 요청으로 조회
+                    detail = await self.get_article_detail(cafe_id, article.article_id)
+                    content_html = detail['content_html'] if detail else None
+                    created_at = detail['created_at'] if detail else None
                     if content_html:
                         article.content = self.parse_content_html(content_html)
                         self.log_info(f"게시글 {article.article_id} 내용 파싱 완료")
@@ -516,8 +594,7 @@ class NaverCafeAPI(LoggedClass):
                         self.log_warning(f"게시글 {article.article_id} 내용 조회 실패")
                         article.content = ""
                     
-                    # 댓글 조회
-                    comments = await self.get_article_comments(cafe_id, article.article_id)
+                    comments = detail['comments'] if detail else []
                     # self.log_info(f"게시글 {article.article_id} 댓글 {len(comments)}개 조회 완료")
                     
                     # 결과 데이터 구성
@@ -538,19 +615,8 @@ class NaverCafeAPI(LoggedClass):
                         break
                     
                 except Exception as e:
-                    error_msg = str(e)
-                    if "404" in error_msg or "Not Found" in error_msg:
-                        consecutive_404_errors += 1
-                        self.log_error(f"❌ 404 에러 발생 (연속 {consecutive_404_errors}회): {e}")
-                        
-                        if consecutive_404_errors >= max_404_errors:
-                            self.log_error(f"🚫 연속 404 에러 {max_404_errors}회 발생. 20분 대기 후 재시도합니다.")
-                            await asyncio.sleep(20 * 60)  # 20분 대기
-                            consecutive_404_errors = 0  # 카운터 리셋
-                        else:
-                            await asyncio.sleep(5)  # 5초 대기
-                    else:
-                        self.log_error(f"게시글 {article.article_id} 처리 실패: {str(e)}")
+                    # HTTP 오류로 인한 호스트 대기는 서킷 브레이커가 처리
+                    self.log_error(f"게시글 {article.article_id} 처리 실패: {str(e)}")
                     
                     article_data = {
                         'article': article,
@@ -560,33 +626,6 @@ class NaverCafeAPI(LoggedClass):
                     articles_with_content_and_comments.append(article_data)
                     continue
             
-            # 날짜 필터링 (target_date가 지정된 경우, 내용 조회 후 수행)
-            if target_date:
-                try:
-                    from datetime import datetime
-                    target_datetime = datetime.strptime(target_date, "%Y-%m-%d")
-                    self.log_info(f"날짜 필터링 적용: {target_date}")
-                    
-                    # 해당 날짜의 게시글만 필터링
-                    filtered_articles = []
-                    for article_data in articles_with_content_and_comments:
-                        article = article_data['article']
-                        if article.created_at and article.created_at.date() == target_datetime.date():
-                            filtered_articles.append(article_data)
-                    
-                    articles_with_content_and_comments = filtered_articles
-                    self.log_info(f"날짜 필터링 후 게시글 수: {len(articles_with_content_and_comments)}개")
-                    
-                    # 필터링된 게시글이 per_page보다 적으면 더 많은 게시글을 조회
-                    if len(articles_with_content_and_comments) < per_page:
-                        self.log_info(f"필터링된 게시글이 {per_page}개보다 적어서 추가 조회를 시도합니다")
-                        # 이미 충분한 게시글을 조회했으므로 현재 결과를 반환
-                        self.log_warning(f"요청된 날짜({target_date})에 해당하는 게시글이 {len(articles_with_content_and_comments)}개만 있습니다")
-                        
-                except ValueError as e:
-                    self.log_error(f"날짜 형식 오류: {target_date}, 예상 형식: YYYY-MM-DD")
-                    return []
-            
             # per_page만큼만 처리
             articles_with_content_and_comments = articles_with_content_and_comments[:per_page]
             # self.log_info(f"최종 처리할 게시글 수: {len(articles_with_content_and_comments)}개")
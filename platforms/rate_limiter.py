@@ -0,0 +1,137 @@
+"""
+호스트별 요청 속도 제한기
+
+토큰 버킷(초당 요청 수)과 동시 요청 수 제한을 함께 적용하여
+상세 조회를 병렬로 실행하면서도 대상 서버에 과부하를 주지 않도록 합니다.
+"""
+import asyncio
+import time
+from typing import Dict, Optional
+
+from utils.logger import LoggedClass
+
+# 기본 제한값 (호스트별 설정이 없는 경우 사용)
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# 호스트별 제한 설정: 호스트 -> (초당 요청 수, 최대 동시 요청 수)
+HOST_RATE_LIMITS: Dict[str, tuple] = {
+    "www.gangnamunni.com": (2.0, 4),    # 게시글 상세(댓글) 페이지
+    "env.gnsister.com": (3.0, 4),       # 리뷰 목록/상세 API
+    "web-api.babitalk.com": (3.0, 4),
+    "article.cafe.naver.com": (2.0, 3),
+    "apis.naver.com": (2.0, 3),
+}
+
+
+class RateLimiter:
+    """토큰 버킷 + 동시 요청 수 제한기"""
+
+    def __init__(self, requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, burst: Optional[int] = None):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second는 0보다 커야 합니다.")
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight는 0보다 커야 합니다.")
+
+        self.requests_per_second = requests_per_second
+        self.max_in_flight = max_in_flight
+        self.burst = burst or max(1, int(requests_per_second))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        # asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _ensure_primitives(self):
+        """현재 이벤트 루프용 락/세마포어 준비"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+    def _refill(self):
+        """경과 시간만큼 토큰 충전"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+
+    async def _acquire_token(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.requests_per_second)
+
+    async def __aenter__(self):
+        self._ensure_primitives()
+        await self._semaphore.acquire()
+        try:
+            await self._acquire_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 요청 수"""
+        if self._semaphore is None:
+            return 0
+        return self.max_in_flight - self._semaphore._value
+
+    def get_stats(self) -> Dict:
+        """제한기 상태 반환"""
+        return {
+            "requests_per_second": self.requests_per_second,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+        }
+
+
+class RateLimiterRegistry(LoggedClass):
+    """호스트별 공유 속도 제한기 관리자"""
+
+    def __init__(self):
+        super().__init__("RateLimiterRegistry")
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    def get(self, host: str) -> RateLimiter:
+        """호스트의 공유 제한기 반환 (없으면 설정값으로 생성)"""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            requests_per_second, max_in_flight = HOST_RATE_LIMITS.get(
+                host, (DEFAULT_REQUESTS_PER_SECOND, DEFAULT_MAX_IN_FLIGHT)
+            )
+            limiter = RateLimiter(requests_per_second, max_in_flight)
+            self._limiters[host] = limiter
+        return limiter
+
+    def configure(self, host: str, requests_per_second: float, max_in_flight: int):
+        """호스트별 제한값 변경 (기존 제한기는 교체됨)"""
+        HOST_RATE_LIMITS[host] = (requests_per_second, max_in_flight)
+        self._limiters[host] = RateLimiter(requests_per_second, max_in_flight)
+        self.log_info(f"⚙️ {host} 속도 제한 설정: 초당 {requests_per_second}회, 동시 {max_in_flight}개")
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """호스트별 제한기 상태 반환"""
+        return {host: limiter.get_stats() for host, limiter in self._limiters.items()}
+
+
+# 전역 제한기 레지스트리
+rate_limiters = RateLimiterRegistry()
+
+
+def get_rate_limiter(host: str) -> RateLimiter:
+    """호스트의 공유 속도 제한기 반환 (편의 함수)"""
+    return rate_limiters.get(host)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+분석용 Parquet 스냅샷을 증분으로 내보내는 스크립트
+
+지난 실행 이후 수집된 게시글/댓글/후기를 작성일 파티션별 Parquet 파일로 추가합니다.
+cron 등으로 주기적으로 실행하고, 분석은 출력 디렉토리의 파일로 수행합니다.
+
+    python scripts/export_parquet_snapshot.py [출력 디렉토리]  (기본값: SNAPSHOT_DIR 또는 data/snapshots)
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.snapshot import ParquetSnapshotExporter
+from utils.logger import get_logger
+
+logger = get_logger("export_parquet_snapshot")
+
+def export_parquet_snapshot(output_dir: str):
+    """워터마크 이후 수집된 데이터를 Parquet 파일로 내보냅니다."""
+    try:
+        totals = ParquetSnapshotExporter(output_dir).export()
+        logger.info(f"Parquet 스냅샷을 내보냈습니다 ({output_dir}): {totals}")
+    except Exception as e:
+        logger.error(f"Parquet 스냅샷 내보내기 중 오류가 발생했습니다: {e}")
+        raise
+
+if __name__ == "__main__":
+    export_parquet_snapshot(sys.argv[1] if len(sys.argv) > 1 else os.getenv("SNAPSHOT_DIR", "data/snapshots"))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+새로 추가된 테이블을 생성하는 마이그레이션 스크립트
+
+로컬 환경(APPS_ENV=local)이 아니면 서버 시작 시 테이블을 자동 생성하지 않으므로,
+배포 환경에서는 이 스크립트로 없는 테이블(예: collection_tasks, search_documents, daily_stats), 기존 테이블에 새로 정의한 인덱스,
+전문 검색 인덱스만 생성합니다.
+기존 테이블의 데이터는 변경하지 않습니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect, text
+
+from database.config import db_config
+from database.fulltext import ensure_fulltext_indexes
+from database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from database.sqlalchemy_models import Base
+from utils.logger import get_logger
+
+logger = get_logger("migrate_add_tables")
+
+# 복합 인덱스로 대체되어 더 이상 모델에 정의하지 않는 인덱스
+OBSOLETE_INDEXES = {
+    "articles": ["idx_articles_community_id", "idx_articles_created_at"],
+    "comments": ["idx_comments_article_id", "idx_comments_created_at"],
+    "reviews": ["idx_reviews_platform_id", "idx_reviews_created_at"],
+}
+
+def migrate_add_tables():
+    """모델에 정의되어 있으나 DB에 없는 테이블을 생성합니다."""
+    try:
+        existing_tables = set(inspect(db_config.engine).get_table_names())
+        missing_tables = [table for name, table in Base.metadata.tables.items() if name not in existing_tables]
+
+        if missing_tables:
+            Base.metadata.create_all(bind=db_config.engine, tables=missing_tables)
+            for table in missing_tables:
+                logger.info(f"{table.name} 테이블을 생성했습니다.")
+        else:
+            logger.info("추가할 테이블이 없습니다.")
+
+        # 기존 테이블에 모델에서 새로 정의한 인덱스 추가
+        inspector = inspect(db_config.engine)
+        for name, table in Base.metadata.tables.items():
+            if name not in existing_tables:
+                continue
+            existing_indexes = {index["name"] for index in inspector.get_indexes(name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(bind=db_config.engine)
+                    logger.info(f"{name}.{index.name} 인덱스를 생성했습니다.")
+
+        # 대체된 인덱스 제거 (새 복합 인덱스를 만든 뒤 제거해야 외래키 인덱스가 유지됨)
+        for name, index_names in OBSOLETE_INDEXES.items():
+            if name not in existing_tables:
+                continue
+            existing_indexes = {index["name"] for index in inspector.get_indexes(name)}
+            for index_name in index_names:
+                if index_name in existing_indexes:
+                    on_table = f" ON {name}" if db_config.engine.dialect.name == "mysql" else ""
+                    with db_config.engine.begin() as conn:
+                        conn.execute(text(f"DROP INDEX {index_name}{on_table}"))
+                    logger.info(f"{name}.{index_name} 인덱스를 제거했습니다.")
+
+        # 통합 검색 문서는 새로 만든 경우 기존 게시글/댓글/후기로 채움
+        if any(table.name == "search_documents" for table in missing_tables):
+            counts = SQLAlchemyDatabaseManager().rebuild_search_documents()
+            logger.info(f"search_documents 테이블을 기존 데이터로 채웠습니다: {counts}")
+
+        # 일별 집계는 새로 만든 경우 기존 데이터로 계산
+        if any(table.name == "daily_stats" for table in missing_tables):
+            totals = SQLAlchemyDatabaseManager().rebuild_daily_stats()
+            logger.info(f"daily_stats 테이블을 기존 데이터로 채웠습니다: {totals}")
+
+        # 전문 검색 인덱스 (없으면 생성 후 기존 데이터로 채움)
+        # 이전 테이블별 인덱스는 위에서 검색 문서를 채우고 새 인덱스/트리거를 만든 뒤에만 제거되므로,
+        # 중간에 실패하면 이전 인덱스가 남아 있는 상태로 다시 실행할 수 있음
+        if ensure_fulltext_indexes(db_config.engine):
+            logger.info("전문 검색 인덱스를 확인했습니다.")
+        else:
+            logger.warning("전문 검색 인덱스를 사용할 수 없어 이전 인덱스를 유지하고 LIKE 검색을 사용합니다.")
+
+        logger.info("마이그레이션이 성공적으로 완료되었습니다.")
+
+    except Exception as e:
+        logger.error(f"마이그레이션 중 오류가 발생했습니다: {e}")
+        raise
+
+if __name__ == "__main__":
+    migrate_add_tables()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+일별 집계(daily_stats)를 원본 테이블 기준으로 다시 계산하는 유지보수 스크립트
+
+수집 시 증분 갱신되는 집계가 수동 데이터 수정/이관 스크립트 등으로 원본과 어긋났을 때 실행합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from utils.logger import get_logger
+
+logger = get_logger("rebuild_daily_stats")
+
+def rebuild_daily_stats():
+    """daily_stats 테이블을 비우고 게시글/댓글/후기로 다시 집계합니다."""
+    try:
+        totals = SQLAlchemyDatabaseManager().rebuild_daily_stats()
+        logger.info(f"일별 집계를 다시 계산했습니다: {totals}")
+    except Exception as e:
+        logger.error(f"일별 집계 재계산 중 오류가 발생했습니다: {e}")
+        raise
+
+if __name__ == "__main__":
+    rebuild_daily_stats()
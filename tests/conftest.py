@@ -0,0 +1,99 @@
+"""
+테스트 공용 fixture
+
+임시 SQLite 데이터베이스 매니저, 테스트용 게시글 데이터, 실행된 SELECT 문 캡처를 제공합니다.
+"""
+
+import sys
+import os
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+
+from database.config import DatabaseConfig, Base
+from database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+def _create_manager(tmp_dir: str) -> SQLAlchemyDatabaseManager:
+    """임시 SQLite 파일을 사용하는 매니저 생성"""
+    original_env = {key: os.environ.get(key) for key in ("DB_TYPE", "DB_PATH")}
+    os.environ["DB_TYPE"] = "sqlite"
+    os.environ["DB_PATH"] = os.path.join(tmp_dir, "test.db")
+    try:
+        config = DatabaseConfig()
+    finally:
+        for key, value in original_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    Base.metadata.create_all(bind=config.engine)
+
+    manager = SQLAlchemyDatabaseManager()
+    manager.db_config = config
+    return manager
+
+
+def _article(community_id: int, article_id: str) -> dict:
+    return {
+        "platform_id": "gangnamunni",
+        "community_article_id": article_id,
+        "community_id": community_id,
+        "title": f"제목 {article_id}",
+        "content": f"내용 {article_id}",
+        "writer_nickname": "작성자",
+        "writer_id": "writer",
+        "created_at": datetime(2025, 8, 5, 12, 0, 0)
+    }
+
+
+def _capture_selects(engine, call):
+    """call 실행 중 수행된 SELECT 문과 파라미터 목록, call 의 반환값"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "sqlite_master" not in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements, result
+
+
+@pytest.fixture
+def manager(tmp_path) -> SQLAlchemyDatabaseManager:
+    """임시 SQLite 파일을 사용하는 매니저"""
+    manager = _create_manager(str(tmp_path))
+    yield manager
+    manager.db_config.engine.dispose()
+
+
+@pytest.fixture
+def make_article():
+    """make_article(community_id, article_id) -> insert_article/bulk_upsert_articles 용 게시글 데이터"""
+    return _article
+
+
+@pytest.fixture
+def count_selects():
+    """count_selects(engine, call) -> (call 실행 중 수행된 SELECT 수, call 의 반환값)"""
+    def count(engine, call):
+        statements, result = _capture_selects(engine, call)
+        return len(statements), result
+    return count
+
+
+@pytest.fixture
+def capture_selects():
+    """capture_selects(engine, call) -> call 실행 중 수행된 (SELECT 문, 파라미터) 목록"""
+    def capture(engine, call):
+        statements, _ = _capture_selects(engine, call)
+        return statements
+    return capture
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+비동기 DB 접근 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from database.async_db import AsyncDatabase, run_db
+
+
+def test_async_database_runs_on_db_threads(manager, make_article):
+    db = AsyncDatabase(manager)
+
+    async def scenario():
+        community_id = await db.insert_community("강남언니")
+        await db.bulk_upsert_articles([make_article(community_id, str(i)) for i in range(3)])
+        thread_name = await run_db(lambda: threading.current_thread().name)
+        return await db.get_articles_by_filters({}, limit=10), thread_name
+
+    articles, thread_name = asyncio.run(scenario())
+    assert len(articles) == 3
+    assert thread_name.startswith("db")
+    # 메서드가 아닌 속성은 그대로 반환
+    assert db.db_config is manager.db_config
+
+
+def test_slow_query_does_not_block_event_loop():
+    async def scenario():
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        await asyncio.gather(run_db(time.sleep, 0.2), ticker())
+        return started, ticks
+
+    started, ticks = asyncio.run(scenario())
+    # 느린 DB 호출이 끝나기 전에 다른 코루틴이 계속 실행됨
+    assert len(ticks) == 5
+    assert ticks[-1] - started < 0.2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
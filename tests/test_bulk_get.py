@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Bulk Get 청크 조회 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from api.models import BulkGetRequest
+from api.routers import data_viewer
+from database.async_db import AsyncDatabase
+from database.sqlalchemy_manager import BULK_CHUNK_SIZE
+
+
+def _seed_articles(manager, make_article, count: int):
+    community_id = manager.insert_community("강남언니")
+    return sorted(manager.bulk_upsert_articles([make_article(community_id, str(i)) for i in range(count)]).values())
+
+
+async def _read_stream(response) -> list:
+    chunks = [chunk async for chunk in response.body_iterator]
+    return [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+
+
+def test_manager_chunks_ids_and_keeps_request_order(manager, make_article, count_selects):
+    ids = _seed_articles(manager, make_article, BULK_CHUNK_SIZE + 10)
+    requested = list(reversed(ids)) + [999999, ids[0]]
+
+    count, rows = count_selects(manager.db_config.engine, lambda: manager.get_articles_by_ids(requested))
+    assert count == 2
+    assert [row["id"] for row in rows] == list(reversed(ids))
+
+
+def test_bulk_endpoint_order_and_missing_ids(manager, make_article):
+    original_chunk_size = data_viewer.BULK_CHUNK_SIZE
+    data_viewer.BULK_CHUNK_SIZE = 3
+    try:
+        ids = _seed_articles(manager, make_article, 10)
+        db = AsyncDatabase(manager)
+        requested = [ids[7], 999999, ids[2], ids[9], ids[0], ids[5], 888888, ids[1]]
+
+        response = asyncio.run(data_viewer.get_articles_bulk(request=BulkGetRequest(ids=requested), db=db))
+        body = json.loads(response.body)
+        assert body["found_ids"] == [id for id in requested if id < 888888]
+        assert [item["id"] for item in body["data"]] == body["found_ids"]
+        assert body["missing_ids"] == [999999, 888888]
+
+        response = asyncio.run(data_viewer.get_articles_bulk(
+            request=BulkGetRequest(ids=requested, stream=True), db=db
+        ))
+        assert response.media_type == "application/x-ndjson"
+        lines = asyncio.run(_read_stream(response))
+        assert [line["id"] for line in lines[:-1]] == body["found_ids"]
+        assert lines[-1] == {"summary": {"total": 6, "requested": 8, "missing_ids": [999999, 888888]}}
+    finally:
+        data_viewer.BULK_CHUNK_SIZE = original_chunk_size
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
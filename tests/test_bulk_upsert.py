@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+bulk upsert 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+
+from database.sqlalchemy_manager import BULK_MAX_PARAMS
+
+
+def test_bulk_upsert_articles_and_comments(manager, make_article):
+    """게시글/댓글 일괄 저장 및 중복 무시 테스트"""
+    community_id = manager.insert_community("강남언니")
+    
+    mapping = manager.bulk_upsert_articles([make_article(community_id, "1"), make_article(community_id, "2")])
+    assert set(mapping.keys()) == {("gangnamunni", "1"), ("gangnamunni", "2")}
+    
+    # 중복 + 신규 혼합 저장 시 기존 ID 유지
+    mapping2 = manager.bulk_upsert_articles([make_article(community_id, "2"), make_article(community_id, "3")])
+    assert mapping2[("gangnamunni", "2")] == mapping[("gangnamunni", "2")]
+    assert manager.get_articles_count_by_filters({"platform_id": "gangnamunni"}) == 3
+    
+    # 중복 시 지정 컬럼만 갱신
+    updated = make_article(community_id, "1")
+    updated["like_count"] = 7
+    manager.bulk_upsert_articles([updated], update_fields=["like_count"])
+    assert manager.get_article_by_id(mapping[("gangnamunni", "1")])["like_count"] == 7
+    
+    article_id = mapping[("gangnamunni", "1")]
+    comments = [
+        {"article_id": article_id, "community_comment_id": str(i), "content": f"댓글 {i}",
+         "writer_nickname": "댓글러", "writer_id": "commenter"}
+        for i in range(3)
+    ]
+    comment_mapping = manager.bulk_upsert_comments(comments + comments[:1])
+    assert len(comment_mapping) == 3
+    assert manager.get_comments_count_by_article_id(article_id) == 3
+    
+    # 존재하지 않는 게시글의 댓글은 건너뜀
+    assert manager.bulk_upsert_comments([dict(comments[0], article_id=9999, community_comment_id="x")]) == {}
+
+
+def test_bulk_upsert_reviews(manager):
+    """후기 일괄 저장 테스트"""
+    community_id = manager.insert_community("바비톡")
+    
+    reviews = [
+        {"platform_id": "babitalk_review", "platform_review_id": str(i), "community_id": community_id,
+         "content": f"후기 {i}", "writer_nickname": "작성자", "writer_id": "writer"}
+        for i in range(5)
+    ]
+    mapping = manager.bulk_upsert_reviews(reviews)
+    assert len(mapping) == 5
+    assert manager.bulk_upsert_reviews(reviews) == mapping
+
+
+
+def test_existing_id_lookups(manager, make_article):
+    """중복 체크용 일괄 조회 테스트"""
+    community_id = manager.insert_community("강남언니")
+    
+    mapping = manager.bulk_upsert_articles([make_article(community_id, "1"), make_article(community_id, "2")])
+    existing = manager.get_article_ids_by_community_article_ids("gangnamunni", ["1", "2", "3"])
+    assert existing == {"1": mapping[("gangnamunni", "1")], "2": mapping[("gangnamunni", "2")]}
+    assert manager.get_article_ids_by_community_article_ids("babitalk_talk", ["1"]) == {}
+    
+    article_id = mapping[("gangnamunni", "1")]
+    manager.bulk_upsert_comments([
+        {"article_id": article_id, "community_comment_id": "c1", "content": "댓글",
+         "writer_nickname": "댓글러", "writer_id": "commenter"}
+    ])
+    assert manager.get_existing_comment_ids(article_id, ["c1", "c2"]) == {"c1"}
+    assert manager.get_existing_comment_ids(mapping[("gangnamunni", "2")], ["c1"]) == set()
+    
+    manager.bulk_upsert_reviews([
+        {"platform_id": "gangnamunni_review", "platform_review_id": "r1", "community_id": community_id,
+         "content": "후기", "writer_nickname": "작성자", "writer_id": "writer"}
+    ])
+    assert manager.get_existing_review_ids("gangnamunni_review", ["r1", "r2"]) == {"r1"}
+    assert manager.get_existing_review_ids("babitalk_review", ["r1"]) == set()
+
+
+
+def test_bulk_insert_stays_under_bind_parameter_limit(manager):
+    """다중 행 INSERT 문 하나의 바인드 파라미터 수는 BULK_MAX_PARAMS 이하"""
+    community_id = manager.insert_community("강남언니")
+    param_counts = []
+
+    def count_params(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO REVIEWS"):
+            param_counts.append(len(parameters))
+
+    event.listen(manager.db_config.engine, "before_cursor_execute", count_params)
+    try:
+        mapping = manager.bulk_upsert_reviews([
+            {"platform_id": "gangnamunni_review", "platform_review_id": f"r{i}", "community_id": community_id,
+             "content": "후기", "writer_nickname": "작성자", "writer_id": "writer"}
+            for i in range(300)
+        ])
+    finally:
+        event.remove(manager.db_config.engine, "before_cursor_execute", count_params)
+
+    assert len(mapping) == 300
+    assert len(param_counts) > 1
+    assert max(param_counts) <= BULK_MAX_PARAMS
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+호스트별 서킷 브레이커 테스트
+"""
+
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platforms.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerRegistry, CircuitState,
+    NotFoundError, PlatformHTTPError, http_error_for_status, retry_delay
+)
+
+
+async def _fail(breaker: CircuitBreaker, status: int = 404):
+    """실패 요청 1건 실행"""
+    try:
+        async with breaker:
+            raise http_error_for_status(status, "Not Found")
+    except PlatformHTTPError:
+        pass
+
+
+def test_opens_after_threshold_and_recovers_with_probe():
+    """연속 실패 시 OPEN, 차단 시간 후 확인 요청 성공 시 CLOSED"""
+    breaker = CircuitBreaker("example.com", failure_threshold=3, base_open_seconds=0.05, jitter_ratio=0)
+
+    async def run():
+        for _ in range(3):
+            await _fail(breaker)
+        assert breaker.state == CircuitState.OPEN
+
+        # 차단 시간이 지나면 확인 요청이 통과하고 성공 시 정상화
+        async with breaker:
+            assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.consecutive_failures == 0
+
+    asyncio.run(run())
+
+
+def test_failed_probe_backs_off_longer():
+    """확인 요청 실패 시 더 긴 시간 동안 다시 차단"""
+    breaker = CircuitBreaker("example.com", failure_threshold=1, base_open_seconds=0.02, jitter_ratio=0)
+
+    async def run():
+        await _fail(breaker)
+        first_duration = breaker.open_until - breaker.opened_at
+        await _fail(breaker)  # 확인 요청 실패
+        second_duration = breaker.open_until - breaker.opened_at
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.open_count == 2
+        assert second_duration > first_duration
+
+    asyncio.run(run())
+
+
+def test_half_open_allows_single_probe():
+    """HALF-OPEN 상태에서는 확인 요청 1건만 진행"""
+    breaker = CircuitBreaker("example.com", failure_threshold=1, base_open_seconds=0.01, jitter_ratio=0)
+    entered_states = []
+
+    async def job():
+        async with breaker:
+            entered_states.append(breaker.state)
+            await asyncio.sleep(0.02)
+
+    async def run():
+        await _fail(breaker)
+        await asyncio.sleep(0.02)
+        await asyncio.gather(*(job() for _ in range(5)))
+
+    asyncio.run(run())
+    # 확인 요청 1건만 HALF-OPEN 상태에서 진행되고 나머지는 정상화 후 진행
+    assert entered_states.count(CircuitState.HALF_OPEN) == 1
+    assert entered_states.count(CircuitState.CLOSED) == 4
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_non_failure_status_does_not_open():
+    """호스트 이상이 아닌 오류(400 등)는 실패로 집계하지 않음"""
+    breaker = CircuitBreaker("example.com", failure_threshold=1)
+
+    async def run():
+        await _fail(breaker, status=400)
+
+    asyncio.run(run())
+    assert breaker.state == CircuitState.CLOSED
+    assert isinstance(http_error_for_status(404), NotFoundError)
+
+
+def test_registry_and_retry_delay():
+    """호스트별 브레이커 공유 및 재시도 대기 시간 범위"""
+    registry = CircuitBreakerRegistry()
+    assert registry.get("example.com") is registry.get("example.com")
+    assert registry.get_stats()["example.com"]["state"] == CircuitState.CLOSED
+
+    for attempt in range(1, 5):
+        base = min(60.0, 2.0 * (2 ** (attempt - 1)))
+        assert base / 2 <= retry_delay(attempt) <= base
+
+
+if __name__ == "__main__":
+    test_opens_after_threshold_and_recovers_with_probe()
+    test_failed_probe_backs_off_longer()
+    test_half_open_allows_single_probe()
+    test_non_failure_status_does_not_open()
+    test_registry_and_retry_delay()
+    print("✅ 서킷 브레이커 테스트 완료")
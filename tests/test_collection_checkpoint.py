@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+날짜별 수집 체크포인트 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from api.services.async_collection_service import _checkpointed_units
+from collectors.checkpoint import DateCheckpoint
+from collectors.scheduler import CollectionUnit
+from collectors.gannamunni_collector import GangnamUnniDataCollector
+from database.async_db import AsyncDatabase
+from platforms.babitalk import BabitalkAPI, BabitalkEventAskMemoPagination, BabitalkTalkPagination
+from platforms.circuit_breaker import PlatformHTTPError
+from platforms.gannamunni import GangnamUnniAPI
+
+
+class _PagedTalkAPI(BabitalkAPI):
+    """search_after 커서별로 고정된 자유톡 페이지를 반환하는 API"""
+
+    PAGES = {
+        0: ([("1", "2025-08-05 12:00:00"), ("2", "2025-08-05 11:00:00")], 100),
+        100: ([("3", "2025-08-05 10:00:00"), ("4", "2025-08-05 09:00:00")], 200),
+        200: ([("5", "2025-08-05 08:00:00")] + [(str(i), "2025-08-04 23:00:00") for i in range(6, 11)], None),
+    }
+
+    def __init__(self, failing=()):
+        super().__init__()
+        self.requested = []
+        self.failing = set(failing)
+
+    async def get_talks(self, service_id, limit=24, search_after=None, sort="recent"):
+        self.requested.append(search_after)
+        if search_after in self.failing:
+            raise PlatformHTTPError(503, "Service Unavailable")
+        rows, next_cursor = self.PAGES[search_after]
+        talks = [SimpleNamespace(id=talk_id, created_at=created_at) for talk_id, created_at in rows]
+        return talks, BabitalkTalkPagination(has_next=next_cursor is not None, search_after=next_cursor)
+
+
+def test_checkpoint_resume_and_complete(manager):
+    """진행 중 체크포인트만 재개하고, 완료된 체크포인트는 처음부터 다시 수집"""
+    checkpoint = DateCheckpoint(manager, "babitalk_talk", "2025-08-05", 79)
+
+    assert checkpoint.resume() == (None, {})
+
+    checkpoint.save(100, "2", {"talks": 2})
+    assert checkpoint.resume() == (100, {"talks": 2})
+    assert manager.get_collection_checkpoint("babitalk_talk", "2025-08-05", "79")["last_item_id"] == "2"
+
+    # 다른 카테고리는 별도 체크포인트
+    assert DateCheckpoint(manager, "babitalk_talk", "2025-08-05", 71).resume() == (None, {})
+
+    checkpoint.complete({"talks": 5})
+    assert checkpoint.resume() == (None, {})
+    assert manager.get_collection_checkpoint("babitalk_talk", "2025-08-05", "79")["status"] == "completed"
+
+
+def test_paging_resumes_from_saved_cursor(manager):
+    """중단된 페이지 수집이 저장된 search_after 커서부터 재개"""
+    checkpoint = DateCheckpoint(manager, "babitalk_talk", "2025-08-05", 79)
+    saved_ids = []
+
+    async def save_page(talks, next_search_after):
+        saved_ids.extend(talk.id for talk in talks)
+        checkpoint.save(next_search_after, talks[-1].id if talks else None, {"talks": len(saved_ids)})
+        if next_search_after == 200 and len(saved_ids) == 4:
+            # 두 번째 페이지 저장 직후 중단 (서버 종료 상황)
+            raise asyncio.CancelledError()
+
+    first_api = _PagedTalkAPI()
+    try:
+        asyncio.run(first_api.get_talks_by_date("2025-08-05", 79, on_page=save_page))
+    except asyncio.CancelledError:
+        pass
+    assert first_api.requested == [0, 100]
+
+    start_search_after, stats = checkpoint.resume()
+    assert (start_search_after, stats) == (200, {"talks": 4})
+
+    second_api = _PagedTalkAPI()
+    talks = asyncio.run(second_api.get_talks_by_date("2025-08-05", 79, start_search_after=start_search_after, on_page=save_page))
+    assert second_api.requested == [200]
+    assert [talk.id for talk in talks] == ["5"]
+    assert saved_ids == ["1", "2", "3", "4", "5"]
+
+
+def test_http_error_keeps_checkpoint_in_progress(manager):
+    """요청 실패로 중단된 수집은 완료로 기록하지 않고, 재개 후 날짜 끝에 도달하면 완료"""
+    checkpoint = DateCheckpoint(manager, "babitalk_talk", "2025-08-05", 79)
+
+    async def save_page(talks, next_search_after):
+        checkpoint.save(next_search_after, talks[-1].id if talks else None, {"talks": 2})
+
+    failing_api = _PagedTalkAPI(failing={100})
+    with patch("platforms.babitalk.retry_delay", return_value=0):
+        asyncio.run(failing_api.get_talks_by_date("2025-08-05", 79, on_page=save_page, on_complete=checkpoint.mark_end))
+    assert failing_api.requested[0] == 0 and set(failing_api.requested[1:]) == {100}
+
+    assert checkpoint.complete_if_reached_end({"talks": 2}) is False
+    assert manager.get_collection_checkpoint("babitalk_talk", "2025-08-05", "79")["status"] == "in_progress"
+
+    resumed = DateCheckpoint(manager, "babitalk_talk", "2025-08-05", 79)
+    start_search_after, _ = resumed.resume()
+    assert start_search_after == 100
+
+    asyncio.run(_PagedTalkAPI().get_talks_by_date("2025-08-05", 79, start_search_after=start_search_after,
+                                                  on_complete=resumed.mark_end))
+    assert resumed.complete_if_reached_end({"talks": 5}) is True
+    assert manager.get_collection_checkpoint("babitalk_talk", "2025-08-05", "79")["status"] == "completed"
+
+
+class _PagedMemoAPI(BabitalkAPI):
+    """search_after 커서별로 고정된 발품후기 페이지를 반환하는 API (작성 시각은 절대 시각으로 고정)"""
+
+    PAGES = {
+        0: (["2025-08-05 12:00:00"], 100),
+        100: (["2025-08-06 01:00:00"], 200),
+        200: (["2025-08-05 09:00:00", "2025-08-04 23:00:00"], None),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.requested = []
+
+    def _parse_relative_time_to_date(self, time_str):
+        return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
+
+    async def get_event_ask_memos(self, category_id, limit=24, search_after=None, sort="recent"):
+        self.requested.append(search_after)
+        rows, next_cursor = self.PAGES[search_after]
+        memos = [SimpleNamespace(id=f"{search_after}-{i}", first_write_at=written_at) for i, written_at in enumerate(rows)]
+        return memos, BabitalkEventAskMemoPagination(has_next=next_cursor is not None, search_after=next_cursor)
+
+
+def test_event_ask_memos_resume_like_first_page():
+    """발품후기 재개도 후기/자유톡과 같이 첫 요청 페이지를 처음부터 수집하는 것처럼 처리"""
+    api = _PagedMemoAPI()
+    reached_end = []
+
+    async def on_complete():
+        reached_end.append(True)
+
+    # 재개 첫 페이지에 대상 날짜 항목이 없어도 중단하지 않고 다음 페이지까지 진행
+    memos = asyncio.run(api.get_event_ask_memos_by_date("2025-08-05", 1, start_search_after=100, on_complete=on_complete))
+    assert api.requested == [100, 200]
+    assert [memo.id for memo in memos] == ["200-0"]
+    assert reached_end == [True]
+
+
+class _FlakyCommentAPI:
+    """게시글 1건을 반환하고, 댓글 조회는 fail_comments 가 True 인 동안 HTTP 오류(None)로 응답하는 API"""
+
+    def __init__(self, fail_comments: bool):
+        self.fail_comments = fail_comments
+        self.start_pages = []
+        self.comment_requests = []
+
+    async def get_articles_by_date(self, target_date, category="hospital_question", start_page=1, on_page=None, on_complete=None):
+        self.start_pages.append(start_page)
+        if start_page == 1:
+            await on_page([SimpleNamespace(id=1, comment_count=3)], 2)
+        await on_complete()
+
+    async def get_comments_for_articles(self, article_ids):
+        self.comment_requests.append(list(article_ids))
+        return {article_id: None if self.fail_comments else [] for article_id in article_ids}
+
+
+def _gangnamunni_collector(manager, api) -> GangnamUnniDataCollector:
+    collector = GangnamUnniDataCollector.__new__(GangnamUnniDataCollector)
+    super(GangnamUnniDataCollector, collector).__init__("GangnamUnniCollector")
+    collector.api = api
+    collector.db = manager
+    collector.async_db = AsyncDatabase(manager)
+    return collector
+
+
+def test_failed_comment_targets_survive_restart(manager, make_article):
+    """댓글 재시도 대상은 체크포인트에 남아 재시작 후 다시 시도되고, 성공해야 완료로 기록"""
+    community_id = manager.insert_community("강남언니")
+    article_db_id = manager.insert_article(make_article(community_id, "1"))
+
+    with patch("collectors.gannamunni_collector.retry_delay", return_value=0):
+        failing_api = _FlakyCommentAPI(fail_comments=True)
+        asyncio.run(_gangnamunni_collector(manager, failing_api).collect_category_articles_by_date("2025-08-05"))
+
+        checkpoint = manager.get_collection_checkpoint("gangnamunni", "2025-08-05", "hospital_question")
+        assert checkpoint["status"] == "in_progress"
+        assert checkpoint["stats"]["failed_comment_targets"] == [[1, article_db_id]]
+
+        # 재시작: 저장된 페이지 다음부터 재개하고, 남은 댓글 대상을 다시 조회
+        api = _FlakyCommentAPI(fail_comments=False)
+        asyncio.run(_gangnamunni_collector(manager, api).collect_category_articles_by_date("2025-08-05"))
+
+    assert api.start_pages == [2]
+    assert api.comment_requests == [[1]]
+    checkpoint = manager.get_collection_checkpoint("gangnamunni", "2025-08-05", "hospital_question")
+    assert checkpoint["status"] == "completed"
+    assert checkpoint["stats"]["failed_comment_targets"] == []
+
+
+def test_unit_recorded_only_after_date_checkpoint_completed(manager):
+    """날짜별 체크포인트가 진행 중이면 단위를 완료로 기록하지 않고, 완료된 뒤에만 기록"""
+    checkpoint = DateCheckpoint(manager, "babitalk_review", "2025-08-05")
+    recorded = []
+
+    async def collect():
+        return 3
+
+    def run_unit():
+        units = _checkpointed_units(
+            [CollectionUnit("reviews", "시술후기", collect)], {}, recorded.append,
+            manager, "2025-08-05", {"reviews": [("babitalk_review", "")]}
+        )
+        return asyncio.run(units[0].factory())
+
+    checkpoint.save(100, "2", {"reviews": 2})
+    assert run_unit() == 3
+    assert recorded == []
+
+    checkpoint.complete({"reviews": 3})
+    assert run_unit() == 3
+    assert recorded == [{"units": {"reviews": 3}}]
+
+
+def test_gangnamunni_page_save_error_is_not_swallowed():
+    """페이지 저장(on_page) 오류는 실패한 페이지로 처리되지 않고 전파되어 완료로 기록되지 않음"""
+    class _OnePageAPI(GangnamUnniAPI):
+        def __init__(self):
+            super().__init__()
+            self.requested_pages = []
+
+        async def get_article_list(self, category="hospital_question", page=1):
+            self.requested_pages.append(page)
+            return [SimpleNamespace(id=page, create_time="2025-08-05 12:00:00")]
+
+    api = _OnePageAPI()
+    completed = []
+
+    async def on_page(articles, next_page):
+        raise RuntimeError("database is locked")
+
+    async def on_complete():
+        completed.append(True)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(api.get_articles_by_date("2025-08-05", on_page=on_page, on_complete=on_complete))
+    assert api.requested_pages == [1]
+    assert completed == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+수집 단위 동시 실행 스케줄러 테스트
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.scheduler import CollectionScheduler, CollectionUnit, configure_platform_budget
+
+
+def test_units_run_in_parallel_with_errors_isolated():
+    """단위 병렬 실행, 실패 단위 격리, 결과 순서 유지"""
+    configure_platform_budget("test_parallel", units_per_second=100, max_concurrency=4)
+
+    async def sleeper(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    units = [CollectionUnit(i, f"unit-{i}", lambda i=i: sleeper(i)) for i in range(3)]
+    units.append(CollectionUnit("bad", "bad-unit", failing))
+
+    started = time.monotonic()
+    report = asyncio.run(CollectionScheduler("test_parallel").run(units))
+    elapsed = time.monotonic() - started
+
+    # 순차 실행이면 0.35초 이상, 병렬이면 가장 긴 단위(0.1초) 수준
+    assert elapsed < 0.3
+    assert list(report.units.keys()) == [0, 1, 2, "bad"]
+    assert report.values(default=0) == {0: 0, 1: 1, 2: 2, "bad": 0}
+    assert report.errors == {"bad": "boom"}
+    assert report.to_dict()["units"]["bad"]["status"] == "error"
+
+
+def test_platform_concurrency_cap():
+    """플랫폼별 최대 동시 실행 수 제한"""
+    configure_platform_budget("test_cap", units_per_second=100, max_concurrency=2)
+    running = 0
+    peak = 0
+    completed = []
+
+    async def job():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return 1
+
+    units = [CollectionUnit(i, f"unit-{i}", job) for i in range(6)]
+    report = asyncio.run(CollectionScheduler("test_cap").run(
+        units, on_unit_done=lambda result, done, total: completed.append((done, total))
+    ))
+
+    assert peak == 2
+    assert sum(report.values().values()) == 6
+    assert completed[-1] == (6, 6)
+
+
+if __name__ == "__main__":
+    test_units_run_in_parallel_with_errors_isolated()
+    test_platform_concurrency_cap()
+    print("✅ 스케줄러 테스트 완료")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+댓글 조회 쿼리 수 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+def test_comment_reads_do_not_lazy_load_articles(manager, make_article, count_selects):
+    """댓글 수와 관계없이 게시글 정보를 포함한 조회가 한 번의 쿼리로 끝남"""
+    engine = manager.db_config.engine
+    community_id = manager.insert_community("강남언니")
+
+    mapping = manager.bulk_upsert_articles([make_article(community_id, str(i)) for i in range(10)])
+    comment_mapping = manager.bulk_upsert_comments([
+        {"article_id": article_id, "community_comment_id": f"c{article_id}-{i}", "content": "코성형 댓글",
+         "writer_nickname": "댓글러", "writer_id": "commenter"}
+        for article_id in mapping.values()
+        for i in range(3)
+    ])
+
+    count, comments = count_selects(engine, lambda: manager.get_comments_by_filters({}, limit=100))
+    assert count == 1
+    assert len(comments) == 30
+    assert {comment["article_title"] for comment in comments} == {f"제목 {i}" for i in range(10)}
+    assert {comment["article_platform_id"] for comment in comments} == {"gangnamunni"}
+
+    count, comments = count_selects(engine, lambda: manager.get_comments_by_ids(list(comment_mapping.values())))
+    assert count == 1
+    assert len(comments) == 30
+
+    count, results = count_selects(engine, lambda: manager.search_documents_by_keywords(
+        ["코성형"], data_types=["comment"], limit=30
+    ))
+    # 개수 1 + 페이지 1 + 원본 조회 1
+    assert count == 3
+    assert all(item["data"]["article_title"] for item in results["results"])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
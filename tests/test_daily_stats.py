@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+일별 집계 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import text
+
+
+def _seed(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    today = datetime.now().replace(microsecond=0)
+
+    naver = make_article(community_id, "n1")
+    naver.update({"platform_id": "naver", "category_name": "여우야", "created_at": today})
+    mapping = manager.bulk_upsert_articles([make_article(community_id, "1"), make_article(community_id, "2"), naver])
+    # 중복 저장은 집계에 더하지 않음
+    manager.bulk_upsert_articles([make_article(community_id, "1"), make_article(community_id, "3")])
+
+    manager.insert_comment({
+        "article_id": mapping[("naver", "n1")], "community_comment_id": "c1", "content": "댓글",
+        "writer_nickname": "댓글러", "writer_id": "commenter", "created_at": today
+    })
+    manager.bulk_upsert_reviews([
+        {"platform_id": "babitalk", "platform_review_id": f"r{i}", "community_id": community_id,
+         "content": "후기", "writer_nickname": "작성자", "writer_id": "writer",
+         "created_at": today - timedelta(days=i)}
+        for i in range(3)
+    ])
+    return today
+
+
+def test_counters_updated_at_ingest(manager, make_article):
+    today = _seed(manager, make_article)
+
+    stats = manager.get_statistics()
+    assert (stats["total_articles"], stats["total_comments"], stats["total_reviews"]) == (4, 1, 3)
+    assert stats["category_stats"] == {"여우야": 1}
+    assert stats["today_articles"] == 1
+    assert stats["platform_stats"]["gangnamunni"] == {"articles": 3, "comments": 0, "reviews": 0}
+    assert stats["platform_stats"]["naver"] == {"articles": 1, "comments": 1, "reviews": 0}
+
+    assert manager.get_platform_statistics("babitalk") == {"articles": 0, "comments": 0, "reviews": 3}
+
+    daily = manager.get_daily_statistics(today.strftime("%Y-%m-%d"))
+    assert (daily["articles"], daily["comments"], daily["reviews"]) == (1, 1, 1)
+    assert daily["by_platform"]["naver"] == {"articles": 1, "comments": 1, "reviews": 0}
+
+    trends = manager.get_trend_statistics(3)
+    assert [point["count"] for point in trends["review_trends"]] == [1, 1, 1]
+    assert [point["count"] for point in trends["comment_trends"]] == [0, 0, 1]
+    assert trends["article_trends"][-1] == {"date": today.strftime("%Y-%m-%d"), "count": 1}
+
+
+def test_rebuild_matches_incremental_counters(manager, make_article):
+    _seed(manager, make_article)
+    expected = manager.get_daily_stat_counts(["stat_date", "platform_id", "category", "entity_type"])
+
+    # 원본을 직접 수정해 집계가 어긋난 상황
+    with manager.db_config.engine.begin() as conn:
+        conn.execute(text("DELETE FROM daily_stats"))
+    assert manager.get_statistics()["total_articles"] == 0
+
+    assert manager.rebuild_daily_stats() == {"article": 4, "comment": 1, "review": 3}
+    assert manager.get_daily_stat_counts(["stat_date", "platform_id", "category", "entity_type"]) == expected
+
+
+def test_created_at_update_moves_counters_and_null_days_skipped(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    manager.bulk_upsert_articles([make_article(community_id, "1"), make_article(community_id, "2")])
+
+    # 중복 갱신으로 작성일/카테고리가 바뀌면 이전 날짜에서 빼고 새 날짜에 더함
+    moved = make_article(community_id, "1")
+    moved.update({"created_at": datetime(2025, 8, 1, 9, 0, 0), "category_name": "자유수다"})
+    manager.bulk_upsert_articles([moved], update_fields=["created_at", "category_name"])
+    counts = manager.get_daily_stat_counts(["stat_date", "category"], entity_type="article")
+    assert counts == [
+        {"stat_date": "2025-08-01", "category": "자유수다", "count": 1},
+        {"stat_date": "2025-08-05", "category": "", "count": 1},
+    ]
+
+    # 작성일이 없는 행은 증분 갱신과 재생성 모두 제외
+    with manager.db_config.engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO articles (platform_id, community_article_id, community_id, title, content, "
+            "writer_nickname, writer_id, created_at) VALUES ('gangnamunni', 'null', :community_id, "
+            "'제목', '내용', '작성자', 'writer', NULL)"
+        ), {"community_id": community_id})
+        null_id = conn.execute(text("SELECT id FROM articles WHERE community_article_id = 'null'")).scalar()
+    session = manager.get_session()
+    try:
+        manager._increment_daily_stats(session, "article", [null_id])
+        session.commit()
+    finally:
+        session.close()
+    incremental = manager.get_daily_stat_counts(["stat_date", "platform_id", "category", "entity_type"])
+    manager.rebuild_daily_stats()
+    assert manager.get_daily_stat_counts(["stat_date", "platform_id", "category", "entity_type"]) == incremental
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
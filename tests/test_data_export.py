@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+대량 내보내기 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from api.models import DataType
+from api.routers import data_viewer
+from database.async_db import AsyncDatabase
+
+
+def _seed(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    articles = []
+    for i in range(7):
+        article = make_article(community_id, str(i))
+        article["created_at"] = datetime(2025, 8, 1) + timedelta(days=i)
+        articles.append(article)
+    naver = make_article(community_id, "n1")
+    naver["platform_id"] = "naver"
+    articles.append(naver)
+    mapping = manager.bulk_upsert_articles(articles)
+    manager.bulk_upsert_comments([
+        {"article_id": mapping[("gangnamunni", "0")], "community_comment_id": "c1", "content": "댓글, \"인용\"",
+         "writer_nickname": "댓글러", "writer_id": "commenter", "created_at": datetime(2025, 8, 2)}
+    ])
+
+
+async def _read_body(response) -> str:
+    chunks = []
+    async for chunk in response.body_iterator:
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+def test_export_batches_filter_and_order(manager, make_article):
+    _seed(manager, make_article)
+
+    batches = list(manager.iter_export_batches(
+        "article", platforms=["gangnamunni"], start_date="2025-08-02", end_date="2025-08-06", batch_size=2
+    ))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row["community_article_id"] for row in rows] == ["1", "2", "3", "4", "5"]
+    assert rows[0]["created_at"] == "2025-08-02T00:00:00"
+    assert list(rows[0].keys()) == manager.get_export_fields("article")
+
+    comments = [row for batch in manager.iter_export_batches("comment") for row in batch]
+    assert comments[0]["article_title"] == "제목 0"
+    assert list(manager.iter_export_batches("review")) == []
+
+
+def test_export_endpoint_streams_ndjson_and_csv(manager, make_article):
+    _seed(manager, make_article)
+    db = AsyncDatabase(manager)
+
+    async def scenario():
+        ndjson = await data_viewer.export_data(
+            data_type=DataType.ARTICLE, platforms="naver", start_date=None, end_date=None,
+            format="ndjson", db=db
+        )
+        csv_response = await data_viewer.export_data(
+            data_type=DataType.COMMENT, platforms=None, start_date=None, end_date=None,
+            format="csv", db=db
+        )
+        return ndjson, await _read_body(ndjson), csv_response, await _read_body(csv_response)
+
+    ndjson, ndjson_body, csv_response, csv_body = asyncio.run(scenario())
+
+    assert ndjson.media_type == "application/x-ndjson"
+    lines = [json.loads(line) for line in ndjson_body.splitlines()]
+    assert [line["community_article_id"] for line in lines] == ["n1"]
+
+    assert csv_response.media_type == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(csv_body)))
+    assert len(rows) == 1
+    assert rows[0]["content"] == "댓글, \"인용\""
+    assert rows[0]["community_comment_id"] == "c1"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
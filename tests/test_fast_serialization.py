@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+조회 응답 직렬화 테스트 (임시 SQLite 데이터베이스 사용)
+
+DB 행을 바로 직렬화한 응답이 Pydantic 응답 모델과 같은 형식인지 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import json
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+
+from api.main import app
+from api.models import Article, BulkGetRequest, Comment, PaginatedResponse, Review
+from api.routers import data_viewer
+from api.utils.serialization import dumps
+from database.async_db import AsyncDatabase
+from database.cache import set_response_cache
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []})
+
+
+def _seed(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    article_ids = manager.bulk_upsert_articles([make_article(community_id, str(i)) for i in range(3)])
+    article_id = article_ids[("gangnamunni", "0")]
+    manager.bulk_upsert_comments([{
+        "article_id": article_id, "community_comment_id": f"c{i}", "content": "댓글",
+        "writer_nickname": "작성자", "writer_id": "writer", "created_at": datetime(2025, 8, 1, 12)
+    } for i in range(2)])
+    manager.bulk_upsert_reviews([{
+        "platform_id": "babitalk_review", "platform_review_id": "r1", "community_id": community_id,
+        "content": "후기", "writer_nickname": "작성자", "writer_id": "writer",
+        "created_at": datetime(2025, 8, 1, 12), "categories": '["코성형"]'
+    }])
+
+
+def test_dumps_handles_models_and_datetimes():
+    created_at = datetime(2025, 8, 1, 12, 30)
+    assert json.loads(dumps({"created_at": created_at, "name": "강남언니"})) == {
+        "created_at": "2025-08-01T12:30:00", "name": "강남언니"
+    }
+    assert json.loads(dumps([BulkGetRequest(ids=[1, 2])])) == [{"ids": [1, 2], "stream": False}]
+
+
+def test_list_responses_match_response_models(manager, make_article):
+    set_response_cache(None)
+    _seed(manager, make_article)
+    db = AsyncDatabase(manager)
+
+    for endpoint, model in (
+        (data_viewer.get_articles, Article),
+        (data_viewer.get_reviews, Review),
+    ):
+        response = asyncio.run(endpoint(
+            platform=None, category=None, page=1, limit=20, cursor=None, db=db, request=_request()
+        ))
+        body = json.loads(response.body)
+        assert body["data"]
+        expected = PaginatedResponse(**{**body, "data": [model(**item) for item in body["data"]]})
+        assert body == expected.model_dump(mode="json")
+
+    response = asyncio.run(data_viewer.get_comments(
+        platform=None, article_id=None, page=1, limit=20, cursor=None, db=db, request=_request()
+    ))
+    body = json.loads(response.body)
+    assert len(body["data"]) == 2
+    assert body["data"] == [Comment(**item).model_dump(mode="json") for item in body["data"]]
+
+    bulk = asyncio.run(data_viewer.get_comments_bulk(request=BulkGetRequest(ids=[1, 2, 99999]), db=db))
+    bulk_body = json.loads(bulk.body)
+    assert bulk_body["found_ids"] == [1, 2]
+    assert bulk_body["missing_ids"] == [99999]
+    assert bulk_body["data"] == [Comment(**item).model_dump(mode="json") for item in bulk_body["data"]]
+
+
+def test_gzip_middleware_enabled():
+    assert any(middleware.cls is GZipMiddleware for middleware in app.user_middleware)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+전문 검색 인덱스 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import text
+
+from database.fulltext import _sqlite_statements, ensure_fulltext_indexes, fulltext_available
+
+
+def test_search_uses_index_kept_in_sync_at_ingest(manager, make_article):
+    """수집 시 저장한 게시글/댓글/후기가 전문 검색 인덱스로 검색됨"""
+    engine = manager.db_config.engine
+    community_id = manager.insert_community("강남언니")
+
+    # 인덱스 생성 전에 저장된 데이터도 인덱스에 반영
+    before = make_article(community_id, "1")
+    before["content"] = "코성형 상담 후기 공유합니다"
+    manager.bulk_upsert_articles([before])
+
+    ensure_fulltext_indexes(engine)
+    assert fulltext_available(engine)
+
+    after = make_article(community_id, "2")
+    after["title"] = "눈 재수술 병원 추천"
+    mapping = manager.bulk_upsert_articles([after])
+    manager.bulk_upsert_comments([
+        {"article_id": mapping[("gangnamunni", "2")], "community_comment_id": "c1",
+         "content": "저도 코성형 고민중이에요", "writer_nickname": "댓글러", "writer_id": "commenter"}
+    ])
+    manager.bulk_upsert_reviews([
+        {"platform_id": "gangnamunni_review", "platform_review_id": "r1", "community_id": community_id,
+         "content": "만족합니다", "hospital_name": "우리성형외과", "writer_nickname": "작성자", "writer_id": "writer"}
+    ])
+
+    results = manager.search_data_by_keywords(["코성형", "우리성형외과"])
+    assert [article["community_article_id"] for article in results["articles"]] == ["1"]
+    assert [comment["community_comment_id"] for comment in results["comments"]] == ["c1"]
+    assert len(results["reviews"]) == 1
+    assert manager.search_data_count_by_keywords(["코성형"]) == {"articles": 1, "comments": 1, "reviews": 0}
+
+    # 인덱스 토큰보다 짧은 키워드는 LIKE 로 검색
+    assert manager.search_data_count_by_keywords(["눈"])["articles"] == 1
+
+    # 수정/삭제도 인덱스에 반영
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE articles SET content = '가슴성형 후기' WHERE community_article_id = '1'"))
+        conn.execute(text("DELETE FROM comments"))
+    assert manager.search_data_count_by_keywords(["코성형"]) == {"articles": 0, "comments": 0, "reviews": 0}
+    assert manager.search_data_count_by_keywords(["가슴성형"])["articles"] == 1
+
+
+def test_like_fallback_without_fulltext_support(manager, make_article):
+    """전문 검색 인덱스를 만들 수 없는 환경에서는 인덱스 없이 LIKE 로 검색"""
+    engine = manager.db_config.engine
+    community_id = manager.insert_community("강남언니")
+    article = make_article(community_id, "1")
+    article["content"] = "코성형 상담 후기 공유합니다"
+    manager.bulk_upsert_articles([article])
+
+    with patch("database.fulltext._fulltext_supported", return_value=False):
+        ensure_fulltext_indexes(engine)
+    assert not fulltext_available(engine)
+    assert manager.search_data_count_by_keywords(["코성형"])["articles"] == 1
+
+
+def test_legacy_indexes_dropped_only_after_new_index_created(manager):
+    """이전 테이블별 인덱스는 검색 문서 인덱스가 만들어진 뒤에만 제거"""
+    engine = manager.db_config.engine
+    with engine.begin() as conn:
+        for statement in _sqlite_statements("articles", ("title", "content")):
+            conn.execute(text(statement))
+
+    def legacy_objects():
+        with engine.connect() as conn:
+            return {name for (name,) in conn.execute(text("SELECT name FROM sqlite_master WHERE name LIKE 'articles_fts%'"))}
+
+    with patch("database.fulltext._sqlite_statements", side_effect=RuntimeError("index creation failed")):
+        with pytest.raises(RuntimeError):
+            ensure_fulltext_indexes(engine)
+    assert {"articles_fts", "articles_fts_ai", "articles_fts_ad", "articles_fts_au"} <= legacy_objects()
+
+    with patch("database.fulltext.fulltext_available", return_value=False):
+        assert not ensure_fulltext_indexes(engine)
+    assert {"articles_fts", "articles_fts_ai", "articles_fts_ad", "articles_fts_au"} <= legacy_objects()
+
+    assert ensure_fulltext_indexes(engine)
+    assert legacy_objects() == set()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
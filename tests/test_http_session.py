@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+플랫폼 공유 HTTP 세션 관리자 테스트 (네트워크 요청 없음)
+"""
+
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platforms.http_session import HttpSessionManager
+
+
+def test_session_reused_per_platform_within_loop():
+    """같은 이벤트 루프에서는 플랫폼별 세션을 재사용하고, 닫힌 세션은 새로 생성"""
+    manager = HttpSessionManager(limit=20, limit_per_host=5)
+
+    async def run():
+        first = await manager.get_session("naver")
+        concurrent = await asyncio.gather(*(manager.get_session("naver") for _ in range(5)))
+        other = await manager.get_session("babitalk")
+        assert all(session is first for session in concurrent)
+        assert other is not first
+        assert manager.get_stats()["naver"] == {"closed": False, "limit": 20, "limit_per_host": 5}
+
+        await first.close()
+        replaced = await manager.get_session("naver")
+        assert replaced is not first and not replaced.closed
+
+        await manager.close_all()
+
+    asyncio.run(run())
+
+
+def test_new_loop_gets_new_session():
+    """다른 이벤트 루프에서는 이전 루프의 세션을 재사용하지 않고 닫음"""
+    manager = HttpSessionManager()
+
+    async def get_and_keep():
+        return await manager.get_session("gangnamunni")
+
+    first = asyncio.run(get_and_keep())
+
+    async def run():
+        second = await manager.get_session("gangnamunni")
+        assert second is not first
+        assert first.closed
+        assert await manager.get_session("gangnamunni") is second
+        await manager.close_all()
+        return second
+
+    second = asyncio.run(run())
+    assert second.closed
+
+
+def test_close_all_closes_other_loop_sessions():
+    """close_all 은 다른 이벤트 루프에서 생성된 세션도 닫음"""
+    manager = HttpSessionManager()
+
+    async def get_and_keep():
+        return await manager.get_session("babitalk")
+
+    stale = asyncio.run(get_and_keep())
+
+    async def run():
+        await manager.close_all()
+        assert manager.get_stats() == {}
+
+    asyncio.run(run())
+    assert stale.closed
+
+
+def test_close_all_closes_current_loop_sessions():
+    """close_all 은 현재 루프의 세션을 닫고 비우며, 이후 요청은 새 세션을 생성"""
+    manager = HttpSessionManager()
+
+    async def run():
+        sessions = [await manager.get_session(platform) for platform in ("gangnamunni", "babitalk", "naver")]
+        await manager.close_all()
+        assert all(session.closed for session in sessions)
+        assert manager.get_stats() == {}
+
+        # 이미 닫힌 세션이 있어도 오류 없이 정리
+        reopened = await manager.get_session("naver")
+        assert reopened not in sessions
+        await reopened.close()
+        await manager.close_all()
+        assert manager.get_stats() == {}
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_session_reused_per_platform_within_loop()
+    test_new_loop_gets_new_session()
+    test_close_all_closes_other_loop_sessions()
+    test_close_all_closes_current_loop_sessions()
+    print("✅ HTTP 세션 관리자 테스트 완료")
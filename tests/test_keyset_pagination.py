@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+키셋(커서) 페이지네이션 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.pagination import decode_cursor, encode_cursor, split_page
+
+
+def _walk(fetch, limit):
+    """커서로 마지막 페이지까지 순회하며 ID 목록 반환"""
+    ids, cursor = [], None
+    while True:
+        page, cursor = split_page(fetch(limit + 1, cursor), limit)
+        ids.extend(item["id"] for item in page)
+        if cursor is None:
+            return ids
+
+
+def test_cursor_pages_match_offset_order(manager, make_article):
+    """같은 작성일이 섞여 있어도 커서 순회 결과가 offset 전체 조회와 같음"""
+    community_id = manager.insert_community("강남언니")
+
+    articles = []
+    for i in range(7):
+        article = make_article(community_id, str(i))
+        # 두 건씩 같은 작성일
+        article["created_at"] = datetime(2025, 8, 5, 12, 0, 0) - timedelta(hours=i // 2)
+        articles.append(article)
+    manager.bulk_upsert_articles(articles)
+
+    expected = [article["id"] for article in manager.get_articles_by_filters({}, limit=100)]
+    assert len(expected) == 7
+
+    walked = _walk(lambda size, cursor: manager.get_articles_by_filters({}, limit=size, cursor=cursor), 3)
+    assert walked == expected
+
+    # 필터와 함께 사용
+    assert _walk(lambda size, cursor: manager.get_articles_by_filters(
+        {"platform_id": "gangnamunni"}, limit=size, cursor=cursor
+    ), 2) == expected
+
+
+def test_search_cursor_pages(manager, make_article):
+    """통합 검색도 커서로 전체 결과를 중복 없이 순회"""
+    community_id = manager.insert_community("강남언니")
+    articles = []
+    for i in range(5):
+        article = make_article(community_id, str(i))
+        article["content"] = "코성형 후기"
+        articles.append(article)
+    manager.bulk_upsert_articles(articles)
+
+    ids, cursor = [], None
+    while True:
+        results = manager.search_documents_by_keywords(["코성형"], limit=2, cursor=cursor, with_counts=False)
+        assert results["total"] is None
+        ids.extend(item["id"] for item in results["results"])
+        cursor = results["next_cursor"]
+        if cursor is None:
+            break
+    assert ids == [item["id"] for item in manager.search_documents_by_keywords(["코성형"], limit=10)["results"]]
+
+
+def test_invalid_cursor():
+    assert decode_cursor(encode_cursor(datetime(2025, 8, 5, 12, 0, 0), 3)) == (datetime(2025, 8, 5, 12, 0, 0), 3)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Parquet 스냅샷 내보내기 테스트 (임시 SQLite 데이터베이스 사용)
+
+pyarrow 가 없으면 파일 기록 테스트는 건너뜁니다.
+"""
+
+import sys
+import os
+import glob
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.snapshot import ParquetSnapshotExporter, decode_string_list, extract_image_urls
+
+
+def _seed(manager, make_article, collected_at: datetime, prefix: str):
+    community_id = manager.insert_community("강남언니")
+    articles = []
+    for i in range(3):
+        article = make_article(community_id, f"{prefix}{i}")
+        article["created_at"] = datetime(2025, 8, 1 + i % 2)
+        article["collected_at"] = collected_at
+        article["images"] = json.dumps([{"url": f"https://img/{prefix}{i}.jpg"}])
+        articles.append(article)
+    manager.bulk_upsert_articles(articles)
+    manager.bulk_upsert_reviews([{
+        "platform_id": "babitalk_review", "platform_review_id": f"{prefix}r", "community_id": community_id,
+        "content": "후기", "writer_nickname": "작성자", "writer_id": "writer", "created_at": datetime(2025, 8, 1),
+        "collected_at": collected_at, "categories": json.dumps(["코성형", "눈성형"], ensure_ascii=False),
+        "images": json.dumps({"beforePhotos": ["https://img/before.jpg"], "afterPhotos": []}),
+        "is_blind": False
+    }])
+
+
+def test_json_columns_decoded():
+    assert decode_string_list('["코성형", "눈성형"]') == ["코성형", "눈성형"]
+    assert decode_string_list("{}") is None
+    assert decode_string_list(None) is None
+    assert extract_image_urls('[{"url": "https://a"}, {"url": "https://b", "small_url": "https://b-s"}]') == ["https://a", "https://b"]
+    assert extract_image_urls('{"beforePhotos": ["https://a"], "progressReviewPhotos": [{"url": "https://b"}]}') == ["https://a", "https://b"]
+    assert extract_image_urls("[]") == []
+
+
+def test_snapshot_batches_follow_collected_at_window(manager, make_article):
+    first = datetime(2025, 8, 10, 9, 0, 0)
+    _seed(manager, make_article, first, "a")
+    _seed(manager, make_article, first + timedelta(hours=1), "b")
+
+    def ids(after, until):
+        return [row["community_article_id"]
+                for batch in manager.iter_snapshot_batches("article", after, until, batch_size=2)
+                for row in batch]
+
+    assert ids(None, first) == ["a0", "a1", "a2"]
+    assert ids(first, first + timedelta(hours=1)) == ["b0", "b1", "b2"]
+    assert ids(first + timedelta(hours=1), first + timedelta(hours=2)) == []
+
+
+def test_incremental_parquet_export(manager, make_article, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    output_dir = str(tmp_path / "snapshots")
+    exporter = ParquetSnapshotExporter(output_dir, manager, batch_size=2, lag_seconds=0)
+
+    _seed(manager, make_article, datetime.now() - timedelta(hours=1), "a")
+    assert exporter.export() == {"article": 3, "comment": 0, "review": 1}
+    assert sorted(os.listdir(os.path.join(output_dir, "articles"))) == ["date=2025-08-01", "date=2025-08-02"]
+
+    # 새 데이터가 없으면 추가 파일 없음
+    assert exporter.export()["article"] == 0
+
+    _seed(manager, make_article, datetime.now(), "b")
+    exporter.lag_seconds = -1
+    assert exporter.export()["article"] == 3
+
+    table = pq.read_table(os.path.join(output_dir, "articles"))
+    assert table.num_rows == 6
+    assert sorted(table.column("community_article_id").to_pylist()) == ["a0", "a1", "a2", "b0", "b1", "b2"]
+    assert table.schema.field("created_at").type.unit == "us"
+
+    review = pq.read_table(os.path.join(output_dir, "reviews")).to_pylist()[0]
+    assert review["categories"] == ["코성형", "눈성형"]
+    assert review["image_urls"] == ["https://img/before.jpg"]
+    assert review["image_count"] == 1
+    assert not glob.glob(os.path.join(output_dir, "**", "*.tmp"), recursive=True)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+조회 쿼리 실행 계획 회귀 테스트 (임시 SQLite 데이터베이스 사용)
+
+데이터 뷰어/통계가 실행하는 쿼리를 캡처해 EXPLAIN QUERY PLAN 으로 확인하고,
+원본 테이블을 인덱스 없이 전체 스캔하거나 정렬용 임시 B-트리를 만드는 쿼리가 없는지 검사합니다.
+"""
+
+import sys
+import os
+import re
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from database.fulltext import ensure_fulltext_indexes
+from database.pagination import encode_cursor
+
+TABLES = ("articles", "comments", "reviews", "search_documents")
+
+
+@pytest.fixture
+def assert_indexed(capture_selects):
+    """assert_indexed(engine, call): 캡처한 각 쿼리의 실행 계획에 전체 스캔/정렬용 임시 B-트리가 없는지 확인"""
+    def check(engine, call):
+        statements = capture_selects(engine, call)
+        assert statements
+        with engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+                for detail in plan:
+                    for table in TABLES:
+                        assert detail != f"SCAN {table}", f"{statement}\n{plan}"
+                    assert "USE TEMP B-TREE FOR ORDER BY" not in detail, f"{statement}\n{plan}"
+    return check
+
+
+def test_viewer_queries_use_indexes(manager, make_article, capture_selects, assert_indexed):
+    engine = manager.db_config.engine
+    ensure_fulltext_indexes(engine)
+
+    community_id = manager.insert_community("강남언니")
+    articles = []
+    for i in range(20):
+        article = make_article(community_id, str(i))
+        article["category_name"] = "여우야" if i % 2 else "A+여우야"
+        articles.append(article)
+    mapping = manager.bulk_upsert_articles(articles)
+    article_id = mapping[("gangnamunni", "1")]
+    manager.bulk_upsert_comments([
+        {"article_id": article_id, "community_comment_id": f"c{i}", "content": "코성형 댓글",
+         "writer_nickname": "댓글러", "writer_id": "commenter"}
+        for i in range(5)
+    ])
+    manager.bulk_upsert_reviews([
+        {"platform_id": "gangnamunni_review", "platform_review_id": f"r{i}", "community_id": community_id,
+         "content": "코성형 후기", "writer_nickname": "작성자", "writer_id": "writer"}
+        for i in range(5)
+    ])
+    cursor = encode_cursor(datetime(2025, 8, 5, 12, 0, 0), 10)
+
+    # /articles
+    assert_indexed(engine, lambda: manager.get_articles_by_filters({}, limit=21))
+    assert_indexed(engine, lambda: manager.get_articles_by_filters({}, limit=21, cursor=cursor))
+    assert_indexed(engine, lambda: manager.get_articles_by_filters({"platform_id": "gangnamunni"}, limit=21, cursor=cursor))
+    assert_indexed(engine, lambda: manager.get_articles_by_filters(
+        {"platform_id": "naver", "category_name": "여우야"}, limit=21, cursor=cursor
+    ))
+    assert_indexed(engine, lambda: manager.get_articles_count_by_filters({"platform_id": "gangnamunni"}))
+
+    # /comments
+    assert_indexed(engine, lambda: manager.get_comments_by_filters({"platform_id": "gangnamunni"}, limit=21, cursor=cursor))
+    assert_indexed(engine, lambda: manager.get_comments_by_filters({"community_article_id": "1"}, limit=21))
+    assert_indexed(engine, lambda: manager.get_comments_count_by_article_id(article_id))
+
+    # /reviews
+    assert_indexed(engine, lambda: manager.get_reviews_by_filters({"platform_id": "gangnamunni_review"}, limit=21, cursor=cursor))
+    assert_indexed(engine, lambda: manager.get_reviews_count_by_filters({"platform_id": "gangnamunni_review"}))
+    assert_indexed(engine, lambda: manager.get_reviews_count_by_filters({}))
+
+    # 날짜 조회 / 통계
+    assert_indexed(engine, lambda: manager.get_articles_by_date("2025-08-05"))
+    assert_indexed(engine, lambda: manager.get_articles_by_date("2025-08-05", community_id=community_id))
+    assert_indexed(engine, lambda: manager.get_statistics())
+    # 통계는 daily_stats 집계만 읽고 원본 테이블은 조회하지 않음
+    statements = capture_selects(engine, manager.get_statistics)
+    assert {table for statement, _ in statements for table in re.findall(r"\bFROM (\w+)", statement)} == {"daily_stats"}
+
+    # /search
+    assert_indexed(engine, lambda: manager.search_documents_by_keywords(
+        ["코성형"], platforms=["gangnamunni"], start_date="2025-08-01", end_date="2025-08-05", limit=20, cursor=cursor
+    ))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
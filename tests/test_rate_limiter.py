@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+호스트별 속도 제한기 테스트
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from platforms.rate_limiter import RateLimiter, RateLimiterRegistry
+
+
+def test_max_in_flight():
+    """동시 요청 수 제한 테스트"""
+    limiter = RateLimiter(requests_per_second=100, max_in_flight=3)
+    peak = 0
+    
+    async def job():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.02)
+    
+    async def run():
+        await asyncio.gather(*(job() for _ in range(12)))
+    
+    asyncio.run(run())
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+def test_requests_per_second():
+    """초당 요청 수 제한 테스트 (버스트 이후 속도 유지)"""
+    limiter = RateLimiter(requests_per_second=20, max_in_flight=10, burst=1)
+    
+    async def run():
+        started = time.monotonic()
+        for _ in range(6):
+            async with limiter:
+                pass
+        return time.monotonic() - started
+    
+    elapsed = asyncio.run(run())
+    # 첫 요청은 즉시, 이후 5건은 0.05초 간격
+    assert elapsed >= 0.2
+
+
+def test_registry_shares_limiter_per_host():
+    """호스트별 제한기 공유 테스트"""
+    registry = RateLimiterRegistry()
+    assert registry.get("example.com") is registry.get("example.com")
+    assert registry.get("example.com") is not registry.get("example.org")
+    
+    registry.configure("example.com", 5, 2)
+    assert registry.get_stats()["example.com"]["max_in_flight"] == 2
+
+
+if __name__ == "__main__":
+    test_max_in_flight()
+    test_requests_per_second()
+    test_registry_shares_limiter_per_host()
+    print("✅ 속도 제한기 테스트 완료")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+조회 응답 캐시 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from starlette.requests import Request
+
+from api.models import PlatformType
+from api.routers import data_viewer
+from database.async_db import AsyncDatabase
+from database.cache import MemoryResponseCache, SQLiteResponseCache, set_response_cache, bump_generation
+
+
+def _request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": headers})
+
+
+def _get_articles(db, platform=None, request=None):
+    return asyncio.run(data_viewer.get_articles(
+        platform=platform, category=None, page=1, limit=20, cursor=None, db=db, request=request or _request()
+    ))
+
+
+def _assert_cache_behaviour(manager, make_article, count_selects):
+    engine = manager.db_config.engine
+    db = AsyncDatabase(manager)
+    community_id = manager.insert_community("강남언니")
+    manager.bulk_upsert_articles([make_article(community_id, "1")])
+
+    count, first = count_selects(engine, lambda: _get_articles(db, PlatformType.GANGNAMUNNI))
+    assert count > 0
+    assert json.loads(first.body)["total"] == 1
+    etag = first.headers["etag"]
+
+    # 같은 조건 반복 조회는 DB 를 조회하지 않음
+    count, second = count_selects(engine, lambda: _get_articles(db, PlatformType.GANGNAMUNNI))
+    assert count == 0
+    assert second.body == first.body
+
+    # ETag 일치 시 304
+    not_modified = _get_articles(db, PlatformType.GANGNAMUNNI, _request(f'W/{etag}'))
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+
+    # 다른 플랫폼 수집은 이 조회를 무효화하지 않음
+    naver = make_article(community_id, "n1")
+    naver["platform_id"] = "naver"
+    manager.bulk_upsert_articles([naver])
+    count, _ = count_selects(engine, lambda: _get_articles(db, PlatformType.GANGNAMUNNI))
+    assert count == 0
+    # 전체 조회는 무효화됨
+    assert json.loads(_get_articles(db).body)["total"] == 2
+
+    # 같은 플랫폼 수집은 무효화
+    manager.bulk_upsert_articles([make_article(community_id, "2")])
+    refreshed = _get_articles(db, PlatformType.GANGNAMUNNI, _request(etag))
+    assert refreshed.status_code == 200
+    assert json.loads(refreshed.body)["total"] == 2
+    assert refreshed.headers["etag"] != etag
+
+    # 중복 저장(새 행 없음)은 무효화하지 않음
+    manager.bulk_upsert_articles([make_article(community_id, "2")])
+    count, _ = count_selects(engine, lambda: _get_articles(db, PlatformType.GANGNAMUNNI))
+    assert count == 0
+
+
+def test_memory_cache_invalidated_per_platform(manager, make_article, count_selects):
+    set_response_cache(MemoryResponseCache(ttl=60))
+    try:
+        _assert_cache_behaviour(manager, make_article, count_selects)
+    finally:
+        set_response_cache(None)
+
+
+def test_sqlite_cache_shared_between_instances(manager, make_article, count_selects, tmp_path):
+    path = str(tmp_path / "viewer_cache.db")
+    set_response_cache(SQLiteResponseCache(path, ttl=60))
+    try:
+        _assert_cache_behaviour(manager, make_article, count_selects)
+
+        # 다른 프로세스의 수집이 올린 세대가 보임
+        other = SQLiteResponseCache(path, ttl=60)
+        before = other.generations(["naver"])
+        bump_generation(["naver"])
+        assert other.generations(["naver"])["naver"] == before["naver"] + 1
+    finally:
+        set_response_cache(None)
+
+
+def test_memory_cache_lru_and_ttl():
+    cache = MemoryResponseCache(ttl=60, max_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, (key, key.encode()))
+    cache.get("a")
+    cache.set("c", ("c", b"c"))
+    assert cache.get("b") is None
+    assert cache.get("a") == ("a", b"a")
+
+    expired = MemoryResponseCache(ttl=0)
+    expired.set("a", ("a", b"a"))
+    assert expired.get("a") is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
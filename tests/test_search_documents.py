@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+통합 검색 문서 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import text
+
+from database.fulltext import ensure_fulltext_indexes
+
+
+def _seed(manager, make_article):
+    """게시글/댓글/후기를 작성일이 섞이도록 저장"""
+    community_id = manager.insert_community("강남언니")
+
+    articles = []
+    for article_id, hour in (("1", 9), ("2", 12)):
+        article = make_article(community_id, article_id)
+        article["content"] = f"코성형 상담 {article_id}"
+        article["created_at"] = datetime(2025, 8, 5, hour, 0, 0)
+        articles.append(article)
+    naver = make_article(community_id, "n1")
+    naver.update({"platform_id": "naver", "category_name": "여우야", "content": "코성형 카페 글",
+                  "created_at": datetime(2025, 8, 4, 15, 0, 0)})
+    articles.append(naver)
+    mapping = manager.bulk_upsert_articles(articles)
+
+    manager.insert_comment({
+        "article_id": mapping[("gangnamunni", "1")], "community_comment_id": "c1", "content": "코성형 어디서 하셨어요",
+        "writer_nickname": "댓글러", "writer_id": "commenter", "created_at": datetime(2025, 8, 5, 11, 0, 0)
+    })
+    manager.bulk_upsert_reviews([
+        {"platform_id": "gangnamunni_review", "platform_review_id": "r1", "community_id": community_id,
+         "content": "만족합니다", "hospital_name": "코성형전문의원", "writer_nickname": "작성자", "writer_id": "writer",
+         "created_at": datetime(2025, 8, 5, 10, 0, 0)}
+    ])
+
+
+def test_search_pages_globally_ordered_results(manager, make_article):
+    """게시글/댓글/후기를 합쳐 작성일 역순으로 페이지 나눔"""
+    ensure_fulltext_indexes(manager.db_config.engine)
+    _seed(manager, make_article)
+
+    first = manager.search_documents_by_keywords(["코성형"], limit=3, offset=0)
+    assert [(item["type"], item["data"]["created_at"]) for item in first["results"]] == [
+        ("article", "2025-08-05T12:00:00"),
+        ("comment", "2025-08-05T11:00:00"),
+        ("review", "2025-08-05T10:00:00"),
+    ]
+    assert first["total_counts"] == {"articles": 3, "comments": 1, "reviews": 1}
+    assert first["total"] == 5
+
+    second = manager.search_documents_by_keywords(["코성형"], limit=3, offset=3)
+    assert [item["data"]["community_article_id"] for item in second["results"]] == ["1", "n1"]
+    assert len(second["articles"]) == 2 and not second["comments"] and not second["reviews"]
+
+    # 필터: 후기 플랫폼 확장, 네이버 카페, 날짜(종료일 포함)
+    assert manager.search_data_count_by_keywords(["코성형"], platforms=["gangnamunni"]) == {
+        "articles": 2, "comments": 1, "reviews": 1
+    }
+    assert manager.search_data_count_by_keywords(["코성형"], naver_cafes=["다른카페"])["articles"] == 2
+    assert manager.search_data_count_by_keywords(["코성형"], start_date="2025-08-04", end_date="2025-08-04") == {
+        "articles": 1, "comments": 0, "reviews": 0
+    }
+    assert manager.search_data_count_by_keywords(["코성형"], data_types=["review"]) == {
+        "articles": 0, "comments": 0, "reviews": 1
+    }
+
+
+def test_rebuild_search_documents(manager, make_article):
+    """검색 문서가 없는 기존 데이터도 재생성으로 검색됨"""
+    _seed(manager, make_article)
+
+    engine = manager.db_config.engine
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM search_documents"))
+    ensure_fulltext_indexes(engine)
+    assert manager.search_documents_by_keywords(["코성형"])["total"] == 0
+
+    assert manager.rebuild_search_documents() == {"article": 3, "comment": 1, "review": 1}
+    assert manager.search_documents_by_keywords(["코성형"])["total"] == 5
+
+
+def test_source_delete_and_update_sync_search_documents(manager, make_article):
+    """원본 삭제/수정이 검색 문서에 반영되어 합계와 페이지가 맞음"""
+    ensure_fulltext_indexes(manager.db_config.engine)
+    _seed(manager, make_article)
+
+    engine = manager.db_config.engine
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM articles WHERE community_article_id = '2'"))
+        conn.execute(text("DELETE FROM reviews"))
+        conn.execute(text("UPDATE comments SET content = '' WHERE community_comment_id = 'c1'"))
+        conn.execute(text("UPDATE articles SET title = '', content = '눈성형 후기' WHERE community_article_id = 'n1'"))
+
+    page = manager.search_documents_by_keywords(["코성형"], limit=3, offset=0)
+    assert page["total_counts"] == {"articles": 1, "comments": 0, "reviews": 0}
+    assert [item["data"]["community_article_id"] for item in page["results"]] == ["1"]
+
+    # 트리거로 만든 검색 텍스트는 수집 시 만든 텍스트와 같음
+    with engine.connect() as conn:
+        texts = dict(conn.execute(text("SELECT doc_type || source_id, text FROM search_documents")).all())
+    article_ids = manager.get_article_ids_by_community_article_ids("naver", ["n1"])
+    assert texts[f"article{article_ids['n1']}"] == manager._search_text("", "눈성형 후기") == "눈성형 후기"
+    assert manager.search_data_count_by_keywords(["눈성형"])["articles"] == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+SQLite 운영 설정 테스트 (임시 SQLite 데이터베이스 사용)
+
+WAL/PRAGMA 적용과 단일 writer 경로(쓰기 잠금, DB writer 스레드)를 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import text
+
+from api.services.async_task_manager import AsyncTaskManager
+from database.async_db import AsyncDatabase, run_db_write
+from database.sqlalchemy_manager import SQLAlchemyDatabaseManager, WRITE_METHODS
+
+
+def test_pragmas_applied_on_connect(manager):
+    with manager.db_config.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 30000
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+
+def test_write_methods_marked():
+    assert {"insert_article", "bulk_upsert_comments", "update_collection_task", "save_collection_checkpoint"} <= WRITE_METHODS
+    assert not WRITE_METHODS & {"get_articles_by_ids", "get_articles_count_by_filters", "get_collection_checkpoint"}
+    assert all(callable(getattr(SQLAlchemyDatabaseManager, name)) for name in WRITE_METHODS)
+
+
+def test_concurrent_writes_serialized(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    errors = []
+
+    def save(start: int):
+        try:
+            for i in range(start, start + 20):
+                manager.insert_article(make_article(community_id, str(i)))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(n * 100,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert manager.get_articles_count_by_filters({}) == 80
+
+
+def test_reads_not_blocked_by_write_unit(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    manager.insert_article(make_article(community_id, "1"))
+
+    with manager.unit_of_work() as db:
+        db.insert_article(make_article(community_id, "2"))
+        assert manager.db_config.write_lock.locked()
+
+        # 쓰기 작업 단위가 잠금을 잡고 있어도 다른 스레드의 조회는 커밋된 데이터로 바로 실행
+        counts = []
+        reader = threading.Thread(target=lambda: counts.append(manager.get_articles_count_by_filters({})))
+        reader.start()
+        reader.join(timeout=5)
+        assert counts == [1]
+
+        # 다른 스레드의 쓰기는 작업 단위가 끝날 때까지 대기
+        writer = threading.Thread(target=lambda: manager.insert_article(make_article(community_id, "3")))
+        writer.start()
+        time.sleep(0.2)
+        assert writer.is_alive()
+    writer.join(timeout=5)
+
+    assert not manager.db_config.write_lock.locked()
+    assert manager.get_articles_count_by_filters({}) == 3
+
+
+def test_async_writes_run_on_writer_thread(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    threads = {}
+    original_insert, original_count = manager.insert_article, manager.get_articles_count_by_filters
+
+    def insert_article(article_data):
+        threads["write"] = threading.current_thread().name
+        return original_insert(article_data)
+
+    def get_articles_count_by_filters(filters):
+        threads["read"] = threading.current_thread().name
+        return original_count(filters)
+
+    manager.insert_article = insert_article
+    manager.get_articles_count_by_filters = get_articles_count_by_filters
+
+    async def run():
+        db = AsyncDatabase(manager)
+        await asyncio.gather(*(db.insert_article(make_article(community_id, str(i))) for i in range(5)))
+        return await db.get_articles_count_by_filters({})
+
+    assert asyncio.run(run()) == 5
+    assert threads["write"].startswith("db-writer")
+    assert not threads["read"].startswith("db-writer")
+
+
+def _run_with_timeout(coroutine_factory, timeout: float = 10):
+    """이벤트 루프를 별도 스레드에서 실행하고 멈추면 실패 (교착 상태 회귀 확인)"""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = asyncio.run(coroutine_factory())
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "이벤트 루프가 writer 잠금을 기다리며 멈춤"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
+def test_event_loop_never_waits_on_writer_lock(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+    task_manager = AsyncTaskManager(manager)
+    in_unit = threading.Event()
+
+    def save(db):
+        db.insert_article(make_article(community_id, "1"))
+        in_unit.set()
+        time.sleep(0.2)  # writer 잠금을 잡은 채 커밋 전 대기
+
+    async def run():
+        unit = asyncio.ensure_future(AsyncDatabase(manager).run_unit_of_work(save))
+        while not in_unit.is_set():
+            await asyncio.sleep(0.01)
+        # 잠금은 writer 스레드 호출 안에서만 유지되므로 이벤트 루프 스레드의 동기 쓰기도 오류 없이 커밋 뒤 실행
+        manager.heartbeat_collection_tasks("worker", [])
+        await unit
+        return await task_manager.run_worker_cycle()
+
+    assert _run_with_timeout(run) == []
+    assert manager.get_articles_count_by_filters({}) == 1
+
+
+def test_concurrent_units_of_work_and_plain_write(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+
+    def save(db, article_id: str):
+        row_id = db.insert_article(make_article(community_id, article_id))
+        time.sleep(0.05)
+        db.bulk_upsert_comments([{
+            "article_id": row_id, "community_comment_id": f"{article_id}-{i}", "content": "댓글",
+            "writer_nickname": "작성자", "writer_id": "writer"
+        } for i in range(2)])
+        return threading.current_thread().name
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(10):
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        db = AsyncDatabase(manager)
+        # 작업 단위 두 개와 작업 단위 밖의 쓰기가 writer 스레드에서 차례로 실행되는 동안 이벤트 루프는 계속 실행
+        threads = await asyncio.gather(
+            db.run_unit_of_work(save, "1"),
+            db.run_unit_of_work(save, "2"),
+            run_db_write(manager.insert_article, make_article(community_id, "3")),
+            ticker()
+        )
+        return threads[:2], ticks
+
+    threads, ticks = _run_with_timeout(run)
+    assert all(name.startswith("db-writer") for name in threads)
+    assert ticks == 10
+    assert not manager.db_config.write_lock.locked()
+    assert manager.get_articles_count_by_filters({}) == 3
+    assert manager.get_comments_count_by_filters({}) == 4
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+수집 작업 저장소 및 작업 재개 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from api.services.async_task_manager import AsyncTaskManager, TaskType
+from database.async_db import run_db_write
+
+
+def test_claim_is_exclusive_and_stale_tasks_are_reclaimed(manager):
+    """작업은 한 워커만 획득하고, 하트비트가 끊긴 작업만 다른 워커가 인수"""
+    manager.create_collection_task("task-1", "babitalk_collect", {"target_date": "2025-08-05"})
+
+    assert manager.claim_collection_task("task-1", "worker-a")
+    assert not manager.claim_collection_task("task-1", "worker-b")
+
+    # 하트비트가 살아 있으면 인수 불가
+    stale_before = datetime.now() - timedelta(seconds=60)
+    assert manager.heartbeat_collection_tasks("worker-a", ["task-1"]) == set()
+    assert not manager.claim_collection_task("task-1", "worker-b", stale_before=stale_before)
+
+    # 하트비트가 끊기면 다른 워커가 인수하고, 기존 워커는 소유권 상실을 감지
+    manager.update_collection_task("task-1", {"heartbeat_at": datetime.now() - timedelta(minutes=5)})
+    assert manager.find_resumable_collection_tasks(stale_before, stale_before) == ["task-1"]
+    assert manager.claim_collection_task("task-1", "worker-b", stale_before=stale_before)
+    assert manager.heartbeat_collection_tasks("worker-a", ["task-1"]) == {"task-1"}
+
+    task = manager.get_collection_task("task-1")
+    assert task["worker_id"] == "worker-b"
+    assert task["attempts"] == 2
+
+
+def test_interrupted_task_resumes_from_checkpoint(manager):
+    """중단된 작업을 다른 워커가 저장된 인자와 체크포인트로 이어서 실행"""
+    calls = []
+
+    async def runner(target_date, progress_callback=None, checkpoint=None, checkpoint_callback=None):
+        done = list((checkpoint or {}).get("done", []))
+        calls.append(list(done))
+        for step in ["a", "b", "c"]:
+            if step in done:
+                continue
+            done.append(step)
+            checkpoint_callback({"done": done})
+            if step == "b" and len(calls) == 1:
+                # 첫 실행은 b 이후 중단 (서버 종료 상황)
+                await asyncio.sleep(10)
+        return {"target_date": target_date, "done": done}
+
+    first = AsyncTaskManager(manager)
+    second = AsyncTaskManager(manager)
+    second.register_runner(TaskType.BABITALK_COLLECT, runner)
+
+    async def run():
+        task_id = await first.create_task(TaskType.BABITALK_COLLECT, {"target_date": "2025-08-05"})
+        assert await first.start_task(task_id, runner, "2025-08-05")
+        await asyncio.sleep(0.05)
+        await first.stop_worker()
+
+        # 첫 워커의 하트비트가 끊긴 상태로 만든 뒤 두 번째 워커가 재개
+        manager.update_collection_task(task_id, {"heartbeat_at": datetime.now() - timedelta(hours=1)})
+        assert await second.run_worker_cycle() == [task_id]
+        await asyncio.gather(*second._local_tasks.values())
+        return task_id
+
+    task_id = asyncio.run(run())
+    status = asyncio.run(second.get_task_status(task_id))
+    assert status["status"] == "completed"
+    assert status["attempts"] == 2
+    assert calls == [[], ["a", "b"]]
+    assert manager.get_collection_task(task_id)["result"]["done"] == ["a", "b", "c"]
+
+
+def test_progress_updates_saved_in_order_without_blocking(manager):
+    """진행률 콜백은 쓰기를 예약만 하고, 예약된 쓰기는 호출 순서대로 저장"""
+    task_manager = AsyncTaskManager(manager)
+
+    async def run():
+        task_id = await task_manager.create_task(TaskType.BABITALK_COLLECT, {"target_date": "2025-08-05"})
+        await run_db_write(manager.claim_collection_task, task_id, task_manager.worker_id)
+        for progress in range(1, 21):
+            task_manager.update_task_progress(task_id, progress, 20, f"단계 {progress}")
+        assert task_id in task_manager._pending_writes
+        await task_manager._flush_updates(task_id)
+        assert task_id not in task_manager._pending_writes
+        return task_id
+
+    task_id = asyncio.run(run())
+    task = manager.get_collection_task(task_id)
+    assert (task["progress"], task["current_step"]) == (20, "단계 20")
+    assert len(task["logs"]) == 20
+
+
+def test_credentials_not_persisted_and_reinjected_on_resume(manager):
+    """토큰은 작업 저장소에 남기지 않고, 재개 시 환경변수에서 다시 채움"""
+    received = []
+
+    async def runner(target_date, categories=None, token=None, progress_callback=None):
+        received.append(token)
+        if len(received) == 1:
+            await asyncio.sleep(10)
+        return {"target_date": target_date}
+
+    original_token = os.environ.get("GANGNAMUNNI_TOKEN")
+    os.environ["GANGNAMUNNI_TOKEN"] = "env-token"
+    try:
+        first = AsyncTaskManager(manager)
+        second = AsyncTaskManager(manager)
+        second.register_runner(TaskType.GANGNAMUNNI_COLLECT, runner)
+
+        async def run():
+            task_id = await first.create_task(TaskType.GANGNAMUNNI_COLLECT, {
+                "target_date": "2025-08-05", "token": "secret-token"
+            })
+            assert await first.start_task(task_id, runner, "2025-08-05", ["free_chat"], "secret-token")
+            await asyncio.sleep(0.05)
+            await first.stop_worker()
+
+            stored = manager.get_collection_task(task_id)
+            assert "secret-token" not in repr((stored["task_data"], stored["call_args"]))
+            assert stored["call_args"]["kwargs"] == {"target_date": "2025-08-05", "categories": ["free_chat"]}
+
+            manager.update_collection_task(task_id, {"heartbeat_at": datetime.now() - timedelta(hours=1)})
+            assert await second.run_worker_cycle() == [task_id]
+            await asyncio.gather(*second._local_tasks.values())
+
+        asyncio.run(run())
+        assert received == ["secret-token", "env-token"]
+    finally:
+        if original_token is None:
+            os.environ.pop("GANGNAMUNNI_TOKEN", None)
+        else:
+            os.environ["GANGNAMUNNI_TOKEN"] = original_token
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
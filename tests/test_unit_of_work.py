@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+작업 단위(unit of work) 세션 테스트 (임시 SQLite 데이터베이스 사용)
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from database.async_db import AsyncDatabase
+from database.cache import MemoryResponseCache, set_response_cache, platform_scopes
+
+
+def _comments(article_id: int, count: int):
+    return [{
+        "article_id": article_id, "community_comment_id": f"{article_id}-{i}", "content": "댓글",
+        "writer_nickname": "작성자", "writer_id": "writer"
+    } for i in range(count)]
+
+
+def _count_checkouts(engine, call):
+    checkouts = []
+    listener = lambda dbapi_connection, connection_record, connection_proxy: checkouts.append(1)
+    event.listen(engine, "checkout", listener)
+    try:
+        call()
+    finally:
+        event.remove(engine, "checkout", listener)
+    return len(checkouts)
+
+
+def test_unit_of_work_shares_one_connection(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+
+    def save_article_with_comments(db, article_key):
+        article_id = db.insert_article(make_article(community_id, article_key))
+        existing = db.get_existing_comment_ids(article_id, [f"{article_id}-{i}" for i in range(50)])
+        db.bulk_upsert_comments([c for c in _comments(article_id, 50) if c["community_comment_id"] not in existing])
+
+    per_call = _count_checkouts(manager.db_config.engine, lambda: save_article_with_comments(manager, "1"))
+
+    def in_unit():
+        with manager.unit_of_work() as db:
+            save_article_with_comments(db, "2")
+
+    assert per_call >= 3
+    assert _count_checkouts(manager.db_config.engine, in_unit) == 1
+    assert manager.get_comments_count_by_filters({}) == 100
+
+
+def test_failed_call_keeps_earlier_writes_and_error_rolls_back_unit(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+
+    with manager.unit_of_work() as db:
+        db.insert_article(make_article(community_id, "1"))
+        with pytest.raises(Exception):
+            # NOT NULL 위반: 이 호출의 SAVEPOINT 만 롤백
+            db.insert_article({**make_article(community_id, "x"), "content": None})
+        db.insert_article(make_article(community_id, "2"))
+    assert manager.get_articles_count_by_filters({}) == 2
+
+    with pytest.raises(RuntimeError):
+        with manager.unit_of_work() as db:
+            db.insert_article(make_article(community_id, "3"))
+            raise RuntimeError("수집 중단")
+    assert manager.get_articles_count_by_filters({}) == 2
+
+
+def test_cache_generation_bumped_after_commit(manager, make_article):
+    cache = MemoryResponseCache(ttl=60)
+    set_response_cache(cache)
+    try:
+        community_id = manager.insert_community("강남언니")
+        scopes = platform_scopes(["gangnamunni"])
+        before = cache.generations(scopes)
+
+        with manager.unit_of_work() as db:
+            db.insert_article(make_article(community_id, "1"))
+            assert cache.generations(scopes) == before
+        assert cache.generations(scopes)["gangnamunni"] == before["gangnamunni"] + 1
+    finally:
+        set_response_cache(None)
+
+
+def test_async_unit_of_work(manager, make_article):
+    community_id = manager.insert_community("강남언니")
+
+    def save(db, article_id: str, fail: bool = False):
+        row_id = db.insert_article(make_article(community_id, article_id))
+        if fail:
+            raise RuntimeError("수집 중단")
+        db.bulk_upsert_comments(_comments(row_id, 3))
+        return row_id
+
+    async def run():
+        db = AsyncDatabase(manager)
+        article_id = await db.run_unit_of_work(save, "1")
+        with pytest.raises(RuntimeError):
+            await db.run_unit_of_work(save, "2", fail=True)
+        return article_id
+
+    assert asyncio.run(run()) == 1
+    assert manager.get_articles_count_by_filters({}) == 1
+    assert manager.get_comments_count_by_filters({}) == 3
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))